@@ -0,0 +1,72 @@
+"""add security detection indexes
+
+Revision ID: b7e3c91d4a20
+Revises: 6a8147462764
+Create Date: 2026-10-18 09:00:00.000000
+
+Composite indexes for the set-based security monitoring detections:
+- audit_logs (action, result, timestamp): windowed aggregates per action
+  (failed logins, logins, role assignments, lockouts, 2FA)
+- audit_logs (result, timestamp): denied and atypical-hour access windows
+- security_events (event_type, user_id, detected_at): open event lookup
+  when upserting detections
+
+Indexes are built concurrently so audit log writes are not blocked.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3c91d4a20'
+down_revision = '6a8147462764'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_action_result_timestamp',
+            'audit_logs',
+            ['action', 'result', 'timestamp'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_audit_logs_result_timestamp',
+            'audit_logs',
+            ['result', 'timestamp'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_security_events_type_user_detected',
+            'security_events',
+            ['event_type', 'user_id', 'detected_at'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_security_events_type_user_detected',
+            table_name='security_events',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_result_timestamp',
+            table_name='audit_logs',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_action_result_timestamp',
+            table_name='audit_logs',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,176 @@
+"""
+Import Time Benchmark
+
+Measures how long the entry points take to import, in fresh interpreters:
+- src.api.main    (FastAPI app, imported by uvicorn workers)
+- devmatrix_cli   (devmatrix command-line interface)
+
+For each target it reports the wall time (median of --runs), the slowest
+modules from `python -X importtime`, and whether heavy ML libraries (torch,
+transformers, sentence_transformers) were imported. Models are loaded
+lazily through src.models.model_registry, so none of them should be.
+
+With --budget the script exits non-zero if a target's median import time
+exceeds the budget or a heavy ML library is imported, so it can run as a
+CI check.
+
+Usage:
+    PYTHONPATH=. python scripts/benchmark_import_time.py [--runs 3] [--budget 30] [--json benchmarks/import_time.json]
+
+src.api.main creates the app on import and requires the API environment
+(.env with JWT_SECRET, DATABASE_URL) like the app itself. Connection
+attempts to unavailable services (PostgreSQL, Redis) are part of the
+measured time.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+TARGETS = {
+    "src.api.main": "src.api.main",
+    "devmatrix_cli.py": "devmatrix_cli",
+}
+
+HEAVY_MODULES = ("torch", "transformers", "sentence_transformers")
+
+PROBE = """
+import importlib, json, sys
+importlib.import_module({module!r})
+print("__HEAVY__" + json.dumps([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def time_import(module: str) -> Tuple[float, List[str]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        (wall time in seconds, heavy ML modules imported)
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=REPO_ROOT, env=_env(), capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    heavy = []
+    for line in result.stdout.splitlines():
+        if line.startswith("__HEAVY__"):
+            heavy = json.loads(line[len("__HEAVY__"):])
+    return elapsed, heavy
+
+
+def slowest_modules(module: str, top: int = 15) -> List[Tuple[str, float, float]]:
+    """
+    Slowest imports from `python -X importtime`.
+
+    Returns:
+        (module, self seconds, cumulative seconds), by cumulative time
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, env=_env(), capture_output=True, text=True,
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+        except ValueError:
+            continue
+
+    return sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+
+
+def benchmark(runs: int, top: int) -> Dict[str, Dict]:
+    results = {}
+    for target, module in TARGETS.items():
+        times = []
+        heavy: List[str] = []
+        for _ in range(runs):
+            elapsed, heavy = time_import(module)
+            times.append(elapsed)
+
+        results[target] = {
+            "median_s": statistics.median(times),
+            "min_s": min(times),
+            "max_s": max(times),
+            "heavy_modules": heavy,
+            "slowest": [
+                {"module": name, "self_s": self_s, "cumulative_s": cumulative_s}
+                for name, self_s, cumulative_s in slowest_modules(module, top)
+            ],
+        }
+    return results
+
+
+def print_results(results: Dict[str, Dict]) -> None:
+    for target, result in results.items():
+        print(f"\n{target}")
+        print(f"  import time: {result['median_s']:.2f}s median "
+              f"({result['min_s']:.2f}s - {result['max_s']:.2f}s)")
+        print(f"  heavy ML modules imported: {', '.join(result['heavy_modules']) or 'none'}")
+        print(f"  {'module':<60} {'self':>8} {'cumulative':>11}")
+        for row in result["slowest"]:
+            print(f"  {row['module']:<60} {row['self_s']:>7.2f}s {row['cumulative_s']:>10.2f}s")
+
+
+def check_budget(results: Dict[str, Dict], budget: Optional[float]) -> List[str]:
+    """Budget violations (empty if within budget)."""
+    if budget is None:
+        return []
+
+    violations = []
+    for target, result in results.items():
+        if result["median_s"] > budget:
+            violations.append(f"{target}: {result['median_s']:.2f}s > {budget:.2f}s")
+        if result["heavy_modules"]:
+            violations.append(f"{target}: imports {', '.join(result['heavy_modules'])}")
+    return violations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Fresh-interpreter imports per target")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to report")
+    parser.add_argument("--budget", type=float, default=None, help="Max median import time in seconds")
+    parser.add_argument("--json", type=Path, default=None, help="Write results to this file")
+    args = parser.parse_args()
+
+    results = benchmark(args.runs, args.top)
+    print_results(results)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(results, indent=2))
+
+    violations = check_budget(results, args.budget)
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
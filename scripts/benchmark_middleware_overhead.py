@@ -0,0 +1,180 @@
+"""
+Middleware Overhead Benchmark
+
+Measures per-request latency added by the API middleware stack:
+- bare:     FastAPI app without middleware
+- legacy:   metrics, audit, rate limit and security headers stages, each
+            wrapped in its own BaseHTTPMiddleware (the pre-pipeline layout)
+- pipeline: the same stages in one pure-ASGI MiddlewarePipeline
+
+Requests are driven as raw ASGI calls (no HTTP client or socket) so the
+numbers isolate middleware cost. Redis is replaced by an always-allow
+limiter and audit log writes are skipped. The legacy variant reuses the new
+stages, so it does not include the old per-request settings lookups / regex
+compilation: its numbers are a lower bound for the former stack.
+
+Usage:
+    PYTHONPATH=. python scripts/benchmark_middleware_overhead.py [--requests 5000] [--json benchmarks/middleware_overhead.json]
+
+Requires the API environment (.env with JWT_SECRET, DATABASE_URL) like the
+app itself.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from src.api.middleware.audit_middleware import AuditStage
+from src.api.middleware.rate_limit_middleware import RateLimitStage
+from src.api.middleware.security_headers_middleware import SecurityHeadersStage
+from src.observability import MetricsCollector, MetricsStage, MiddlewarePipeline
+from src.observability.asgi_pipeline import RequestContext
+from src.observability.audit_logger import AuditLogger
+
+PATHS = [
+    "/api/v1/conversations/550e8400-e29b-41d4-a716-446655440000",
+    "/api/v1/health",
+    "/api/v1/workflows/42",
+]
+
+
+async def _skip_audit_write(**kwargs) -> None:
+    """Audit classification is measured; the database write is not."""
+
+
+class _AllowAllLimiter:
+    async def check(self, identifier: str, limit: int):
+        return True, limit - 1, int(time.time()) + 60
+
+
+class _LegacyStageMiddleware(BaseHTTPMiddleware):
+    """One stage behind its own BaseHTTPMiddleware layer."""
+
+    def __init__(self, app, stage):
+        super().__init__(app)
+        self.stage = stage
+
+    async def dispatch(self, request: Request, call_next):
+        ctx = RequestContext(request.scope)
+        short_circuit = await self.stage.on_request(ctx)
+        if short_circuit is not None:
+            return short_circuit
+        response = await call_next(request)
+        ctx.status_code = response.status_code
+        self.stage.on_response_start(ctx, response.headers)
+        await self.stage.on_complete(ctx, None)
+        return response
+
+
+def _stages():
+    rate_limit = RateLimitStage()  # lazy Redis pool, never contacted
+    rate_limit.limiter = _AllowAllLimiter()
+    return [
+        MetricsStage(MetricsCollector()),
+        AuditStage(enabled=True, excluded_paths="/api/v1/health"),
+        rate_limit,
+        SecurityHeadersStage(environment="production"),
+    ]
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/{path:path}")
+    async def endpoint(path: str):
+        return Response(status_code=204)
+
+    if variant == "legacy":
+        # add_middleware: last added is outermost
+        for stage in reversed(_stages()):
+            app.add_middleware(_LegacyStageMiddleware, stage=stage)
+    elif variant == "pipeline":
+        app.add_middleware(MiddlewarePipeline, stages=_stages())
+    return app
+
+
+async def _request(app: FastAPI, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+        "client": ("10.0.0.1", 5000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(app: FastAPI, requests: int) -> Dict[str, float]:
+    # Warm-up (route compilation, lazy middleware stack build)
+    for path in PATHS:
+        await _request(app, path)
+
+    samples: List[float] = []
+    for i in range(requests):
+        start = time.perf_counter()
+        await _request(app, PATHS[i % len(PATHS)])
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    return {
+        "mean_us": statistics.mean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+async def main(requests: int) -> Dict[str, Dict[str, float]]:
+    AuditLogger.log_read_operation = _skip_audit_write
+
+    results = {}
+    for variant in ("bare", "legacy", "pipeline"):
+        results[variant] = await measure(build_app(variant), requests)
+
+    bare = results["bare"]["mean_us"]
+    for variant in ("legacy", "pipeline"):
+        results[variant]["overhead_us"] = results[variant]["mean_us"] - bare
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args.requests))
+
+    print(f"\nMiddleware overhead ({args.requests} requests, raw ASGI)")
+    print(f"{'variant':<10} {'mean µs':>10} {'p50 µs':>10} {'p99 µs':>10} {'overhead µs':>12}")
+    for variant, stats in results.items():
+        overhead = stats.get("overhead_us")
+        print(
+            f"{variant:<10} {stats['mean_us']:>10.1f} {stats['p50_us']:>10.1f} {stats['p99_us']:>10.1f} "
+            f"{(f'{overhead:.1f}' if overhead is not None else '-'):>12}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"requests": args.requests, "results": results}, f, indent=2)
+        print(f"\nResults written to {args.json}")
@@ -138,21 +138,6 @@ def prepare_documents(examples: List[Tuple[str, Dict[str, Any]]],
     return documents
 
 
-def ingest_batch(vector_store, codes: List[str], example_ids: List[str],
-                metadatas: List[Dict[str, Any]]) -> bool:
-    """Ingest a batch of examples."""
-    try:
-        vector_store.add_batch(
-            codes=codes,
-            example_ids=example_ids,
-            metadatas=metadatas
-        )
-        return True
-    except Exception as e:
-        logger.error(f"Batch ingestion failed: {str(e)}")
-        return False
-
-
 def main():
     logger.info("=" * 80)
     logger.info("🔄 RESET EMBEDDINGS WITH CODE-SPECIFIC MODEL")
@@ -205,27 +190,19 @@ def main():
     logger.info("\n📥 Step 5: Re-ingesting 146 examples with new model...")
     documents = prepare_documents(all_examples)
 
-    batch_size = 10
-    total_ingested = 0
-    failed = 0
-
-    for batch_idx in range(0, len(documents), batch_size):
-        batch_docs = documents[batch_idx:batch_idx + batch_size]
-        batch_num = batch_idx // batch_size + 1
-        total_batches = (len(documents) + batch_size - 1) // batch_size
-
-        logger.info(f"\nBatch {batch_num}/{total_batches} ({len(batch_docs)} examples)")
-
-        codes = [doc["code"] for doc in batch_docs]
-        example_ids = [doc["id"] for doc in batch_docs]
-        metadatas = [doc["metadatas"] for doc in batch_docs]
-
-        if ingest_batch(vector_store, codes, example_ids, metadatas):
-            logger.info(f"   ✅ Ingested {len(batch_docs)} examples")
-            total_ingested += len(batch_docs)
-        else:
-            logger.error(f"   ❌ Failed to ingest batch {batch_num}")
-            failed += len(batch_docs)
+    # Streamed in batches; an interrupted run resumes from the checkpoint and
+    # documents already embedded with the same content are skipped
+    try:
+        stats = vector_store.add_stream(
+            documents,
+            batch_size=32,
+            checkpoint_path=".cache/rag/reset_embeddings.checkpoint.json",
+        )
+        total_ingested = stats.added + stats.updated + stats.skipped
+        failed = stats.invalid
+    except Exception as e:
+        logger.error(f"   ❌ Ingestion interrupted: {str(e)} (re-run to resume)")
+        return False
 
     # Summary
     logger.info("\n" + "=" * 80)
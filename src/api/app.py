@@ -20,7 +20,13 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
-from ..observability import StructuredLogger, HealthCheck, MetricsMiddleware, setup_logging
+from ..observability import (
+    StructuredLogger,
+    HealthCheck,
+    MetricsStage,
+    MiddlewarePipeline,
+    setup_logging,
+)
 from ..observability.global_metrics import metrics_collector
 from .routers import workflows, executions, metrics, health, websocket, rag, chat, masterplans, auth, usage, admin, validation, execution_v2, atomization, dependency, review, testing, conversations, acceptance_gate, traceability, traces
 from ..services.orphan_cleanup import OrphanCleanupWorker
@@ -35,6 +41,22 @@ health_check = HealthCheck()
 orphan_cleanup_worker: OrphanCleanupWorker = None
 
 
+def _declare_rag_models() -> None:
+    """Declare the models the RAG components will load with the current configuration."""
+    import os
+
+    from ..config import EMBEDDING_DEVICE, EMBEDDING_MODEL, RAG_RERANK_BACKEND
+    from ..models.model_registry import get_model_registry, load_sentence_transformer
+    from ..rag.cross_encoder_reranker import DEFAULT_RERANK_MODEL, RERANK_BACKENDS
+
+    registry = get_model_registry()
+    # create_embedding_model() only uses sentence-transformers without an OpenAI key
+    if not os.getenv("OPENAI_API_KEY"):
+        registry.declare(load_sentence_transformer, EMBEDDING_MODEL, EMBEDDING_DEVICE)
+    if RAG_RERANK_BACKEND in RERANK_BACKENDS:
+        registry.declare(RERANK_BACKENDS[RAG_RERANK_BACKEND], DEFAULT_RERANK_MODEL)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -94,6 +116,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to start orphan cleanup worker: {e}")
 
+    # ========================================
+    # Model Warm-up (optional)
+    # ========================================
+    # Models load lazily on first use; with MODEL_WARMUP=true the configured
+    # RAG models (components are built on first request, so none has declared
+    # its models yet) load in the background
+    from ..models.model_registry import MODEL_WARMUP_ENABLED, get_model_registry
+
+    if MODEL_WARMUP_ENABLED:
+        _declare_rag_models()
+        get_model_registry().warm_up(background=True)
+        logger.info("Model warm-up started in background")
+
     yield
 
     # Shutdown
@@ -170,33 +205,33 @@ def create_app() -> FastAPI:
         )
 
     # ========================================
-    # Phase 1 Security: Security Headers Middleware
-    # Group 5.5: Add security headers (CSP, X-Frame-Options, HSTS, etc.)
+    # Request pipeline (single pure-ASGI middleware)
     # ========================================
-    # MUST run before rate limiting (order matters for headers)
-    from .middleware.security_headers_middleware import SecurityHeadersMiddleware
-    app.add_middleware(SecurityHeadersMiddleware)
-    logger.info("Security headers middleware enabled")
-
-    # ========================================
-    # Phase 1 Security: Rate Limiting Middleware
-    # Group 5.3: Enable rate limiting with Redis backing
-    # ========================================
-    from .middleware.rate_limit_middleware import RateLimitMiddleware
-    app.add_middleware(RateLimitMiddleware)
-    logger.info("Rate limiting middleware enabled")
-
-    # ========================================
-    # Phase 2 Task Group 12: Enhanced Audit Logging Middleware
-    # ========================================
-    # This MUST run AFTER auth middleware (to get user_id)
-    # but BEFORE request processing
-    from .middleware.audit_middleware import AuditMiddleware
-    app.add_middleware(AuditMiddleware)
-    logger.info("Enhanced audit logging middleware enabled (read operations)")
-
-    # Add metrics middleware
-    app.add_middleware(MetricsMiddleware, metrics_collector=metrics_collector)
+    # Stages run outermost first, same order as the former
+    # BaseHTTPMiddleware stack:
+    # - Metrics: times and counts every request (incl. 429s)
+    # - Request cache: per-request memo shared by auth / RBAC / ownership
+    # - Audit (Phase 2 Task Group 12): logs read operations once the
+    #   response completed; runs AFTER auth (to get user_id)
+    # - Rate limiting (Group 5.3): Redis-backed, may short-circuit with 429
+    # - Security headers (Group 5.5): CSP, X-Frame-Options, HSTS, etc.
+    from .middleware.audit_middleware import AuditStage
+    from .middleware.auth_middleware import RequestCacheStage
+    from .middleware.rate_limit_middleware import RateLimitStage
+    from .middleware.security_headers_middleware import SecurityHeadersStage
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            MetricsStage(metrics_collector),
+            RequestCacheStage(),
+            AuditStage(),
+            RateLimitStage(),
+            SecurityHeadersStage(),
+        ],
+    )
+    logger.info(
+        "Request pipeline enabled (metrics, audit read operations, rate limiting, security headers)"
+    )
 
     # Include routers
     app.include_router(auth.router)  # Authentication (includes /api/v1 prefix)
@@ -21,24 +21,98 @@ Excluded paths:
 
 import re
 import uuid
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
 
+from src.observability.asgi_pipeline import MiddlewarePipeline, PipelineStage, RequestContext
 from src.observability.audit_logger import AuditLogger
 from src.observability import get_logger
 from src.config.settings import get_settings
 
 logger = get_logger("audit_middleware")
 
+# Fallback to hardcoded list if settings not available
+DEFAULT_EXCLUDED_PATHS = "/health,/metrics,/auth/session/keep-alive"
+
+# Always excluded from read-operation logging
+BASE_EXCLUDED_PATTERNS = [
+    r"^/health$",
+    r"^/api/v[0-9]+/health$",
+    r"^/metrics$",
+    r"^/api/v[0-9]+/metrics$",
+    r"^/api/v[0-9]+/auth/session/keep-alive$",
+    r"^/auth/session/keep-alive$",
+    r"^/static/",
+    r"^/assets/",
+    r"^/favicon\.ico$",
+    r"^/docs",
+    r"^/redoc",
+    r"^/openapi\.json$",
+    r"^/$",  # Root path
+    r"^/api$",  # API info endpoint
+]
+
+_UUID = r"([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"
+
+# (pattern, resource_type, has_resource_id) - checked in order, first match wins
+RESOURCE_PATTERNS: List[Tuple[Pattern, str, bool]] = [
+    # /conversations/{uuid}
+    (re.compile(rf"/(?:api/v[0-9]+/)?conversations/{_UUID}(?:/(?!messages|shares).*)?$", re.IGNORECASE), "conversation", True),
+    # /conversations/{uuid}/messages
+    (re.compile(rf"/(?:api/v[0-9]+/)?conversations/{_UUID}/messages", re.IGNORECASE), "message", True),
+    # /conversations/{uuid}/shares
+    (re.compile(rf"/(?:api/v[0-9]+/)?conversations/{_UUID}/shares", re.IGNORECASE), "conversation", True),
+    # /users/{uuid}
+    (re.compile(rf"/(?:api/v[0-9]+/)?users/{_UUID}", re.IGNORECASE), "user", True),
+    # /admin/users (list users)
+    (re.compile(r"/(?:api/v[0-9]+/)?admin/users", re.IGNORECASE), "user", False),
+    # /conversations/shared-with-me
+    (re.compile(r"/(?:api/v[0-9]+/)?conversations/shared-with-me", re.IGNORECASE), "conversation", False),
+]
+
+
+@lru_cache(maxsize=16)
+def compile_excluded_paths(excluded_paths: str) -> Pattern:
+    """
+    Compile the audit exclusion list into a single regex.
+
+    Args:
+        excluded_paths: Comma-separated paths from AUDIT_EXCLUDED_PATHS
+            (`*` is a wildcard)
 
-def should_log_read_operation(path: str, method: str) -> bool:
+    Returns:
+        Compiled pattern; `.match(path)` is truthy for excluded paths
+    """
+    patterns = list(BASE_EXCLUDED_PATTERNS)
+
+    # Add configured excluded paths
+    for excluded_path in excluded_paths.split(","):
+        excluded_path = excluded_path.strip()
+        if excluded_path:
+            # Escape special regex characters except *
+            pattern = re.escape(excluded_path).replace(r"\*", ".*")
+            patterns.append(f"^{pattern}$")
+
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+def _configured_excluded_paths() -> str:
+    try:
+        return get_settings().AUDIT_EXCLUDED_PATHS
+    except Exception:
+        return DEFAULT_EXCLUDED_PATHS
+
+
+def should_log_read_operation(path: str, method: str, excluded: Optional[Pattern] = None) -> bool:
     """
     Determine if the request should be logged.
 
     Args:
         path: Request path
         method: HTTP method
+        excluded: Precompiled exclusion pattern (default: from settings)
 
     Returns:
         bool: True if should log, False if excluded
@@ -47,46 +121,11 @@ def should_log_read_operation(path: str, method: str) -> bool:
     if method != "GET":
         return False
 
-    # Load excluded paths from settings
-    try:
-        settings = get_settings()
-        excluded_paths = settings.AUDIT_EXCLUDED_PATHS.split(",")
-        excluded_paths = [p.strip() for p in excluded_paths if p.strip()]
-    except Exception:
-        # Fallback to hardcoded list if settings not available
-        excluded_paths = ["/health", "/metrics", "/auth/session/keep-alive"]
-
-    # Check if path matches excluded patterns
-    excluded_patterns = [
-        r"^/health$",
-        r"^/api/v[0-9]+/health$",
-        r"^/metrics$",
-        r"^/api/v[0-9]+/metrics$",
-        r"^/api/v[0-9]+/auth/session/keep-alive$",
-        r"^/auth/session/keep-alive$",
-        r"^/static/",
-        r"^/assets/",
-        r"^/favicon\.ico$",
-        r"^/docs",
-        r"^/redoc",
-        r"^/openapi\.json$",
-        r"^/$",  # Root path
-        r"^/api$",  # API info endpoint
-    ]
-
-    # Add configured excluded paths
-    for excluded_path in excluded_paths:
-        if excluded_path:
-            # Escape special regex characters except *
-            pattern = re.escape(excluded_path).replace(r"\*", ".*")
-            excluded_patterns.append(f"^{pattern}$")
+    if excluded is None:
+        excluded = compile_excluded_paths(_configured_excluded_paths())
 
     # Check if path matches any excluded pattern
-    for pattern in excluded_patterns:
-        if re.match(pattern, path):
-            return False
-
-    return True
+    return excluded.match(path) is None
 
 
 def map_endpoint_to_resource_type(path: str) -> Tuple[Optional[str], Optional[str]]:
@@ -100,39 +139,10 @@ def map_endpoint_to_resource_type(path: str) -> Tuple[Optional[str], Optional[st
         Tuple of (resource_type, resource_id)
         Returns (None, None) if path doesn't match known patterns
     """
-    # Pattern: /conversations/{uuid}
-    conversation_pattern = r"/(?:api/v[0-9]+/)?conversations/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})(?:/(?!messages|shares).*)?$"
-    match = re.match(conversation_pattern, path, re.IGNORECASE)
-    if match:
-        return ("conversation", match.group(1))
-
-    # Pattern: /conversations/{uuid}/messages
-    messages_pattern = r"/(?:api/v[0-9]+/)?conversations/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})/messages"
-    match = re.match(messages_pattern, path, re.IGNORECASE)
-    if match:
-        return ("message", match.group(1))
-
-    # Pattern: /conversations/{uuid}/shares
-    shares_pattern = r"/(?:api/v[0-9]+/)?conversations/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})/shares"
-    match = re.match(shares_pattern, path, re.IGNORECASE)
-    if match:
-        return ("conversation", match.group(1))
-
-    # Pattern: /users/{uuid}
-    user_pattern = r"/(?:api/v[0-9]+/)?users/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"
-    match = re.match(user_pattern, path, re.IGNORECASE)
-    if match:
-        return ("user", match.group(1))
-
-    # Pattern: /admin/users (list users)
-    admin_users_pattern = r"/(?:api/v[0-9]+/)?admin/users"
-    if re.match(admin_users_pattern, path, re.IGNORECASE):
-        return ("user", None)
-
-    # Pattern: /conversations/shared-with-me
-    shared_pattern = r"/(?:api/v[0-9]+/)?conversations/shared-with-me"
-    if re.match(shared_pattern, path, re.IGNORECASE):
-        return ("conversation", None)
+    for pattern, resource_type, has_resource_id in RESOURCE_PATTERNS:
+        match = pattern.match(path)
+        if match:
+            return (resource_type, match.group(1) if has_resource_id else None)
 
     return (None, None)
 
@@ -164,9 +174,9 @@ def extract_client_ip(request: Request) -> Optional[str]:
     return None
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
+class AuditStage(PipelineStage):
     """
-    Middleware to log read operations to audit logs.
+    Pipeline stage to log read operations to audit logs.
 
     Intercepts all GET requests and logs read operations for:
     - Conversations
@@ -174,61 +184,63 @@ class AuditMiddleware(BaseHTTPMiddleware):
     - Users
 
     Excludes health checks, metrics, keep-alive, and static assets.
+    Settings are read once at startup; logging happens after the response
+    has been sent, so it never delays the client.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, enabled: Optional[bool] = None, excluded_paths: Optional[str] = None):
         """
-        Process request and log read operations.
+        Initialize audit stage.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware in chain
-
-        Returns:
-            Response from next middleware
+            enabled: Overrides settings.AUDIT_READ_OPERATIONS
+            excluded_paths: Overrides settings.AUDIT_EXCLUDED_PATHS
         """
-        # Get method and path
-        method = request.method
-        path = request.url.path
+        if enabled is None:
+            try:
+                enabled = get_settings().AUDIT_READ_OPERATIONS
+            except Exception:
+                # If settings not available, default to enabled
+                enabled = True
+        if excluded_paths is None:
+            excluded_paths = _configured_excluded_paths()
 
-        # Check if read operation logging is enabled
-        try:
-            settings = get_settings()
-            if not settings.AUDIT_READ_OPERATIONS:
-                # Logging disabled, skip
-                return await call_next(request)
-        except Exception:
-            # If settings not available, default to enabled
-            pass
+        self.enabled = enabled
+        self.excluded = compile_excluded_paths(excluded_paths)
 
-        # Process request first
-        response = await call_next(request)
+    async def on_complete(self, ctx: RequestContext, exc: Optional[BaseException]) -> None:
+        """Log the read operation once the response completed."""
+        if not self.enabled or exc is not None:
+            return
 
         # Only log if request succeeded (2xx status code)
-        if not (200 <= response.status_code < 300):
-            return response
+        status_code = ctx.status_code
+        if status_code is None or not (200 <= status_code < 300):
+            return
+
+        method = ctx.method
+        path = ctx.path
 
         # Check if should log this operation
-        if not should_log_read_operation(path, method):
-            return response
+        if not should_log_read_operation(path, method, self.excluded):
+            return
 
         # Map endpoint to resource type
         resource_type, resource_id = map_endpoint_to_resource_type(path)
 
         if resource_type is None:
             # Unknown endpoint, don't log
-            return response
+            return
 
         # Extract user ID from request state (set by auth middleware)
-        user_id = None
-        if hasattr(request.state, "user"):
-            user = request.state.user
-            user_id = user.user_id if hasattr(user, "user_id") else None
+        user = ctx.state.get("user")
+        user_id = getattr(user, "user_id", None)
 
         # Extract request metadata
+        request = ctx.request
         client_ip = extract_client_ip(request)
-        user_agent = request.headers.get("User-Agent")
-        correlation_id = getattr(request.state, "correlation_id", None)
+        user_agent = ctx.headers.get("User-Agent")
+        correlation_id = ctx.state.get("correlation_id")
 
         # Parse resource_id as UUID if present
         resource_uuid = None
@@ -239,7 +251,6 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 # Invalid UUID, log without resource_id
                 pass
 
-        # Log read operation asynchronously (non-blocking)
         try:
             await AuditLogger.log_read_operation(
                 user_id=user_id,
@@ -250,7 +261,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 metadata={
                     "endpoint": path,
                     "method": method,
-                    "status_code": response.status_code
+                    "status_code": status_code
                 },
                 correlation_id=correlation_id
             )
@@ -267,4 +278,17 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 exc_info=True
             )
 
-        return response
+
+class AuditMiddleware(MiddlewarePipeline):
+    """
+    Standalone audit middleware for read operations (single-stage pipeline).
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize audit middleware.
+
+        Args:
+            app: ASGI application
+        """
+        super().__init__(app, [AuditStage()])
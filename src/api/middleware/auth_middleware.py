@@ -8,15 +8,19 @@ Updated with Phase 2 Task Group 4: Session timeout management (idle + absolute).
 
 from typing import Optional
 from datetime import datetime
+from uuid import UUID
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 
+from src.services.auth_cache import get_principal_cache
 from src.services.auth_service import AuthService
+from src.services.request_cache import begin_request_cache, end_request_cache, set_request_cached
 from src.services.session_service import SessionService
 from src.models.user import User
 from src.config.settings import get_settings
 from src.observability import get_logger
+from src.observability.asgi_pipeline import PipelineStage, RequestContext
 
 logger = get_logger("auth_middleware")
 settings = get_settings()
@@ -75,6 +79,21 @@ class AuthMiddleware:
 auth_middleware = AuthMiddleware()
 
 
+class RequestCacheStage(PipelineStage):
+    """
+    Opens a request-scoped cache (src/services/request_cache.py) so the
+    authenticated user, roles and ownership lookups are loaded once per
+    request.
+    """
+
+    async def on_request(self, ctx: RequestContext) -> None:
+        ctx.values["request_cache_token"] = begin_request_cache()
+        return None
+
+    async def on_complete(self, ctx: RequestContext, exc: Optional[BaseException]) -> None:
+        end_request_cache(ctx.values.pop("request_cache_token"))
+
+
 async def get_token_from_header(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> str:
@@ -123,6 +142,10 @@ async def get_current_user(request: Request, token: str = Depends(get_token_from
     4. Check absolute timeout from iat claim (12 hours)
     5. Update last activity and reset idle timer
 
+    Steps 2-3 and the user lookup are skipped for tokens validated within
+    AUTH_CACHE_TTL_SECONDS (see src/services/auth_cache.py); activity
+    writes are coalesced per session.
+
     Args:
         request: FastAPI request (for storing user in state and correlation_id)
         token: JWT access token
@@ -202,37 +225,60 @@ async def get_current_user(request: Request, token: str = Depends(get_token_from
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    # Phase 2 Task Group 4: Check idle timeout (Redis session metadata exists)
-    from uuid import UUID
-    session_metadata = session_service.get_session(UUID(user_id), jti)
+    principal_cache = get_principal_cache()
+    user = principal_cache.get(jti, user_id)
+
+    if user is not None:
+        # Fast path: token fully validated within AUTH_CACHE_TTL_SECONDS and
+        # not revoked since (blacklist/logout invalidate the cache). When an
+        # activity write is due it doubles as the idle-timeout check.
+        if not session_service.update_activity(user.user_id, jti):
+            principal_cache.invalidate(jti=jti)
+            logger.warning(
+                f"Session not found or expired (idle timeout) for user {user_id}",
+                extra={"correlation_id": correlation_id}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session expired. Please log in again.",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+    else:
+        # Phase 2 Task Group 4: Check idle timeout (Redis session metadata exists)
+        session_metadata = session_service.get_session(UUID(user_id), jti)
+
+        if not session_metadata:
+            logger.warning(
+                f"Session not found or expired (idle timeout) for user {user_id}",
+                extra={"correlation_id": correlation_id}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session expired. Please log in again.",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+        # Get user (includes blacklist check)
+        user = auth_middleware.auth_service.get_current_user(token, correlation_id)
 
-    if not session_metadata:
-        logger.warning(
-            f"Session not found or expired (idle timeout) for user {user_id}",
-            extra={"correlation_id": correlation_id}
-        )
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Session expired. Please log in again.",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+        if not user:
+            logger.warning(
+                "Invalid or expired token",
+                extra={"correlation_id": correlation_id}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
 
-    # Get user (includes blacklist check)
-    user = auth_middleware.auth_service.get_current_user(token, correlation_id)
+        # Phase 2 Task Group 4: Update session activity (reset idle timer)
+        session_service.update_activity(user.user_id, jti, force=True)
 
-    if not user:
-        logger.warning(
-            "Invalid or expired token",
-            extra={"correlation_id": correlation_id}
-        )
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+        principal_cache.put(jti, user, payload.get("exp"))
 
-    # Phase 2 Task Group 4: Update session activity (reset idle timer)
-    session_service.update_activity(user.user_id, jti)
+    # Share the user row with RBAC / ownership checks in this request
+    set_request_cached(("user", user.user_id), user)
 
     # Store user in request state for rate limiting middleware
     request.state.user = user
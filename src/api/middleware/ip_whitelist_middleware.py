@@ -10,16 +10,20 @@ Phase 2 - Task Group 5: IP-Based Access Controls
 from typing import List, Optional
 from ipaddress import ip_address, ip_network, AddressValueError
 from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp
 
 from src.config.settings import get_settings
 from src.observability import get_logger
+from src.observability.asgi_pipeline import MiddlewarePipeline, PipelineStage, RequestContext
 from src.observability.audit_logger import AuditLogger
 
 
 logger = get_logger("ip_whitelist_middleware")
 settings = get_settings()
 
+ADMIN_PATH_PREFIX = "/api/v1/admin"
+
 
 def get_client_ip(request: Request) -> str:
     """
@@ -194,7 +198,7 @@ async def check_ip_whitelist(request: Request):
         HTTPException: 403 if IP is not whitelisted for admin endpoint
     """
     # Only check admin endpoints
-    if not request.url.path.startswith("/api/v1/admin"):
+    if not request.url.path.startswith(ADMIN_PATH_PREFIX):
         return
 
     # Get client IP
@@ -240,7 +244,27 @@ async def check_ip_whitelist(request: Request):
         )
 
 
-class IPWhitelistHTTPMiddleware(BaseHTTPMiddleware):
+class IPWhitelistStage(PipelineStage):
+    """
+    Pipeline stage for IP whitelist checking on admin endpoints.
+
+    Rejected requests get the same 403 body check_ip_whitelist produces.
+    """
+
+    async def on_request(self, ctx: RequestContext) -> Optional[Response]:
+        """Check IP whitelist for admin endpoints."""
+        if not ctx.path.startswith(ADMIN_PATH_PREFIX):
+            return None
+
+        try:
+            await check_ip_whitelist(ctx.request)
+        except HTTPException as e:
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return None
+
+
+class IPWhitelistHTTPMiddleware(MiddlewarePipeline):
     """
     HTTP middleware wrapper for IP whitelist checking.
 
@@ -248,11 +272,5 @@ class IPWhitelistHTTPMiddleware(BaseHTTPMiddleware):
         app.add_middleware(IPWhitelistHTTPMiddleware)
     """
 
-    async def dispatch(self, request: Request, call_next):
-        """Process request and check IP whitelist for admin endpoints."""
-        # Check IP whitelist (raises HTTPException if blocked)
-        await check_ip_whitelist(request)
-
-        # Continue to next middleware/endpoint
-        response = await call_next(request)
-        return response
+    def __init__(self, app: ASGIApp):
+        super().__init__(app, [IPWhitelistStage()])
@@ -22,6 +22,7 @@ from src.models.conversation import Conversation
 from src.models.user import User
 from src.config.database import get_db_context
 from src.services.permission_service import PermissionService
+from src.services.request_cache import set_request_cached
 from src.observability import get_logger
 from src.observability.audit_logger import audit_logger
 
@@ -135,6 +136,9 @@ def require_resource_ownership(resource_type: str) -> Callable:
                         detail=f"{resource_type.capitalize()} not found"
                     )
 
+            # PermissionService ownership checks reuse this lookup
+            set_request_cached(("conversation_owner", conversation_id), conversation.user_id)
+
             # Check permissions using PermissionService
             permission_service = PermissionService()
             has_permission = permission_service.user_can_access_conversation(
@@ -0,0 +1,245 @@
+"""
+Rate Limit Engine
+
+Atomic sliding-window rate limiting over an async Redis connection pool.
+
+The whole check (trim window → count → admit → expire) runs in one Lua
+script, so concurrent requests cannot both pass a limit that only one of
+them fits in, and each check costs a single round-trip (EVALSHA) that does
+not block the event loop.
+
+Optional local token bucket:
+    Users far below their limit are admitted in-process from a small token
+    allowance granted by the last Redis sync. Locally admitted requests are
+    recorded in Redis in batches on the next sync. Tokens are only handed
+    out from a fraction (`local_fraction`) of the remaining window capacity
+    and expire after `max_staleness` seconds, which bounds the overshoot
+    when several app instances share a limit.
+"""
+
+import itertools
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from src.observability import get_logger
+
+logger = get_logger("rate_limit_engine")
+
+# KEYS[1] = rate limit key
+# ARGV = window_seconds, limit, ttl_seconds, member_prefix, pending
+# Records `pending` locally-admitted requests unconditionally, then checks
+# and (if allowed) records the current request.
+# Returns {allowed, count_after, reset_timestamp}
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local prefix = ARGV[4]
+local pending = tonumber(ARGV[5])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+
+for i = 1, pending do
+    redis.call('ZADD', key, now, prefix .. ':p' .. i)
+end
+
+local count = redis.call('ZCARD', key)
+local allowed = 0
+local reset = math.floor(now) + window
+
+if count < limit then
+    redis.call('ZADD', key, now, prefix)
+    count = count + 1
+    allowed = 1
+else
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    if oldest[2] then
+        reset = math.floor(tonumber(oldest[2])) + window
+    end
+end
+
+redis.call('EXPIRE', key, ttl)
+return {allowed, count, reset}
+"""
+
+
+@dataclass
+class _LocalBucket:
+    """In-process token allowance for one rate limit key."""
+    tokens: int = 0
+    pending: int = 0  # admitted locally, not yet recorded in Redis
+    known_count: int = 0  # window count at last sync
+    synced_at: float = 0.0
+    reset_time: int = 0
+
+
+class SlidingWindowRateLimiter:
+    """
+    Redis sliding-window rate limiter with an optional local token bucket.
+
+    Fails open: if Redis errors, requests are allowed and Redis is retried
+    after `retry_after_error` seconds.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        window_seconds: int = 60,
+        ttl_seconds: int = 120,
+        local_fraction: float = 0.5,
+        max_local_batch: int = 20,
+        max_staleness: float = 1.0,
+        retry_after_error: float = 30.0,
+        max_local_keys: int = 10000,
+    ):
+        """
+        Args:
+            redis_client: Async Redis client (its connection pool is shared)
+            window_seconds: Sliding window length
+            ttl_seconds: Expiry of the per-key sorted set
+            local_fraction: Share of remaining capacity handed out as local
+                tokens (0 disables the local bucket)
+            max_local_batch: Max requests admitted locally between syncs
+            max_staleness: Max seconds local tokens stay valid
+            retry_after_error: Seconds to bypass Redis after a failure
+            max_local_keys: Local bucket entries kept before pruning
+        """
+        self.redis = redis_client
+        self.window_seconds = window_seconds
+        self.ttl_seconds = ttl_seconds
+        self.local_fraction = local_fraction
+        self.max_local_batch = max_local_batch
+        self.max_staleness = max_staleness
+        self.retry_after_error = retry_after_error
+        self.max_local_keys = max_local_keys
+
+        self._script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+        self._buckets: Dict[str, _LocalBucket] = {}
+        self._member_prefix = uuid.uuid4().hex[:12]
+        self._member_counter = itertools.count()
+        self._unavailable_until = 0.0
+
+        # Stats
+        self.local_hits = 0
+        self.redis_checks = 0
+
+    async def check(self, identifier: str, limit: int) -> Tuple[bool, int, int]:
+        """
+        Check and record one request.
+
+        Args:
+            identifier: User identifier (e.g. "user:<id>", "ip:<addr>")
+            limit: Requests allowed per window
+
+        Returns:
+            Tuple of (allowed, remaining_requests, reset_timestamp)
+        """
+        now = time.time()
+        key = f"rate_limit:{identifier}"
+
+        bucket = self._buckets.get(key)
+        if bucket and bucket.tokens > 0 and now - bucket.synced_at < self.max_staleness:
+            bucket.tokens -= 1
+            bucket.pending += 1
+            self.local_hits += 1
+            remaining = limit - bucket.known_count - bucket.pending
+            return True, max(0, remaining), bucket.reset_time
+
+        if now < self._unavailable_until:
+            return True, limit, int(now) + self.window_seconds
+
+        # Take ownership of the pending batch before awaiting: concurrent
+        # requests for the same key must not record it twice.
+        pending = bucket.pending if bucket else 0
+        if bucket:
+            bucket.pending = 0
+            bucket.tokens = 0
+
+        try:
+            self.redis_checks += 1
+            allowed, count, reset_time = await self._script(
+                keys=[key],
+                args=[
+                    self.window_seconds,
+                    limit,
+                    self.ttl_seconds,
+                    f"{self._member_prefix}:{next(self._member_counter)}",
+                    pending,
+                ],
+            )
+        except Exception as e:
+            logger.error(f"Rate limit check failed: {str(e)}")
+            self._unavailable_until = now + self.retry_after_error
+            # On error, allow request (fail open)
+            return True, limit, int(now) + self.window_seconds
+
+        allowed, count, reset_time = bool(int(allowed)), int(count), int(reset_time)
+        self._grant_local_tokens(key, limit, count, reset_time, now)
+        return allowed, max(0, limit - count), reset_time
+
+    def _grant_local_tokens(self, key: str, limit: int, count: int, reset_time: int, now: float) -> None:
+        """Hand out local tokens from a fraction of the remaining capacity."""
+        if self.local_fraction <= 0:
+            return
+
+        tokens = min(self.max_local_batch, int((limit - count) * self.local_fraction))
+        if tokens <= 0:
+            bucket = self._buckets.get(key)
+            if bucket and not bucket.pending:
+                del self._buckets[key]
+            elif bucket:
+                bucket.tokens = 0
+            return
+
+        if len(self._buckets) >= self.max_local_keys and key not in self._buckets:
+            self._prune(now)
+
+        bucket = self._buckets.setdefault(key, _LocalBucket())
+        bucket.tokens = tokens
+        bucket.known_count = count
+        bucket.synced_at = now
+        bucket.reset_time = reset_time
+
+    def _prune(self, now: float) -> None:
+        """Drop stale buckets; pending requests of dropped buckets are lost (bounded by max_local_batch)."""
+        stale = [
+            key for key, bucket in self._buckets.items()
+            if now - bucket.synced_at >= self.max_staleness
+        ]
+        for key in stale:
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_local_keys:
+            self._buckets.clear()
+
+
+def create_rate_limit_redis_pool(
+    host: str,
+    port: int,
+    password: Optional[str] = None,
+    max_connections: int = 50,
+) -> aioredis.Redis:
+    """
+    Async Redis client backed by a bounded connection pool.
+
+    Connection is lazy: nothing is contacted until the first check. When all
+    connections are busy, callers wait up to socket_timeout for a free one.
+    """
+    pool = aioredis.BlockingConnectionPool(
+        host=host,
+        port=port,
+        password=password,
+        decode_responses=True,
+        socket_timeout=1,
+        socket_connect_timeout=1,
+        max_connections=max_connections,
+        timeout=1,
+    )
+    return aioredis.Redis(connection_pool=pool)
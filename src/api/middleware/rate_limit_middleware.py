@@ -6,7 +6,8 @@ Updated for Phase 1 Critical Security Vulnerabilities - Group 5: API Security La
 
 Features:
 - Redis-backed distributed rate limiting
-- Sliding window rate limiting algorithm
+- Sliding window rate limiting algorithm (atomic Lua script, async pool)
+- Local token bucket short-circuits users far below their limit
 - Per-IP rate limits for anonymous users: 30 req/min global, 10 req/min auth endpoints
 - Per-user rate limits for authenticated users: 100 req/min global, 20 req/min auth endpoints
 - Rate limit headers in all responses
@@ -15,13 +16,19 @@ Features:
 
 import time
 from typing import Optional, Tuple
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from fastapi import status
+from starlette.datastructures import MutableHeaders
 from starlette.responses import Response, JSONResponse
-import redis
+from starlette.types import ASGIApp
+import redis.asyncio as aioredis
 
+from src.api.middleware.rate_limit_engine import (
+    SlidingWindowRateLimiter,
+    create_rate_limit_redis_pool,
+)
 from src.config.settings import get_settings
 from src.observability import get_logger
+from src.observability.asgi_pipeline import MiddlewarePipeline, PipelineStage, RequestContext
 
 logger = get_logger("rate_limit_middleware")
 
@@ -52,9 +59,21 @@ else:
 REDIS_TTL = 120
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+# Paths that are never rate limited (health checks, docs, static files)
+SKIP_RATE_LIMIT_PREFIXES = (
+    "/health",
+    "/api/v1/health",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/static",
+    "/assets",
+)
+
+
+class RateLimitStage(PipelineStage):
     """
-    Rate limiting middleware using Redis sliding window algorithm.
+    Rate limiting stage using Redis sliding window algorithm.
 
     Applies different rate limits based on:
     - Authentication status (anonymous vs authenticated)
@@ -66,56 +85,56 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     - X-RateLimit-Reset: Unix timestamp when limit resets
     """
 
-    def __init__(self, app, redis_client: Optional[redis.Redis] = None):
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        local_bucket_fraction: float = 0.5
+    ):
         """
-        Initialize rate limit middleware.
+        Initialize rate limit stage.
 
         Args:
-            app: FastAPI application
-            redis_client: Optional Redis client (creates new one if None)
+            redis_client: Optional async Redis client (creates a pooled one if None)
+            local_bucket_fraction: Share of remaining capacity admitted in-process
+                between Redis syncs (0 = check Redis on every request)
         """
-        super().__init__(app)
-
         if redis_client:
             self.redis = redis_client
         else:
             try:
-                self.redis = redis.Redis(
+                # Lazy pool: unreachable Redis is detected on first check (fail open)
+                self.redis = create_rate_limit_redis_pool(
                     host=settings.REDIS_HOST,
                     port=settings.REDIS_PORT,
                     password=settings.REDIS_PASSWORD,
-                    decode_responses=True,
-                    socket_timeout=1,
-                    socket_connect_timeout=1
                 )
-                # Test connection
-                self.redis.ping()
-                logger.info(f"Rate limiter connected to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+                logger.info(f"Rate limiter using Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}")
             except Exception as e:
                 logger.warning(f"Redis not available for rate limiting: {str(e)}")
                 self.redis = None
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        """
-        Process request and apply rate limiting.
+        self.limiter = (
+            SlidingWindowRateLimiter(self.redis, ttl_seconds=REDIS_TTL, local_fraction=local_bucket_fraction)
+            if self.redis else None
+        )
 
-        Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint
+    async def on_request(self, ctx: RequestContext) -> Optional[Response]:
+        """
+        Apply rate limiting.
 
         Returns:
-            Response with rate limit headers
+            429 response if the limit is exceeded, None otherwise
         """
         # Skip rate limiting for certain paths
-        if self._should_skip_rate_limit(request.url.path):
-            return await call_next(request)
+        if self._should_skip_rate_limit(ctx.path):
+            return None
 
         # Get user identifier and rate limit
-        user_id, rate_limit = await self._get_user_and_limit(request)
+        user_id, rate_limit = self._get_user_and_limit(ctx)
 
         # Check rate limit if Redis is available
-        if self.redis:
-            allowed, remaining, reset_time = self._check_rate_limit(user_id, rate_limit)
+        if self.limiter:
+            allowed, remaining, reset_time = await self._check_rate_limit(user_id, rate_limit)
 
             if not allowed:
                 logger.warning(f"Rate limit exceeded for {user_id}")
@@ -135,19 +154,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     }
                 )
         else:
-            # Redis not available - allow request but log warning
+            # Redis not available - allow request
             remaining = rate_limit
             reset_time = int(time.time()) + 60
 
-        # Process request
-        response = await call_next(request)
+        ctx.values["rate_limit"] = (rate_limit, remaining, reset_time)
+        return None
 
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = str(rate_limit)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, remaining - 1))
-        response.headers["X-RateLimit-Reset"] = str(reset_time)
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        rate_limit_info = ctx.values.get("rate_limit")
+        if rate_limit_info is None:
+            return
 
-        return response
+        # Add rate limit headers to response
+        rate_limit, remaining, reset_time = rate_limit_info
+        headers["X-RateLimit-Limit"] = str(rate_limit)
+        headers["X-RateLimit-Remaining"] = str(max(0, remaining))
+        headers["X-RateLimit-Reset"] = str(reset_time)
 
     def _should_skip_rate_limit(self, path: str) -> bool:
         """
@@ -159,38 +182,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             True if should skip rate limiting
         """
-        # Skip health checks and static files
-        skip_paths = [
-            "/health",
-            "/api/v1/health",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/static",
-            "/assets"
-        ]
-
-        for skip_path in skip_paths:
-            if path.startswith(skip_path):
-                return True
-
-        return False
-
-    async def _get_user_and_limit(self, request: Request) -> Tuple[str, int]:
+        return path.startswith(SKIP_RATE_LIMIT_PREFIXES)
+
+    def _get_user_and_limit(self, ctx: RequestContext) -> Tuple[str, int]:
         """
         Get user identifier and their rate limit.
 
         Args:
-            request: Incoming request
+            ctx: Pipeline request context
 
         Returns:
             Tuple of (user_identifier, rate_limit_per_minute)
         """
         # Try to get user from request state (set by auth middleware)
-        user = getattr(request.state, "user", None)
+        user = ctx.state.get("user")
 
         # Check if this is an auth endpoint
-        is_auth_endpoint = "/auth/" in request.url.path
+        is_auth_endpoint = "/auth/" in ctx.path
 
         if user:
             # Authenticated user
@@ -203,7 +211,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 rate_limit = AUTHENTICATED_GLOBAL_LIMIT
         else:
             # Unauthenticated - use IP address with lower limit
-            client_ip = request.client.host if request.client else "unknown"
+            client_ip = ctx.client_host or "unknown"
             user_id = f"ip:{client_ip}"
 
             # Apply different limits for auth endpoints
@@ -214,7 +222,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return user_id, rate_limit
 
-    def _check_rate_limit(self, user_id: str, rate_limit: int) -> Tuple[bool, int, int]:
+    async def _check_rate_limit(self, user_id: str, rate_limit: int) -> Tuple[bool, int, int]:
         """
         Check if request is within rate limit using sliding window.
 
@@ -225,47 +233,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             Tuple of (allowed, remaining_requests, reset_timestamp)
         """
-        now = time.time()
-        window_start = now - 60  # 60 second window
+        return await self.limiter.check(user_id, rate_limit)
 
-        # Redis key for this user's requests
-        key = f"rate_limit:{user_id}"
 
-        try:
-            # Remove old requests outside the sliding window
-            self.redis.zremrangebyscore(key, 0, window_start)
-
-            # Count requests in current window
-            request_count = self.redis.zcard(key)
-
-            # Check if under limit
-            if request_count < rate_limit:
-                # Add current request
-                self.redis.zadd(key, {str(now): now})
-
-                # Set expiry on key (2 minutes to be safe)
-                self.redis.expire(key, REDIS_TTL)
+class RateLimitMiddleware(MiddlewarePipeline):
+    """
+    Standalone rate limiting middleware (single-stage pipeline).
+    """
 
-                remaining = rate_limit - request_count - 1
-                reset_time = int(now) + 60
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis_client: Optional[aioredis.Redis] = None,
+        local_bucket_fraction: float = 0.5
+    ):
+        """
+        Initialize rate limit middleware.
 
-                return True, remaining, reset_time
-            else:
-                # Over limit
-                # Calculate when oldest request will expire
-                oldest_requests = self.redis.zrange(key, 0, 0, withscores=True)
-                if oldest_requests:
-                    oldest_time = oldest_requests[0][1]
-                    reset_time = int(oldest_time) + 60
-                else:
-                    reset_time = int(now) + 60
-
-                return False, 0, reset_time
-
-        except Exception as e:
-            logger.error(f"Rate limit check failed: {str(e)}")
-            # On error, allow request (fail open)
-            return True, rate_limit, int(now) + 60
+        Args:
+            app: ASGI application
+            redis_client: Optional async Redis client (creates a pooled one if None)
+            local_bucket_fraction: See RateLimitStage
+        """
+        self.stage = RateLimitStage(redis_client, local_bucket_fraction)
+        super().__init__(app, [self.stage])
 
 
 def create_rate_limit_middleware(app):
@@ -80,6 +80,21 @@ class CognitiveSettings(BaseSettings):
         le=1.0,
         description="Target pattern reuse rate (30% MVP, 50% final)"
     )
+    pattern_usage_flush_interval: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Seconds between batched usage_count flushes to Qdrant"
+    )
+    pattern_dag_score_ttl: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Seconds a pattern's DAG ranking score is cached (0 disables)"
+    )
+    pattern_embedding_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Query embeddings memoized per (model, text) in PatternBank (0 disables)"
+    )
 
     # CPIE Configuration
     cpie_max_inference_time: int = Field(
@@ -9,8 +9,11 @@ Target Coverage: >90% (TDD approach)
 """
 
 import uuid
+import time
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -24,9 +27,6 @@ from qdrant_client.models import (
     MatchValue,
     SearchRequest,
 )
-from sentence_transformers import SentenceTransformer
-import torch
-from transformers import AutoTokenizer, AutoModel
 
 from src.cognitive.config.settings import settings
 from src.cognitive.signatures.semantic_signature import (
@@ -34,6 +34,13 @@ from src.cognitive.signatures.semantic_signature import (
     compute_semantic_hash,
 )
 from src.cognitive.patterns.pattern_classifier import PatternClassifier
+from src.cognitive.patterns.usage_tracker import PatternUsageTracker
+from src.models.model_registry import (
+    get_model_registry,
+    load_sentence_transformer,
+    load_transformers_model,
+    load_transformers_tokenizer,
+)
 
 # Import DAG synchronizer for execution-based ranking (Milestone 3)
 try:
@@ -43,6 +50,29 @@ try:
 except ImportError:
     DAG_RANKING_AVAILABLE = False
 
+# Neutral DAG ranking score (ranking disabled, pattern not in DAG, or error)
+NEUTRAL_DAG_SCORE = 0.5
+
+# Ranking score and execution stats for a batch of patterns (Milestone 3)
+DAG_RANKING_QUERY = """
+UNWIND $pattern_ids AS pattern_id
+MATCH (p:Pattern {pattern_id: pattern_id})
+OPTIONAL MATCH (t:AtomicTask)-[u:USES_PATTERN]->(p)
+OPTIONAL MATCH (t)-[e:EXECUTED_WITH_METRICS]->(:ExecutionTrace)
+WITH p,
+     coalesce(p.ranking_score, 0.5) AS base_score,
+     collect(DISTINCT {
+         success: e.success,
+         timestamp: e.timestamp,
+         duration_ms: e.duration_ms,
+         memory_mb: e.memory_mb
+     }) AS executions
+RETURN p.pattern_id AS pattern_id,
+       base_score,
+       size(executions) AS execution_count,
+       executions
+"""
+
 # Import DualEmbeddingGenerator for automatic dual embedding generation
 try:
     from src.cognitive.embeddings.dual_embedding_generator import DualEmbeddingGenerator
@@ -83,9 +113,17 @@ class PatternBank:
     - Pattern storage with ≥95% success rate threshold
     - Semantic similarity search (Sentence Transformers embeddings)
     - Hybrid search (vector + metadata filtering)
-    - Usage tracking and metrics
+    - Usage tracking and metrics (buffered, flushed to Qdrant in batches)
     - Auto-evolution through feedback loops
 
+    Searches never write: usage counts go to a PatternUsageTracker and DAG
+    ranking scores for all hits are fetched in one Neo4j query and cached
+    for `pattern_dag_score_ttl` seconds.
+
+    Query embeddings are memoized per (model, text) and computed in batches;
+    hybrid_search_many() embeds several signatures in one forward pass and
+    searches them in one Qdrant batch request.
+
     **Example Usage**:
     ```python
     # Initialize pattern bank
@@ -149,6 +187,9 @@ class PatternBank:
         self.client: Optional[QdrantClient] = None
         self.is_connected = False
 
+        # Buffered usage_count increments (created on connect())
+        self.usage_tracker: Optional[PatternUsageTracker] = None
+
         # Initialize pattern classifier for auto-categorization
         self.classifier = PatternClassifier()
 
@@ -163,6 +204,15 @@ class PatternBank:
                 logger.warning(f"Failed to enable DAG ranking: {e}")
                 self.enable_dag_ranking = False
 
+        # pattern_id -> (score, monotonic expiry)
+        self._dag_score_cache: Dict[str, Tuple[float, float]] = {}
+        self._dag_score_lock = threading.Lock()
+
+        # (model, text) -> embedding (LRU)
+        self._embedding_cache: "OrderedDict[Tuple[str, str], Tuple[float, ...]]" = OrderedDict()
+        self._embedding_cache_size = settings.pattern_embedding_cache_size
+        self._embedding_lock = threading.Lock()
+
         # Dual embeddings (automatic code + semantic embeddings)
         self.enable_dual_embeddings = enable_dual_embeddings and DUAL_EMBEDDINGS_AVAILABLE
         self.dual_generator: Optional[DualEmbeddingGenerator] = None
@@ -174,20 +224,19 @@ class PatternBank:
                 logger.warning(f"Failed to enable dual embeddings: {e}")
                 self.enable_dual_embeddings = False
 
-        # Initialize embedding encoder (fallback if dual embeddings disabled)
+        # Embedding encoder (fallback if dual embeddings disabled), loaded on
+        # first use from the shared model registry
+        self._encoder = None
+        self._tokenizer = None
+        self._model = None
+        registry = get_model_registry()
         if self.use_sentence_transformers:
             # SentenceTransformers wrapper (e.g., all-MiniLM-L6-v2)
-            self.encoder = SentenceTransformer(self.embedding_model_name)
-            self.tokenizer = None
-            self.model = None
+            registry.declare(load_sentence_transformer, self.embedding_model_name)
         else:
             # Direct transformers usage (e.g., GraphCodeBERT)
-            self.tokenizer = AutoTokenizer.from_pretrained(self.embedding_model_name)
-            self.model = AutoModel.from_pretrained(self.embedding_model_name)
-            self.encoder = None
-
-            # Set model to eval mode
-            self.model.eval()
+            registry.declare(load_transformers_tokenizer, self.embedding_model_name)
+            registry.declare(load_transformers_model, self.embedding_model_name)
 
         logger.info(
             f"Initialized PatternBank with collection '{self.collection_name}', "
@@ -196,6 +245,39 @@ class PatternBank:
             f"DualEmbeddings: {self.enable_dual_embeddings})"
         )
 
+    @property
+    def encoder(self):
+        """SentenceTransformer encoder (None unless use_sentence_transformers)."""
+        if self._encoder is None and self.use_sentence_transformers:
+            self._encoder = get_model_registry().get(load_sentence_transformer, self.embedding_model_name)
+        return self._encoder
+
+    @encoder.setter
+    def encoder(self, value) -> None:
+        self._encoder = value
+
+    @property
+    def tokenizer(self):
+        """Transformers tokenizer (None if use_sentence_transformers)."""
+        if self._tokenizer is None and not self.use_sentence_transformers:
+            self._tokenizer = get_model_registry().get(load_transformers_tokenizer, self.embedding_model_name)
+        return self._tokenizer
+
+    @tokenizer.setter
+    def tokenizer(self, value) -> None:
+        self._tokenizer = value
+
+    @property
+    def model(self):
+        """Transformers encoder in eval mode (None if use_sentence_transformers)."""
+        if self._model is None and not self.use_sentence_transformers:
+            self._model = get_model_registry().get(load_transformers_model, self.embedding_model_name)
+        return self._model
+
+    @model.setter
+    def model(self, value) -> None:
+        self._model = value
+
     def connect(self) -> None:
         """
         Connect to Qdrant vector database.
@@ -212,6 +294,15 @@ class PatternBank:
             self.client.get_collections()
             self.is_connected = True
 
+            if self.usage_tracker is not None:
+                self.usage_tracker.stop()
+            self.usage_tracker = PatternUsageTracker(
+                self.client,
+                self.collection_name,
+                flush_interval=settings.pattern_usage_flush_interval,
+            )
+            self.usage_tracker.start()
+
             logger.info(
                 f"Connected to Qdrant at {settings.qdrant_host}:{settings.qdrant_port}"
             )
@@ -220,6 +311,25 @@ class PatternBank:
             logger.error(f"Failed to connect to Qdrant: {e}")
             raise ConnectionError(f"Failed to connect to Qdrant: {e}")
 
+    def close(self) -> None:
+        """
+        Flush pending usage counts, stop the flush thread and close the client.
+
+        Safe to call more than once; connect() can be called again afterwards.
+        """
+        if self.usage_tracker is not None:
+            self.usage_tracker.stop()
+            self.usage_tracker = None
+
+        if self.client is not None:
+            try:
+                self.client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close Qdrant client: {e}")
+            self.client = None
+
+        self.is_connected = False
+
     def create_collection(self) -> None:
         """
         Create Qdrant collection for semantic patterns.
@@ -279,17 +389,67 @@ class PatternBank:
         Returns:
             Embedding vector as list of floats (384-dim for semantic_patterns, 768-dim otherwise)
         """
+        return self._encode_many([text])[0]
+
+    def _encode_many(self, texts: Sequence[str]) -> List[List[float]]:
+        """
+        Generate embedding vectors for several texts.
+
+        Embeddings are memoized per (model, text) in an LRU cache
+        (`pattern_embedding_cache_size` entries); texts not in the cache are
+        encoded together in one batch.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Embedding vectors, in the order of texts
+        """
+        model_key = self._embedding_model_key()
+        embeddings: Dict[str, Tuple[float, ...]] = {}
+
+        with self._embedding_lock:
+            for text in texts:
+                cached = self._embedding_cache.get((model_key, text))
+                if cached is not None:
+                    self._embedding_cache.move_to_end((model_key, text))
+                    embeddings[text] = cached
+
+        missing = list(dict.fromkeys(text for text in texts if text not in embeddings))
+        if missing:
+            computed = self._encode_batch(missing)
+            with self._embedding_lock:
+                for text, vector in zip(missing, computed, strict=True):
+                    vector = tuple(vector)
+                    embeddings[text] = vector
+                    if self._embedding_cache_size > 0:
+                        self._embedding_cache[(model_key, text)] = vector
+                while len(self._embedding_cache) > self._embedding_cache_size:
+                    self._embedding_cache.popitem(last=False)
+
+        return [list(embeddings[text]) for text in texts]
+
+    def _embedding_model_key(self) -> str:
+        """Identifies the model _encode_batch uses (embedding cache key)."""
+        if self.enable_dual_embeddings and self.collection_name == "semantic_patterns":
+            return "dual:semantic"
+        return self.embedding_model_name
+
+    def _encode_batch(self, texts: List[str]) -> List[List[float]]:
+        """Encode texts with one model call (one forward pass for Transformers)."""
         # FIX: Use semantic embedding (384-dim) for semantic_patterns collection
         if self.enable_dual_embeddings and self.collection_name == "semantic_patterns":
             # Use Sentence-BERT for semantic understanding (384-dim)
-            return self.dual_generator._generate_semantic_embedding(text)
+            return [self.dual_generator._generate_semantic_embedding(text) for text in texts]
         elif self.use_sentence_transformers:
             # SentenceTransformers path (legacy)
-            return self.encoder.encode(text).tolist()
+            return self.encoder.encode(list(texts)).tolist()
         else:
             # Direct transformers path (GraphCodeBERT 768-dim)
+            import torch
+
             inputs = self.tokenizer(
-                text,
+                list(texts),
                 return_tensors="pt",
                 padding=True,
                 truncation=True,
@@ -299,7 +459,7 @@ class PatternBank:
             with torch.no_grad():
                 outputs = self.model(**inputs)
                 # Use CLS token (first token) embedding
-                embeddings = outputs.last_hidden_state[:, 0, :].squeeze()
+                embeddings = outputs.last_hidden_state[:, 0, :]
 
             return embeddings.numpy().tolist()
 
@@ -545,8 +705,8 @@ class PatternBank:
                 continue
             patterns.append(pattern)
 
-            # Increment usage count
-            self._increment_usage_count(hit.id)
+        # Buffered usage count increment (flushed in batches)
+        self._record_usage(hit.id for hit in search_result if hit.payload.get("code"))
 
         logger.info(
             f"Found {len(patterns)} patterns for '{signature.purpose[:50]}' "
@@ -827,7 +987,109 @@ class PatternBank:
         query_text = f"{signature.purpose}"
         query_embedding = self._encode(query_text)
 
-        # Build filter for domain and/or production_ready if specified
+        # Search with optional filter
+        search_result = self.client.search(
+            collection_name=self.collection_name,
+            query_vector=query_embedding,
+            query_filter=self._build_search_filter(domain, production_ready),
+            limit=top_k,
+        )
+
+        # DAG ranking scores for all hits in one query (cached)
+        dag_scores: Dict[str, float] = {}
+        if self.enable_dag_ranking:
+            dag_scores = self._get_dag_ranking_scores(
+                hit.payload.get("pattern_id") for hit in search_result
+            )
+
+        patterns = self._score_hybrid_hits(search_result, signature, domain, dag_scores)
+
+        logger.info(
+            f"Hybrid search found {len(patterns)} patterns "
+            f"(domain={domain}, top_k={top_k})"
+        )
+
+        return patterns
+
+    def hybrid_search_many(
+        self,
+        signatures: Sequence[SemanticTaskSignature],
+        domains: Optional[Sequence[Optional[str]]] = None,
+        production_ready: bool = False,
+        top_k: int = 5,
+    ) -> List[List[StoredPattern]]:
+        """
+        Run hybrid_search for several signatures at once.
+
+        All query embeddings are computed in one batched forward pass, the
+        searches go to Qdrant in one batch request and the DAG ranking
+        scores of all hits are fetched in one query. Each result list is
+        the same as hybrid_search() would return for that signature.
+
+        Args:
+            signatures: Query signatures
+            domains: Optional domain filter per signature (same length as signatures)
+            production_ready: If True, only return production-ready patterns
+            top_k: Maximum results per signature
+
+        Returns:
+            List of StoredPattern lists, one per signature (in order)
+
+        Example:
+        ```python
+        config_patterns, db_patterns = bank.hybrid_search_many(
+            [config_signature, db_signature],
+            domains=["configuration", "data_access"],
+            production_ready=True,
+            top_k=10
+        )
+        ```
+        """
+        if not signatures:
+            return []
+        if domains is None:
+            domains = [None] * len(signatures)
+        if len(domains) != len(signatures):
+            raise ValueError("domains must have one entry per signature")
+
+        if not self.is_connected:
+            self.connect()
+
+        query_embeddings = self._encode_many([f"{signature.purpose}" for signature in signatures])
+
+        batch_results = self.client.search_batch(
+            collection_name=self.collection_name,
+            requests=[
+                SearchRequest(
+                    vector=query_embedding,
+                    filter=self._build_search_filter(domain, production_ready),
+                    limit=top_k,
+                    with_payload=True,
+                )
+                for query_embedding, domain in zip(query_embeddings, domains, strict=True)
+            ],
+        )
+
+        dag_scores: Dict[str, float] = {}
+        if self.enable_dag_ranking:
+            dag_scores = self._get_dag_ranking_scores(
+                hit.payload.get("pattern_id") for hits in batch_results for hit in hits
+            )
+
+        results = [
+            self._score_hybrid_hits(hits, signature, domain, dag_scores)
+            for hits, signature, domain in zip(batch_results, signatures, domains, strict=True)
+        ]
+
+        logger.info(
+            f"Hybrid batch search found {sum(len(r) for r in results)} patterns "
+            f"for {len(signatures)} queries (top_k={top_k})"
+        )
+
+        return results
+
+    def _build_search_filter(self, domain: Optional[str], production_ready: bool) -> Optional[Filter]:
+        """Build filter for domain and/or production_ready if specified."""
         filter_conditions = []
         if domain:
             filter_conditions.append(
@@ -838,23 +1100,26 @@ class PatternBank:
                 FieldCondition(key="production_ready", match=MatchValue(value=True))
             )
 
-        search_filter = None
         if filter_conditions:
-            search_filter = Filter(must=filter_conditions)
-
-        # Search with optional filter
-        search_result = self.client.search(
-            collection_name=self.collection_name,
-            query_vector=query_embedding,
-            query_filter=search_filter,
-            limit=top_k,
-        )
+            return Filter(must=filter_conditions)
+        return None
 
+    def _score_hybrid_hits(
+        self,
+        search_result: List[Any],
+        signature: SemanticTaskSignature,
+        domain: Optional[str],
+        dag_scores: Dict[str, float],
+    ) -> List[StoredPattern]:
+        """Convert search hits to StoredPattern sorted by hybrid score."""
         # Convert to StoredPattern with hybrid scoring
         patterns = []
         for hit in search_result:
             vector_score = hit.score
-            metadata_score = self._metadata_score(hit.payload, signature, domain)
+            metadata_score = self._metadata_score(
+                hit.payload, signature, domain,
+                dag_score=dag_scores.get(hit.payload.get("pattern_id")),
+            )
 
             # Hybrid score: 70% vector + 30% metadata
             final_score = 0.7 * vector_score + 0.3 * metadata_score
@@ -866,17 +1131,12 @@ class PatternBank:
             pattern.similarity_score = final_score  # Override with hybrid score
             patterns.append(pattern)
 
-            # Increment usage count
-            self._increment_usage_count(hit.id)
+        # Buffered usage count increment (flushed in batches)
+        self._record_usage(hit.id for hit in search_result if hit.payload.get("code"))
 
         # Sort by hybrid score
         patterns.sort(key=lambda p: p.similarity_score, reverse=True)
 
-        logger.info(
-            f"Hybrid search found {len(patterns)} patterns "
-            f"(domain={domain}, top_k={top_k})"
-        )
-
         return patterns
 
     def _vector_search(
@@ -892,7 +1152,11 @@ class PatternBank:
         return [{"pattern_id": r.id, "score": r.score} for r in results]
 
     def _metadata_score(
-        self, payload: Dict, signature: SemanticTaskSignature, domain: Optional[str]
+        self,
+        payload: Dict,
+        signature: SemanticTaskSignature,
+        domain: Optional[str],
+        dag_score: Optional[float] = None,
     ) -> float:
         """
         Calculate metadata relevance score with optional DAG-based ranking.
@@ -903,6 +1167,12 @@ class PatternBank:
         - Success rate
         - DAG execution success (if enabled) - Milestone 3
 
+        Args:
+            payload: Pattern payload
+            signature: Query signature
+            domain: Optional domain filter
+            dag_score: Prefetched DAG ranking score (looked up if None)
+
         Returns:
             Score in range [0.0, 1.0]
         """
@@ -921,7 +1191,8 @@ class PatternBank:
 
         # DAG execution-based ranking (30%) - Milestone 3
         if self.enable_dag_ranking:
-            dag_score = self._get_dag_ranking_score(payload.get("pattern_id"))
+            if dag_score is None:
+                dag_score = self._get_dag_ranking_score(payload.get("pattern_id"))
             score += 0.3 * dag_score
         else:
             # Fallback: use success_rate again
@@ -930,28 +1201,27 @@ class PatternBank:
         return min(score, 1.0)
 
     def _increment_usage_count(self, pattern_id: str) -> None:
-        """Increment usage count for pattern."""
-        try:
-            # Get current pattern
-            result = self.client.retrieve(
-                collection_name=self.collection_name, ids=[pattern_id]
-            )
+        """Increment usage count for pattern (buffered, see PatternUsageTracker)."""
+        self._record_usage([pattern_id])
 
-            if result:
-                current_count = result[0].payload.get("usage_count", 0)
-                new_count = current_count + 1
-
-                # Update payload
-                self.client.set_payload(
-                    collection_name=self.collection_name,
-                    payload={"usage_count": new_count},
-                    points=[pattern_id],
-                )
+    def _record_usage(self, pattern_ids: Iterable[str]) -> None:
+        """Buffer usage count increments; the tracker flushes them to Qdrant."""
+        try:
+            if self.usage_tracker is not None:
+                self.usage_tracker.record(pattern_ids)
+        except Exception as e:
+            logger.warning(f"Failed to record pattern usage: {e}")
 
-                logger.debug(f"Incremented usage_count for {pattern_id}: {new_count}")
+    def flush_usage_counts(self) -> int:
+        """
+        Write buffered usage counts to Qdrant now.
 
-        except Exception as e:
-            logger.warning(f"Failed to increment usage_count for {pattern_id}: {e}")
+        Returns:
+            Number of patterns updated
+        """
+        if self.usage_tracker is None:
+            return 0
+        return self.usage_tracker.flush()
 
     def _hit_to_stored_pattern(self, hit: Any, similarity_score: float) -> StoredPattern:
         """Convert Qdrant search hit to StoredPattern object."""
@@ -1058,6 +1328,9 @@ class PatternBank:
         if not self.is_connected:
             self.connect()
 
+        # Include buffered usage counts
+        self.flush_usage_counts()
+
         # Get collection info
         collection_info = self.client.get_collection(self.collection_name)
         total_patterns = collection_info.points_count
@@ -1122,101 +1395,130 @@ class PatternBank:
         """
         Get DAG-based ranking score for a pattern (Milestone 3).
 
+        See _get_dag_ranking_scores().
+
+        Returns:
+            Score in range [0.0, 1.0]
+        """
+        if not pattern_id:
+            return NEUTRAL_DAG_SCORE
+        return self._get_dag_ranking_scores([pattern_id]).get(pattern_id, NEUTRAL_DAG_SCORE)
+
+    def _get_dag_ranking_scores(self, pattern_ids: Iterable[Optional[str]]) -> Dict[str, float]:
+        """
+        Get DAG-based ranking scores for several patterns in one query (Milestone 3).
+
+        Scores are cached for `pattern_dag_score_ttl` seconds; only uncached
+        patterns are sent to Neo4j, in a single UNWIND query.
+
         Formula:
         - Base: Pattern's Neo4j ranking_score (0.0-1.0)
         - Boost: Recent successful executions (+0.10 if within 7 days)
         - Penalty: Failed executions (-0.05 per failure in last 10 executions)
         - Efficiency: Resource-efficient executions (+0.03 if <5s and <256MB)
 
+        Args:
+            pattern_ids: Pattern IDs (None entries are ignored)
+
         Returns:
-            Score in range [0.0, 1.0]
+            Dictionary pattern_id -> score in range [0.0, 1.0]
         """
-        if not pattern_id or not self.enable_dag_ranking or not self.neo4j_client:
-            return 0.5  # Neutral score if DAG ranking disabled
+        ids = list(dict.fromkeys(pid for pid in pattern_ids if pid))
+        if not ids:
+            return {}
+
+        if not self.enable_dag_ranking or not self.neo4j_client:
+            return {pid: NEUTRAL_DAG_SCORE for pid in ids}  # Neutral score if DAG ranking disabled
+
+        scores: Dict[str, float] = {}
+        now = time.monotonic()
+        with self._dag_score_lock:
+            for pid in ids:
+                cached = self._dag_score_cache.get(pid)
+                if cached and cached[1] > now:
+                    scores[pid] = cached[0]
+
+        missing = [pid for pid in ids if pid not in scores]
+        if not missing:
+            return scores
 
         try:
             # Ensure Neo4j connection
             if not self.neo4j_client._driver:
                 self.neo4j_client.connect()
 
-            # Query Neo4j for pattern's ranking score and execution stats
-            query = """
-            MATCH (p:Pattern {pattern_id: $pattern_id})
-            OPTIONAL MATCH (t:AtomicTask)-[u:USES_PATTERN]->(p)
-            OPTIONAL MATCH (t)-[e:EXECUTED_WITH_METRICS]->(:ExecutionTrace)
-            WITH p,
-                 coalesce(p.ranking_score, 0.5) AS base_score,
-                 collect(DISTINCT {
-                     success: e.success,
-                     timestamp: e.timestamp,
-                     duration_ms: e.duration_ms,
-                     memory_mb: e.memory_mb
-                 }) AS executions
-            RETURN base_score,
-                   size(executions) AS execution_count,
-                   executions
-            LIMIT 1
-            """
-
-            result = self.neo4j_client._execute_query(query, {"pattern_id": pattern_id})
-
-            if not result:
-                return 0.5  # Pattern not in DAG yet
-
-            data = result[0]
-            base_score = data["base_score"]
-            executions = data.get("executions", [])
-
-            # Filter out empty executions (OPTIONAL MATCH returns nulls)
-            executions = [e for e in executions if e.get("success") is not None]
-
-            if not executions:
-                return base_score  # No execution history, use base score
-
-            # Calculate adjustments
-            adjustment = 0.0
-
-            # Recent success boost (within 7 days)
-            from datetime import datetime, timedelta
-            now_ts = int(datetime.now().timestamp() * 1000)
-            seven_days_ago = now_ts - (7 * 24 * 60 * 60 * 1000)
-
-            recent_successes = [
-                e for e in executions
-                if e.get("success") and e.get("timestamp", 0) > seven_days_ago
-            ]
-            if recent_successes:
-                adjustment += 0.10
-
-            # Failure penalty (last 10 executions)
-            last_10 = sorted(executions, key=lambda e: e.get("timestamp", 0), reverse=True)[:10]
-            failures = sum(1 for e in last_10 if not e.get("success", True))
-            adjustment -= 0.05 * failures
-
-            # Efficiency bonus (fast and low memory)
-            efficient_execs = [
-                e for e in executions
-                if e.get("success") and
-                   e.get("duration_ms", float('inf')) < 5000 and
-                   e.get("memory_mb", float('inf')) < 256
-            ]
-            if efficient_execs and len(efficient_execs) / max(len(executions), 1) > 0.5:
-                adjustment += 0.03
-
-            # Final score
-            final_score = base_score + adjustment
-            final_score = max(0.0, min(1.0, final_score))  # Clamp to [0.0, 1.0]
-
-            logger.debug(
-                f"DAG ranking for {pattern_id}: base={base_score:.3f}, "
-                f"adjustment={adjustment:+.3f}, final={final_score:.3f}"
-            )
+            rows = self.neo4j_client._execute_query(DAG_RANKING_QUERY, {"pattern_ids": missing})
 
-            return final_score
+            fetched = {pid: NEUTRAL_DAG_SCORE for pid in missing}  # Patterns not in DAG yet
+            for row in rows:
+                fetched[row["pattern_id"]] = self._score_dag_executions(
+                    row["pattern_id"], row["base_score"], row.get("executions", [])
+                )
 
         except Exception as e:
-            logger.warning(f"Failed to get DAG ranking for {pattern_id}: {e}")
-            return 0.5  # Fallback to neutral score on error
+            logger.warning(f"Failed to get DAG ranking for {len(missing)} patterns: {e}")
+            # Fallback to neutral score on error (not cached)
+            scores.update({pid: NEUTRAL_DAG_SCORE for pid in missing})
+            return scores
+
+        ttl = settings.pattern_dag_score_ttl
+        if ttl > 0:
+            expires_at = time.monotonic() + ttl
+            with self._dag_score_lock:
+                for pid, score in fetched.items():
+                    self._dag_score_cache[pid] = (score, expires_at)
+
+        scores.update(fetched)
+        return scores
+
+    @staticmethod
+    def _score_dag_executions(pattern_id: str, base_score: float, executions: List[Dict]) -> float:
+        """Apply execution-history adjustments to a pattern's base ranking score."""
+        # Filter out empty executions (OPTIONAL MATCH returns nulls)
+        executions = [e for e in executions if e.get("success") is not None]
+
+        if not executions:
+            return base_score  # No execution history, use base score
+
+        # Calculate adjustments
+        adjustment = 0.0
+
+        # Recent success boost (within 7 days)
+        now_ts = int(datetime.now().timestamp() * 1000)
+        seven_days_ago = now_ts - (7 * 24 * 60 * 60 * 1000)
+
+        recent_successes = [
+            e for e in executions
+            if e.get("success") and e.get("timestamp", 0) > seven_days_ago
+        ]
+        if recent_successes:
+            adjustment += 0.10
+
+        # Failure penalty (last 10 executions)
+        last_10 = sorted(executions, key=lambda e: e.get("timestamp", 0), reverse=True)[:10]
+        failures = sum(1 for e in last_10 if not e.get("success", True))
+        adjustment -= 0.05 * failures
+
+        # Efficiency bonus (fast and low memory)
+        efficient_execs = [
+            e for e in executions
+            if e.get("success") and
+               e.get("duration_ms", float('inf')) < 5000 and
+               e.get("memory_mb", float('inf')) < 256
+        ]
+        if efficient_execs and len(efficient_execs) / max(len(executions), 1) > 0.5:
+            adjustment += 0.03
+
+        # Final score
+        final_score = base_score + adjustment
+        final_score = max(0.0, min(1.0, final_score))  # Clamp to [0.0, 1.0]
+
+        logger.debug(
+            f"DAG ranking for {pattern_id}: base={base_score:.3f}, "
+            f"adjustment={adjustment:+.3f}, final={final_score:.3f}"
+        )
+
+        return final_score
 
     def _calculate_production_readiness_score(
         self,
@@ -12,7 +12,7 @@ Date: 2025-11-20
 Spec: agent-os/specs/2025-11-20-devmatrix-improvements-minimal/spec.md (lines 2071-2431)
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Production Pattern Categories
 # Each category defines production-ready patterns with success thresholds and metadata
@@ -251,6 +251,64 @@ def get_composition_order() -> List[str]:
     return [category_name for category_name, _ in sorted_categories]
 
 
+def get_category_dependencies() -> Dict[str, List[str]]:
+    """
+    Get the category dependency graph used for composition.
+
+    A category lists in its optional "depends_on" field the categories whose
+    composed files it reads. Categories compose from the spec/IR alone, so
+    none declares dependencies today and all of them can run concurrently.
+
+    Returns:
+        Dictionary mapping category name to the categories it depends on
+    """
+    return {
+        category_name: list(config.get("depends_on", []))
+        for category_name, config in PRODUCTION_PATTERN_CATEGORIES.items()
+    }
+
+
+def get_composition_waves(categories: Optional[List[str]] = None) -> List[List[str]]:
+    """
+    Group categories into waves that can be composed concurrently.
+
+    Every category runs in a wave after all of its dependencies. Within a
+    wave, categories keep composition order (get_composition_order()).
+
+    Args:
+        categories: Categories to schedule (default: all, in composition order);
+            dependencies outside this list are ignored
+
+    Returns:
+        List of waves, each a list of category names
+
+    Raises:
+        ValueError: If the dependency graph has a cycle
+    """
+    if categories is None:
+        categories = get_composition_order()
+
+    dependencies = get_category_dependencies()
+    selected = set(categories)
+    pending = {
+        category: {dep for dep in dependencies.get(category, []) if dep in selected}
+        for category in categories
+    }
+
+    waves: List[List[str]] = []
+    done: set = set()
+    while pending:
+        wave = [category for category in categories if category in pending and pending[category] <= done]
+        if not wave:
+            raise ValueError(f"Cyclic category dependencies: {sorted(pending)}")
+        waves.append(wave)
+        done.update(wave)
+        for category in wave:
+            del pending[category]
+
+    return waves
+
+
 def validate_category_config() -> bool:
     """
     Validate production pattern category configuration.
@@ -260,6 +318,7 @@ def validate_category_config() -> bool:
     - Success thresholds are valid (0.0-1.0)
     - Priorities are sequential
     - Domains are valid
+    - Dependencies reference known categories and are acyclic
 
     Returns:
         True if valid, raises ValueError otherwise
@@ -305,6 +364,15 @@ def validate_category_config() -> bool:
                 f"Category '{category_name}' has empty patterns list"
             )
 
+        # Validate dependencies
+        for dependency in config.get("depends_on", []):
+            if dependency not in PRODUCTION_PATTERN_CATEGORIES:
+                raise ValueError(
+                    f"Category '{category_name}' depends on unknown category: {dependency}"
+                )
+
+    get_composition_waves()  # Raises on cycles
+
     return True
 
 
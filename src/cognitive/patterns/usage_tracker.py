@@ -0,0 +1,147 @@
+"""
+Pattern Usage Tracker
+
+Keeps pattern search off the write path. Searches record hits in an
+in-memory counter map; a background timer flushes the accumulated deltas
+to Qdrant's `usage_count` payload:
+
+- One batched `retrieve` for the current counts of every pending pattern
+- One `batch_update_points` with a SetPayload operation per pattern
+
+Concurrent searches in one process only touch the counter map (under a
+lock), so increments are never lost to interleaved read-modify-write calls.
+Qdrant has no atomic increment, so separate processes flushing the same
+pattern at the same moment can still overwrite each other; with a flush
+every `flush_interval` seconds that window is small and usage_count is a
+ranking signal, not an invariant.
+
+Failed flushes put the deltas back and are retried on the next tick.
+"""
+
+import atexit
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+from qdrant_client.models import SetPayload, SetPayloadOperation
+
+logger = logging.getLogger(__name__)
+
+
+class PatternUsageTracker:
+    """
+    Buffered usage_count increments for a Qdrant pattern collection.
+
+    Example:
+        >>> tracker = PatternUsageTracker(client, "semantic_patterns", flush_interval=30)
+        >>> tracker.start()
+        >>> tracker.record(["pat_1", "pat_2"])  # in-memory only
+        >>> tracker.flush()  # or wait for the timer
+        2
+    """
+
+    def __init__(self, client: Any, collection_name: str, flush_interval: float = 30.0):
+        """
+        Args:
+            client: QdrantClient
+            collection_name: Collection holding the patterns
+            flush_interval: Seconds between background flushes
+        """
+        self.client = client
+        self.collection_name = collection_name
+        self.flush_interval = flush_interval
+
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # one flush at a time
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._atexit_registered = False
+
+    def record(self, pattern_ids: Iterable[Any]) -> None:
+        """Count one use of each pattern (no I/O)."""
+        with self._lock:
+            self._pending.update(pattern_ids)
+
+    def pending(self) -> Dict[Any, int]:
+        """Snapshot of unflushed increments."""
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write pending increments to Qdrant.
+
+        Returns:
+            Number of patterns updated
+        """
+        with self._flush_lock:
+            with self._lock:
+                deltas = self._pending
+                self._pending = Counter()
+
+            if not deltas:
+                return 0
+
+            try:
+                points = self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=list(deltas),
+                    with_payload=["usage_count"],
+                    with_vectors=False,
+                )
+
+                operations = [
+                    SetPayloadOperation(
+                        set_payload=SetPayload(
+                            payload={"usage_count": (point.payload or {}).get("usage_count", 0) + deltas[point.id]},
+                            points=[point.id],
+                        )
+                    )
+                    for point in points
+                    if point.id in deltas
+                ]
+
+                if operations:
+                    self.client.batch_update_points(
+                        collection_name=self.collection_name,
+                        update_operations=operations,
+                    )
+
+                logger.debug(f"Flushed usage_count for {len(operations)} patterns")
+                return len(operations)
+
+            except Exception as e:
+                logger.warning(f"Failed to flush usage_count for {len(deltas)} patterns: {e}")
+                with self._lock:
+                    self._pending.update(deltas)
+                return 0
+
+    def start(self) -> None:
+        """Start the background flush timer (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pattern-usage-flush", daemon=True)
+        self._thread.start()
+
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+    def stop(self) -> None:
+        """Stop the timer and flush what is left."""
+        self._stop.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval)
+        self.flush()
+
+        if self._atexit_registered:
+            atexit.unregister(self.stop)  # Don't keep stopped trackers alive until exit
+            self._atexit_registered = False
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
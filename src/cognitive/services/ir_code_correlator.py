@@ -7,9 +7,12 @@ to identify patterns that consistently produce failing code.
 Reference: DOCS/mvp/exit/learning/LEARNING_GAPS_IMPLEMENTATION_PLAN.md Gap 5
 """
 import logging
+import re
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from neo4j import GraphDatabase
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,7 @@ class EntityCorrelation:
     has_enums: bool = False
     has_json_fields: bool = False
     failure_types: List[str] = field(default_factory=list)
+    failure_histogram: Dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -44,6 +48,7 @@ class EndpointCorrelation:
     has_path_params: bool = False
     has_query_params: bool = False
     failure_types: List[str] = field(default_factory=list)
+    failure_histogram: Dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -70,6 +75,107 @@ class IRCorrelationReport:
     summary: Dict[str, Any] = field(default_factory=dict)
 
 
+# =============================================================================
+# Smoke Result Index
+# =============================================================================
+
+_HTTP_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+_PATH_PARAM_RE = re.compile(r"\{[^}]+\}")
+PATH_PREFIXES = {"api", "v1", "v2"}  # Path segments that never name an entity
+_MAX_FAILURE_TYPES = 5
+
+
+def normalize_entity_key(name: str) -> str:
+    """Normalize entity names and path segments to one key (OrderItem ≈ /order-items)."""
+    key = re.sub(r"[^a-z0-9]", "", name.lower())
+    if key.endswith("ies") and len(key) > 3:
+        return key[:-3] + "y"
+    if key.endswith("s") and not key.endswith("ss"):
+        return key[:-1]
+    return key
+
+
+def endpoint_key(method: str, path: str) -> Tuple[str, str]:
+    """Normalize (method, path) so /products/{id} ≈ /products/{product_id}."""
+    normalized = _PATH_PARAM_RE.sub("{}", path.strip().lower()).rstrip("/") or "/"
+    return method.upper(), normalized
+
+
+@dataclass
+class _ResultStats:
+    """Pass/fail counts and failure types collected for one index key."""
+    passes: int = 0
+    failures: int = 0
+    failure_types: Counter = field(default_factory=Counter)
+
+    def pass_rate(self) -> float:
+        total = self.passes + self.failures
+        return self.passes / total if total else 1.0  # No data = assume OK
+
+
+class SmokeResultIndex:
+    """
+    Single-pass index of smoke results by entity and by (method, path).
+
+    Each violation / passed scenario is parsed once. Its endpoint is read from
+    "method" + "endpoint"/"path", or from an "endpoint" string such as
+    "GET /products/{id}". Entity keys come from an explicit "entity" field
+    and from the static segments of the path.
+    """
+
+    def __init__(self, smoke_results: Dict[str, Any]):
+        self._by_entity: Dict[str, _ResultStats] = {}
+        self._by_endpoint: Dict[Tuple[str, str], _ResultStats] = {}
+
+        for violation in smoke_results.get("violations", []) or []:
+            self._add(violation, passed=False)
+        for scenario in smoke_results.get("passed_scenarios", []) or []:
+            self._add(scenario, passed=True)
+
+    def _add(self, result: Any, passed: bool) -> None:
+        if not isinstance(result, dict):
+            return
+
+        method, path = self._parse_endpoint(result)
+        entity_keys = set()
+        if result.get("entity"):
+            entity_keys.add(normalize_entity_key(str(result["entity"])))
+        if path:
+            for segment in path.strip("/").split("/"):
+                if segment and not segment.startswith("{") and segment.lower() not in PATH_PREFIXES:
+                    entity_keys.add(normalize_entity_key(segment))
+
+        buckets = [self._by_entity.setdefault(key, _ResultStats()) for key in entity_keys]
+        if method and path:
+            buckets.append(self._by_endpoint.setdefault(endpoint_key(method, path), _ResultStats()))
+
+        error_type = result.get("error_type", result.get("type", "unknown"))
+        for stats in buckets:
+            if passed:
+                stats.passes += 1
+            else:
+                stats.failures += 1
+                stats.failure_types[error_type] += 1
+
+    @staticmethod
+    def _parse_endpoint(result: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        endpoint = str(result.get("endpoint") or result.get("path") or "").strip()
+        method = str(result.get("method") or "").upper() or None
+
+        parts = endpoint.split(maxsplit=1)
+        if len(parts) == 2 and parts[0].upper() in _HTTP_METHODS:
+            method = method or parts[0].upper()
+            endpoint = parts[1]
+
+        return method, (endpoint or None)
+
+    def entity_stats(self, entity_name: str) -> _ResultStats:
+        return self._by_entity.get(normalize_entity_key(entity_name), _ResultStats())
+
+    def endpoint_stats(self, method: str, path: str) -> _ResultStats:
+        return self._by_endpoint.get(endpoint_key(method, path), _ResultStats())
+
+
 # =============================================================================
 # IR Code Correlator Service
 # =============================================================================
@@ -102,11 +208,40 @@ class IRCodeCorrelator:
 
         self.logger = logging.getLogger(f"{__name__}.IRCodeCorrelator")
 
+        # Single background writer keeps Neo4j persistence off the analysis path
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Future] = []
+
     def close(self):
-        """Close Neo4j connection."""
+        """Flush pending writes and close Neo4j connection."""
+        self.flush()
+        if self._writer:
+            self._writer.shutdown(wait=True)
+            self._writer = None
         if self.driver:
             self.driver.close()
 
+    def flush(self, timeout: Optional[float] = None):
+        """Wait for queued Neo4j writes to complete."""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                self.logger.warning(f"Background write failed: {e}")
+
+    def _submit_write(self, fn, *args, **kwargs):
+        """Queue a persistence call on the background writer."""
+        if not self._neo4j_available or not self.driver:
+            return
+
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ir-correlator-writer"
+            )
+        self._pending_writes = [f for f in self._pending_writes if not f.done()]
+        self._pending_writes.append(self._writer.submit(fn, *args, **kwargs))
+
     def analyze_generation(
         self,
         entities: List[Dict[str, Any]],
@@ -127,14 +262,17 @@ class IRCodeCorrelator:
         entity_correlations = []
         endpoint_correlations = []
 
+        # Index smoke results once; per-element lookups are then O(1)
+        result_index = SmokeResultIndex(smoke_results)
+
         # Analyze entities
         for entity in entities:
-            correlation = self._analyze_entity(entity, smoke_results)
+            correlation = self._analyze_entity(entity, result_index)
             entity_correlations.append(correlation)
 
         # Analyze endpoints
         for endpoint in endpoints:
-            correlation = self._analyze_endpoint(endpoint, smoke_results)
+            correlation = self._analyze_endpoint(endpoint, result_index)
             endpoint_correlations.append(correlation)
 
         # Identify high-risk patterns
@@ -165,15 +303,15 @@ class IRCodeCorrelator:
             summary=summary
         )
 
-        # Persist to Neo4j
-        self._persist_report(report)
+        # Persist to Neo4j (background writer, see flush())
+        self._submit_write(self._persist_report, report)
 
         return report
 
     def _analyze_entity(
         self,
         entity: Dict[str, Any],
-        smoke_results: Dict[str, Any]
+        result_index: SmokeResultIndex
     ) -> EntityCorrelation:
         """Analyze a single entity's complexity vs generation quality."""
         name = entity.get("name", "unknown")
@@ -183,11 +321,8 @@ class IRCodeCorrelator:
         # Compute complexity
         complexity = self._compute_entity_complexity(entity)
 
-        # Get pass rate from smoke results
-        pass_rate = self._get_entity_pass_rate(name, smoke_results)
-
-        # Get failure types
-        failure_types = self._get_entity_failure_types(name, smoke_results)
+        # Get pass rate and failure types from indexed smoke results
+        stats = result_index.entity_stats(name)
 
         # Check for complex types
         has_enums = any(
@@ -202,18 +337,19 @@ class IRCodeCorrelator:
         return EntityCorrelation(
             entity_name=name,
             complexity_score=complexity,
-            pass_rate=pass_rate,
+            pass_rate=stats.pass_rate(),
             attributes_count=len(attributes),
             relationships_count=len(relationships),
             has_enums=has_enums,
             has_json_fields=has_json,
-            failure_types=failure_types
+            failure_types=list(stats.failure_types)[:_MAX_FAILURE_TYPES],
+            failure_histogram=dict(stats.failure_types)
         )
 
     def _analyze_endpoint(
         self,
         endpoint: Dict[str, Any],
-        smoke_results: Dict[str, Any]
+        result_index: SmokeResultIndex
     ) -> EndpointCorrelation:
         """Analyze a single endpoint's complexity vs generation quality."""
         path = endpoint.get("path", "/unknown")
@@ -224,11 +360,8 @@ class IRCodeCorrelator:
         # Compute complexity
         complexity = self._compute_endpoint_complexity(endpoint)
 
-        # Get pass rate
-        pass_rate = self._get_endpoint_pass_rate(path, method, smoke_results)
-
-        # Get failure types
-        failure_types = self._get_endpoint_failure_types(path, method, smoke_results)
+        # Get pass rate and failure types from indexed smoke results
+        stats = result_index.endpoint_stats(method, path)
 
         # Check parameter types
         has_path = any(p.get("in") == "path" for p in parameters)
@@ -238,12 +371,13 @@ class IRCodeCorrelator:
             path=path,
             method=method,
             complexity_score=complexity,
-            pass_rate=pass_rate,
+            pass_rate=stats.pass_rate(),
             params_count=len(parameters),
             has_body=request_body is not None,
             has_path_params=has_path,
             has_query_params=has_query,
-            failure_types=failure_types
+            failure_types=list(stats.failure_types)[:_MAX_FAILURE_TYPES],
+            failure_histogram=dict(stats.failure_types)
         )
 
     def _compute_entity_complexity(self, entity: Dict[str, Any]) -> float:
@@ -299,106 +433,6 @@ class IRCodeCorrelator:
 
         return min(1.0, base_score)
 
-    def _get_entity_pass_rate(
-        self,
-        entity_name: str,
-        smoke_results: Dict[str, Any]
-    ) -> float:
-        """Get pass rate for entity-related tests."""
-        violations = smoke_results.get("violations", [])
-        passed = smoke_results.get("passed_scenarios", [])
-
-        entity_lower = entity_name.lower()
-
-        # Count entity-related failures
-        entity_failures = sum(
-            1 for v in violations
-            if entity_lower in str(v).lower()
-        )
-
-        # Count entity-related passes
-        entity_passes = sum(
-            1 for p in passed
-            if entity_lower in str(p).lower()
-        )
-
-        total = entity_failures + entity_passes
-        if total == 0:
-            return 1.0  # No data = assume OK
-
-        return entity_passes / total
-
-    def _get_endpoint_pass_rate(
-        self,
-        path: str,
-        method: str,
-        smoke_results: Dict[str, Any]
-    ) -> float:
-        """Get pass rate for a specific endpoint."""
-        violations = smoke_results.get("violations", [])
-        passed = smoke_results.get("passed_scenarios", [])
-
-        # Normalize path for matching
-        path_pattern = path.replace("{", "").replace("}", "").lower()
-
-        # Count failures
-        failures = sum(
-            1 for v in violations
-            if path_pattern in str(v.get("endpoint", "")).lower()
-            and method.upper() in str(v.get("method", "")).upper()
-        )
-
-        # Count passes
-        passes = sum(
-            1 for p in passed
-            if path_pattern in str(p.get("endpoint", "")).lower()
-            and method.upper() in str(p.get("method", "")).upper()
-        )
-
-        total = failures + passes
-        if total == 0:
-            return 1.0
-
-        return passes / total
-
-    def _get_entity_failure_types(
-        self,
-        entity_name: str,
-        smoke_results: Dict[str, Any]
-    ) -> List[str]:
-        """Get failure types for an entity."""
-        violations = smoke_results.get("violations", [])
-        entity_lower = entity_name.lower()
-
-        failure_types = []
-        for v in violations:
-            if entity_lower in str(v).lower():
-                error_type = v.get("error_type", v.get("type", "unknown"))
-                if error_type not in failure_types:
-                    failure_types.append(error_type)
-
-        return failure_types[:5]  # Limit to 5
-
-    def _get_endpoint_failure_types(
-        self,
-        path: str,
-        method: str,
-        smoke_results: Dict[str, Any]
-    ) -> List[str]:
-        """Get failure types for an endpoint."""
-        violations = smoke_results.get("violations", [])
-        path_pattern = path.replace("{", "").replace("}", "").lower()
-
-        failure_types = []
-        for v in violations:
-            if (path_pattern in str(v.get("endpoint", "")).lower() and
-                    method.upper() in str(v.get("method", "")).upper()):
-                error_type = v.get("error_type", v.get("type", "unknown"))
-                if error_type not in failure_types:
-                    failure_types.append(error_type)
-
-        return failure_types[:5]
-
     def _identify_high_risk_patterns(
         self,
         entity_correlations: List[EntityCorrelation],
@@ -708,8 +742,9 @@ class IRCodeCorrelator:
         improved_endpoints = violations_before - violations_after
         endpoints_affected.update(improved_endpoints)
 
-        # Persist realignment to Neo4j
-        self._persist_realignment(
+        # Persist realignment to Neo4j (background writer)
+        self._submit_write(
+            self._persist_realignment,
             entities_affected=list(entities_affected),
             endpoints_affected=list(endpoints_affected),
             pass_rate_delta=pass_rate_delta,
@@ -47,6 +47,16 @@ from src.config.constants import (
     RAG_SIMILARITY_THRESHOLD_CURATED,
     RAG_SIMILARITY_THRESHOLD_PROJECT,
     RAG_SIMILARITY_THRESHOLD_STANDARDS,
+    RAG_MULTI_COLLECTION_MODE,
+    RAG_FUSION_METHOD,
+    RAG_EARLY_CUTOFF_SIMILARITY,
+    RAG_SOURCE_TIMEOUT,
+    RAG_RERANK_BACKEND,
+    RAG_RERANK_SCORE_MARGIN,
+    RAG_RERANK_MAX_CANDIDATES,
+    RAG_RERANK_CACHE_SIZE,
+    RAG_EXPANSION_CACHE_SIZE,
+    RAG_EXPANSION_DEDUP_SIMILARITY,
     RAG_ENABLE_FEEDBACK,
     CHROMADB_COLLECTION_NAME,
     CHROMADB_DISTANCE_METRIC,
@@ -91,6 +101,16 @@ __all__ = [
     "RAG_SIMILARITY_THRESHOLD_CURATED",
     "RAG_SIMILARITY_THRESHOLD_PROJECT",
     "RAG_SIMILARITY_THRESHOLD_STANDARDS",
+    "RAG_MULTI_COLLECTION_MODE",
+    "RAG_FUSION_METHOD",
+    "RAG_EARLY_CUTOFF_SIMILARITY",
+    "RAG_SOURCE_TIMEOUT",
+    "RAG_RERANK_BACKEND",
+    "RAG_RERANK_SCORE_MARGIN",
+    "RAG_RERANK_MAX_CANDIDATES",
+    "RAG_RERANK_CACHE_SIZE",
+    "RAG_EXPANSION_CACHE_SIZE",
+    "RAG_EXPANSION_DEDUP_SIMILARITY",
     "RAG_ENABLE_FEEDBACK",
     "CHROMADB_COLLECTION_NAME",
     "CHROMADB_DISTANCE_METRIC",
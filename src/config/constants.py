@@ -399,3 +399,32 @@ RAG_SIMILARITY_THRESHOLD_CURATED = float(os.getenv("RAG_SIMILARITY_THRESHOLD_CUR
 RAG_SIMILARITY_THRESHOLD_PROJECT = float(os.getenv("RAG_SIMILARITY_THRESHOLD_PROJECT", "0.35"))
 # Standards: moderate threshold
 RAG_SIMILARITY_THRESHOLD_STANDARDS = float(os.getenv("RAG_SIMILARITY_THRESHOLD_STANDARDS", "0.40"))
+
+# Multi-collection search mode: "fallback" (curated -> project code -> standards,
+# one round-trip per miss) or "parallel" (embed once, query all collections
+# concurrently and fuse per-collection scores)
+RAG_MULTI_COLLECTION_MODE = os.getenv("RAG_MULTI_COLLECTION_MODE", "fallback")
+# Score fusion for parallel mode: "rrf" (reciprocal rank fusion) or
+# "calibrated" (similarity rescaled from the collection threshold to 1.0)
+RAG_FUSION_METHOD = os.getenv("RAG_FUSION_METHOD", "rrf")
+# Parallel mode: return curated results without waiting for the other
+# collections when curated alone has top_k results at or above this similarity
+RAG_EARLY_CUTOFF_SIMILARITY = float(os.getenv("RAG_EARLY_CUTOFF_SIMILARITY", "0.75"))
+
+# Unified retriever: per-source deadline (seconds). Sources answering later
+# are dropped from the result, which is then tagged partial
+RAG_SOURCE_TIMEOUT = float(os.getenv("RAG_SOURCE_TIMEOUT", "2.0"))
+
+# Cross-encoder re-ranking: model backend ("torch", "onnx" or "onnx-int8")
+RAG_RERANK_BACKEND = os.getenv("RAG_RERANK_BACKEND", "torch")
+# Only candidates within this first-stage score margin of the best one are
+# scored by the cross-encoder, at most RAG_RERANK_MAX_CANDIDATES of them
+RAG_RERANK_SCORE_MARGIN = float(os.getenv("RAG_RERANK_SCORE_MARGIN", "0.3"))
+RAG_RERANK_MAX_CANDIDATES = int(os.getenv("RAG_RERANK_MAX_CANDIDATES", "20"))
+# (query, document, document version) -> cross-encoder score, LRU entries
+RAG_RERANK_CACHE_SIZE = int(os.getenv("RAG_RERANK_CACHE_SIZE", "4096"))
+
+# Query expansion: memoized expansions (LRU entries) and the cosine
+# similarity above which a variant is a near-duplicate and is not retrieved
+RAG_EXPANSION_CACHE_SIZE = int(os.getenv("RAG_EXPANSION_CACHE_SIZE", "1024"))
+RAG_EXPANSION_DEDUP_SIMILARITY = float(os.getenv("RAG_EXPANSION_DEDUP_SIMILARITY", "0.95"))
@@ -130,6 +130,16 @@ class Settings(BaseSettings):
         description="Session absolute timeout in hours (default: 12 hours)"
     )
 
+    SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS: int = Field(
+        default=60,
+        description="Minimum seconds between session last-activity writes (0 = write on every request)"
+    )
+
+    AUTH_CACHE_TTL_SECONDS: float = Field(
+        default=5.0,
+        description="TTL of the in-process validated-token cache (0 disables it)"
+    )
+
     # ========================================
     # Phase 2: IP-Based Access Controls
     # ========================================
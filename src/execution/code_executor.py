@@ -20,13 +20,21 @@ import subprocess
 import tempfile
 import os
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
 from src.models import AtomicUnit
+from src.execution.sandbox_pool import (
+    SANDBOX_POOL_SUPPORTED,
+    SandboxPoolExhausted,
+    SandboxWorkerCrashed,
+    SandboxWorkerPool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +70,10 @@ class CodeExecutor:
     - Direct: Execute code directly (for testing)
     - Sandbox: Execute in Docker container (production)
 
+    Python atoms run on a pool of warm, pre-forked sandbox workers
+    (SandboxWorkerPool) instead of a fresh interpreter per atom; batches
+    fan out across the pool.
+
     Safety features:
     - Timeout limits (default: 30s)
     - Memory limits (default: 512MB)
@@ -74,7 +86,9 @@ class CodeExecutor:
         self,
         timeout: int = 30,
         memory_limit: str = "512m",
-        use_sandbox: bool = False
+        use_sandbox: bool = False,
+        use_worker_pool: bool = True,
+        pool_size: Optional[int] = None
     ):
         """
         Initialize code executor
@@ -83,10 +97,18 @@ class CodeExecutor:
             timeout: Execution timeout in seconds
             memory_limit: Memory limit (e.g., "512m", "1g")
             use_sandbox: Use Docker sandbox (vs direct execution)
+            use_worker_pool: Run Python atoms on warm sandbox workers
+            pool_size: Number of workers / batch parallelism (default: CPU count, max 8)
         """
         self.timeout = timeout
         self.memory_limit = memory_limit
         self.use_sandbox = use_sandbox
+        self.use_worker_pool = use_worker_pool and SANDBOX_POOL_SUPPORTED
+        self.pool_size = pool_size or min(os.cpu_count() or 1, 8)
+
+        # Started lazily on the first Python atom
+        self._pool: Optional[SandboxWorkerPool] = None
+        self._pool_lock = threading.Lock()
 
         logger.info(f"CodeExecutor initialized (timeout={timeout}s, memory={memory_limit}, sandbox={use_sandbox})")
 
@@ -110,7 +132,9 @@ class CodeExecutor:
         started_at = datetime.utcnow()
 
         try:
-            if atom.language == "python":
+            if atom.language == "python" and self.use_worker_pool:
+                result = self._execute_python_pooled(atom, input_data)
+            elif atom.language == "python":
                 result = self._execute_python(atom, input_data)
             elif atom.language in ["typescript", "javascript"]:
                 result = self._execute_nodejs(atom, input_data, atom.language)
@@ -147,6 +171,76 @@ class CodeExecutor:
                 completed_at=datetime.utcnow()
             )
 
+    def _get_pool(self) -> Optional[SandboxWorkerPool]:
+        """Start the worker pool on first use; disable pooling if it cannot start."""
+        with self._pool_lock:
+            if self._pool is None and self.use_worker_pool:
+                try:
+                    self._pool = SandboxWorkerPool(self.pool_size, memory_limit=self.memory_limit)
+                except Exception as e:
+                    logger.warning(f"Sandbox worker pool unavailable, using subprocess per atom: {e}")
+                    self.use_worker_pool = False
+            return self._pool
+
+    def _execute_python_pooled(
+        self,
+        atom: AtomicUnit,
+        input_data: Optional[Dict[str, Any]]
+    ) -> ExecutionResult:
+        """Execute Python code on a warm sandbox worker"""
+        pool = self._get_pool()
+        if pool is None:
+            return self._execute_python(atom, input_data)
+
+        try:
+            run = pool.run(atom.code_to_generate, input_data, self.timeout)
+        except SandboxPoolExhausted as e:
+            logger.warning(f"{e}; running atom {atom.atom_id} in a subprocess")
+            return self._execute_python(atom, input_data)
+        except SandboxWorkerCrashed as e:
+            # Typically killed by an rlimit (SIGXCPU, out of memory) or a
+            # malformed reply; the worker has been replaced
+            return ExecutionResult(
+                atom_id=atom.atom_id,
+                success=False,
+                exit_code=-1,
+                stdout="",
+                stderr=str(e),
+                error_message=f"Sandbox worker crashed: {e}",
+                exception_type="SandboxWorkerCrashed"
+            )
+
+        if run.timed_out:
+            return ExecutionResult(
+                atom_id=atom.atom_id,
+                success=False,
+                exit_code=-1,
+                stdout="",
+                stderr=run.stderr,
+                error_message=f"Timeout ({self.timeout}s)",
+                exception_type="TimeoutError"
+            )
+
+        return ExecutionResult(
+            atom_id=atom.atom_id,
+            success=run.exit_code == 0,
+            exit_code=run.exit_code,
+            stdout=run.stdout,
+            stderr=run.stderr,
+            return_value=run.return_value,
+            execution_time=run.execution_time,
+            error_message=run.stderr if run.exit_code != 0 else None,
+            exception_type=run.exception_type,
+            exception_traceback=run.exception_traceback
+        )
+
+    def close(self) -> None:
+        """Shut down the sandbox worker pool (if started)"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
     def _execute_python(
         self,
         atom: AtomicUnit,
@@ -160,9 +254,15 @@ class CodeExecutor:
             # Write code to file
             code = atom.code_to_generate
 
-            # Add input data if provided
-            if input_data:
-                code = f"# Input data\ninput_data = {json.dumps(input_data)}\n\n{code}"
+            # Input data is read from stdin as JSON (never spliced into the source)
+            if input_data is not None:
+                code = (
+                    "# Input data\n"
+                    "import json as _json, sys as _sys\n"
+                    "input_data = _json.load(_sys.stdin)\n"
+                    "del _json, _sys\n\n"
+                    f"{code}"
+                )
 
             # Add result capture
             code += "\n\n# Capture result for JSON output\nimport json\nimport sys\nif 'result' in locals():\n    print('__RESULT__' + json.dumps(result))"
@@ -175,6 +275,7 @@ class CodeExecutor:
 
             process = subprocess.run(
                 ['python', temp_file],
+                input=json.dumps(input_data) if input_data is not None else None,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout
@@ -354,11 +455,17 @@ class CodeExecutor:
         """
         logger.info(f"Batch executing {len(atoms)} atoms")
 
-        results = []
-        for atom in atoms:
+        def run(atom: AtomicUnit) -> ExecutionResult:
             atom_input = input_data.get(atom.atom_id) if input_data else None
-            result = self.execute_atom(atom, atom_input)
-            results.append(result)
+            return self.execute_atom(atom, atom_input)
+
+        # Fan out across the worker pool; map() keeps input order
+        workers = min(self.pool_size, len(atoms)) if self.use_worker_pool else 1
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="atom-exec") as executor:
+                results = list(executor.map(run, atoms))
+        else:
+            results = [run(atom) for atom in atoms]
 
         logger.info(f"Batch execution complete: {sum(1 for r in results if r.success)}/{len(results)} succeeded")
         return results
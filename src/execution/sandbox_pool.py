@@ -0,0 +1,278 @@
+"""
+Sandbox Worker Pool - Pre-forked Python interpreters for CodeExecutor
+
+Spawning a fresh interpreter per atom costs ~50-100ms (startup + imports),
+usually more than the atom itself. The pool keeps N warm sandbox_worker.py
+processes and sends code to them over a pipe.
+
+Safety:
+- Resource limits per worker (RLIMIT_AS from memory_limit, RLIMIT_FSIZE,
+  per-run RLIMIT_CPU) - see sandbox_worker.py
+- Fresh namespace per run; workers are recycled after max_runs_per_worker
+  and after any run that changed sys.modules (e.g. imported a module)
+- Timeout: the worker's process group is killed and a new worker is spawned
+- A worker that fails to respawn leaves an empty slot, which is respawned
+  by the next run() that takes it; run() waits at most acquire_timeout for
+  a slot
+
+Author: DevMatrix Team
+Date: 2025-10-23
+"""
+
+import json
+import logging
+import os
+import queue
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("sandbox_worker.py")
+
+# Pipes + select() + rlimits are POSIX only; CodeExecutor falls back to
+# one subprocess per atom elsewhere.
+SANDBOX_POOL_SUPPORTED = os.name == "posix"
+
+
+def parse_memory_limit(memory_limit: str) -> int:
+    """
+    Convert a Docker-style memory limit ("512m", "1g", "256k") to bytes.
+
+    Returns 0 (no limit) for empty or unparseable values.
+    """
+    units = {"k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+    value = (memory_limit or "").strip().lower().rstrip("b")
+    try:
+        if value and value[-1] in units:
+            return int(float(value[:-1]) * units[value[-1]])
+        return int(value) if value else 0
+    except ValueError:
+        return 0
+
+
+@dataclass
+class SandboxRunResult:
+    """Structured result returned by a sandbox worker."""
+    exit_code: int
+    stdout: str
+    stderr: str
+    execution_time: float
+    return_value: Optional[Any] = None
+    has_return_value: bool = False
+    exception_type: Optional[str] = None
+    exception_traceback: Optional[str] = None
+    timed_out: bool = False
+
+
+class SandboxWorkerCrashed(RuntimeError):
+    """Worker exited or broke the protocol (e.g. killed by an rlimit)."""
+
+
+class SandboxPoolExhausted(RuntimeError):
+    """No worker slot became free within acquire_timeout."""
+
+
+class _SandboxWorker:
+    """One warm interpreter process."""
+
+    def __init__(self, memory_bytes: int, max_file_bytes: int):
+        self.process = subprocess.Popen(
+            [sys.executable, str(WORKER_SCRIPT), str(memory_bytes), str(max_file_bytes)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # own process group, so children die with it
+        )
+        self.runs = 0
+        self._buffer = b""
+        try:
+            self._read_line(time.monotonic() + 30)  # wait for {"ready": true}
+        except BaseException:
+            self.kill()
+            raise
+
+    def run(self, code: str, input_data: Optional[Dict[str, Any]], timeout: float) -> Dict[str, Any]:
+        request = json.dumps({"code": code, "input_data": input_data, "timeout": timeout})
+        try:
+            self.process.stdin.write(request.encode("utf-8") + b"\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise SandboxWorkerCrashed(f"worker pipe closed: {e}") from e
+        self.runs += 1
+        line = self._read_line(time.monotonic() + timeout)
+        try:
+            response = json.loads(line)  # UnicodeDecodeError is a ValueError too
+        except ValueError as e:
+            raise SandboxWorkerCrashed(f"malformed worker reply: {e}") from e
+        if not isinstance(response, dict):
+            raise SandboxWorkerCrashed(f"malformed worker reply: {line[:200]!r}")
+        return response
+
+    def _read_line(self, deadline: float) -> bytes:
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                raise TimeoutError
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise SandboxWorkerCrashed(f"worker exited (code {self.process.poll()})")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, OSError):
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for pipe in (self.process.stdin, self.process.stdout):
+            try:
+                pipe.close()
+            except Exception:
+                pass
+
+
+class SandboxWorkerPool:
+    """
+    Pool of pre-forked sandbox workers.
+
+    Thread-safe: run() borrows an idle worker, so up to `size` atoms execute
+    in parallel (CodeExecutor.execute_batch fans out over threads).
+    """
+
+    def __init__(
+        self,
+        size: int,
+        memory_limit: str = "512m",
+        max_file_size: int = 64 * 1024 * 1024,
+        max_runs_per_worker: int = 200,
+        acquire_timeout: float = 300,
+    ):
+        self.size = max(1, size)
+        self.memory_bytes = parse_memory_limit(memory_limit)
+        self.max_file_size = max_file_size
+        self.max_runs_per_worker = max_runs_per_worker
+        self.acquire_timeout = acquire_timeout
+
+        # Slots: a warm worker, or None when its respawn failed
+        self._idle: "queue.Queue[Optional[_SandboxWorker]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.respawns = 0
+
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+        logger.info(f"SandboxWorkerPool started ({self.size} workers, memory={memory_limit})")
+
+    def run(
+        self,
+        code: str,
+        input_data: Optional[Dict[str, Any]] = None,
+        timeout: float = 30,
+    ) -> SandboxRunResult:
+        """
+        Execute Python code on an idle worker.
+
+        Raises:
+            RuntimeError: If the pool is closed
+            SandboxPoolExhausted: If no slot is free within acquire_timeout
+            SandboxWorkerCrashed: If the worker died mid-run or sent a malformed
+                reply (it is replaced), or an empty slot could not be respawned
+        """
+        if self._closed:
+            raise RuntimeError("SandboxWorkerPool is closed")
+
+        worker = self._acquire()
+        healthy = False
+        try:
+            response = worker.run(code, input_data, timeout)
+            modules_changed = response.pop("modules_changed", True)
+            try:
+                result = SandboxRunResult(**response)
+            except TypeError as e:
+                raise SandboxWorkerCrashed(f"malformed worker reply: {e}") from e
+            healthy = worker.runs < self.max_runs_per_worker and not modules_changed
+            return result
+        except TimeoutError:
+            return SandboxRunResult(
+                exit_code=-1,
+                stdout="",
+                stderr=f"Execution timed out after {timeout}s",
+                execution_time=timeout,
+                exception_type="TimeoutError",
+                timed_out=True,
+            )
+        finally:
+            if self._closed:
+                worker.kill()
+            else:
+                if not healthy:
+                    # Timed out, crashed, changed sys.modules or recycled: replace with a fresh worker
+                    worker.kill()
+                    worker = self._respawn()
+                self._idle.put(worker)
+
+    def close(self) -> None:
+        """Kill all workers."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.kill()
+
+    def _acquire(self) -> _SandboxWorker:
+        """Take a slot, respawning its worker if a previous respawn failed."""
+        try:
+            worker = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty as e:
+            raise SandboxPoolExhausted(
+                f"No sandbox worker free after {self.acquire_timeout}s ({self.size} workers)"
+            ) from e
+
+        if worker is None:
+            try:
+                worker = self._spawn()
+            except Exception as e:
+                self._idle.put(None)  # keep the slot for the next caller
+                raise SandboxWorkerCrashed(f"could not respawn sandbox worker: {e}") from e
+        return worker
+
+    def _respawn(self) -> Optional[_SandboxWorker]:
+        """Spawn a replacement worker; None (empty slot) if that fails."""
+        try:
+            worker = self._spawn()
+        except Exception as e:
+            logger.error(f"Failed to respawn sandbox worker, slot left empty: {e}")
+            return None
+        with self._lock:
+            self.respawns += 1
+        return worker
+
+    def _spawn(self) -> _SandboxWorker:
+        return _SandboxWorker(self.memory_bytes, self.max_file_size)
+
+    def __enter__(self) -> "SandboxWorkerPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,188 @@
+"""
+Sandbox Worker - Warm Python interpreter for CodeExecutor atoms
+
+Runs as a standalone script (no src imports, so it starts fast) spawned by
+SandboxWorkerPool. Reads one JSON request per line from the protocol pipe,
+executes the code in a fresh namespace and writes one JSON result per line.
+
+Request:  {"code": str, "input_data": dict|null, "timeout": float}
+Response: {"exit_code", "stdout", "stderr", "return_value", "has_return_value",
+           "exception_type", "exception_traceback", "execution_time",
+           "modules_changed"}
+
+Isolation per run:
+- Fresh module namespace (__name__ == "__main__") with its own copy of
+  the builtins dict
+- builtins module attributes restored afterwards
+- sys.modules is left alone (C extensions cannot be loaded twice per
+  process); a run that imported, removed or replaced a module reports
+  modules_changed and the pool recycles the worker
+- sys.argv, sys.path, os.environ and cwd restored afterwards
+- The protocol's json functions are bound at startup, so an atom patching
+  the json module cannot corrupt replies
+- RLIMIT_CPU re-armed to (cpu used so far + timeout)
+Process-wide limits (RLIMIT_AS, RLIMIT_FSIZE) are applied once at startup.
+
+Author: DevMatrix Team
+Date: 2025-10-23
+"""
+
+import builtins
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX
+    resource = None
+
+# Common imports pre-loaded so atoms don't pay for them
+import collections  # noqa: F401
+import dataclasses  # noqa: F401
+import datetime  # noqa: F401
+import re  # noqa: F401
+import typing  # noqa: F401
+
+# Protocol serialization, bound before any atom can patch the json module
+_dumps = json.dumps
+_loads = json.loads
+
+
+def _apply_process_limits(memory_bytes: int, max_file_bytes: int) -> None:
+    if resource is None:
+        return
+    if memory_bytes > 0:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    if max_file_bytes > 0:
+        resource.setrlimit(resource.RLIMIT_FSIZE, (max_file_bytes, max_file_bytes))
+
+
+def _arm_cpu_limit(timeout: float) -> None:
+    """Soft CPU limit for this run; SIGXCPU kills a busy loop the parent missed."""
+    if resource is None or not timeout:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = usage.ru_utime + usage.ru_stime
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(used + timeout) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _modules_changed(saved: dict) -> bool:
+    """True if sys.modules gained, lost or rebound an entry since `saved` was copied."""
+    modules = sys.modules
+    return len(modules) != len(saved) or any(modules.get(k, _MISSING) is not v for k, v in saved.items())
+
+
+def _restore_dict(target: dict, saved: dict) -> None:
+    """Undo additions and rebinds made to `target` since `saved` was copied."""
+    for key in [k for k in target if k not in saved]:
+        del target[key]
+    for key, value in saved.items():
+        if target.get(key, _MISSING) is not value:
+            target[key] = value
+
+
+_MISSING = object()
+
+
+def _run(request: dict) -> dict:
+    namespace = {"__name__": "__main__", "__builtins__": dict(builtins.__dict__)}
+    if request.get("input_data") is not None:
+        namespace["input_data"] = request["input_data"]
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    exception_type = None
+    exception_traceback = None
+    return_value = None
+    has_return_value = False
+
+    saved_argv, saved_path = list(sys.argv), list(sys.path)
+    saved_environ, saved_cwd = dict(os.environ), os.getcwd()
+    saved_builtins, saved_modules = dict(builtins.__dict__), dict(sys.modules)
+
+    _arm_cpu_limit(request.get("timeout") or 0)
+    start_time = time.time()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            sys.argv = ["<atom>"]
+            exec(compile(request["code"], "<atom>", "exec"), namespace)
+            if "result" in namespace:
+                # Same contract as the subprocess runner: result must be JSON-serializable
+                return_value = _loads(_dumps(namespace["result"]))
+                has_return_value = True
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException as e:
+            exit_code = 1
+            exception_type = type(e).__name__
+            # Drop this module's frame from the traceback
+            tb = e.__traceback__.tb_next if e.__traceback__ else None
+            exception_traceback = "".join(traceback.format_exception(type(e), e, tb))
+            sys.stderr.write(exception_traceback)
+    execution_time = time.time() - start_time
+
+    _restore_dict(builtins.__dict__, saved_builtins)
+    modules_changed = _modules_changed(saved_modules)
+    sys.argv[:] = saved_argv
+    sys.path[:] = saved_path
+    os.environ.clear()
+    os.environ.update(saved_environ)
+    with contextlib.suppress(OSError):
+        os.chdir(saved_cwd)
+
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "return_value": return_value,
+        "has_return_value": has_return_value,
+        "exception_type": exception_type,
+        "exception_traceback": exception_traceback,
+        "execution_time": execution_time,
+        "modules_changed": modules_changed,
+    }
+
+
+def main() -> None:
+    memory_bytes = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    max_file_bytes = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    # Keep the protocol pipes private: atoms (and their child processes)
+    # only ever see /dev/null on fd 0/1.
+    protocol_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    protocol_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+
+    _apply_process_limits(memory_bytes, max_file_bytes)
+
+    write, flush = protocol_out.write, protocol_out.flush
+    write(_dumps({"ready": True}) + "\n")
+    flush()
+
+    for line in protocol_in:
+        if not line.strip():
+            continue
+        response = _run(_loads(line))
+        write(_dumps(response) + "\n")
+        flush()
+
+
+if __name__ == "__main__":
+    main()
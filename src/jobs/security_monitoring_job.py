@@ -32,6 +32,9 @@ settings = get_settings()
 # Global scheduler instance
 _scheduler: AsyncIOScheduler = None
 
+# Global monitoring service instance (keeps the detection high-water mark between runs)
+_monitoring_service: SecurityMonitoringService = None
+
 
 def detect_security_events():
     """
@@ -40,18 +43,22 @@ def detect_security_events():
     Runs every 5 minutes (configurable via SECURITY_MONITORING_INTERVAL_MINUTES).
 
     Workflow:
-    1. Run all security event detections
+    1. Run all security event detections (incremental: only audit logs
+       newer than the previous run's high-water mark are examined)
     2. Send alerts for new security events (Task Group 14)
 
     Returns:
         int: Number of security events detected
     """
+    global _monitoring_service
+
     try:
         logger.info("Security monitoring job started")
 
         # Step 1: Detect security events
-        monitoring_service = SecurityMonitoringService()
-        events = monitoring_service.run_all_detections()
+        if _monitoring_service is None:
+            _monitoring_service = SecurityMonitoringService()
+        events = _monitoring_service.run_all_detections()
 
         if len(events) > 0:
             logger.info(f"Security monitoring job completed: {len(events)} events detected")
@@ -10,9 +10,12 @@ import hashlib
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from neo4j import GraphDatabase
 
@@ -157,6 +160,127 @@ def generate_pattern_id(
     return f"gap_{hash_val}"  # gap = Generation Anti-Pattern
 
 
+# =============================================================================
+# Endpoint Keys
+# =============================================================================
+
+_HTTP_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+_ID_SEGMENT = re.compile(
+    r"^(\d+|\{[^/{}]+\}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$",
+    re.IGNORECASE,
+)
+
+
+def endpoint_key(endpoint: str) -> Tuple[str, str]:
+    """
+    Split an endpoint pattern into its normalized (method, path) key.
+
+    Concrete IDs and path parameters all become "{id}", so
+    "POST /products/123/", "POST /products/{product_id}" and
+    "post /products/{id}" share the key ("POST", "/products/{id}").
+    The method is "" when the pattern has none (e.g. "/products").
+
+    Args:
+        endpoint: Endpoint pattern, "*" for any endpoint
+
+    Returns:
+        (method, path) tuple, ("", "*") for the wildcard
+    """
+    endpoint = (endpoint or "").strip()
+    if not endpoint or endpoint == "*":
+        return "", "*"
+
+    method, _, path = endpoint.partition(" ")
+    if method.upper() in _HTTP_METHODS and path.strip():
+        method, path = method.upper(), path.strip()
+    else:
+        method, path = "", endpoint
+
+    segments = [
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/") if segment
+    ]
+    return method, "/" + "/".join(segments)
+
+
+@dataclass
+class _RouteNode:
+    """Route trie node: one path segment, pattern IDs by method ("" = any method)."""
+    children: Dict[str, "_RouteNode"] = field(default_factory=dict)
+    methods: Dict[str, Set[str]] = field(default_factory=dict)
+
+
+class _PatternIndex:
+    """
+    In-memory anti-pattern index.
+
+    Patterns are indexed by endpoint in a route trie keyed by normalized
+    path segments, and by entity and error type in dicts, so lookups touch
+    only the matching patterns instead of scanning the whole cache.
+    """
+
+    def __init__(self):
+        self.patterns: Dict[str, GenerationAntiPattern] = {}
+        self._routes = _RouteNode()
+        self._any_endpoint: Set[str] = set()
+        self._by_entity: Dict[str, Set[str]] = {}
+        self._by_error_type: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, pattern: GenerationAntiPattern) -> GenerationAntiPattern:
+        """Add or replace a pattern (its signature fields never change for one ID)."""
+        pattern_id = pattern.pattern_id
+        with self._lock:
+            known = pattern_id in self.patterns
+            self.patterns[pattern_id] = pattern
+            if known:
+                return pattern
+
+            method, path = endpoint_key(pattern.endpoint_pattern)
+            if path == "*":
+                self._any_endpoint.add(pattern_id)
+            else:
+                node = self._routes
+                for segment in path.strip("/").split("/"):
+                    node = node.children.setdefault(segment, _RouteNode())
+                node.methods.setdefault(method, set()).add(pattern_id)
+
+            self._by_entity.setdefault(pattern.entity_pattern or "*", set()).add(pattern_id)
+            self._by_error_type.setdefault(pattern.error_type, set()).add(pattern_id)
+        return pattern
+
+    def for_endpoint(self, method: str, path: str) -> List[GenerationAntiPattern]:
+        """Patterns for a normalized endpoint key, plus method-less and "*" patterns."""
+        with self._lock:
+            ids = set(self._any_endpoint)
+            node: Optional[_RouteNode] = self._routes
+            for segment in path.strip("/").split("/"):
+                node = node.children.get(segment)
+                if node is None:
+                    break
+            if node is not None:
+                if method:
+                    ids.update(node.methods.get(method, ()))
+                    ids.update(node.methods.get("", ()))
+                else:
+                    for method_ids in node.methods.values():
+                        ids.update(method_ids)
+            return [self.patterns[i] for i in ids]
+
+    def for_entity(self, entity_name: str, error_type: str = None) -> List[GenerationAntiPattern]:
+        """Patterns for an entity (or "*"), optionally of one error type."""
+        with self._lock:
+            ids = self._by_entity.get(entity_name, set()) | self._by_entity.get("*", set())
+            if error_type is not None:
+                ids = ids & self._by_error_type.get(error_type, set())
+            return [self.patterns[i] for i in ids]
+
+    def for_error_type(self, error_type: str) -> List[GenerationAntiPattern]:
+        """Patterns of an error type."""
+        with self._lock:
+            return [self.patterns[i] for i in self._by_error_type.get(error_type, ())]
+
+
 # =============================================================================
 # Negative Pattern Store
 # =============================================================================
@@ -174,15 +298,27 @@ class NegativePatternStore:
         (:GenerationAntiPattern {
             pattern_id, error_type, exception_class, error_message_pattern,
             entity_pattern, endpoint_pattern, field_pattern,
+            endpoint_method, endpoint_key,  # normalized, see endpoint_key()
             bad_code_snippet, correct_code_snippet,
             occurrence_count, times_prevented, last_seen, created_at
         })
+
+    Entity, endpoint and schema lookups filter on indexed properties in
+    Cypher. Results are kept in an in-memory index (route trie + entity and
+    error type dicts); a lookup is served from it while the same query was
+    refreshed from Neo4j less than CACHE_TTL_SECONDS ago (refresh times are
+    kept for at most MAX_TRACKED_QUERIES queries).
     """
 
     # Thresholds for pattern retrieval
     MIN_OCCURRENCE_FOR_PROMPT = 2   # Only inject patterns seen 2+ times
     MAX_PATTERNS_PER_QUERY = 10     # Limit patterns per query
 
+    # Seconds a Neo4j query result is served from the local index
+    CACHE_TTL_SECONDS = float(os.environ.get("NEGATIVE_PATTERN_CACHE_TTL", "300"))
+    # Queries whose refresh time is tracked (least recently refreshed dropped first)
+    MAX_TRACKED_QUERIES = 1024
+
     def __init__(
         self,
         neo4j_uri: str = "bolt://localhost:7687",
@@ -192,6 +328,14 @@ class NegativePatternStore:
         """Initialize store with Neo4j connection."""
         self.logger = logging.getLogger(f"{__name__}.NegativePatternStore")
 
+        # In-memory index for fast lookups (_cache: pattern_id -> pattern)
+        self._index = _PatternIndex()
+        self._cache: Dict[str, GenerationAntiPattern] = self._index.patterns
+        self._cache_loaded = False
+        # query key -> (monotonic time, min_occ), oldest refresh first
+        self._refreshed: "OrderedDict[Tuple, Tuple[float, int]]" = OrderedDict()
+        self._refreshed_lock = threading.Lock()
+
         try:
             self.driver = GraphDatabase.driver(
                 neo4j_uri,
@@ -204,10 +348,6 @@ class NegativePatternStore:
             self._neo4j_available = False
             self.driver = None
 
-        # In-memory cache for fast lookups
-        self._cache: Dict[str, GenerationAntiPattern] = {}
-        self._cache_loaded = False
-
     def close(self):
         """Close Neo4j connection."""
         if self.driver:
@@ -247,6 +387,39 @@ class NegativePatternStore:
                     FOR (ap:GenerationAntiPattern) ON (ap.exception_class)
                 """)
 
+                session.run("""
+                    CREATE INDEX gap_endpoint_key IF NOT EXISTS
+                    FOR (ap:GenerationAntiPattern) ON (ap.endpoint_key, ap.endpoint_method)
+                """)
+
+                session.run("""
+                    CREATE INDEX gap_error_type_entity IF NOT EXISTS
+                    FOR (ap:GenerationAntiPattern) ON (ap.error_type, ap.entity_pattern)
+                """)
+
+                session.run("""
+                    CREATE INDEX gap_occurrence IF NOT EXISTS
+                    FOR (ap:GenerationAntiPattern) ON (ap.occurrence_count)
+                """)
+
+                # Backfill endpoint keys of patterns stored before they existed
+                result = session.run("""
+                    MATCH (ap:GenerationAntiPattern)
+                    WHERE ap.endpoint_key IS NULL
+                    RETURN ap.pattern_id AS pattern_id, ap.endpoint_pattern AS endpoint_pattern
+                """)
+                rows = []
+                for record in result:
+                    method, path = endpoint_key(record["endpoint_pattern"])
+                    rows.append({"pattern_id": record["pattern_id"], "method": method, "key": path})
+                if rows:
+                    session.run("""
+                        UNWIND $rows AS row
+                        MATCH (ap:GenerationAntiPattern {pattern_id: row.pattern_id})
+                        SET ap.endpoint_method = row.method, ap.endpoint_key = row.key
+                    """, rows=rows)
+                    self.logger.info(f"Backfilled endpoint keys of {len(rows)} anti-patterns")
+
                 self.logger.debug("Neo4j schema for GenerationAntiPattern ensured")
 
         except Exception as e:
@@ -265,12 +438,21 @@ class NegativePatternStore:
         Returns:
             True if stored/updated successfully
         """
-        # Update cache
-        self._cache[pattern.pattern_id] = pattern
+        # Update cache (mirrors the MERGE below)
+        cached = self._cache.get(pattern.pattern_id)
+        if cached is not None and cached is not pattern:
+            cached.occurrence_count += 1
+            cached.last_seen = datetime.now()
+            cached.bad_code_snippet = pattern.bad_code_snippet or cached.bad_code_snippet
+            cached.correct_code_snippet = pattern.correct_code_snippet or cached.correct_code_snippet
+        else:
+            self._index.add(pattern)
 
         if not self._neo4j_available or not self.driver:
             return True  # Cache-only mode
 
+        method, path = endpoint_key(pattern.endpoint_pattern)
+
         try:
             with self.driver.session() as session:
                 session.run("""
@@ -282,6 +464,8 @@ class NegativePatternStore:
                         ap.entity_pattern = $entity_pattern,
                         ap.endpoint_pattern = $endpoint_pattern,
                         ap.field_pattern = $field_pattern,
+                        ap.endpoint_method = $endpoint_method,
+                        ap.endpoint_key = $endpoint_key,
                         ap.bad_code_snippet = $bad_code_snippet,
                         ap.correct_code_snippet = $correct_code_snippet,
                         ap.occurrence_count = 1,
@@ -301,6 +485,8 @@ class NegativePatternStore:
                         END
                 """, {
                     "pattern_id": pattern.pattern_id,
+                    "endpoint_method": method,
+                    "endpoint_key": path,
                     "error_type": pattern.error_type,
                     "exception_class": pattern.exception_class,
                     "error_message_pattern": pattern.error_message_pattern[:500],
@@ -357,9 +543,7 @@ class NegativePatternStore:
 
                 record = result.single()
                 if record:
-                    pattern = self._node_to_pattern(record["ap"])
-                    self._cache[pattern_id] = pattern
-                    return pattern
+                    return self._index.add(self._node_to_pattern(record["ap"]))
 
         except Exception as e:
             self.logger.warning(f"Failed to get pattern: {e}")
@@ -431,44 +615,14 @@ class NegativePatternStore:
         Returns:
             List of relevant anti-patterns sorted by severity
         """
-        min_occ = min_occurrences or self.MIN_OCCURRENCE_FOR_PROMPT
-
-        # Check cache first
-        cached = [
-            p for p in self._cache.values()
-            if (p.entity_pattern == entity_name or p.entity_pattern == "*")
-            and p.occurrence_count >= min_occ
-        ]
-
-        if not self._neo4j_available or not self.driver:
-            return sorted(cached, key=lambda p: p.severity_score, reverse=True)
-
-        try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (ap:GenerationAntiPattern)
-                    WHERE (ap.entity_pattern = $entity_name OR ap.entity_pattern = '*')
-                      AND ap.occurrence_count >= $min_occ
-                    RETURN ap
-                    ORDER BY ap.occurrence_count DESC
-                    LIMIT $limit
-                """, {
-                    "entity_name": entity_name,
-                    "min_occ": min_occ,
-                    "limit": self.MAX_PATTERNS_PER_QUERY
-                })
-
-                patterns = []
-                for record in result:
-                    pattern = self._node_to_pattern(record["ap"])
-                    self._cache[pattern.pattern_id] = pattern
-                    patterns.append(pattern)
-
-                return sorted(patterns, key=lambda p: p.severity_score, reverse=True)
-
-        except Exception as e:
-            self.logger.warning(f"Failed to query patterns for entity: {e}")
-            return cached
+        return self._query_patterns(
+            query_key=("entity", entity_name),
+            where="ap.entity_pattern IN [$entity_name, '*']",
+            params={"entity_name": entity_name},
+            local=lambda: self._index.for_entity(entity_name),
+            min_occurrences=min_occurrences,
+            label="entity",
+        )
 
     def get_patterns_for_endpoint(
         self,
@@ -479,58 +633,39 @@ class NegativePatternStore:
         """
         Get anti-patterns relevant to an endpoint.
 
+        Matches patterns with the same normalized endpoint key (see
+        endpoint_key()), patterns stored without a method for that path,
+        and "*" patterns.
+
         Args:
             endpoint_pattern: Endpoint pattern (e.g., "POST /products")
-            method: HTTP method (optional, for filtering)
+            method: HTTP method (optional, used if endpoint_pattern has none)
             min_occurrences: Minimum occurrence count
 
         Returns:
             List of relevant anti-patterns
         """
-        min_occ = min_occurrences or self.MIN_OCCURRENCE_FOR_PROMPT
-
-        # Normalize endpoint pattern
-        normalized = self._normalize_endpoint(endpoint_pattern)
-
-        # Check cache first
-        cached = [
-            p for p in self._cache.values()
-            if self._endpoint_matches(p.endpoint_pattern, normalized)
-            and p.occurrence_count >= min_occ
-        ]
-
-        if not self._neo4j_available or not self.driver:
-            return sorted(cached, key=lambda p: p.severity_score, reverse=True)
-
-        try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (ap:GenerationAntiPattern)
-                    WHERE ap.occurrence_count >= $min_occ
-                    RETURN ap
-                    ORDER BY ap.occurrence_count DESC
-                    LIMIT $limit
-                """, {
-                    "min_occ": min_occ,
-                    "limit": self.MAX_PATTERNS_PER_QUERY * 2  # Fetch more for filtering
-                })
-
-                patterns = []
-                for record in result:
-                    pattern = self._node_to_pattern(record["ap"])
-                    if self._endpoint_matches(pattern.endpoint_pattern, normalized):
-                        self._cache[pattern.pattern_id] = pattern
-                        patterns.append(pattern)
-
-                return sorted(
-                    patterns[:self.MAX_PATTERNS_PER_QUERY],
-                    key=lambda p: p.severity_score,
-                    reverse=True
-                )
-
-        except Exception as e:
-            self.logger.warning(f"Failed to query patterns for endpoint: {e}")
-            return cached
+        key_method, path = endpoint_key(endpoint_pattern)
+        key_method = key_method or (method or "").upper()
+
+        if path == "*":
+            where = "ap.endpoint_key = '*'"
+        elif key_method:
+            where = (
+                "(ap.endpoint_key = $path AND ap.endpoint_method IN [$method, '']) "
+                "OR ap.endpoint_key = '*'"
+            )
+        else:
+            where = "ap.endpoint_key IN [$path, '*']"
+
+        return self._query_patterns(
+            query_key=("endpoint", key_method, path),
+            where=where,
+            params={"path": path, "method": key_method},
+            local=lambda: self._index.for_endpoint(key_method, path),
+            min_occurrences=min_occurrences,
+            label="endpoint",
+        )
 
     def get_patterns_for_schema(
         self,
@@ -546,49 +681,17 @@ class NegativePatternStore:
             schema_name: Schema name (e.g., "ProductCreate")
             min_occurrences: Minimum occurrence count
         """
-        min_occ = min_occurrences or self.MIN_OCCURRENCE_FOR_PROMPT
-
         # Extract entity from schema name (ProductCreate -> Product)
         entity_name = re.sub(r'(Create|Update|Read|Base|Schema)$', '', schema_name)
 
-        # Get patterns for validation errors
-        cached = [
-            p for p in self._cache.values()
-            if p.error_type == "validation"
-            and (p.entity_pattern == entity_name or p.entity_pattern == "*")
-            and p.occurrence_count >= min_occ
-        ]
-
-        if not self._neo4j_available or not self.driver:
-            return sorted(cached, key=lambda p: p.severity_score, reverse=True)
-
-        try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (ap:GenerationAntiPattern)
-                    WHERE ap.error_type = 'validation'
-                      AND (ap.entity_pattern = $entity_name OR ap.entity_pattern = '*')
-                      AND ap.occurrence_count >= $min_occ
-                    RETURN ap
-                    ORDER BY ap.occurrence_count DESC
-                    LIMIT $limit
-                """, {
-                    "entity_name": entity_name,
-                    "min_occ": min_occ,
-                    "limit": self.MAX_PATTERNS_PER_QUERY
-                })
-
-                patterns = []
-                for record in result:
-                    pattern = self._node_to_pattern(record["ap"])
-                    self._cache[pattern.pattern_id] = pattern
-                    patterns.append(pattern)
-
-                return sorted(patterns, key=lambda p: p.severity_score, reverse=True)
-
-        except Exception as e:
-            self.logger.warning(f"Failed to query patterns for schema: {e}")
-            return cached
+        return self._query_patterns(
+            query_key=("schema", entity_name),
+            where="ap.error_type = 'validation' AND ap.entity_pattern IN [$entity_name, '*']",
+            params={"entity_name": entity_name},
+            local=lambda: self._index.for_entity(entity_name, error_type="validation"),
+            min_occurrences=min_occurrences,
+            label="schema",
+        )
 
     def get_patterns_by_error_type(
         self,
@@ -596,42 +699,101 @@ class NegativePatternStore:
         min_occurrences: int = None
     ) -> List[GenerationAntiPattern]:
         """Get all patterns of a specific error type."""
-        min_occ = min_occurrences or self.MIN_OCCURRENCE_FOR_PROMPT
+        return self._query_patterns(
+            query_key=("error_type", error_type),
+            where="ap.error_type = $error_type",
+            params={"error_type": error_type},
+            local=lambda: self._index.for_error_type(error_type),
+            min_occurrences=min_occurrences,
+            label="error type",
+        )
 
-        cached = [
-            p for p in self._cache.values()
-            if p.error_type == error_type and p.occurrence_count >= min_occ
-        ]
+    def _query_patterns(
+        self,
+        query_key: Tuple,
+        where: str,
+        params: Dict[str, Any],
+        local,
+        min_occurrences: Optional[int],
+        label: str,
+    ) -> List[GenerationAntiPattern]:
+        """
+        Run a filtered pattern lookup against the local index or Neo4j.
 
-        if not self._neo4j_available or not self.driver:
-            return sorted(cached, key=lambda p: p.severity_score, reverse=True)
+        Served from the local index in cache-only mode, while the same query
+        was refreshed less than CACHE_TTL_SECONDS ago, and when Neo4j fails.
+        Otherwise the filter runs in Cypher and its results refresh the index.
+
+        Args:
+            query_key: Identifies the query for TTL bookkeeping. A refresh also
+                serves stricter min_occurrences: its top patterns by occurrence
+                include theirs
+            where: Cypher WHERE condition on `ap`
+            params: Cypher parameters used by `where`
+            local: Returns the index candidates of this query
+            min_occurrences: Minimum occurrence count (default: MIN_OCCURRENCE_FOR_PROMPT)
+            label: Query description for log messages
+
+        Returns:
+            Up to MAX_PATTERNS_PER_QUERY most frequent patterns, sorted by severity
+        """
+        min_occ = min_occurrences or self.MIN_OCCURRENCE_FOR_PROMPT
+
+        with self._refreshed_lock:
+            refreshed_at, refreshed_min_occ = self._refreshed.get(query_key, (None, None))
+        fresh = (
+            refreshed_at is not None
+            and refreshed_min_occ <= min_occ
+            and time.monotonic() - refreshed_at < self.CACHE_TTL_SECONDS
+        )
+        if fresh or not self._neo4j_available or not self.driver:
+            return self._rank(local(), min_occ)
 
         try:
             with self.driver.session() as session:
-                result = session.run("""
+                result = session.run(f"""
                     MATCH (ap:GenerationAntiPattern)
-                    WHERE ap.error_type = $error_type
+                    WHERE ({where})
                       AND ap.occurrence_count >= $min_occ
                     RETURN ap
                     ORDER BY ap.occurrence_count DESC
                     LIMIT $limit
                 """, {
-                    "error_type": error_type,
+                    **params,
                     "min_occ": min_occ,
                     "limit": self.MAX_PATTERNS_PER_QUERY
                 })
 
-                patterns = []
-                for record in result:
-                    pattern = self._node_to_pattern(record["ap"])
-                    self._cache[pattern.pattern_id] = pattern
-                    patterns.append(pattern)
+                patterns = [self._index.add(self._node_to_pattern(record["ap"])) for record in result]
+
+            self._mark_refreshed(query_key, min_occ)
 
-                return sorted(patterns, key=lambda p: p.severity_score, reverse=True)
+            return sorted(patterns, key=lambda p: p.severity_score, reverse=True)
 
         except Exception as e:
-            self.logger.warning(f"Failed to query patterns by error type: {e}")
-            return cached
+            self.logger.warning(f"Failed to query patterns for {label}: {e}")
+            return self._rank(local(), min_occ)
+
+    def _mark_refreshed(self, query_key: Tuple, min_occ: int) -> None:
+        """Record a query refresh, dropping expired and excess entries."""
+        now = time.monotonic()
+        with self._refreshed_lock:
+            self._refreshed[query_key] = (now, min_occ)
+            self._refreshed.move_to_end(query_key)
+            while self._refreshed:
+                oldest_key, (refreshed_at, _) = next(iter(self._refreshed.items()))
+                if now - refreshed_at < self.CACHE_TTL_SECONDS and len(self._refreshed) <= self.MAX_TRACKED_QUERIES:
+                    break
+                del self._refreshed[oldest_key]
+
+    def _rank(self, patterns: Iterable[GenerationAntiPattern], min_occ: int) -> List[GenerationAntiPattern]:
+        """Local equivalent of the Cypher ranking: top occurrences, sorted by severity."""
+        qualifying = sorted(
+            (p for p in patterns if p.occurrence_count >= min_occ),
+            key=lambda p: p.occurrence_count,
+            reverse=True
+        )
+        return sorted(qualifying[:self.MAX_PATTERNS_PER_QUERY], key=lambda p: p.severity_score, reverse=True)
 
     def get_all_patterns(
         self,
@@ -661,9 +823,7 @@ class NegativePatternStore:
 
                 patterns = []
                 for record in result:
-                    pattern = self._node_to_pattern(record["ap"])
-                    self._cache[pattern.pattern_id] = pattern
-                    patterns.append(pattern)
+                    patterns.append(self._index.add(self._node_to_pattern(record["ap"])))
 
                 return patterns
 
@@ -784,32 +944,6 @@ class NegativePatternStore:
             created_at=created_at,
         )
 
-    def _normalize_endpoint(self, endpoint: str) -> str:
-        """Normalize endpoint to pattern form."""
-        # /products/123 → /products/{id}
-        # /users/abc-def/orders → /users/{id}/orders
-        pattern = re.sub(r'/\d+', '/{id}', endpoint)
-        pattern = re.sub(
-            r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
-            '/{id}',
-            pattern,
-            flags=re.IGNORECASE
-        )
-        return pattern
-
-    def _endpoint_matches(self, pattern: str, endpoint: str) -> bool:
-        """Check if endpoint matches pattern."""
-        if pattern == "*":
-            return True
-        if pattern == endpoint:
-            return True
-
-        # Generalize both and compare
-        norm_pattern = self._normalize_endpoint(pattern)
-        norm_endpoint = self._normalize_endpoint(endpoint)
-
-        return norm_pattern == norm_endpoint
-
 
 # =============================================================================
 # Singleton Instance
@@ -237,9 +237,11 @@ class CodeRepairAgent:
                         )
                         if success:
                             repairs_applied.append(f"Added validation: {validation_str}")
+                            # Database constraints are routed to entities.py, the rest to schemas.py
                             schemas_file = str(self.output_path / "src" / "models" / "schemas.py")
-                            if schemas_file not in repaired_files:
-                                repaired_files.append(schemas_file)
+                            for constraint_file in (schemas_file, str(self.entities_file)):
+                                if constraint_file not in repaired_files:
+                                    repaired_files.append(constraint_file)
                         else:
                             logger.warning(f"Failed to add validation: {validation_str}")
                     except Exception as e:
@@ -380,9 +382,11 @@ class CodeRepairAgent:
                         success = await self._repair_validation_from_ir(validation_str)
                         if success:
                             repairs_applied.append(f"Added validation (IR): {validation_str}")
+                            # Database constraints are routed to entities.py, the rest to schemas.py
                             schemas_file = str(self.output_path / "src" / "models" / "schemas.py")
-                            if schemas_file not in repaired_files:
-                                repaired_files.append(schemas_file)
+                            for constraint_file in (schemas_file, str(self.entities_file)):
+                                if constraint_file not in repaired_files:
+                                    repaired_files.append(constraint_file)
                         else:
                             # Log as info, not warning - constraints can be complex
                             logger.info(f"Constraint not auto-repairable: {validation_str}")
@@ -68,6 +68,9 @@ class AuditLog(Base):
         Index('ix_audit_logs_user_id', 'user_id'),
         Index('ix_audit_logs_resource', 'resource_type', 'resource_id'),
         Index('ix_audit_logs_action', 'action'),
+        # Security monitoring detections (windowed aggregates by action/result)
+        Index('ix_audit_logs_action_result_timestamp', 'action', 'result', 'timestamp'),
+        Index('ix_audit_logs_result_timestamp', 'result', 'timestamp'),
     )
 
     def __repr__(self):
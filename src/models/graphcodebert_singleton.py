@@ -31,8 +31,14 @@ Reference: P3 fix for DevMatrix QA evaluation
 import threading
 import warnings
 import logging
-from typing import Optional
-from sentence_transformers import SentenceTransformer
+from typing import TYPE_CHECKING, Optional
+
+from src.models.model_registry import get_model_registry, load_sentence_transformer
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+GRAPHCODEBERT_MODEL = 'microsoft/graphcodebert-base'
 
 
 class GraphCodeBERTSingleton:
@@ -44,12 +50,12 @@ class GraphCodeBERTSingleton:
     request it.
     """
 
-    _instance: Optional[SentenceTransformer] = None
+    _instance: Optional["SentenceTransformer"] = None
     _lock = threading.Lock()
     _loaded = False
 
     @classmethod
-    def get_instance(cls) -> SentenceTransformer:
+    def get_instance(cls) -> "SentenceTransformer":
         """
         Get singleton instance of GraphCodeBERT.
 
@@ -76,7 +82,7 @@ class GraphCodeBERTSingleton:
             return cls._instance
 
     @classmethod
-    def _load_model(cls) -> SentenceTransformer:
+    def _load_model(cls) -> "SentenceTransformer":
         """
         Load GraphCodeBERT model with warnings suppressed.
 
@@ -117,7 +123,8 @@ class GraphCodeBERTSingleton:
 
                 logger.info("⏳ Loading GraphCodeBERT model (singleton, first time only)...")
 
-                model = SentenceTransformer('microsoft/graphcodebert-base')
+                # Shared with any other component using the same model
+                model = get_model_registry().get(load_sentence_transformer, GRAPHCODEBERT_MODEL)
 
                 logger.info("✅ GraphCodeBERT singleton loaded (768-dim embeddings)")
 
@@ -141,7 +148,7 @@ class GraphCodeBERTSingleton:
 
 
 # Convenience function for cleaner imports
-def get_graphcodebert() -> SentenceTransformer:
+def get_graphcodebert() -> "SentenceTransformer":
     """
     Get GraphCodeBERT singleton instance.
 
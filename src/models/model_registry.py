@@ -0,0 +1,278 @@
+"""
+Model Registry
+
+Process-wide registry for the ML models used by the RAG, pattern and
+validation subsystems (SentenceTransformer, CrossEncoder, transformers
+AutoTokenizer / AutoModel).
+
+- One instance per (loader, model name, device), shared by every component
+  that asks for it (EmbeddingModel, SemanticMatcher, CrossEncoderReranker,
+  PatternBank, GraphCodeBERT singleton). device=None is resolved to the
+  device the loader would pick, so it shares the instance of that device
+- Models are loaded lazily on first use. torch, transformers and
+  sentence_transformers are imported by the loaders, not when a module
+  that uses a model is imported, so importing src.api.main stays cheap
+- Components declare the models they will need when constructed; with
+  MODEL_WARMUP=true the API declares the configured embedding and
+  re-ranking models and loads every declared model in a background thread
+  once the server is ready, so the first request does not pay for it
+
+Usage:
+    from src.models.model_registry import get_sentence_transformer
+
+    encoder = get_sentence_transformer("all-MiniLM-L6-v2")  # loaded once
+
+Configuration:
+    MODEL_WARMUP: Load declared models in the background after startup (default: false)
+    CROSS_ENCODER_ONNX_INT8_FILE: Quantized ONNX file for the "onnx-int8"
+        cross-encoder backend (default: onnx/model_quint8_avx2.onnx)
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODEL_WARMUP_ENABLED = os.getenv("MODEL_WARMUP", "false").lower() == "true"
+
+# Quantized ONNX file inside the cross-encoder's model repository
+CROSS_ENCODER_ONNX_INT8_FILE = os.getenv("CROSS_ENCODER_ONNX_INT8_FILE", "onnx/model_quint8_avx2.onnx")
+
+# loader(model_name, device) -> model
+ModelLoader = Callable[[str, Optional[str]], Any]
+ModelKey = Tuple[Hashable, str, Optional[str]]
+
+
+def load_sentence_transformer(model_name: str, device: Optional[str] = None):
+    """Load a sentence-transformers bi-encoder."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name, device=device)
+
+
+def load_cross_encoder(model_name: str, device: Optional[str] = None):
+    """Load a sentence-transformers cross-encoder."""
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(model_name, device=device)
+
+
+def load_cross_encoder_onnx(model_name: str, device: Optional[str] = None):
+    """Load a cross-encoder on the ONNX Runtime backend (CPU inference)."""
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(model_name, device=device, backend="onnx")
+
+
+def load_cross_encoder_onnx_int8(model_name: str, device: Optional[str] = None):
+    """Load the int8-quantized ONNX export of a cross-encoder (CPU inference)."""
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(
+        model_name,
+        device=device,
+        backend="onnx",
+        model_kwargs={"file_name": CROSS_ENCODER_ONNX_INT8_FILE},
+    )
+
+
+def load_transformers_tokenizer(model_name: str, device: Optional[str] = None):
+    """Load a transformers tokenizer (device is ignored)."""
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(model_name)
+
+
+def load_transformers_model(model_name: str, device: Optional[str] = None):
+    """Load a transformers encoder in eval mode."""
+    from transformers import AutoModel
+
+    model = AutoModel.from_pretrained(model_name)
+    if device is not None:
+        model = model.to(device)
+    model.eval()
+    return model
+
+
+@functools.lru_cache(maxsize=None)
+def _sentence_transformers_device() -> str:
+    """Device sentence-transformers picks when none is given (cuda, mps, ... or cpu)."""
+    from sentence_transformers.util import get_device_name
+
+    return get_device_name()
+
+
+# loader -> device it uses when given None
+_DEFAULT_DEVICES: Dict[ModelLoader, Callable[[], str]] = {
+    load_sentence_transformer: _sentence_transformers_device,
+    load_cross_encoder: _sentence_transformers_device,
+    load_cross_encoder_onnx: _sentence_transformers_device,
+    load_cross_encoder_onnx_int8: _sentence_transformers_device,
+    load_transformers_model: lambda: "cpu",  # Not moved off the CPU without a device
+}
+
+
+def resolve_device(loader: ModelLoader, device: Optional[str]) -> Optional[str]:
+    """
+    Device a loader actually uses, so a model requested with device=None and
+    with its default device explicitly is one instance.
+
+    Unknown loaders keep the device as given.
+    """
+    if loader is load_transformers_tokenizer:
+        return None  # Tokenizers have no device
+    if device is None and loader in _DEFAULT_DEVICES:
+        return _DEFAULT_DEVICES[loader]()
+    return device
+
+
+class ModelRegistry:
+    """
+    Lazily loaded, shared model instances.
+
+    Thread-safe: each (loader, model name, device) is loaded exactly once
+    even if several threads ask for it at the same time; different models
+    load concurrently.
+    """
+
+    def __init__(self):
+        self._models: Dict[ModelKey, Any] = {}
+        self._declared: Dict[ModelKey, ModelLoader] = {}
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.load_times: Dict[ModelKey, float] = {}
+
+    @staticmethod
+    def _key(loader: ModelLoader, model_name: str, device: Optional[str]) -> ModelKey:
+        return (loader, model_name, device)
+
+    def get(self, loader: ModelLoader, model_name: str, device: Optional[str] = None) -> Any:
+        """
+        Get a model, loading it on first use.
+
+        Args:
+            loader: Callable (model_name, device) -> model, e.g. load_sentence_transformer
+            model_name: HuggingFace model ID or local path
+            device: Device passed to the loader (None = library default)
+
+        Returns:
+            Shared model instance
+
+        Raises:
+            Exception: Whatever the loader raises; failures are not cached
+        """
+        device = resolve_device(loader, device)
+        key = self._key(loader, model_name, device)
+
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            model = self._models.get(key)
+            if model is not None:
+                return model
+
+            logger.info(f"Loading model '{model_name}' (device: {device or 'default'})")
+            start = time.perf_counter()
+            model = loader(model_name, device)
+            self.load_times[key] = time.perf_counter() - start
+            logger.info(f"Model '{model_name}' loaded in {self.load_times[key]:.1f}s")
+
+            with self._lock:
+                self._models[key] = model
+
+        return model
+
+    def declare(self, loader: ModelLoader, model_name: str, device: Optional[str] = None) -> None:
+        """
+        Declare a model a component will use, without loading it.
+
+        Declared models are loaded by warm_up(). The device is resolved
+        then, so declaring does not import the model libraries.
+        """
+        with self._lock:
+            self._declared.setdefault(self._key(loader, model_name, device), loader)
+
+    def is_loaded(self, loader: ModelLoader, model_name: str, device: Optional[str] = None) -> bool:
+        return self._key(loader, model_name, resolve_device(loader, device)) in self._models
+
+    def loaded_models(self) -> List[Tuple[str, Optional[str]]]:
+        """(model name, device) of every loaded model."""
+        with self._lock:
+            return [(name, device) for _, name, device in self._models]
+
+    def warm_up(self, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Load every declared model that is not loaded yet.
+
+        Failures are logged; the model is then loaded (or fails) on first use
+        as without warm-up.
+
+        Args:
+            background: Load in a daemon thread instead of blocking
+
+        Returns:
+            The warm-up thread if background, else None
+        """
+        with self._lock:
+            pending = [key for key in self._declared if key not in self._models]
+
+        def run():
+            for loader, model_name, device in pending:
+                try:
+                    self.get(loader, model_name, device)
+                except Exception as e:
+                    logger.warning(f"Model warm-up failed for '{model_name}': {e}")
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, name="model-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self) -> None:
+        """Drop all loaded models and declarations."""
+        with self._lock:
+            self._models.clear()
+            self._declared.clear()
+            self._load_locks.clear()
+            self.load_times.clear()
+
+
+# Global registry (singleton per process)
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry."""
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+
+    return _registry
+
+
+def get_sentence_transformer(model_name: str, device: Optional[str] = None):
+    """Get the shared SentenceTransformer for (model_name, device)."""
+    return get_model_registry().get(load_sentence_transformer, model_name, device)
+
+
+def get_cross_encoder(model_name: str, device: Optional[str] = None):
+    """Get the shared CrossEncoder for (model_name, device)."""
+    return get_model_registry().get(load_cross_encoder, model_name, device)
@@ -76,6 +76,8 @@ class SecurityEvent(Base):
         Index('idx_security_events_detected_at', 'detected_at'),
         Index('idx_security_events_severity', 'severity'),
         Index('idx_security_events_resolved', 'resolved'),
+        # Open event lookup when upserting detections
+        Index('idx_security_events_type_user_detected', 'event_type', 'user_id', 'detected_at'),
         CheckConstraint(
             "severity IN ('low', 'medium', 'high', 'critical')",
             name='ck_security_events_severity'
@@ -13,8 +13,10 @@ from typing import Optional
 
 from .structured_logger import StructuredLogger, LogContext, LogLevel
 from .metrics_collector import MetricsCollector, MetricType, Metric
+from .histogram import StreamingHistogram, QuantileSketch
 from .health_check import HealthCheck, HealthStatus, ComponentHealth
-from .middleware import MetricsMiddleware
+from .asgi_pipeline import MiddlewarePipeline, PipelineStage, RequestContext
+from .middleware import MetricsMiddleware, MetricsStage
 
 __all__ = [
     "StructuredLogger",
@@ -23,10 +25,16 @@ __all__ = [
     "MetricsCollector",
     "MetricType",
     "Metric",
+    "StreamingHistogram",
+    "QuantileSketch",
     "HealthCheck",
     "HealthStatus",
     "ComponentHealth",
     "MetricsMiddleware",
+    "MetricsStage",
+    "MiddlewarePipeline",
+    "PipelineStage",
+    "RequestContext",
     "setup_logging",
     "get_logger",
 ]
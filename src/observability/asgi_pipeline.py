@@ -0,0 +1,164 @@
+"""
+Pure-ASGI Middleware Pipeline
+
+Runs several request stages (metrics, audit, rate limiting, security headers,
+...) inside ONE ASGI middleware instead of a chain of BaseHTTPMiddleware
+layers.
+
+Each BaseHTTPMiddleware layer wraps the downstream app in its own task,
+memory stream and Request/Response objects, so a stack of five adds that
+overhead five times per request and buffers streaming responses through
+every layer. The pipeline instead:
+- Builds one RequestContext per request (method, path, headers parsed once)
+- Calls each stage's on_request() in order; a stage may short-circuit by
+  returning a Response (e.g. 429), in which case inner stages are skipped
+- Wraps `send` once: on http.response.start every entered stage can add
+  headers (innermost first), and the status code is captured
+- Calls on_complete() in reverse order after the response body was sent
+
+Non-HTTP scopes (websocket, lifespan) pass straight through.
+
+Stage contract (duck-typed, see PipelineStage):
+    async def on_request(ctx) -> Optional[Response]
+    def on_response_start(ctx, headers: MutableHeaders) -> None
+    async def on_complete(ctx, exc: Optional[BaseException]) -> None
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .structured_logger import StructuredLogger
+
+logger = StructuredLogger("observability.asgi_pipeline")
+
+
+class RequestContext:
+    """Per-request data shared by all pipeline stages."""
+
+    __slots__ = ("scope", "method", "path", "start_time", "status_code", "values", "_headers", "_request")
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.start_time = time.perf_counter()
+        self.status_code: Optional[int] = None  # set on http.response.start
+        self.values: Dict[str, Any] = {}  # per-stage scratch space
+        self._headers: Optional[Headers] = None
+        self._request: Optional[Request] = None
+
+    @property
+    def headers(self) -> Headers:
+        """Request headers (parsed on first access)."""
+        if self._headers is None:
+            self._headers = Headers(scope=self.scope)
+        return self._headers
+
+    @property
+    def request(self) -> Request:
+        """Starlette Request view of the scope (shares request.state with handlers)."""
+        if self._request is None:
+            self._request = Request(self.scope)
+        return self._request
+
+    @property
+    def client_host(self) -> Optional[str]:
+        client = self.scope.get("client")
+        return client[0] if client else None
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """Raw request.state storage (set by auth / correlation ID middleware)."""
+        return self.scope.setdefault("state", {})
+
+
+class PipelineStage:
+    """
+    Base class for pipeline stages. All hooks are optional no-ops.
+    """
+
+    async def on_request(self, ctx: RequestContext) -> Optional[Response]:
+        """Inspect the request; return a Response to short-circuit the app."""
+        return None
+
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        """Mutate response headers before they are sent."""
+
+    async def on_complete(self, ctx: RequestContext, exc: Optional[BaseException]) -> None:
+        """Called once the response finished (or the app raised `exc`)."""
+
+
+class MiddlewarePipeline:
+    """
+    Pure-ASGI middleware running a sequence of stages (outermost first).
+
+    Usage:
+        app.add_middleware(
+            MiddlewarePipeline,
+            stages=[MetricsStage(collector), AuditStage(), SecurityHeadersStage()],
+        )
+    """
+
+    def __init__(self, app: ASGIApp, stages: Sequence[PipelineStage]):
+        """
+        Args:
+            app: Downstream ASGI application
+            stages: Stages in the order a BaseHTTPMiddleware stack would
+                run them (first = outermost)
+        """
+        self.app = app
+        self.stages: List[PipelineStage] = list(stages)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = RequestContext(scope)
+        entered: List[PipelineStage] = []
+        exc: Optional[BaseException] = None
+
+        try:
+            response: Optional[Response] = None
+            for stage in self.stages:
+                response = await stage.on_request(ctx)
+                if response is not None:
+                    # The short-circuiting stage built its own headers
+                    break
+                entered.append(stage)
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    ctx.status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    for entered_stage in reversed(entered):
+                        entered_stage.on_response_start(ctx, headers)
+                await send(message)
+
+            if response is not None:
+                await response(scope, receive, send_wrapper)
+            else:
+                await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            await self._complete(ctx, entered, exc)
+
+    async def _complete(
+        self, ctx: RequestContext, entered: List[PipelineStage], exc: Optional[BaseException]
+    ) -> None:
+        """Run on_complete of every entered stage, innermost first; errors are logged."""
+        for stage in reversed(entered):
+            try:
+                await stage.on_complete(ctx, exc)
+            except Exception as e:
+                logger.error(
+                    f"Pipeline stage {type(stage).__name__} failed on completion",
+                    extra={"error": str(e), "path": ctx.path}
+                )
@@ -0,0 +1,231 @@
+"""
+Streaming Histograms
+
+Fixed-memory histogram used by MetricsCollector. Observations are never
+stored; each series keeps:
+- count / sum / min / max
+- Cumulative Prometheus buckets (`le` upper bounds)
+- A QuantileSketch for p50/p95/p99
+
+QuantileSketch is a DDSketch-style log-bucketed sketch: values are mapped
+to buckets whose boundaries grow geometrically by `gamma`, so every
+quantile estimate is within `relative_accuracy` of the true value. Sketches
+with the same accuracy merge by adding bucket counts. Memory is bounded by
+`max_bins`; past that, the lowest buckets are collapsed (high quantiles,
+the ones that matter for latency, keep their accuracy).
+"""
+
+import math
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Prometheus client default buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees.
+
+    Example:
+        >>> sketch = QuantileSketch()
+        >>> for v in range(1, 1001):
+        ...     sketch.add(v)
+        >>> round(sketch.quantile(0.99))  # within 1% of 990
+        990
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        """
+        Args:
+            relative_accuracy: Max relative error of quantile estimates
+            max_bins: Max buckets per sign before the lowest are collapsed
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        if value > 0:
+            self._add_to(self._positive, self._index(value))
+        elif value < 0:
+            self._add_to(self._negative, self._index(-value))
+        else:
+            self._zero_count += 1
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Negative values: largest magnitude first
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return -self._value(index)
+
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._value(index)
+
+        # Floating point rounding on q == 1
+        return self._value(max(self._positive)) if self._positive else 0.0
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch with the same relative accuracy into this one."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for index, count in other._positive.items():
+            self._add_to(self._positive, index, count)
+        for index, count in other._negative.items():
+            self._add_to(self._negative, index, count)
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    @property
+    def num_bins(self) -> int:
+        return len(self._positive) + len(self._negative)
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def _add_to(self, bins: Dict[int, int], index: int, count: int = 1) -> None:
+        bins[index] = bins.get(index, 0) + count
+        if len(bins) > self.max_bins:
+            self._collapse(bins)
+
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """Fold the lowest buckets into one so at most max_bins remain."""
+        indexes = sorted(bins)
+        excess = len(indexes) - self.max_bins + 1
+        target = indexes[excess]
+        bins[target] += sum(bins.pop(index) for index in indexes[:excess])
+
+
+class StreamingHistogram:
+    """
+    Histogram series with cumulative buckets and quantile estimates.
+
+    Memory is constant in the number of observations.
+    """
+
+    __slots__ = ("bounds", "bucket_counts", "count", "sum", "min", "max", "sketch")
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None, relative_accuracy: float = 0.01):
+        """
+        Args:
+            buckets: Bucket upper bounds (default: DEFAULT_BUCKETS); +Inf is implicit
+            relative_accuracy: Quantile sketch accuracy
+        """
+        self.bounds: List[float] = sorted(float(b) for b in (buckets or DEFAULT_BUCKETS) if b != math.inf)
+        self.bucket_counts: List[int] = [0] * (len(self.bounds) + 1)  # last = +Inf overflow
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.bucket_counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sketch.add(value)
+
+    def observe_many(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.observe(value)
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Merge another histogram with the same buckets into this one."""
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different buckets")
+
+        for i, bucket_count in enumerate(other.bucket_counts):
+            self.bucket_counts[i] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile, clamped to the observed min/max (0.0 if empty)."""
+        estimate = self.sketch.quantile(q)
+        if estimate is None:
+            return 0.0
+        return min(max(estimate, self.min), self.max)
+
+    def cumulative_buckets(self) -> List[tuple]:
+        """
+        Prometheus `_bucket` samples.
+
+        Returns:
+            List of (le, cumulative_count), ending with ("+Inf", count)
+        """
+        result = []
+        running = 0
+        # bucket_counts has one more entry (the +Inf overflow), reported as count below
+        for bound, bucket_count in zip(self.bounds, self.bucket_counts, strict=False):
+            running += bucket_count
+            result.append((bound, running))
+        result.append(("+Inf", self.count))
+        return result
+
+    def stats(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, float]:
+        """
+        Summary statistics.
+
+        Returns:
+            Dictionary with count, sum, min, max, avg and p<NN> per quantile
+        """
+        if self.count == 0:
+            stats = {"count": 0, "sum": 0.0, "min": 0.0, "max": 0.0, "avg": 0.0}
+        else:
+            stats = {
+                "count": self.count,
+                "sum": self.sum,
+                "min": self.min,
+                "max": self.max,
+                "avg": self.sum / self.count,
+            }
+        for q in quantiles:
+            stats[f"p{q * 100:g}"] = self.quantile(q)
+        return stats
@@ -6,12 +6,15 @@ system performance and behavior.
 """
 
 import time
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
 from threading import Lock
 
+from .histogram import StreamingHistogram
+
 
 class MetricType(Enum):
     """Metric type enumeration."""
@@ -40,6 +43,14 @@ class MetricsCollector:
     Collects and exposes metrics in Prometheus exposition format
     for scraping by monitoring systems.
 
+    Memory and scrape cost are bounded:
+    - Histograms are StreamingHistogram series (buckets + quantile sketch),
+      observations are not stored
+    - Updates take one of LOCK_STRIPES locks (by series key), so hot
+      counters on different series do not contend
+    - Rendered exposition text is cached per series; a scrape only
+      re-renders series updated since the last one
+
     Example:
         >>> metrics = MetricsCollector()
         >>> metrics.increment_counter("requests_total", labels={"method": "GET"})
@@ -48,13 +59,22 @@ class MetricsCollector:
         >>> print(metrics.export_prometheus())
     """
 
+    LOCK_STRIPES = 16
+
     def __init__(self):
         """Initialize metrics collector."""
         self._counters: Dict[str, float] = defaultdict(float)
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, List[float]] = defaultdict(list)
+        self._histograms: Dict[str, StreamingHistogram] = {}
         self._metric_help: Dict[str, str] = {}
-        self._lock = Lock()
+        self._locks = [Lock() for _ in range(self.LOCK_STRIPES)]
+
+        # Exposition cache: (metric type, key) -> rendered lines
+        self._rendered: Dict[Tuple[MetricType, str], str] = {}
+        self._dirty: Set[Tuple[MetricType, str]] = set()
+        self._exposition: Optional[str] = None
+        # Guards _dirty and _metric_help, shared by all stripes (taken after a stripe lock)
+        self._meta_lock = Lock()
 
     def increment_counter(
         self,
@@ -73,10 +93,9 @@ class MetricsCollector:
             help_text: Help text
         """
         key = self._make_key(name, labels)
-        with self._lock:
+        with self._lock_for(key):
             self._counters[key] += value
-            if help_text:
-                self._metric_help[name] = help_text
+            self._mark_dirty(MetricType.COUNTER, key, name, help_text)
 
     def set_gauge(
         self,
@@ -95,10 +114,9 @@ class MetricsCollector:
             help_text: Help text
         """
         key = self._make_key(name, labels)
-        with self._lock:
+        with self._lock_for(key):
             self._gauges[key] = value
-            if help_text:
-                self._metric_help[name] = help_text
+            self._mark_dirty(MetricType.GAUGE, key, name, help_text)
 
     def observe_histogram(
         self,
@@ -106,6 +124,7 @@ class MetricsCollector:
         value: float,
         labels: Optional[Dict[str, str]] = None,
         help_text: str = "",
+        buckets: Optional[Sequence[float]] = None,
     ):
         """
         Add observation to histogram.
@@ -115,12 +134,16 @@ class MetricsCollector:
             value: Observed value
             labels: Metric labels
             help_text: Help text
+            buckets: Bucket upper bounds, used when the series is created
+                (default: Prometheus default latency buckets)
         """
         key = self._make_key(name, labels)
-        with self._lock:
-            self._histograms[key].append(value)
-            if help_text:
-                self._metric_help[name] = help_text
+        with self._lock_for(key):
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = StreamingHistogram(buckets)
+            histogram.observe(value)
+            self._mark_dirty(MetricType.HISTOGRAM, key, name, help_text)
 
     def get_counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> float:
         """Get counter value."""
@@ -141,72 +164,119 @@ class MetricsCollector:
         Get histogram statistics.
 
         Returns:
-            Dictionary with count, sum, min, max, avg
+            Dictionary with count, sum, min, max, avg, p50, p95, p99
         """
         key = self._make_key(name, labels)
-        values = self._histograms.get(key, [])
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            return StreamingHistogram().stats()
 
-        if not values:
-            return {"count": 0, "sum": 0.0, "min": 0.0, "max": 0.0, "avg": 0.0}
+        with self._lock_for(key):
+            return histogram.stats()
+
+    def get_histogram_quantile(
+        self,
+        name: str,
+        q: float,
+        labels: Optional[Dict[str, str]] = None
+    ) -> float:
+        """Estimated q-quantile of a histogram (0.0 if it has no observations)."""
+        key = self._make_key(name, labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            return 0.0
 
-        return {
-            "count": len(values),
-            "sum": sum(values),
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
-        }
+        with self._lock_for(key):
+            return histogram.quantile(q)
 
     def export_prometheus(self) -> str:
         """
         Export metrics in Prometheus exposition format.
 
+        Only series updated since the previous export are re-rendered; if
+        nothing changed, the previous text is returned as is.
+
         Returns:
             Prometheus-formatted metrics
         """
-        lines = []
+        with self._all_locks(), self._meta_lock:
+            if self._exposition is not None and not self._dirty:
+                return self._exposition
 
-        with self._lock:
-            # Export counters
-            for key, value in sorted(self._counters.items()):
-                name, labels = self._parse_key(key)
-                if name in self._metric_help:
-                    lines.append(f"# HELP {name} {self._metric_help[name]}")
-                lines.append(f"# TYPE {name} counter")
-                label_str = self._format_labels(labels) if labels else ""
-                lines.append(f"{name}{label_str} {value}")
-
-            # Export gauges
-            for key, value in sorted(self._gauges.items()):
-                name, labels = self._parse_key(key)
-                if name in self._metric_help:
-                    lines.append(f"# HELP {name} {self._metric_help[name]}")
-                lines.append(f"# TYPE {name} gauge")
-                label_str = self._format_labels(labels) if labels else ""
-                lines.append(f"{name}{label_str} {value}")
-
-            # Export histograms
-            for key, values in sorted(self._histograms.items()):
-                name, labels = self._parse_key(key)
-                if name in self._metric_help:
-                    lines.append(f"# HELP {name} {self._metric_help[name]}")
-                lines.append(f"# TYPE {name} histogram")
-
-                stats = self.get_histogram_stats(name, labels)
-                label_str = self._format_labels(labels) if labels else ""
-
-                lines.append(f"{name}_count{label_str} {stats['count']}")
-                lines.append(f"{name}_sum{label_str} {stats['sum']}")
-
-        return "\n".join(lines) + "\n"
+            for metric_type, key in self._dirty:
+                self._rendered[(metric_type, key)] = self._render_series(metric_type, key)
+            self._dirty.clear()
+
+            blocks = []
+            for metric_type, series in (
+                (MetricType.COUNTER, self._counters),
+                (MetricType.GAUGE, self._gauges),
+                (MetricType.HISTOGRAM, self._histograms),
+            ):
+                blocks.extend(self._rendered[(metric_type, key)] for key in sorted(series))
+
+            self._exposition = "\n".join(blocks) + "\n"
+            return self._exposition
 
     def reset(self):
         """Reset all metrics."""
-        with self._lock:
+        with self._all_locks(), self._meta_lock:
             self._counters.clear()
             self._gauges.clear()
             self._histograms.clear()
             self._metric_help.clear()
+            self._rendered.clear()
+            self._dirty.clear()
+            self._exposition = None
+
+    def _lock_for(self, key: str) -> Lock:
+        return self._locks[hash(key) % self.LOCK_STRIPES]
+
+    @contextmanager
+    def _all_locks(self):
+        """Hold every stripe (export/reset see a consistent snapshot)."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _mark_dirty(self, metric_type: MetricType, key: str, name: str, help_text: str) -> None:
+        """Record a series update (caller holds the series' stripe lock)."""
+        with self._meta_lock:
+            self._dirty.add((metric_type, key))
+            if help_text and self._metric_help.get(name) != help_text:
+                self._metric_help[name] = help_text
+                # HELP line changed: every rendered series of this metric is stale
+                self._dirty.update(
+                    series for series in self._rendered
+                    if self._parse_key(series[1])[0] == name
+                )
+
+    def _render_series(self, metric_type: MetricType, key: str) -> str:
+        """Render the exposition lines of one series."""
+        name, labels = self._parse_key(key)
+        lines = []
+        if name in self._metric_help:
+            lines.append(f"# HELP {name} {self._metric_help[name]}")
+        lines.append(f"# TYPE {name} {metric_type.value}")
+        label_str = self._format_labels(labels) if labels else ""
+
+        if metric_type == MetricType.COUNTER:
+            lines.append(f"{name}{label_str} {self._counters[key]}")
+        elif metric_type == MetricType.GAUGE:
+            lines.append(f"{name}{label_str} {self._gauges[key]}")
+        else:
+            histogram = self._histograms[key]
+            for le, cumulative in histogram.cumulative_buckets():
+                bucket_labels = self._format_labels({**labels, "le": str(le)})
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{name}_count{label_str} {histogram.count}")
+            lines.append(f"{name}_sum{label_str} {histogram.sum}")
+
+        return "\n".join(lines)
 
     def _make_key(self, name: str, labels: Optional[Dict[str, str]]) -> str:
         """Make metric key from name and labels."""
@@ -5,39 +5,101 @@ Automatically instruments all HTTP requests with metrics:
 - Request count by endpoint/method/status
 - Request latency histogram
 - Error rates and status code distribution
+
+MetricsStage runs inside the pure-ASGI MiddlewarePipeline (see
+asgi_pipeline.py); MetricsMiddleware is the standalone single-stage form.
 """
 
 import time
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from functools import lru_cache
+from typing import Optional
+
+from starlette.responses import Response
 from starlette.types import ASGIApp
 
+from .asgi_pipeline import MiddlewarePipeline, PipelineStage, RequestContext
 from .metrics_collector import MetricsCollector
 from .structured_logger import StructuredLogger
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+def _looks_like_id(part: str) -> bool:
     """
-    Middleware for automatic HTTP metrics collection.
+    Check if path part looks like an ID.
+
+    Args:
+        part: Path component
+
+    Returns:
+        True if looks like ID
+    """
+    # Check for UUID pattern
+    if len(part) == 36 and part.count('-') == 4:
+        return True
+
+    # Check for numeric ID
+    if part.isdigit():
+        return True
+
+    # Check for hex ID (MongoDB style)
+    if len(part) == 24 and all(c in '0123456789abcdef' for c in part.lower()):
+        return True
+
+    return False
+
+
+@lru_cache(maxsize=4096)
+def normalize_metrics_path(path: str) -> str:
+    """
+    Normalize URL path for metrics labels.
+
+    Converts dynamic path parameters to template format to avoid
+    high cardinality in metrics labels. Cached: hot paths are classified
+    once instead of on every request.
+
+    Args:
+        path: Raw URL path
+
+    Returns:
+        Normalized path template
+    """
+    # Remove trailing slash
+    path = path.rstrip('/')
+
+    # Skip normalization for static assets and root
+    if not path or path.startswith('/static') or path.startswith('/assets'):
+        return path or '/'
+
+    # Replace UUIDs and IDs with template
+    normalized = [
+        '{id}' if _looks_like_id(part) else part
+        for part in path.split('/')
+        if part
+    ]
+
+    return '/' + '/'.join(normalized)
+
+
+class MetricsStage(PipelineStage):
+    """
+    Pipeline stage for automatic HTTP metrics collection.
 
     Collects:
     - http_requests_total: Counter of requests by endpoint/method/status
     - http_request_duration_seconds: Histogram of request latencies
+      (measured until the response body has been sent)
     - http_requests_in_progress: Gauge of concurrent requests
     """
 
-    def __init__(self, app: ASGIApp, metrics_collector: MetricsCollector):
+    def __init__(self, metrics_collector: MetricsCollector):
         """
-        Initialize metrics middleware.
+        Initialize metrics stage.
 
         Args:
-            app: ASGI application
             metrics_collector: Metrics collector instance
         """
-        super().__init__(app)
         self.metrics = metrics_collector
         self.logger = StructuredLogger("metrics.middleware")
+        self._in_progress = 0
 
         # Initialize in-progress gauge
         self.metrics.set_gauge(
@@ -46,144 +108,79 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             help_text="Number of HTTP requests currently being processed"
         )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process request and collect metrics.
-
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler
-
-        Returns:
-            HTTP response
-        """
-        # Start timing
-        start_time = time.time()
+    async def on_request(self, ctx: RequestContext) -> Optional[Response]:
+        self._in_progress += 1
+        self.metrics.set_gauge("http_requests_in_progress", self._in_progress)
+        return None
 
-        # Track request method and path
-        method = request.method
-        path = self._normalize_path(request.url.path)
+    async def on_complete(self, ctx: RequestContext, exc: Optional[BaseException]) -> None:
+        duration = time.perf_counter() - ctx.start_time
+        path = normalize_metrics_path(ctx.path)
+        method = ctx.method
 
-        # Increment in-progress requests
-        self.metrics.set_gauge(
-            "http_requests_in_progress",
-            self.metrics.get_gauge("http_requests_in_progress") or 0 + 1
-        )
+        # Default to error if the app raised before sending a response
+        status_code = ctx.status_code if ctx.status_code is not None else 500
 
-        # Process request
-        status_code = 500  # Default to error if exception occurs
-        try:
-            response = await call_next(request)
-            status_code = response.status_code
-            return response
+        self._in_progress = max(0, self._in_progress - 1)
+        self.metrics.set_gauge("http_requests_in_progress", self._in_progress)
 
-        except Exception as exc:
+        if exc is not None and isinstance(exc, Exception):
             self.logger.error(
                 f"Request failed: {method} {path}",
                 extra={"error": str(exc)}
             )
-            raise
 
-        finally:
-            # Calculate duration
-            duration = time.time() - start_time
-
-            # Decrement in-progress requests
-            current = self.metrics.get_gauge("http_requests_in_progress") or 1
-            self.metrics.set_gauge("http_requests_in_progress", current - 1)
+        # Record metrics
+        labels = {
+            "method": method,
+            "endpoint": path,
+            "status": str(status_code)
+        }
+
+        # Increment request counter
+        self.metrics.increment_counter(
+            "http_requests_total",
+            labels=labels,
+            help_text="Total HTTP requests"
+        )
 
-            # Record metrics
-            labels = {
-                "method": method,
-                "endpoint": path,
-                "status": str(status_code)
-            }
+        # Record request duration
+        self.metrics.observe_histogram(
+            "http_request_duration_seconds",
+            duration,
+            labels=labels,
+            help_text="HTTP request duration in seconds"
+        )
 
-            # Increment request counter
+        # Track error rates
+        if status_code >= 400:
+            error_type = "client_error" if status_code < 500 else "server_error"
             self.metrics.increment_counter(
-                "http_requests_total",
-                labels=labels,
-                help_text="Total HTTP requests"
+                "http_errors_total",
+                labels={
+                    "method": method,
+                    "endpoint": path,
+                    "status": str(status_code),
+                    "error_type": error_type
+                },
+                help_text="Total HTTP errors"
             )
 
-            # Record request duration
-            self.metrics.observe_histogram(
-                "http_request_duration_seconds",
-                duration,
-                labels=labels,
-                help_text="HTTP request duration in seconds"
-            )
-
-            # Track error rates
-            if status_code >= 400:
-                error_type = "client_error" if status_code < 500 else "server_error"
-                self.metrics.increment_counter(
-                    "http_errors_total",
-                    labels={
-                        "method": method,
-                        "endpoint": path,
-                        "status": str(status_code),
-                        "error_type": error_type
-                    },
-                    help_text="Total HTTP errors"
-                )
-
-    def _normalize_path(self, path: str) -> str:
-        """
-        Normalize URL path for metrics labels.
-
-        Converts dynamic path parameters to template format to avoid
-        high cardinality in metrics labels.
-
-        Args:
-            path: Raw URL path
-
-        Returns:
-            Normalized path template
-        """
-        # Remove trailing slash
-        path = path.rstrip('/')
 
-        # Skip normalization for static assets and root
-        if not path or path.startswith('/static') or path.startswith('/assets'):
-            return path or '/'
-
-        # Common API path patterns
-        parts = path.split('/')
-        normalized = []
-
-        for i, part in enumerate(parts):
-            if not part:
-                continue
-
-            # Replace UUIDs and IDs with template
-            if self._looks_like_id(part):
-                normalized.append('{id}')
-            else:
-                normalized.append(part)
+class MetricsMiddleware(MiddlewarePipeline):
+    """
+    Middleware for automatic HTTP metrics collection.
 
-        return '/' + '/'.join(normalized)
+    Single-stage pipeline; when combining with other stages, add a
+    MetricsStage to one MiddlewarePipeline instead.
+    """
 
-    def _looks_like_id(self, part: str) -> bool:
+    def __init__(self, app: ASGIApp, metrics_collector: MetricsCollector):
         """
-        Check if path part looks like an ID.
+        Initialize metrics middleware.
 
         Args:
-            part: Path component
-
-        Returns:
-            True if looks like ID
+            app: ASGI application
+            metrics_collector: Metrics collector instance
         """
-        # Check for UUID pattern
-        if len(part) == 36 and part.count('-') == 4:
-            return True
-
-        # Check for numeric ID
-        if part.isdigit():
-            return True
-
-        # Check for hex ID (MongoDB style)
-        if len(part) == 24 and all(c in '0123456789abcdef' for c in part.lower()):
-            return True
-
-        return False
+        super().__init__(app, [MetricsStage(metrics_collector)])
@@ -41,7 +41,7 @@ Usage:
 """
 
 from src.rag.embeddings import EmbeddingModel, create_embedding_model
-from src.rag.vector_store import VectorStore, create_vector_store
+from src.rag.vector_store import VectorStore, IngestionStats, create_vector_store
 from src.rag.retriever import (
     Retriever,
     RetrievalResult,
@@ -76,6 +76,7 @@ from src.rag.persistent_cache import (
 from src.rag.unified_retriever import (
     UnifiedRAGRetriever,
     UnifiedRetrievalResult,
+    UnifiedRetrievalResponse,
     create_unified_retriever,
 )
 
@@ -83,6 +84,7 @@ __all__ = [
     "EmbeddingModel",
     "create_embedding_model",
     "VectorStore",
+    "IngestionStats",
     "create_vector_store",
     "Retriever",
     "RetrievalResult",
@@ -107,5 +109,6 @@ __all__ = [
     "get_cache",
     "UnifiedRAGRetriever",
     "UnifiedRetrievalResult",
+    "UnifiedRetrievalResponse",
     "create_unified_retriever",
 ]
@@ -3,12 +3,53 @@ Cross-Encoder Based Re-ranker for RAG
 
 Uses BERT-based cross-encoders for semantic re-ranking of retrieval results.
 Cross-encoders understand query-document relationships better than dual-encoders.
+
+Re-ranking is the most expensive CPU step of retrieval, so:
+- Only the top candidates by first-stage score are scored: those within
+  score_margin of the best candidate, at least top_k and at most
+  max_candidates of them
+- Pair scores are cached by (query hash, document id, document version)
+- Pairs are scored in length order so each batch pads to similar lengths
+- The model backend ("torch", "onnx" or int8-quantized "onnx-int8") is
+  selectable per instance and switchable at runtime (set_backend)
 """
 
-from typing import List, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import numpy as np
 
+from src.config import (
+    RAG_RERANK_BACKEND,
+    RAG_RERANK_CACHE_SIZE,
+    RAG_RERANK_MAX_CANDIDATES,
+    RAG_RERANK_SCORE_MARGIN,
+)
 from src.observability import get_logger
+from src.models.model_registry import (
+    get_model_registry,
+    load_cross_encoder,
+    load_cross_encoder_onnx,
+    load_cross_encoder_onnx_int8,
+)
+from src.rag.vector_store import content_hash
+
+if TYPE_CHECKING:
+    from src.rag.retriever import RetrievalResult  # retriever imports this module
+
+# Lightweight (~180MB) MS MARCO cross-encoder
+DEFAULT_RERANK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+# backend name -> model loader
+RERANK_BACKENDS = {
+    "torch": load_cross_encoder,
+    "onnx": load_cross_encoder_onnx,
+    "onnx-int8": load_cross_encoder_onnx_int8,
+}
+
+# (query hash, document id, document version)
+PairKey = Tuple[str, str, str]
 
 
 class CrossEncoderReranker:
@@ -16,9 +57,13 @@ class CrossEncoderReranker:
 
     def __init__(
         self,
-        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        model_name: str = DEFAULT_RERANK_MODEL,
         top_k: int = 5,
         min_score: float = 0.0,
+        backend: Optional[str] = None,
+        max_candidates: Optional[int] = None,
+        score_margin: Optional[float] = None,
+        cache_size: Optional[int] = None,
     ):
         """
         Initialize cross-encoder re-ranker.
@@ -28,15 +73,61 @@ class CrossEncoderReranker:
                        "cross-encoder/ms-marco-MiniLM-L-6-v2" is lightweight (~180MB)
             top_k: Return top-k results after re-ranking
             min_score: Minimum score threshold for results
+            backend: "torch", "onnx" or "onnx-int8" (default: RAG_RERANK_BACKEND)
+            max_candidates: Max candidates scored per call (default: RAG_RERANK_MAX_CANDIDATES)
+            score_margin: First-stage score margin below the best candidate
+                          for a candidate to be scored (default: RAG_RERANK_SCORE_MARGIN)
+            cache_size: Max cached pair scores, 0 disables (default: RAG_RERANK_CACHE_SIZE)
         """
         self.logger = get_logger("rag.cross_encoder_reranker")
         self.model_name = model_name
         self.top_k = top_k
         self.min_score = min_score
+        self.max_candidates = (
+            RAG_RERANK_MAX_CANDIDATES if max_candidates is None else max_candidates
+        )
+        self.score_margin = RAG_RERANK_SCORE_MARGIN if score_margin is None else score_margin
         self.model = None
 
-        # Lazy load model on first use
+        # Pair score cache (LRU)
+        self._score_cache: "OrderedDict[PairKey, float]" = OrderedDict()
+        self._score_cache_size = RAG_RERANK_CACHE_SIZE if cache_size is None else cache_size
+        self._score_cache_lock = threading.Lock()
+
+        # Lazy load model on first use (shared across rerankers)
         self._model_loaded = False
+        self.backend = None
+        self.set_backend(backend or RAG_RERANK_BACKEND)
+
+    def set_backend(self, backend: str) -> None:
+        """
+        Select the model backend; the model is (re)loaded on next use.
+
+        Args:
+            backend: "torch", "onnx" or "onnx-int8"
+
+        Raises:
+            ValueError: If backend is unknown
+        """
+        if backend not in RERANK_BACKENDS:
+            raise ValueError(
+                f"Unknown cross-encoder backend: {backend} "
+                f"(expected one of {list(RERANK_BACKENDS)})"
+            )
+        if backend == self.backend:
+            return
+
+        self.backend = backend
+        self.model = None
+        self._model_loaded = False
+        # Scores from another backend are close but not identical
+        self.clear_cache()
+        get_model_registry().declare(RERANK_BACKENDS[backend], self.model_name)
+
+    def clear_cache(self) -> None:
+        """Drop all cached pair scores."""
+        with self._score_cache_lock:
+            self._score_cache.clear()
 
     def _ensure_model_loaded(self):
         """Load model on first use (lazy loading)."""
@@ -44,10 +135,8 @@ class CrossEncoderReranker:
             return
 
         try:
-            from sentence_transformers import CrossEncoder
-
-            self.logger.info(f"Loading cross-encoder model: {self.model_name}")
-            self.model = CrossEncoder(self.model_name)
+            self.logger.info(f"Loading cross-encoder model: {self.model_name} ({self.backend})")
+            self.model = get_model_registry().get(RERANK_BACKENDS[self.backend], self.model_name)
             self._model_loaded = True
             self.logger.info("Cross-encoder model loaded successfully")
 
@@ -77,6 +166,9 @@ class CrossEncoderReranker:
         """
         Re-rank results using cross-encoder semantic similarity.
 
+        Only the top candidates by first-stage score are scored (see
+        _select_candidates); the others are dropped.
+
         Args:
             query: Original query text
             results: Retrieved results to re-rank
@@ -97,29 +189,19 @@ class CrossEncoderReranker:
             return results
 
         try:
-            # Extract result codes
-            result_codes = []
-            for result in results:
-                code = getattr(result, "code", None) or getattr(result, "content", "")
-                result_codes.append(code)
-
-            # Prepare query-document pairs for cross-encoder
-            query_doc_pairs = [[query, code] for code in result_codes]
+            candidates = self._select_candidates(results)
 
-            # Get cross-encoder scores
+            # Get cross-encoder scores (cached pairs are not re-scored)
             self.logger.debug(
-                f"Cross-encoder scoring {len(results)} results",
-                result_count=len(results)
+                f"Cross-encoder scoring {len(candidates)} of {len(results)} results",
+                result_count=len(results),
+                candidate_count=len(candidates),
             )
 
-            scores = self.model.predict(query_doc_pairs, show_progress_bar=False)
-
-            # If scores are 2D (multi-label), take the first column
-            if len(scores.shape) > 1:
-                scores = scores[:, 0]
+            scores = self._score(query, candidates)
 
             # Create (result, score) pairs
-            result_score_pairs = list(zip(results, scores))
+            result_score_pairs = list(zip(candidates, scores, strict=True))
 
             # Filter by min_score if set
             if self.min_score > 0:
@@ -146,6 +228,7 @@ class CrossEncoderReranker:
             self.logger.info(
                 f"Cross-encoder re-ranking complete",
                 input_count=len(results),
+                scored_count=len(candidates),
                 output_count=len(final_pairs),
                 min_score=self.min_score,
                 top_k=self.top_k,
@@ -165,6 +248,58 @@ class CrossEncoderReranker:
             # Fallback: return results unchanged
             return results
 
+    def _select_candidates(self, results: List["RetrievalResult"]) -> List["RetrievalResult"]:
+        """
+        Pick the results worth scoring by first-stage (cheap) score.
+
+        Keeps results within score_margin of the best one, never fewer than
+        top_k and never more than max_candidates.
+        """
+        ranked = sorted(results, key=_first_stage_score, reverse=True)
+        best = _first_stage_score(ranked[0])
+        within_margin = sum(1 for r in ranked if best - _first_stage_score(r) <= self.score_margin)
+        keep = max(within_margin, self.top_k)
+        if self.max_candidates > 0:
+            keep = min(keep, max(self.max_candidates, self.top_k))
+        return ranked[:keep]
+
+    def _score(self, query: str, results: List["RetrievalResult"]) -> List[float]:
+        """Cross-encoder scores for results, from the pair cache where possible."""
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        codes = [_result_code(result) for result in results]
+        keys = [(query_hash, _result_id(result, code), _result_version(result, code))
+                for result, code in zip(results, codes, strict=True)]
+
+        scores: Dict[PairKey, float] = {}
+        with self._score_cache_lock:
+            for key in keys:
+                cached = self._score_cache.get(key)
+                if cached is not None:
+                    self._score_cache.move_to_end(key)
+                    scores[key] = cached
+
+        missing = [i for i, key in enumerate(keys) if key not in scores]
+        if missing:
+            # Length order keeps padding low inside each predict batch
+            missing.sort(key=lambda i: len(codes[i]))
+            predicted = np.asarray(
+                self.model.predict([[query, codes[i]] for i in missing], show_progress_bar=False)
+            )
+
+            # If scores are 2D (multi-label), take the first column
+            if len(predicted.shape) > 1:
+                predicted = predicted[:, 0]
+
+            with self._score_cache_lock:
+                for i, score in zip(missing, predicted, strict=True):
+                    scores[keys[i]] = float(score)
+                    if self._score_cache_size > 0:
+                        self._score_cache[keys[i]] = float(score)
+                while len(self._score_cache) > self._score_cache_size:
+                    self._score_cache.popitem(last=False)
+
+        return [scores[key] for key in keys]
+
     def get_model_info(self) -> dict:
         """Get information about the loaded model."""
         self._ensure_model_loaded()
@@ -180,6 +315,8 @@ class CrossEncoderReranker:
                 "status": "loaded",
                 "model": self.model_name,
                 "model_type": type(self.model).__name__,
+                "backend": self.backend,
+                "cached_scores": len(self._score_cache),
             }
         except Exception as e:
             return {
@@ -188,12 +325,39 @@ class CrossEncoderReranker:
             }
 
 
+def _result_code(result) -> str:
+    """Document text of a retrieval result."""
+    return getattr(result, "code", None) or getattr(result, "content", "")
+
+
+def _result_id(result, code: str) -> str:
+    """Document id of a retrieval result (content hash if it has none)."""
+    return str(getattr(result, "id", None) or content_hash(code))
+
+
+def _result_version(result, code: str) -> str:
+    """Document version: stored content hash, else hash of the text."""
+    metadata = getattr(result, "metadata", None) or {}
+    return metadata.get("content_hash") or content_hash(code)
+
+
+def _first_stage_score(result) -> float:
+    """Score from retrieval / heuristic re-ranking, before the cross-encoder."""
+    return float(
+        getattr(result, "relevance_score", 0.0)
+        or getattr(result, "similarity", 0.0)
+        or getattr(result, "score", 0.0)
+    )
+
+
 def create_cross_encoder_reranker(
-    model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+    model_name: str = DEFAULT_RERANK_MODEL,
     top_k: int = 5,
+    backend: Optional[str] = None,
 ) -> CrossEncoderReranker:
     """Factory function to create cross-encoder re-ranker."""
     return CrossEncoderReranker(
         model_name=model_name,
         top_k=top_k,
+        backend=backend,
     )
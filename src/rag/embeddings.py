@@ -9,10 +9,10 @@ from typing import List, Union, Optional
 import numpy as np
 import time
 import os
-from sentence_transformers import SentenceTransformer
 
 from src.observability import get_logger
 from src.config import EMBEDDING_DEVICE, EMBEDDING_MODEL
+from src.models.model_registry import get_model_registry, load_sentence_transformer
 from .persistent_cache import get_cache, PersistentEmbeddingCache
 
 
@@ -23,9 +23,12 @@ class EmbeddingModel:
     Provides semantic embeddings for code and text, optimized for similarity search
     in the RAG system.
 
+    The SentenceTransformer is loaded on first use and shared (per model name
+    and device) with every other component through the model registry.
+
     Attributes:
         model_name: Name of the sentence-transformers model
-        model: Loaded SentenceTransformer instance
+        model: SentenceTransformer instance (loaded on first access)
         dimension: Embedding vector dimension
         cache: Persistent cache for embeddings (optional)
     """
@@ -48,41 +51,44 @@ class EmbeddingModel:
         """
         self.logger = get_logger("rag.embeddings")
         self.model_name = model_name
+        self.device = EMBEDDING_DEVICE
         self.cache: Optional[PersistentEmbeddingCache] = None
+        self._dimension: Optional[int] = None
+
+        get_model_registry().declare(load_sentence_transformer, model_name, self.device)
+
+        # Initialize cache if enabled
+        if enable_cache:
+            try:
+                self.cache = get_cache(cache_dir=cache_dir)
+                self.logger.info("Persistent cache enabled")
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to initialize cache, continuing without cache",
+                    error=str(e)
+                )
 
+    @property
+    def model(self):
+        """Shared SentenceTransformer, loaded on first access."""
         try:
-            self.logger.info(f"Loading embedding model: {model_name}")
-            # Use local_files_only=True to avoid network calls to HuggingFace
-            # Model should be cached from first download
-            device = EMBEDDING_DEVICE
-            self.model = SentenceTransformer(model_name, device=device, local_files_only=False)
-            self.dimension = self.model.get_sentence_embedding_dimension()
-            self.logger.info(
-                f"Embedding model loaded successfully on {device}",
-                model=model_name,
-                dimension=self.dimension
-            )
-
-            # Initialize cache if enabled
-            if enable_cache:
-                try:
-                    self.cache = get_cache(cache_dir=cache_dir)
-                    self.logger.info("Persistent cache enabled")
-                except Exception as e:
-                    self.logger.warning(
-                        "Failed to initialize cache, continuing without cache",
-                        error=str(e)
-                    )
-
+            return get_model_registry().get(load_sentence_transformer, self.model_name, self.device)
         except Exception as e:
             self.logger.error(
                 f"Failed to load embedding model",
-                model=model_name,
+                model=self.model_name,
                 error=str(e),
                 error_type=type(e).__name__
             )
             raise
 
+    @property
+    def dimension(self) -> int:
+        """Embedding vector dimension (loads the model on first access)."""
+        if self._dimension is None:
+            self._dimension = self.model.get_sentence_embedding_dimension()
+        return self._dimension
+
     def embed_text(self, text: str) -> List[float]:
         """
         Generate embedding for a single text.
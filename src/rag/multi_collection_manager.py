@@ -6,9 +6,16 @@ Collections are organized by quality/source:
 - devmatrix_curated: High-quality curated examples (priority)
 - devmatrix_project_code: Actual project code (fallback)
 - devmatrix_standards: Project standards and patterns (reference)
+
+Search modes (RAG_MULTI_COLLECTION_MODE):
+- fallback: query curated first, then project code / standards only when
+  results are insufficient (one round-trip per miss)
+- parallel: embed the query once, query all collections concurrently and
+  merge them with per-collection score fusion (RAG_FUSION_METHOD)
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
 
@@ -16,12 +23,21 @@ from src.config import (
     RAG_SIMILARITY_THRESHOLD_CURATED,
     RAG_SIMILARITY_THRESHOLD_PROJECT,
     RAG_SIMILARITY_THRESHOLD_STANDARDS,
+    RAG_MULTI_COLLECTION_MODE,
+    RAG_FUSION_METHOD,
+    RAG_EARLY_CUTOFF_SIMILARITY,
 )
 from src.observability import get_logger
 from .vector_store import VectorStore
 
 logger = get_logger("rag.multi_collection_manager")
 
+SEARCH_MODES = ("fallback", "parallel")
+FUSION_METHODS = ("rrf", "calibrated")
+
+# Reciprocal rank fusion constant (Cormack et al.)
+RRF_K = 60
+
 
 @dataclass
 class SearchResult:
@@ -31,6 +47,7 @@ class SearchResult:
     metadata: Dict[str, Any]
     collection: str
     id: Optional[str] = None
+    score: Optional[float] = None  # Fused ranking score (parallel search)
 
 
 class MultiCollectionManager:
@@ -44,9 +61,18 @@ class MultiCollectionManager:
     4. Filter by collection-specific thresholds
     """
     
-    def __init__(self, embedding_model):
-        """Initialize multi-collection manager."""
+    def __init__(self, embedding_model, mode: Optional[str] = None):
+        """
+        Initialize multi-collection manager.
+
+        Args:
+            embedding_model: Embedding model shared by the collections
+            mode: "fallback" or "parallel" (default: RAG_MULTI_COLLECTION_MODE)
+        """
         self.embedding_model = embedding_model
+        self.mode = mode or RAG_MULTI_COLLECTION_MODE
+        if self.mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown multi-collection search mode: {self.mode}")
         
         # Initialize separate vector stores for each collection
         self.curated = VectorStore(
@@ -61,14 +87,55 @@ class MultiCollectionManager:
             embedding_model,
             collection_name="devmatrix_standards",
         )
-        
-        logger.info("MultiCollectionManager initialized with 3 collections")
+
+        # Collections in priority order with their similarity thresholds
+        self.collections: Dict[str, Tuple[VectorStore, float]] = {
+            "curated": (self.curated, RAG_SIMILARITY_THRESHOLD_CURATED),
+            "project_code": (self.project_code, RAG_SIMILARITY_THRESHOLD_PROJECT),
+            "standards": (self.standards, RAG_SIMILARITY_THRESHOLD_STANDARDS),
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.collections),
+            thread_name_prefix="multi-collection-search",
+        )
+
+        logger.info(f"MultiCollectionManager initialized with 3 collections (mode: {self.mode})")
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        include_low_quality: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[SearchResult]:
+        """
+        Search across collections using the configured mode.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            include_low_quality: Include results below thresholds
+            query_embedding: Precomputed embedding of query (skips embedding)
+
+        Returns:
+            List of SearchResult objects, best first
+        """
+        if self.mode == "parallel":
+            return self.search_parallel(
+                query, top_k=top_k, include_low_quality=include_low_quality,
+                query_embedding=query_embedding,
+            )
+        return self.search_with_fallback(
+            query, top_k=top_k, include_low_quality=include_low_quality,
+            query_embedding=query_embedding,
+        )
     
     def search_with_fallback(
         self,
         query: str,
         top_k: int = 5,
-        include_low_quality: bool = False
+        include_low_quality: bool = False,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[SearchResult]:
         """
         Search across collections with intelligent fallback.
@@ -77,6 +144,7 @@ class MultiCollectionManager:
             query: Search query
             top_k: Number of results to return
             include_low_quality: Include results below thresholds
+            query_embedding: Precomputed embedding of query (skips embedding)
         
         Returns:
             List of SearchResult objects sorted by similarity
@@ -86,7 +154,7 @@ class MultiCollectionManager:
         try:
             # Phase 1: Search in curated collection (highest priority)
             logger.info(f"Searching curated collection for: {query[:50]}...")
-            curated_results = self.curated.search(query, top_k=top_k)
+            curated_results = self.curated.search(query, top_k=top_k, query_embedding=query_embedding)
             
             curated_high_quality = []
             for result in curated_results:
@@ -107,7 +175,9 @@ class MultiCollectionManager:
             # Phase 2: If we don't have enough results, search project code
             if len(curated_high_quality) < top_k // 2:
                 logger.info(f"Low curated results ({len(curated_high_quality)}), searching project code...")
-                project_results = self.project_code.search(query, top_k=top_k)
+                project_results = self.project_code.search(
+                    query, top_k=top_k, query_embedding=query_embedding
+                )
                 
                 for result in project_results:
                     sim = result.get('similarity', 0)
@@ -126,7 +196,9 @@ class MultiCollectionManager:
             if len(results) < top_k * 0.7:
                 logger.info("Supplementing with standards...")
                 standards_top_k = max(1, top_k // 3)  # Ensure top_k >= 1
-                standards_results = self.standards.search(query, top_k=standards_top_k)
+                standards_results = self.standards.search(
+                    query, top_k=standards_top_k, query_embedding=query_embedding
+                )
                 
                 for result in standards_results:
                     sim = result.get('similarity', 0)
@@ -168,6 +240,160 @@ class MultiCollectionManager:
             logger.error(f"Multi-collection search failed: {str(e)}")
             return []
     
+    def search_parallel(
+        self,
+        query: str,
+        top_k: int = 5,
+        include_low_quality: bool = False,
+        fusion: Optional[str] = None,
+        early_cutoff: Optional[float] = None,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[SearchResult]:
+        """
+        Search all collections concurrently and fuse the results.
+
+        The query is embedded once and every collection is queried in
+        parallel (one round-trip in total instead of one per fallback).
+        Results are filtered by their collection threshold and merged:
+        - rrf: sum of 1 / (RRF_K + rank) over the collections a result appears in
+        - calibrated: similarity rescaled from the collection threshold (0.0) to 1.0
+
+        Early cut-off: if curated alone returns top_k results with
+        similarity >= early_cutoff, they are returned without waiting for
+        the other collections. Queries that have not started yet are
+        cancelled; queries already running cannot be interrupted, they
+        finish in the background and their results are discarded.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            include_low_quality: Include results below thresholds
+            fusion: "rrf" or "calibrated" (default: RAG_FUSION_METHOD)
+            early_cutoff: Curated similarity for early cut-off
+                          (default: RAG_EARLY_CUTOFF_SIMILARITY, > 1.0 disables)
+            query_embedding: Precomputed embedding of query (skips embedding)
+
+        Returns:
+            List of SearchResult objects sorted by fused score (SearchResult.score)
+        """
+        fusion = fusion or RAG_FUSION_METHOD
+        if fusion not in FUSION_METHODS:
+            raise ValueError(f"Unknown fusion method: {fusion}")
+        cutoff = RAG_EARLY_CUTOFF_SIMILARITY if early_cutoff is None else early_cutoff
+
+        try:
+            if query_embedding is None:
+                query_embedding = self.embedding_model.embed_text(query)
+
+            futures = {
+                name: self._executor.submit(
+                    self._search_collection, name, query, top_k, query_embedding, include_low_quality
+                )
+                for name in self.collections
+            }
+
+            per_collection: Dict[str, List[SearchResult]] = {}
+            for name, future in futures.items():
+                try:
+                    per_collection[name] = future.result()
+                except Exception as e:
+                    logger.warning(f"Search in {name} collection failed: {str(e)}")
+                    per_collection[name] = []
+
+                if name == "curated" and self._satisfies_top_k(per_collection[name], top_k, cutoff):
+                    for pending in futures.values():
+                        pending.cancel()
+                    for result in per_collection[name]:
+                        result.score = result.similarity
+                    logger.info(
+                        "Multi-collection search completed (early cut-off)",
+                        query_length=len(query),
+                        total_results=top_k,
+                    )
+                    return per_collection[name][:top_k]
+
+            final_results = self._fuse(per_collection, fusion)[:top_k]
+
+            logger.info(
+                "Multi-collection search completed",
+                query_length=len(query),
+                total_results=len(final_results),
+                fusion=fusion,
+                curated_count=sum(1 for r in final_results if r.collection == "curated"),
+                project_count=sum(1 for r in final_results if r.collection == "project_code"),
+                standards_count=sum(1 for r in final_results if r.collection == "standards"),
+            )
+
+            return final_results
+
+        except Exception as e:
+            logger.error(f"Multi-collection search failed: {str(e)}")
+            return []
+
+    def _search_collection(
+        self,
+        collection: str,
+        query: str,
+        top_k: int,
+        query_embedding: Optional[List[float]] = None,
+        include_low_quality: bool = False,
+    ) -> List[SearchResult]:
+        """Search one collection and keep results above its threshold."""
+        vector_store, threshold = self.collections[collection]
+        raw_results = vector_store.search(query, top_k=top_k, query_embedding=query_embedding)
+
+        results = []
+        for result in raw_results:
+            sim = result.get('similarity', 0)
+            if sim >= threshold or include_low_quality:
+                results.append(
+                    SearchResult(
+                        similarity=sim,
+                        content=result.get('code', ''),
+                        metadata=result.get('metadata', {}),
+                        collection=collection,
+                        id=result.get('id')
+                    )
+                )
+        return results
+
+    @staticmethod
+    def _satisfies_top_k(results: List[SearchResult], top_k: int, cutoff: Optional[float]) -> bool:
+        return (
+            cutoff is not None
+            and len(results) >= top_k
+            and all(r.similarity >= cutoff for r in results[:top_k])
+        )
+
+    def _fuse(self, per_collection: Dict[str, List[SearchResult]], fusion: str) -> List[SearchResult]:
+        """
+        Merge per-collection results into one ranking.
+
+        A result found in several collections (same id) is kept once: RRF
+        adds its scores, calibrated keeps the best one. Ties keep collection
+        priority order.
+        """
+        fused: Dict[str, SearchResult] = {}
+
+        for collection, results in per_collection.items():
+            threshold = self.collections[collection][1]
+            for rank, result in enumerate(results, 1):
+                if fusion == "rrf":
+                    result.score = 1.0 / (RRF_K + rank)
+                else:
+                    result.score = (result.similarity - threshold) / (1.0 - threshold) if threshold < 1.0 else result.similarity
+
+                key = result.id or f"{collection}:{rank}"
+                existing = fused.get(key)
+                if existing is None:
+                    fused[key] = result
+                elif fusion == "rrf":
+                    existing.score += result.score
+                elif result.score > existing.score:
+                    fused[key] = result
+
+        return sorted(fused.values(), key=lambda r: (r.score, r.similarity), reverse=True)
+
     def search_single_collection(
         self,
         query: str,
@@ -176,36 +402,11 @@ class MultiCollectionManager:
     ) -> List[SearchResult]:
         """Search a specific collection."""
         try:
-            if collection == "curated":
-                vector_store = self.curated
-                threshold = RAG_SIMILARITY_THRESHOLD_CURATED
-            elif collection == "project_code":
-                vector_store = self.project_code
-                threshold = RAG_SIMILARITY_THRESHOLD_PROJECT
-            elif collection == "standards":
-                vector_store = self.standards
-                threshold = RAG_SIMILARITY_THRESHOLD_STANDARDS
-            else:
+            if collection not in self.collections:
                 logger.error(f"Unknown collection: {collection}")
                 return []
             
-            raw_results = vector_store.search(query, top_k=top_k)
-            
-            results = []
-            for result in raw_results:
-                sim = result.get('similarity', 0)
-                if sim >= threshold:
-                    results.append(
-                        SearchResult(
-                            similarity=sim,
-                            content=result.get('code', ''),
-                            metadata=result.get('metadata', {}),
-                            collection=collection,
-                            id=result.get('id')
-                        )
-                    )
-            
-            return results
+            return self._search_collection(collection, query, top_k)
         
         except Exception as e:
             logger.error(f"Single collection search failed: {str(e)}")
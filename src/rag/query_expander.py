@@ -3,10 +3,20 @@ Query Expansion for RAG System
 
 Expands queries with synonyms and language variants to improve retrieval.
 Increases coverage by searching for multiple formulations of the same concept.
+
+Expansions are memoized (LRU), and variants whose embeddings are
+near-duplicates of an earlier variant can be dropped before retrieval
+(deduplicate_variants).
 """
 
-from typing import List, Dict, Set
+from collections import OrderedDict
+from typing import List, Dict, Optional, Set, Tuple
 import re
+import threading
+
+import numpy as np
+
+from src.config import RAG_EXPANSION_CACHE_SIZE, RAG_EXPANSION_DEDUP_SIMILARITY
 from src.observability import get_logger
 
 
@@ -45,12 +55,23 @@ class QueryExpander:
         "validation": ["validation", "validate", "check", "verify", "schema"],
     }
 
-    def __init__(self):
+    def __init__(self, cache_size: Optional[int] = None):
+        """
+        Initialize query expander.
+
+        Args:
+            cache_size: Max memoized expansions, 0 disables (default: RAG_EXPANSION_CACHE_SIZE)
+        """
         self.logger = get_logger("rag.query_expander")
 
+        # (query, max_variants) -> variants (LRU)
+        self._expansion_cache: "OrderedDict[Tuple[str, int], Tuple[str, ...]]" = OrderedDict()
+        self._expansion_cache_size = RAG_EXPANSION_CACHE_SIZE if cache_size is None else cache_size
+        self._expansion_lock = threading.Lock()
+
     def expand_query(self, query: str, max_variants: int = 5) -> List[str]:
         """
-        Expand query into multiple variants.
+        Expand query into multiple variants (memoized).
 
         Args:
             query: Original query text
@@ -59,6 +80,68 @@ class QueryExpander:
         Returns:
             List of query variants, starting with original
         """
+        key = (query, max_variants)
+        with self._expansion_lock:
+            cached = self._expansion_cache.get(key)
+            if cached is not None:
+                self._expansion_cache.move_to_end(key)
+                return list(cached)
+
+        result = self._expand_query(query, max_variants)
+
+        if self._expansion_cache_size > 0:
+            with self._expansion_lock:
+                self._expansion_cache[key] = tuple(result)
+                while len(self._expansion_cache) > self._expansion_cache_size:
+                    self._expansion_cache.popitem(last=False)
+
+        return result
+
+    def deduplicate_variants(
+        self,
+        variants: List[str],
+        embeddings: List[List[float]],
+        threshold: Optional[float] = None,
+    ) -> Tuple[List[str], List[List[float]]]:
+        """
+        Drop variants whose embedding is a near-duplicate of an earlier one.
+
+        The first variant (the original query) is always kept.
+
+        Args:
+            variants: Query variants, original first
+            embeddings: Embedding of each variant
+            threshold: Cosine similarity above which a variant is dropped
+                       (default: RAG_EXPANSION_DEDUP_SIMILARITY)
+
+        Returns:
+            (kept variants, their embeddings)
+        """
+        if len(variants) < 2:
+            return list(variants), list(embeddings)
+
+        threshold = RAG_EXPANSION_DEDUP_SIMILARITY if threshold is None else threshold
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        normalized = matrix / np.where(norms == 0, 1.0, norms)
+
+        kept: List[int] = [0]
+        for i in range(1, len(variants)):
+            if float(np.max(normalized[kept] @ normalized[i])) <= threshold:
+                kept.append(i)
+
+        if len(kept) < len(variants):
+            self.logger.debug(
+                f"Dropped {len(variants) - len(kept)} near-duplicate query variants",
+                variants_count=len(variants),
+                kept_count=len(kept),
+                threshold=threshold,
+            )
+
+        return [variants[i] for i in kept], [embeddings[i] for i in kept]
+
+    def _expand_query(self, query: str, max_variants: int) -> List[str]:
+        """Build the variants of query (uncached)."""
         variants = [query]  # Always include original
 
         # Create semantic variants by extracting key concepts
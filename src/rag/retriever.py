@@ -345,8 +345,10 @@ class Retriever:
         """
         Retrieve with query expansion for better coverage.
 
-        Expands query into variants and retrieves results for each,
-        then deduplicates and combines results intelligently.
+        Expands query into variants (memoized), embeds them in one batch,
+        drops near-duplicate variants, and retrieves results for the rest
+        (each with its precomputed embedding), then deduplicates and
+        combines results intelligently.
 
         Args:
             query: Query text (code or natural language)
@@ -365,30 +367,39 @@ class Retriever:
         effective_top_k = top_k or self.config.top_k
 
         try:
-            # Expand query into variants
+            # Expand query into variants (memoized)
             query_variants = self._query_expander.expand_query(
                 query,
                 max_variants=5  # Use up to 5 variants
             )
 
+            # Embed all variants in one call and drop near-duplicates
+            query_embeddings = self._embed_variants(query_variants)
+            if query_embeddings is not None:
+                query_variants, query_embeddings = self._query_expander.deduplicate_variants(
+                    query_variants, query_embeddings
+                )
+
             self.logger.info(
                 "Query expansion",
                 original_query=query,
                 variant_count=len(query_variants)
             )
 
-            # Retrieve results for each variant
+            # Retrieve results for each variant (reusing its batched embedding)
             results_by_query: Dict[str, List[RetrievalResult]] = {}
             all_results: List[RetrievalResult] = []
 
-            for variant in query_variants:
+            variant_embeddings = query_embeddings or [None] * len(query_variants)
+            for variant, variant_embedding in zip(query_variants, variant_embeddings, strict=True):
                 try:
                     variant_results = self.retrieve(
                         query=variant,
                         top_k=effective_top_k * 2,  # Get more to handle deduplication
                         min_similarity=min_similarity,
                         filters=filters,
-                        strategy=strategy
+                        strategy=strategy,
+                        query_embedding=variant_embedding,
                     )
                     results_by_query[variant] = variant_results
                     all_results.extend(variant_results)
@@ -450,6 +461,28 @@ class Retriever:
             # Fallback to regular retrieval
             return self.retrieve(query, top_k, min_similarity, filters, strategy)
 
+    def _embed_variants(self, query_variants: List[str]) -> Optional[List[List[float]]]:
+        """
+        Embed query variants with one batched call.
+
+        Returns:
+            One embedding per variant, or None if no embedding model is
+            available or embedding fails (variants are then retrieved one by one)
+        """
+        source = self.multi_collection_manager if self.use_multi_collection else self.vector_store
+        embedding_model = getattr(source, "embedding_model", None)
+        if embedding_model is None:
+            return None
+
+        try:
+            return embedding_model.embed_batch(query_variants)
+        except Exception as e:
+            self.logger.warning(
+                "Batched variant embedding failed, retrieving variants one by one",
+                error=str(e)
+            )
+            return None
+
     def retrieve(
         self,
         query: str,
@@ -457,6 +490,7 @@ class Retriever:
         min_similarity: Optional[float] = None,
         filters: Optional[Dict[str, Any]] = None,
         strategy: Optional[RetrievalStrategy] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[RetrievalResult]:
         """
         Retrieve relevant code examples.
@@ -467,6 +501,7 @@ class Retriever:
             min_similarity: Minimum similarity (overrides config)
             filters: Metadata filters (overrides config)
             strategy: Retrieval strategy (overrides config)
+            query_embedding: Precomputed embedding of query (skips embedding)
 
         Returns:
             List of RetrievalResult objects, ranked by relevance
@@ -495,7 +530,7 @@ class Retriever:
             )
 
             # FIX #2: Create request-scoped context for embedding deduplication
-            context = RetrievalContext(query=query)
+            context = RetrievalContext(query=query, query_embedding=query_embedding)
 
             # Prefer multi-collection retrieval when available
             if self.use_multi_collection:
@@ -505,6 +540,7 @@ class Retriever:
                     min_similarity=effective_min_sim,
                     filters=effective_filters,
                     strategy=effective_strategy,
+                    query_embedding=query_embedding,
                 )
             else:
                 # Execute retrieval based on strategy
@@ -599,7 +635,8 @@ class Retriever:
             query=context.query,
             top_k=top_k,
             filters=filters,
-            min_similarity=min_similarity
+            min_similarity=min_similarity,
+            query_embedding=context.query_embedding,
         )
 
         # Convert to RetrievalResult objects
@@ -626,9 +663,10 @@ class Retriever:
         min_similarity: Optional[float] = None,
         filters: Optional[Dict[str, Any]] = None,
         strategy: Optional[RetrievalStrategy] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[RetrievalResult]:
         """
-        Retrieve from multi-collection manager with fallback strategy.
+        Retrieve from multi-collection manager (fallback or parallel mode).
         """
         effective_top_k = top_k or self.config.top_k
         
@@ -640,10 +678,11 @@ class Retriever:
             )
             
             # Use MultiCollectionManager for retrieval
-            raw_results = self.multi_collection_manager.search_with_fallback(
+            raw_results = self.multi_collection_manager.search(
                 query=query,
                 top_k=effective_top_k,
-                include_low_quality=False
+                include_low_quality=False,
+                query_embedding=query_embedding,
             )
             
             # Convert SearchResult to RetrievalResult
@@ -835,7 +874,8 @@ class Retriever:
             query=context.query,
             top_k=candidate_k,
             filters=filters,
-            min_similarity=min_similarity
+            min_similarity=min_similarity,
+            query_embedding=context.query_embedding,
         )
 
         if not candidates:
@@ -5,11 +5,18 @@ Combines three retrieval sources for comprehensive code pattern matching:
 - ChromaDB: General semantic code embeddings
 - Qdrant: 21,624 curated patterns from pattern library
 - Neo4j: 30,314 nodes + 159,793 relationships (knowledge graph)
+
+The backend clients are synchronous, so each source runs in a worker
+thread: sources are queried concurrently, each with its own deadline, and
+results are merged / deduplicated as they arrive. Sources that miss the
+deadline are reported (the response is tagged partial) instead of delaying
+the others.
 """
 
 import asyncio
-import warnings
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional
 from dataclasses import dataclass, field
 
 from qdrant_client import QdrantClient
@@ -19,6 +26,7 @@ from neo4j import GraphDatabase
 from src.rag.embeddings import EmbeddingModel, create_embedding_model
 from src.rag.vector_store import VectorStore, create_vector_store
 from src.cognitive.config.settings import CognitiveSettings
+from src.config import RAG_SOURCE_TIMEOUT
 from src.observability import get_logger
 
 
@@ -35,20 +43,34 @@ class UnifiedRetrievalResult:
     rank: int = 0
 
 
+@dataclass
+class UnifiedRetrievalResponse:
+    """Results of one unified retrieval plus per-source outcome."""
+    results: List[UnifiedRetrievalResult] = field(default_factory=list)
+    partial: bool = False  # True if a source timed out or failed
+    timed_out: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    source_latency_ms: Dict[str, float] = field(default_factory=dict)
+
+
 class UnifiedRAGRetriever:
     """
     Unified RAG retriever combining ChromaDB + Qdrant + Neo4j.
 
     Retrieval strategy:
-    1. Query all three sources in parallel
-    2. Merge results with weighted scoring:
-       - ChromaDB: 0.3 (general semantic search)
-       - Qdrant: 0.5 (curated patterns - highest weight)
-       - Neo4j: 0.2 (graph relationships)
-    3. Deduplicate by content similarity
+    1. Query all enabled sources concurrently (worker threads), each with
+       a deadline (RAG_SOURCE_TIMEOUT)
+    2. Merge results with weighted scoring as each source returns:
+       - ChromaDB: 0.0 (disabled)
+       - Qdrant: 0.7 (curated patterns - primary source)
+       - Neo4j: 0.3 (graph relationships)
+    3. Deduplicate by content hash while merging
     4. Return top_k ranked results
     """
 
+    # Merge priority for equal scores
+    SOURCES = ("chroma", "qdrant", "neo4j")
+
     def __init__(
         self,
         embedding_model: Optional[EmbeddingModel] = None,
@@ -74,6 +96,11 @@ class UnifiedRAGRetriever:
         self.logger = logger
         self.settings = CognitiveSettings()
 
+        # Worker threads for the synchronous backend clients. Sized above the
+        # number of sources so a call still running past its deadline does
+        # not delay the next retrieval.
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="unified-rag")
+
         # Initialize embedding model (OpenAI for general use)
         self.embeddings = embedding_model or create_embedding_model()
 
@@ -81,13 +108,10 @@ class UnifiedRAGRetriever:
         # Using GraphCodeBERT (collection rebuilt with this model)
         self.qdrant_embeddings = None
         try:
-            from sentence_transformers import SentenceTransformer
-            # Use GraphCodeBERT for code-aware embeddings (768-dim)
-            # Suppress pooler weights warning (cosmetic only, doesn't affect embeddings)
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", message=".*pooler.*")
-                warnings.filterwarnings("ignore", message=".*Some weights.*not initialized.*")
-                self.qdrant_embeddings = SentenceTransformer('microsoft/graphcodebert-base')
+            # Use GraphCodeBERT for code-aware embeddings (768-dim), shared
+            # process-wide (pooler weight warnings suppressed by the singleton)
+            from src.models.graphcodebert_singleton import get_graphcodebert
+            self.qdrant_embeddings = get_graphcodebert()
             self.logger.info("Loaded GraphCodeBERT model for Qdrant (768-dim, code-aware)")
         except Exception as e:
             self.logger.warning(f"Could not load GraphCodeBERT for Qdrant: {e}")
@@ -148,216 +172,299 @@ class UnifiedRAGRetriever:
             chroma_weight: Weight for ChromaDB scores (disabled, default 0.0)
             qdrant_weight: Weight for Qdrant scores (default 0.7 - primary source)
             neo4j_weight: Weight for Neo4j scores (default 0.3 - graph relationships)
+            **kwargs: Passed to retrieve_with_report (e.g. source_timeout)
 
         Returns:
             List of unified retrieval results, ranked by weighted score
         """
-        # Parallel retrieval from all sources
-        tasks = []
-
-        if self.chroma_enabled:
-            tasks.append(self._retrieve_from_chroma(query, top_k * 2))
-
-        if self.qdrant_enabled:
-            tasks.append(self._retrieve_from_qdrant(query, top_k * 2))
+        response = await self.retrieve_with_report(
+            query,
+            top_k=top_k,
+            chroma_weight=chroma_weight,
+            qdrant_weight=qdrant_weight,
+            neo4j_weight=neo4j_weight,
+            **kwargs
+        )
+        return response.results
 
-        if self.neo4j_enabled:
-            tasks.append(self._retrieve_from_neo4j(query, top_k * 2))
+    async def retrieve_with_report(
+        self,
+        query: str,
+        top_k: int = 10,
+        chroma_weight: float = 0.0,
+        qdrant_weight: float = 0.7,
+        neo4j_weight: float = 0.3,
+        source_timeout: Optional[float] = None,
+        **kwargs
+    ) -> UnifiedRetrievalResponse:
+        """
+        Retrieve from all enabled sources concurrently, with a per-source deadline.
 
-        if not tasks:
-            self.logger.warning("No RAG sources enabled")
-            return []
+        Latency is bounded by the slowest source that answers in time (at
+        most source_timeout). Results that arrived in time are returned;
+        sources that timed out or failed are listed and the response is
+        tagged partial.
 
-        # Execute parallel retrieval
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            chroma_weight: Weight for ChromaDB scores
+            qdrant_weight: Weight for Qdrant scores
+            neo4j_weight: Weight for Neo4j scores
+            source_timeout: Deadline per source in seconds (default: RAG_SOURCE_TIMEOUT)
 
-        # Merge and weight results
-        all_results = []
+        Returns:
+            UnifiedRetrievalResponse with ranked results and per-source outcome
+        """
+        timeout = RAG_SOURCE_TIMEOUT if source_timeout is None else source_timeout
         weights = {
             'chroma': chroma_weight,
             'qdrant': qdrant_weight,
             'neo4j': neo4j_weight
         }
+        searches: Dict[str, Callable[[str, int], List[UnifiedRetrievalResult]]] = {}
+        if self.chroma_enabled:
+            searches['chroma'] = self._search_chroma
+        if self.qdrant_enabled:
+            searches['qdrant'] = self._search_qdrant
+        if self.neo4j_enabled:
+            searches['neo4j'] = self._search_neo4j
 
-        for result, source in zip(results, ['chroma', 'qdrant', 'neo4j'][:len(results)]):
-            if isinstance(result, Exception):
-                self.logger.error(f"Retrieval from {source} failed: {result}")
+        response = UnifiedRetrievalResponse()
+        if not searches:
+            self.logger.warning("No RAG sources enabled")
+            return response
+
+        # Concurrent fan-out; results are merged in completion order
+        tasks = [
+            asyncio.create_task(self._run_source(source, search, query, top_k * 2, timeout))
+            for source, search in searches.items()
+        ]
+
+        merged: Dict[int, UnifiedRetrievalResult] = {}
+        for completed in asyncio.as_completed(tasks):
+            source, results, error, latency_ms = await completed
+            response.source_latency_ms[source] = latency_ms
+
+            if isinstance(error, asyncio.TimeoutError):
+                self.logger.warning(f"Retrieval from {source} missed its {timeout:.1f}s deadline")
+                response.timed_out.append(source)
                 continue
-
-            if not result:
+            if error is not None:
+                self.logger.error(f"Retrieval from {source} failed: {error}")
+                response.failed.append(source)
                 continue
 
-            # Apply weighted scoring
-            weight = weights.get(source, 1.0)
-            for item in result:
-                item.score *= weight
-                item.source = source
-                all_results.append(item)
+            self._merge_results(merged, results, source, weights.get(source, 1.0))
 
-        # Deduplicate by content similarity (simple hash-based for now)
-        unique_results = self._deduplicate_results(all_results)
+        response.partial = bool(response.timed_out or response.failed)
 
-        # Sort by weighted score
-        unique_results.sort(key=lambda x: x.score, reverse=True)
+        # Sort by weighted score (ties: source priority)
+        ranked = sorted(merged.values(), key=lambda r: (-r.score, self.SOURCES.index(r.source)))
+        response.results = ranked[:top_k]
 
         # Assign ranks
-        for rank, result in enumerate(unique_results[:top_k], 1):
+        for rank, result in enumerate(response.results, 1):
             result.rank = rank
 
         self.logger.info(
-            f"Retrieved {len(unique_results[:top_k])} results from "
-            f"{sum([self.chroma_enabled, self.qdrant_enabled, self.neo4j_enabled])} sources"
+            f"Retrieved {len(response.results)} results from "
+            f"{len(searches) - len(response.timed_out) - len(response.failed)}/{len(searches)} sources"
+            + (" (partial)" if response.partial else ""),
         )
 
-        return unique_results[:top_k]
-
-    async def _retrieve_from_chroma(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
-        """Retrieve from ChromaDB."""
-        if not self.chroma or not self.chroma_enabled:
-            return []
+        return response
 
+    async def _run_source(
+        self,
+        source: str,
+        search: Callable[[str, int], List[UnifiedRetrievalResult]],
+        query: str,
+        top_k: int,
+        timeout: float,
+    ):
+        """Run one synchronous source search in a worker thread, with a deadline."""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
         try:
-            # Use existing retriever interface
-            from src.rag.retriever import create_retriever
-            retriever = create_retriever(self.chroma, top_k=top_k)
-            results = retriever.retrieve(query)
+            results = await asyncio.wait_for(
+                loop.run_in_executor(self._executor, search, query, top_k),
+                timeout=timeout,
+            )
+            return source, results, None, (time.perf_counter() - start) * 1000
+        except Exception as e:
+            return source, [], e, (time.perf_counter() - start) * 1000
 
-            return [
-                UnifiedRetrievalResult(
-                    content=r.code,
-                    source='chroma',
-                    score=r.score,
-                    metadata=r.metadata,
-                )
-                for r in results
-            ]
+    def _merge_results(
+        self,
+        merged: Dict[int, UnifiedRetrievalResult],
+        results: List[UnifiedRetrievalResult],
+        source: str,
+        weight: float,
+    ) -> None:
+        """
+        Weight a source's results and merge them, deduplicating by content hash.
+
+        For duplicate content the higher weighted score wins (source priority
+        on ties), so the outcome does not depend on arrival order.
+        """
+        for item in results:
+            item.score *= weight
+            item.source = source
+
+            content_hash = hash(item.content[:500])  # Hash first 500 chars
+            existing = merged.get(content_hash)
+            if existing is None or (item.score, -self.SOURCES.index(source)) > (
+                existing.score, -self.SOURCES.index(existing.source)
+            ):
+                merged[content_hash] = item
+
+    async def _retrieve_from_chroma(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
+        """Retrieve from ChromaDB (in a worker thread)."""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, self._search_chroma, query, top_k)
         except Exception as e:
             self.logger.error(f"ChromaDB retrieval failed: {e}")
             return []
 
-    async def _retrieve_from_qdrant(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
-        """Retrieve from Qdrant pattern library (21,624 patterns)."""
-        if not self.qdrant or not self.qdrant_enabled:
+    def _search_chroma(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
+        """Search ChromaDB (blocking; backend errors propagate to the caller)."""
+        if not self.chroma or not self.chroma_enabled:
             return []
 
-        try:
-            # Generate query embedding using GraphCodeBERT (768-dim, code-aware)
-            if self.qdrant_embeddings is None:
-                self.logger.warning("Qdrant embeddings not available")
-                return []
-
-            query_embedding = self.qdrant_embeddings.encode(query).tolist()
-
-            # Search in devmatrix_patterns collection
-            search_results = self.qdrant.search(
-                collection_name="devmatrix_patterns",
-                query_vector=query_embedding,
-                limit=top_k
+        # Use existing retriever interface
+        from src.rag.retriever import create_retriever
+        retriever = create_retriever(self.chroma, top_k=top_k)
+        results = retriever.retrieve(query)
+
+        return [
+            UnifiedRetrievalResult(
+                content=r.code,
+                source='chroma',
+                score=r.score,
+                metadata=r.metadata,
             )
+            for r in results
+        ]
 
-            return [
-                UnifiedRetrievalResult(
-                    content=hit.payload.get('content', ''),
-                    source='qdrant',
-                    score=hit.score,
-                    metadata=hit.payload,
-                )
-                for hit in search_results
-            ]
+    async def _retrieve_from_qdrant(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
+        """Retrieve from Qdrant pattern library (in a worker thread)."""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, self._search_qdrant, query, top_k)
         except Exception as e:
             self.logger.error(f"Qdrant retrieval failed: {e}")
             return []
 
-    async def _retrieve_from_neo4j(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
-        """Retrieve from Neo4j knowledge graph (30,314 nodes)."""
-        if not self.neo4j_driver or not self.neo4j_enabled:
+    def _search_qdrant(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
+        """Search Qdrant pattern library (21,624 patterns, blocking; errors propagate)."""
+        if not self.qdrant or not self.qdrant_enabled:
+            return []
+
+        # Generate query embedding using GraphCodeBERT (768-dim, code-aware)
+        if self.qdrant_embeddings is None:
+            self.logger.warning("Qdrant embeddings not available")
             return []
 
+        query_embedding = self.qdrant_embeddings.encode(query).tolist()
+
+        # Search in devmatrix_patterns collection
+        search_results = self.qdrant.search(
+            collection_name="devmatrix_patterns",
+            query_vector=query_embedding,
+            limit=top_k
+        )
+
+        return [
+            UnifiedRetrievalResult(
+                content=hit.payload.get('content', ''),
+                source='qdrant',
+                score=hit.score,
+                metadata=hit.payload,
+            )
+            for hit in search_results
+        ]
+
+    async def _retrieve_from_neo4j(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
+        """Retrieve from Neo4j knowledge graph (in a worker thread)."""
         try:
-            # Tokenize query for better keyword matching
-            # Extract meaningful tokens (min 3 chars, exclude common words)
-            import re
-            tokens = re.findall(r'\b\w{3,}\b', query.lower())
-            # Remove common stop words
-            stop_words = {'the', 'and', 'for', 'with', 'from', 'that', 'this', 'domain', 'bounded', 'contexts'}
-            tokens = [t for t in tokens if t not in stop_words]
-
-            if not tokens:
-                self.logger.warning(f"No valid tokens extracted from query: {query}")
-                return []
-
-            # Use first 3 most relevant tokens for search
-            search_tokens = tokens[:3]
-
-            # Keyword-based graph search using actual Neo4j schema
-            # Schema: Pattern nodes have 'code', 'description', 'name' properties
-            with self.neo4j_driver.session() as session:
-                # Build dynamic WHERE clause for multiple tokens
-                where_clauses = []
-                for i, token in enumerate(search_tokens):
-                    where_clauses.append(f"""
-                        (n.description CONTAINS $token{i}
-                         OR n.code CONTAINS $token{i}
-                         OR n.name CONTAINS $token{i})
-                    """)
-
-                where_condition = " OR ".join(where_clauses)
-
-                cypher_query = f"""
-                    MATCH (n)
-                    WHERE {where_condition}
-                    RETURN n.code AS code,
-                           n.description AS description,
-                           n.name AS name,
-                           labels(n) AS labels,
-                           elementId(n) AS node_id
-                    LIMIT $limit
-                """
-
-                # Build parameters dict
-                params = {"limit": top_k}
-                for i, token in enumerate(search_tokens):
-                    params[f"token{i}"] = token
-
-                result = session.run(cypher_query, parameters=params)
-
-                records = list(result)
-
-                return [
-                    UnifiedRetrievalResult(
-                        content=record['code'] or record['description'] or record['name'] or '',
-                        source='neo4j',
-                        score=0.5,  # Fixed score for now, could use graph metrics
-                        metadata={
-                            'labels': record['labels'],
-                            'node_id': record['node_id'],
-                            'name': record['name'],
-                            'description': record['description'],
-                        }
-                    )
-                    for record in records
-                    if record['code'] or record['description'] or record['name']
-                ]
+            return await asyncio.get_running_loop().run_in_executor(self._executor, self._search_neo4j, query, top_k)
         except Exception as e:
             self.logger.error(f"Neo4j retrieval failed: {e}")
             return []
 
-    def _deduplicate_results(self, results: List[UnifiedRetrievalResult]) -> List[UnifiedRetrievalResult]:
-        """Deduplicate results by content hash."""
-        seen_hashes = set()
-        unique = []
+    def _search_neo4j(self, query: str, top_k: int) -> List[UnifiedRetrievalResult]:
+        """Search Neo4j knowledge graph (30,314 nodes, blocking; errors propagate)."""
+        if not self.neo4j_driver or not self.neo4j_enabled:
+            return []
+
+        # Tokenize query for better keyword matching
+        # Extract meaningful tokens (min 3 chars, exclude common words)
+        import re
+        tokens = re.findall(r'\b\w{3,}\b', query.lower())
+        # Remove common stop words
+        stop_words = {'the', 'and', 'for', 'with', 'from', 'that', 'this', 'domain', 'bounded', 'contexts'}
+        tokens = [t for t in tokens if t not in stop_words]
 
-        for result in results:
-            content_hash = hash(result.content[:500])  # Hash first 500 chars
+        if not tokens:
+            self.logger.warning(f"No valid tokens extracted from query: {query}")
+            return []
 
-            if content_hash not in seen_hashes:
-                seen_hashes.add(content_hash)
-                unique.append(result)
+        # Use first 3 most relevant tokens for search
+        search_tokens = tokens[:3]
+
+        # Keyword-based graph search using actual Neo4j schema
+        # Schema: Pattern nodes have 'code', 'description', 'name' properties
+        with self.neo4j_driver.session() as session:
+            # Build dynamic WHERE clause for multiple tokens
+            where_clauses = []
+            for i, token in enumerate(search_tokens):
+                where_clauses.append(f"""
+                    (n.description CONTAINS $token{i}
+                     OR n.code CONTAINS $token{i}
+                     OR n.name CONTAINS $token{i})
+                """)
+
+            where_condition = " OR ".join(where_clauses)
+
+            cypher_query = f"""
+                MATCH (n)
+                WHERE {where_condition}
+                RETURN n.code AS code,
+                       n.description AS description,
+                       n.name AS name,
+                       labels(n) AS labels,
+                       elementId(n) AS node_id
+                LIMIT $limit
+            """
+
+            # Build parameters dict
+            params = {"limit": top_k}
+            for i, token in enumerate(search_tokens):
+                params[f"token{i}"] = token
+
+            result = session.run(cypher_query, parameters=params)
+
+            records = list(result)
 
-        return unique
+            return [
+                UnifiedRetrievalResult(
+                    content=record['code'] or record['description'] or record['name'] or '',
+                    source='neo4j',
+                    score=0.5,  # Fixed score for now, could use graph metrics
+                    metadata={
+                        'labels': record['labels'],
+                        'node_id': record['node_id'],
+                        'name': record['name'],
+                        'description': record['description'],
+                    }
+                )
+                for record in records
+                if record['code'] or record['description'] or record['name']
+            ]
 
     def close(self):
         """Close all connections."""
+        self._executor.shutdown(wait=False)
         if self.neo4j_driver:
             self.neo4j_driver.close()
 
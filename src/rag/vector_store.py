@@ -8,10 +8,17 @@ Updated for Phase 1 Critical Security Vulnerabilities - Group 5: API Security La
 Added input validation and sanitization for SQL injection prevention.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+import hashlib
+import json
+import os
 import uuid
 import re
-from datetime import datetime
 
 import chromadb
 from chromadb.config import Settings
@@ -119,6 +126,44 @@ class SearchRequest(BaseModel):
         return v
 
 
+# ========================================
+# Streaming Ingestion
+# ========================================
+
+# A stream document: code, (code, metadata) or
+# {"code": ..., "metadata"/"metadatas": {...}, "id": ...}
+StreamDocument = Union[str, Tuple[str, Dict[str, Any]], Dict[str, Any]]
+
+
+@dataclass
+class IngestionStats:
+    """Result of VectorStore.add_stream()."""
+
+    processed: int = 0  # Documents read from the stream (including resumed ones)
+    added: int = 0  # New ids written
+    updated: int = 0  # Existing ids whose content changed
+    skipped: int = 0  # Content already stored under the same id
+    invalid: int = 0  # Empty code
+    resumed_from: int = 0  # Documents skipped from a previous checkpoint
+    batches: int = 0
+
+
+def content_hash(code: str) -> str:
+    """SHA-256 of a code example (stored as metadata["content_hash"])."""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+def _normalize_stream_document(document: StreamDocument) -> Tuple[str, Dict[str, Any], Optional[str]]:
+    """Return (code, metadata copy, id or None) for a stream document."""
+    if isinstance(document, str):
+        return document, {}, None
+    if isinstance(document, tuple):
+        code, metadata = document
+        return code, dict(metadata or {}), None
+    metadata = document.get("metadata", document.get("metadatas")) or {}
+    return document.get("code", ""), dict(metadata), document.get("id")
+
+
 class VectorStore:
     """
     ChromaDB wrapper for storing and retrieving code embeddings.
@@ -353,12 +398,215 @@ class VectorStore:
             )
             raise
 
+    def add_stream(
+        self,
+        documents: Iterable[StreamDocument],
+        batch_size: int = 64,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        skip_existing: bool = True,
+    ) -> IngestionStats:
+        """
+        Index a stream of code examples with bounded memory.
+
+        Documents are read in fixed-size batches; at most two batches are
+        held at a time: the embedding of batch N+1 runs while batch N is
+        written to ChromaDB in a background thread.
+
+        Re-indexing is idempotent: documents without an id use their
+        content hash as id, and a document whose id is already stored (or
+        in the write still in flight) with the same content hash is skipped
+        (not re-embedded). Changed content is upserted.
+
+        With checkpoint_path, the number of documents processed is saved
+        after every written batch; a later call with the same checkpoint
+        skips that many documents from the start of the stream, so the
+        stream must yield documents in the same order. The checkpoint is
+        removed once the stream is fully ingested.
+
+        Args:
+            documents: Iterable of code strings, (code, metadata) tuples or
+                       {"code", "metadata"/"metadatas", "id"} dicts
+            batch_size: Documents per embedding / write batch
+            checkpoint_path: Optional JSON file used to resume an interrupted ingestion
+            skip_existing: Skip documents already stored with the same content
+
+        Returns:
+            IngestionStats for this call
+
+        Raises:
+            ValueError: If batch_size is not positive
+            Exception: If embedding or writing a batch fails (progress up to the
+                       last written batch is checkpointed)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        checkpoint = Path(checkpoint_path) if checkpoint_path else None
+        stats = IngestionStats()
+        stream: Iterator[StreamDocument] = iter(documents)
+
+        if checkpoint and checkpoint.exists():
+            saved = json.loads(checkpoint.read_text())
+            if saved.get("collection") == self.collection_name:
+                stats.resumed_from = int(saved.get("processed", 0))
+                stats.processed = sum(1 for _ in islice(stream, stats.resumed_from))
+                self.logger.info(
+                    "Resuming ingestion from checkpoint",
+                    checkpoint=str(checkpoint),
+                    resumed_from=stats.resumed_from
+                )
+
+        self.logger.info(
+            "Starting streaming ingestion",
+            collection=self.collection_name,
+            batch_size=batch_size
+        )
+
+        pending_write: Optional[Future] = None
+        in_flight: Dict[str, str] = {}  # id -> content hash of the write in flight
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector-store-writer") as writer:
+            try:
+                while True:
+                    batch = list(islice(stream, batch_size))
+                    if not batch:
+                        break
+
+                    prepared = self._prepare_stream_batch(batch, stats, skip_existing, in_flight)
+                    stats.processed += len(batch)
+                    stats.batches += 1
+
+                    embeddings = (
+                        self.embedding_model.embed_batch(prepared["documents"], show_progress=False)
+                        if prepared["ids"] else []
+                    )
+
+                    # Keep at most one write in flight
+                    if pending_write is not None:
+                        pending_write.result()
+                    pending_write = writer.submit(
+                        self._write_stream_batch, prepared, embeddings, stats.processed, checkpoint
+                    )
+                    in_flight = {
+                        example_id: metadata["content_hash"]
+                        for example_id, metadata in zip(prepared["ids"], prepared["metadatas"], strict=True)
+                    }
+
+                if pending_write is not None:
+                    pending_write.result()
+
+            except Exception as e:
+                self.logger.error(
+                    "Streaming ingestion failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    processed=stats.processed
+                )
+                raise
+
+        if checkpoint and checkpoint.exists():
+            checkpoint.unlink()
+
+        self.logger.info(
+            "Streaming ingestion completed",
+            collection=self.collection_name,
+            **asdict(stats)
+        )
+
+        return stats
+
+    def _prepare_stream_batch(
+        self,
+        batch: List[StreamDocument],
+        stats: IngestionStats,
+        skip_existing: bool,
+        in_flight: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, List[Any]]:
+        """
+        Normalize a stream batch and drop unchanged documents.
+
+        in_flight maps the ids of the previous batch, whose upsert may not
+        have reached the collection yet, to their content hash; it takes
+        precedence over what the collection returns.
+        """
+        indexed_at = datetime.utcnow().isoformat()
+        by_id: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+        for document in batch:
+            code, metadata, example_id = _normalize_stream_document(document)
+            if not code or not code.strip():
+                stats.invalid += 1
+                continue
+
+            metadata["indexed_at"] = indexed_at
+            metadata["code_length"] = len(code)
+            metadata["content_hash"] = content_hash(code)
+
+            example_id = example_id or metadata["content_hash"]
+            if example_id in by_id:
+                # Same id twice in one batch: the last one wins (as with upsert)
+                stats.skipped += 1
+            by_id[example_id] = (code, metadata)
+
+        prepared: Dict[str, List[Any]] = {
+            "ids": list(by_id),
+            "documents": [code for code, _ in by_id.values()],
+            "metadatas": [metadata for _, metadata in by_id.values()],
+        }
+        existing_ids = set()
+
+        if prepared["ids"]:
+            stored = self.collection.get(ids=prepared["ids"], include=["metadatas"])
+            stored_hashes = {
+                stored_id: (stored_metadata or {}).get("content_hash")
+                for stored_id, stored_metadata in zip(stored["ids"], stored.get("metadatas") or [], strict=False)
+            }
+            existing_ids = set(stored["ids"])
+            for example_id in prepared["ids"]:
+                if in_flight and example_id in in_flight:
+                    stored_hashes[example_id] = in_flight[example_id]
+                    existing_ids.add(example_id)
+
+            keep = [
+                i for i, example_id in enumerate(prepared["ids"])
+                if not (skip_existing and stored_hashes.get(example_id) == prepared["metadatas"][i]["content_hash"])
+            ]
+            stats.skipped += len(prepared["ids"]) - len(keep)
+            for key in prepared:
+                prepared[key] = [prepared[key][i] for i in keep]
+
+        stats.updated += sum(1 for example_id in prepared["ids"] if example_id in existing_ids)
+        stats.added += sum(1 for example_id in prepared["ids"] if example_id not in existing_ids)
+        return prepared
+
+    def _write_stream_batch(
+        self,
+        prepared: Dict[str, List[Any]],
+        embeddings: List[List[float]],
+        processed: int,
+        checkpoint: Optional[Path],
+    ) -> None:
+        """Upsert one prepared batch, then checkpoint progress."""
+        if prepared["ids"]:
+            self.collection.upsert(
+                ids=prepared["ids"],
+                embeddings=embeddings,
+                documents=prepared["documents"],
+                metadatas=prepared["metadatas"]
+            )
+
+        if checkpoint:
+            checkpoint.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = checkpoint.with_name(checkpoint.name + ".tmp")
+            tmp_path.write_text(json.dumps({"collection": self.collection_name, "processed": processed}))
+            os.replace(tmp_path, checkpoint)
+
     def search(
         self,
         query: str,
         top_k: int = 5,
         where: Optional[Dict[str, Any]] = None,
         where_document: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar code examples.
@@ -370,6 +618,8 @@ class VectorStore:
             top_k: Number of results to return (default: 5)
             where: Optional metadata filter (e.g., {"language": "python"})
             where_document: Optional document content filter
+            query_embedding: Precomputed embedding of query (skips embedding,
+                             e.g. when one query searches several collections)
 
         Returns:
             List of results with code, metadata, and similarity scores
@@ -387,7 +637,7 @@ class VectorStore:
             )
         except ValueError as e:
             self.logger.warning(f"Search validation failed: {str(e)}")
-            raise ValueError(f"Invalid search parameters: {str(e)}")
+            raise ValueError(f"Invalid search parameters: {str(e)}") from e
 
         # Use validated values
         query = search_request.query
@@ -404,22 +654,15 @@ class VectorStore:
             )
 
             # Generate query embedding
-            query_embedding = self.embedding_model.embed_text(query)
-
-            # Translate simple equality filters into Chroma's where syntax
-            where_chroma = None
-            if where:
-                clauses = []
-                for k, v in where.items():
-                    clauses.append({k: {"$eq": v}})
-                where_chroma = {"$and": clauses} if len(clauses) > 1 else clauses[0]
+            if query_embedding is None:
+                query_embedding = self.embedding_model.embed_text(query)
 
             # Perform search using parameterized ChromaDB query
             # ChromaDB uses safe parameterization internally
             results: QueryResult = self.collection.query(
                 query_embeddings=[query_embedding],
                 n_results=top_k,
-                where=where_chroma,
+                where=self._to_chroma_where(where),
                 where_document=where_document,
                 include=["documents", "metadatas", "distances"]
             )
@@ -451,6 +694,7 @@ class VectorStore:
         top_k: int = 5,
         filters: Optional[Dict[str, Any]] = None,
         min_similarity: Optional[float] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search with metadata filtering and similarity threshold.
@@ -460,6 +704,7 @@ class VectorStore:
             top_k: Number of results to return
             filters: Metadata filters (e.g., {"language": "python", "approved": True})
             min_similarity: Minimum similarity score (0.0-1.0)
+            query_embedding: Precomputed embedding of query (skips embedding)
 
         Returns:
             List of results filtered by similarity threshold
@@ -469,7 +714,9 @@ class VectorStore:
             Exception: If search fails
         """
         # Perform search (validation happens in search method)
-        results = self.search(query=query, top_k=top_k, where=filters)
+        results = self.search(
+            query=query, top_k=top_k, where=filters, query_embedding=query_embedding
+        )
 
         # Apply similarity threshold if specified
         if min_similarity is not None:
@@ -487,6 +734,14 @@ class VectorStore:
 
         return results
 
+    @staticmethod
+    def _to_chroma_where(where: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Translate simple equality filters into Chroma's where syntax."""
+        if not where:
+            return None
+        clauses = [{k: {"$eq": v}} for k, v in where.items()]
+        return {"$and": clauses} if len(clauses) > 1 else clauses[0]
+
     def delete_example(self, example_id: str) -> bool:
         """
         Delete a code example from the vector store.
@@ -22,6 +22,7 @@ from src.models.user_usage import UserUsage
 from src.models.conversation import Conversation
 from src.models.masterplan import MasterPlan
 from src.config.database import get_db_context
+from src.services.auth_cache import publish_auth_invalidation
 from src.observability import get_logger
 
 logger = get_logger("admin_service")
@@ -201,6 +202,9 @@ class AdminService:
             db.commit()
             db.refresh(user)
 
+            # Cached principals carry the old flags (is_active, is_superuser)
+            publish_auth_invalidation(user_id=user_id)
+
             logger.info(
                 f"Admin updated user {user_id} status: "
                 f"active={is_active}, verified={is_verified}, superuser={is_superuser}"
@@ -245,6 +249,8 @@ class AdminService:
             db.delete(user)
             db.commit()
 
+            publish_auth_invalidation(user_id=user_id)
+
             logger.warning(f"Admin deleted user {user_id} ({user.email})")
 
             return True
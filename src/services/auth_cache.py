@@ -0,0 +1,284 @@
+"""
+Auth Cache
+
+Fast path for get_current_user. A fully validated request costs a blacklist
+GET, a session GET, a session GET+SETEX (activity) and a user SELECT; for a
+token seen a moment ago none of that has changed.
+
+- AuthPrincipalCache: short-TTL in-process cache of validated tokens
+  (jti -> user principal). Entries never outlive the token's exp.
+- Invalidation: blacklist_token / logout / admin status changes publish on
+  the AUTH_INVALIDATION_CHANNEL Redis channel; every API process listens and
+  drops matching entries. If the subscription breaks, the cache is cleared
+  (messages may have been missed) and re-subscribed.
+- The TTL (AUTH_CACHE_TTL_SECONDS) bounds staleness when a publish is lost,
+  e.g. Redis down during logout, or a session expiring on idle timeout.
+
+Cached users are stored as column values and re-hydrated per request as a
+detached User, so concurrent requests never share an ORM instance.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.config.settings import get_settings
+from src.models.user import User
+from src.observability import get_logger
+
+logger = get_logger("auth_cache")
+settings = get_settings()
+
+AUTH_INVALIDATION_CHANNEL = "auth:invalidate"
+
+
+@dataclass
+class CachedPrincipal:
+    """Validated token -> user, as cached between requests."""
+    user_id: str
+    user_data: Dict[str, Any]
+    expires_at: float  # monotonic
+
+    def to_user(self) -> User:
+        """Fresh detached User instance for this request."""
+        user = User(**self.user_data)
+        make_transient_to_detached(user)
+        return user
+
+
+class AuthPrincipalCache:
+    """
+    Bounded TTL cache of validated access tokens, keyed by jti.
+
+    Thread-safe: sync endpoints and the invalidation listener thread share it.
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0, max_entries: int = 10000):
+        """
+        Args:
+            ttl_seconds: Max age of an entry (0 disables the cache)
+            max_entries: Entries kept before the oldest are evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedPrincipal]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, jti: str, user_id: str) -> Optional[User]:
+        """
+        Get the cached user for a token.
+
+        Args:
+            jti: Token jti claim
+            user_id: Token sub claim (must match the cached principal)
+
+        Returns:
+            Detached User, or None on miss/expiry
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None or entry.expires_at <= time.monotonic() or entry.user_id != user_id:
+                if entry is not None:
+                    del self._entries[jti]
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return entry.to_user()
+
+    def put(self, jti: str, user: User, token_exp: Optional[float] = None) -> None:
+        """
+        Cache a validated principal.
+
+        Args:
+            jti: Token jti claim
+            user: User loaded for the token
+            token_exp: Token exp claim (unix time); the entry never outlives it
+        """
+        if not self.enabled:
+            return
+
+        ttl = self.ttl_seconds
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+
+        user_data = {
+            attr.key: getattr(user, attr.key)
+            for attr in sa_inspect(User).column_attrs
+        }
+        entry = CachedPrincipal(
+            user_id=str(user.user_id),
+            user_data=user_data,
+            expires_at=time.monotonic() + ttl,
+        )
+
+        with self._lock:
+            self._entries[jti] = entry
+            self._entries.move_to_end(jti)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, jti: Optional[str] = None, user_id: Optional[str] = None) -> None:
+        """Drop the entry for a jti and/or every entry of a user."""
+        with self._lock:
+            if jti:
+                self._entries.pop(jti, None)
+            if user_id:
+                for key in [k for k, e in self._entries.items() if e.user_id == user_id]:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AuthInvalidationListener:
+    """
+    Background thread applying invalidation messages to an AuthPrincipalCache.
+    """
+
+    def __init__(self, cache: AuthPrincipalCache, redis_client, retry_seconds: float = 5.0):
+        """
+        Args:
+            cache: Cache to invalidate
+            redis_client: Sync redis client (RedisManager.client)
+            retry_seconds: Delay before re-subscribing after an error
+        """
+        self.cache = cache
+        self.redis_client = redis_client
+        self.retry_seconds = retry_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="auth-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(AUTH_INVALIDATION_CHANNEL)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self.handle_message(message.get("data"))
+            except Exception as e:
+                # Messages may have been lost while disconnected
+                logger.warning(f"Auth invalidation subscription failed: {str(e)}")
+                self.cache.clear()
+                self._stop.wait(self.retry_seconds)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def handle_message(self, data: Any) -> None:
+        """Apply one invalidation message ({"jti": ..., "user_id": ...})."""
+        try:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            payload = json.loads(data)
+        except (ValueError, UnicodeDecodeError):
+            logger.warning(f"Ignoring malformed auth invalidation message: {data!r}")
+            return
+
+        self.cache.invalidate(jti=payload.get("jti"), user_id=payload.get("user_id"))
+
+
+# Global cache (singleton per process)
+_principal_cache: Optional[AuthPrincipalCache] = None
+_listener: Optional[AuthInvalidationListener] = None
+_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> AuthPrincipalCache:
+    """
+    Get the process-wide principal cache, starting its invalidation listener.
+
+    Without Redis there is no cross-process invalidation, so the cache is
+    only used when the listener could be started.
+    """
+    global _principal_cache, _listener
+
+    if _principal_cache is not None:
+        return _principal_cache
+
+    with _cache_lock:
+        if _principal_cache is None:
+            cache = AuthPrincipalCache(ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS)
+
+            from src.services.auth_service import get_redis_client
+            redis_manager = get_redis_client()
+            if cache.enabled and redis_manager.connected:
+                _listener = AuthInvalidationListener(cache, redis_manager.client)
+                _listener.start()
+            else:
+                cache.ttl_seconds = 0
+
+            _principal_cache = cache
+
+    return _principal_cache
+
+
+def publish_auth_invalidation(
+    jti: Optional[str] = None,
+    user_id: Optional[UUID] = None,
+    correlation_id: Optional[str] = None
+) -> None:
+    """
+    Drop cached principals in this and every other API process.
+
+    Args:
+        jti: Revoked token jti
+        user_id: User whose tokens must be re-validated (status change)
+        correlation_id: Optional correlation ID for request tracing
+    """
+    message = {"jti": jti, "user_id": str(user_id) if user_id else None}
+
+    # Local process first: never serve a revoked token from this cache
+    if _principal_cache is not None:
+        _principal_cache.invalidate(jti=message["jti"], user_id=message["user_id"])
+
+    try:
+        from src.services.auth_service import get_redis_client
+        redis_manager = get_redis_client()
+        if redis_manager.connected:
+            redis_manager.client.publish(AUTH_INVALIDATION_CHANNEL, json.dumps(message))
+    except Exception as e:
+        logger.error(
+            f"Failed to publish auth invalidation: {str(e)}",
+            extra={"correlation_id": correlation_id}
+        )
@@ -26,6 +26,8 @@ from redis.exceptions import RedisError
 from src.models.user import User
 from src.config.database import get_db_context
 from src.config.settings import get_settings
+from src.services.auth_cache import publish_auth_invalidation
+from src.services.request_cache import request_cached
 from src.state.redis_manager import RedisManager
 from src.observability import get_logger
 
@@ -344,6 +346,10 @@ class AuthService:
             # Use Redis client directly
             if redis_client.connected:
                 redis_client.client.setex(blacklist_key, ttl, "1")
+                # Only now drop cached principals in every API process, so a
+                # concurrent request cannot re-cache the token before it is
+                # blacklisted
+                publish_auth_invalidation(jti=jti, correlation_id=correlation_id)
                 logger.info(
                     f"Token blacklisted: {token_type} token {jti} (TTL: {ttl}s)",
                     extra={"correlation_id": correlation_id}
@@ -772,6 +778,20 @@ class AuthService:
             )
             raise HTTPException(status_code=500, detail="Internal server error")
 
+    @staticmethod
+    def get_user_by_id(user_id: UUID) -> Optional[User]:
+        """
+        Load a user row (detached from the session).
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            User object or None if not found
+        """
+        with get_db_context() as db:
+            return db.query(User).filter(User.user_id == user_id).first()
+
     def get_current_user(self, token: str, correlation_id: Optional[str] = None) -> Optional[User]:
         """
         Get current user from access token.
@@ -789,10 +809,7 @@ class AuthService:
                 return None
 
             user_id = UUID(payload["sub"])
-
-            with get_db_context() as db:
-                user = db.query(User).filter(User.user_id == user_id).first()
-                return user
+            return request_cached(("user", user_id), lambda: self.get_user_by_id(user_id))
 
         except SQLAlchemyError as e:
             logger.error(
@@ -46,6 +46,8 @@ from src.cognitive.patterns.production_patterns import (
 
 # ApplicationIR Normalizer for Template Rendering
 from src.services.application_ir_normalizer import ApplicationIRNormalizer
+from src.services.pattern_template_engine import get_pattern_template_engine
+from src.services.pattern_composition_engine import get_pattern_composition_engine
 
 # Cognitive Feedback Loop - Pattern Promotion Pipeline (Milestone 4)
 from src.cognitive.patterns.pattern_feedback_integration import (
@@ -218,6 +220,11 @@ class CodeGenerationService:
             },
         )
 
+    def close(self) -> None:
+        """Release the PatternBank connection (flushes buffered usage counts)."""
+        if self.pattern_bank is not None:
+            self.pattern_bank.close()
+
     # ============================================================================
     # ApplicationIR Conversion Helpers (Phase 1 Refactoring)
     # ============================================================================
@@ -2120,6 +2127,32 @@ Code MUST pass Python compile() without SyntaxError."""
             ],
         }
 
+        # Search all specific purpose strings in one batch
+        # (one batched embedding pass + one Qdrant batch request)
+        purpose_queries = [
+            (category, purpose)
+            for category, config in PRODUCTION_PATTERN_CATEGORIES.items()
+            for purpose in SPECIFIC_PURPOSES.get(category, [])
+        ]
+        purpose_results = {}
+        if purpose_queries:
+            batch_results = self.pattern_bank.hybrid_search_many(
+                [
+                    SemanticTaskSignature(
+                        purpose=purpose,
+                        intent="implement",
+                        inputs={},
+                        outputs={},
+                        domain=PRODUCTION_PATTERN_CATEGORIES[category]["domain"],
+                    )
+                    for category, purpose in purpose_queries
+                ],
+                domains=[PRODUCTION_PATTERN_CATEGORIES[category]["domain"] for category, _ in purpose_queries],
+                production_ready=True,
+                top_k=10,  # Increased to capture patterns with lower similarity scores
+            )
+            purpose_results = dict(zip(purpose_queries, batch_results, strict=True))
+
         patterns = {}
 
         for category, config in PRODUCTION_PATTERN_CATEGORIES.items():
@@ -2149,21 +2182,8 @@ Code MUST pass Python compile() without SyntaxError."""
             else:
                 # Search for EACH specific purpose string with EXACT matching
                 for purpose in specific_purposes:
-                    query_sig = SemanticTaskSignature(
-                        purpose=purpose,
-                        intent="implement",
-                        inputs={},
-                        outputs={},
-                        domain=config["domain"],
-                    )
-
-                    # Get top 10 candidates to ensure exact match is included
-                    results = self.pattern_bank.hybrid_search(
-                        signature=query_sig,
-                        domain=config["domain"],
-                        production_ready=True,
-                        top_k=10,  # Increased to capture patterns with lower similarity scores
-                    )
+                    # Top 10 candidates to ensure exact match is included
+                    results = purpose_results[(category, purpose)]
 
                     # Find EXACT purpose match (not just semantic similarity)
                     exact_match = None
@@ -2210,7 +2230,8 @@ Code MUST pass Python compile() without SyntaxError."""
         """
         Compose patterns into complete modular application (Task Group 8).
 
-        Pattern composition order (priority-based):
+        Pattern composition order (priority-based, see PatternCompositionEngine
+        for concurrent composition of independent categories):
         1. Core infrastructure (config, database, logging)
         2. Data layer (models, repositories)
         3. Service layer
@@ -2264,24 +2285,27 @@ Code MUST pass Python compile() without SyntaxError."""
                 extra={"uses_application_ir": False}
             )
 
-        files = {}
-
         # Get composition order (priority-based)
         composition_order = get_composition_order()
 
+        categories = []
         for category in composition_order:
             if category not in patterns or not patterns[category]:
                 logger.debug(f"No patterns found for category: {category}")
                 continue
-
-            # Compose patterns for this category
-            # Use app_ir if available, otherwise fall back to spec_requirements
-            category_files = await self._compose_category_patterns(
-                category,
-                patterns[category],
-                app_ir if app_ir is not None else spec_requirements
-            )
-            files.update(category_files)
+            categories.append(category)
+
+        # Compose categories (independent ones concurrently, in the composition engine's
+        # worker pool: threads by default, see CODEGEN_COMPOSITION_EXECUTOR);
+        # files are merged in composition order
+        # Use app_ir if available, otherwise fall back to spec_requirements
+        files = await get_pattern_composition_engine().compose(
+            categories,
+            patterns,
+            app_ir if app_ir is not None else spec_requirements,
+            compose_inline=self._compose_category_patterns,
+            app_ir=getattr(self, "app_ir", None),
+        )
 
         # Search for main.py separately (domain="application" not in categories)
         # Use exact purpose string from populate_production_patterns.py
@@ -2799,6 +2823,13 @@ Generated by DevMatrix Code Generation Engine
             else:
                 return self._adapt_pattern(code, spec_requirements=spec_or_ir, current_entity=current_entity, skip_jinja=skip_jinja)
 
+        def adapt_pattern_for_entities_helper(code, entities):
+            """Helper to adapt one pattern for several entities, auto-detecting spec_or_ir type."""
+            if is_app_ir:
+                return self._adapt_pattern_for_entities(code, entities, app_ir=spec_or_ir)
+            else:
+                return self._adapt_pattern_for_entities(code, entities, spec_requirements=spec_or_ir)
+
         files = {}
 
         # Log patterns for this category
@@ -2932,9 +2963,10 @@ Generated by DevMatrix Code Generation Engine
             repo_pattern = find_pattern_by_keyword(category_patterns, "repository", "crud")
             entities = get_entities()
             if repo_pattern and entities:
-                for entity in entities:
-                    # Pass current entity to _adapt_pattern so Jinja2 has access to {{ entity.name }}
-                    adapted = adapt_pattern_helper(repo_pattern.code, current_entity=entity)
+                # Pass each entity to _adapt_pattern so Jinja2 has access to {{ entity.name }};
+                # the template is compiled once for all entities
+                adapted_repos = adapt_pattern_for_entities_helper(repo_pattern.code, entities)
+                for entity, adapted in zip(entities, adapted_repos, strict=True):
                     files[f"src/repositories/{get_entity_snake_name(entity)}_repository.py"] = adapted
 
         # Business Logic / Service Layer
@@ -3089,26 +3121,32 @@ Generated by DevMatrix Code Generation Engine
                     extra={"entity_count": len(entities), "has_pattern": route_pattern is not None}
                 )
 
+                # Group endpoints by entity once
+                # Use endpoint.entity field (set by LLM parser) for accurate grouping;
+                # endpoints without it fall back to path-based matching per entity
+                endpoint_indexes_by_entity: Dict[str, List[int]] = {}
+                untagged_endpoints = []
+                for index, e in enumerate(endpoints):
+                    if hasattr(e, 'entity') and e.entity:
+                        endpoint_indexes_by_entity.setdefault(e.entity.lower(), []).append(index)
+                    else:
+                        untagged_endpoints.append((index, e.path.lstrip('/')))
+
                 # Generate route for each entity using LLM with pattern as guide
                 for entity in entities:
                     # Extract endpoints specific to this entity from spec
-                    # Use endpoint.entity field (set by LLM parser) for accurate grouping
-                    # Fallback to path-based matching if entity field is missing
                     entity_snake = get_entity_snake_name(entity)
                     entity_plural = f"{entity_snake}s"
-                    
-                    entity_endpoints = []
-                    for e in endpoints:
-                        # Try entity field first (LLM-parsed)
-                        if hasattr(e, 'entity') and e.entity:
-                            if e.entity.lower() == entity.name.lower():
-                                entity_endpoints.append(e)
-                        else:
-                            # Fallback to path-based matching
-                            if (e.path.lstrip('/').startswith(entity_plural + '/') or
-                                e.path.lstrip('/').startswith(entity_plural) or
-                                e.path == f"/{entity_plural}"):
-                                entity_endpoints.append(e)
+
+                    entity_indexes = list(endpoint_indexes_by_entity.get(entity.name.lower(), []))
+                    if untagged_endpoints:
+                        # Path-based matching (covers /{plural}, /{plural}/...)
+                        entity_indexes.extend(
+                            index for index, path in untagged_endpoints
+                            if path.startswith(entity_plural)
+                        )
+                        entity_indexes.sort()  # Keep spec order
+                    entity_endpoints = [endpoints[index] for index in entity_indexes]
 
                     # Generate route using LLM with pattern as style guide
                     # For api_routes, pass spec_or_ir based on type
@@ -3347,6 +3385,8 @@ Generated by DevMatrix Code Generation Engine
         **Phase 1 Refactoring**: Now accepts ApplicationIR as primary input with
         backward compatibility for spec_requirements.
 
+        Compiled templates are cached by the shared PatternTemplateEngine.
+
         Args:
             pattern_code: Pattern code with placeholders (Jinja2 or simple style)
             spec_requirements: SpecRequirements object (deprecated, backward compat)
@@ -3357,6 +3397,80 @@ Generated by DevMatrix Code Generation Engine
         Returns:
             Adapted code with placeholders replaced
         """
+        return self._adapt_pattern_for_entities(
+            pattern_code,
+            [current_entity],
+            spec_requirements=spec_requirements,
+            skip_jinja=skip_jinja,
+            app_ir=app_ir,
+        )[0]
+
+    def _adapt_pattern_for_entities(
+        self,
+        pattern_code: str,
+        entities: List[Any],
+        spec_requirements=None,
+        skip_jinja: bool = False,
+        app_ir=None,
+    ) -> List[str]:
+        """
+        Adapt one pattern for several entities.
+
+        The application context is built and the template compiled once;
+        only the entity-specific variables change per render.
+
+        Args:
+            pattern_code: Pattern code with placeholders (Jinja2 or simple style)
+            entities: Entity objects (None for an application-level render)
+            spec_requirements: SpecRequirements object (deprecated, backward compat)
+            skip_jinja: Skip Jinja2 rendering
+            app_ir: ApplicationIR object (preferred, primary input)
+
+        Returns:
+            Adapted code per entity, in order
+        """
+        context, legacy_values = self._build_adaptation_context(spec_requirements=spec_requirements, app_ir=app_ir)
+
+        contexts = []
+        entity_legacy_values = []
+        for current_entity in entities:
+            entity_context = dict(context)
+            entity_values = dict(legacy_values)
+
+            # Add current entity to context if provided (for entity-specific patterns)
+            if current_entity:
+                entity_snake = current_entity.name.lower().replace(" ", "_")
+                entity_context["entity"] = {
+                    "name": current_entity.name,
+                    "snake_name": entity_snake,
+                }
+                # Add common variables for Jinja2 templates ({{id}}, {{entity_name}}, etc.)
+                entity_context["id"] = "{id}"  # For path parameters like @router.get("/{{id}}") → /@router.get("/{id}")
+                entity_context["entity_name"] = entity_snake  # For function names like get_{{entity_name}}
+                entity_context["ENTITY_NAME"] = current_entity.name  # For class names like {{ENTITY_NAME}}Response
+
+                # Also replace entity-specific placeholders
+                entity_values["ENTITY_NAME"] = current_entity.name
+                entity_values["entity_name"] = entity_snake
+
+            contexts.append(entity_context)
+            entity_legacy_values.append(entity_values)
+
+        return get_pattern_template_engine().render_many(
+            pattern_code, contexts, entity_legacy_values, skip_jinja=skip_jinja
+        )
+
+    def _build_adaptation_context(self, spec_requirements=None, app_ir=None):
+        """
+        Build the Jinja2 context and legacy placeholder values for pattern adaptation.
+
+        Args:
+            spec_requirements: SpecRequirements object (deprecated, backward compat)
+            app_ir: ApplicationIR object (preferred, primary input)
+
+        Returns:
+            Tuple of (Jinja2 context, legacy {PLACEHOLDER} values)
+        """
         # Handle both ApplicationIR and SpecRequirements
         if app_ir is not None:
             # PRIMARY PATH: Extract from ApplicationIR using Normalizer
@@ -3429,61 +3543,16 @@ Generated by DevMatrix Code Generation Engine
         else:
             raise ValueError("Either app_ir or spec_requirements must be provided")
 
-        # Add current entity to context if provided (for entity-specific patterns)
-        if current_entity:
-            entity_snake = current_entity.name.lower().replace(" ", "_")
-            context["entity"] = {
-                "name": current_entity.name,
-                "snake_name": entity_snake,
-            }
-            # Add common variables for Jinja2 templates ({{id}}, {{entity_name}}, etc.)
-            context["id"] = "{id}"  # For path parameters like @router.get("/{{id}}") → /@router.get("/{id}")
-            context["entity_name"] = entity_snake  # For function names like get_{{entity_name}}
-            context["ENTITY_NAME"] = current_entity.name  # For class names like {{ENTITY_NAME}}Response
-
-        rendered = pattern_code
-
-        # Render Jinja2 template (handles {{ }} and {% %} syntax) unless explicitly skipped
-        if not skip_jinja:
-            try:
-                # Create Environment with custom filters for template rendering
-                import re as regex_module
-                from jinja2 import Environment
-
-                def snake_case_filter(value):
-                    """Convert CamelCase to snake_case."""
-                    if not value:
-                        return value
-                    return regex_module.sub(r'(?<!^)(?=[A-Z])', '_', str(value)).lower()
-
-                env = Environment()
-                env.filters['snake_case'] = snake_case_filter
-
-                template = env.from_string(pattern_code)
-                rendered = template.render(context)
-            except Exception as e:
-                # If Jinja2 rendering fails (e.g., syntax error in template),
-                # fall back to simple string replacement without breaking the pipeline
-                logger.warning(
-                    f"Jinja2 template rendering failed: {e}. Falling back to simple replacement.",
-                    extra={"error": str(e)}
-                )
+        # Backward compatibility: simple placeholder style {APP_NAME}
+        legacy_values = {
+            "APP_NAME": app_name,
+            "APP_NAME_SNAKE": app_name_snake,
+            "DATABASE_URL": database_url,
+            "ENTITY_IMPORTS": imports_str,
+            "ENTITY_ROUTERS": routers_str,
+        }
 
-        # Backward compatibility: also replace simple placeholder style {APP_NAME}
-        adapted = rendered
-        adapted = adapted.replace("{APP_NAME}", app_name)
-        adapted = adapted.replace("{APP_NAME_SNAKE}", app_name_snake)
-        adapted = adapted.replace("{DATABASE_URL}", database_url)
-        adapted = adapted.replace("{ENTITY_IMPORTS}", imports_str)
-        adapted = adapted.replace("{ENTITY_ROUTERS}", routers_str)
-
-        # Also replace entity-specific placeholders
-        if current_entity:
-            entity_snake = current_entity.name.lower().replace(" ", "_")
-            adapted = adapted.replace("{ENTITY_NAME}", current_entity.name)
-            adapted = adapted.replace("{entity_name}", entity_snake)
-
-        return adapted
+        return context, legacy_values
 
     async def _generate_route_with_llm(
         self,
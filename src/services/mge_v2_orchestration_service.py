@@ -236,66 +236,70 @@ class MGE_V2_OrchestrationService:
             from src.services.code_generation_service import CodeGenerationService
             code_gen_service = CodeGenerationService(db=self.db, llm_client=self.llm_client)
 
-            total_code_length = 0
-            total_cost = 0.0
-
-            # Parallel code generation - process 5 tasks simultaneously
-            batch_size = 5
-            completed_tasks_count = 0
-            for batch_start in range(0, len(tasks), batch_size):
-                batch_tasks = tasks[batch_start:batch_start + batch_size]
-
-                # Generate code for all tasks in batch concurrently
-                batch_results = await asyncio.gather(
-                    *[code_gen_service.generate_code_for_task(task.task_id) for task in batch_tasks],
-                    return_exceptions=True
-                )
-
-                # Process results and yield progress
-                for idx, (task, result) in enumerate(zip(batch_tasks, batch_results)):
-                    import time
-                    task_start = time.time()
-
-                    # Handle exceptions
-                    if isinstance(result, Exception):
-                        logger.error(f"Code generation failed for task {task.task_id}: {result}")
-                        result = {"success": False, "code_length": 0, "cost_usd": 0.0}
-
-                    if result.get("success"):
-                        total_code_length += result.get("code_length", 0)
-                        total_cost += result.get("cost_usd", 0.0)
-                        completed_tasks_count += 1
-
-                    task_duration_ms = (time.time() - task_start) * 1000
-
-                    # Emit WebSocket progress_update event (Opción 2 - 1 evento por TASK)
-                    if self.ws_manager:
-                        await self.ws_manager.emit_progress_update(
-                            session_id=session_id,
-                            task_id=f"task_{task.task_number:03d}",
-                            task_name=task.name or f"Task {task.task_number}",
-                            phase=getattr(task, 'phase', 3),
-                            phase_name=self._get_phase_name(getattr(task, 'phase', 3)),
-                            status="completed" if result.get("success") else "failed",
-                            progress=completed_tasks_count,
-                            progress_percent=(completed_tasks_count / len(tasks)) * 100,
-                            completed_tasks=completed_tasks_count,
-                            total_tasks=len(tasks),
-                            current_wave=1,  # Code generation is wave 1
-                            duration_ms=task_duration_ms,
-                            subtask_status={}
-                        )
+            try:
+                total_code_length = 0
+                total_cost = 0.0
+
+                # Parallel code generation - process 5 tasks simultaneously
+                batch_size = 5
+                completed_tasks_count = 0
+                for batch_start in range(0, len(tasks), batch_size):
+                    batch_tasks = tasks[batch_start:batch_start + batch_size]
+
+                    # Generate code for all tasks in batch concurrently
+                    batch_results = await asyncio.gather(
+                        *[code_gen_service.generate_code_for_task(task.task_id) for task in batch_tasks],
+                        return_exceptions=True
+                    )
 
-                    yield {
-                        "type": "progress",
-                        "phase": "code_generation",
-                        "task_number": task.task_number,
-                        "task_title": task.name,
-                        "code_length": result.get("code_length", 0),
-                        "success": result.get("success", False),
-                        "progress": f"{batch_start + idx + 1}/{len(tasks)}",
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
+                    # Process results and yield progress
+                    for idx, (task, result) in enumerate(zip(batch_tasks, batch_results)):
+                        import time
+                        task_start = time.time()
+
+                        # Handle exceptions
+                        if isinstance(result, Exception):
+                            logger.error(f"Code generation failed for task {task.task_id}: {result}")
+                            result = {"success": False, "code_length": 0, "cost_usd": 0.0}
+
+                        if result.get("success"):
+                            total_code_length += result.get("code_length", 0)
+                            total_cost += result.get("cost_usd", 0.0)
+                            completed_tasks_count += 1
+
+                        task_duration_ms = (time.time() - task_start) * 1000
+
+                        # Emit WebSocket progress_update event (Opción 2 - 1 evento por TASK)
+                        if self.ws_manager:
+                            await self.ws_manager.emit_progress_update(
+                                session_id=session_id,
+                                task_id=f"task_{task.task_number:03d}",
+                                task_name=task.name or f"Task {task.task_number}",
+                                phase=getattr(task, 'phase', 3),
+                                phase_name=self._get_phase_name(getattr(task, 'phase', 3)),
+                                status="completed" if result.get("success") else "failed",
+                                progress=completed_tasks_count,
+                                progress_percent=(completed_tasks_count / len(tasks)) * 100,
+                                completed_tasks=completed_tasks_count,
+                                total_tasks=len(tasks),
+                                current_wave=1,  # Code generation is wave 1
+                                duration_ms=task_duration_ms,
+                                subtask_status={}
+                            )
+
+                        yield {
+                            "type": "progress",
+                            "phase": "code_generation",
+                            "task_number": task.task_number,
+                            "task_title": task.name,
+                            "code_length": result.get("code_length", 0),
+                            "success": result.get("success", False),
+                            "progress": f"{batch_start + idx + 1}/{len(tasks)}",
+                            "timestamp": datetime.utcnow().isoformat()
+                        }
+            finally:
+                # Stop the PatternBank usage flush thread of this run's service
+                code_gen_service.close()
 
             yield {
                 "type": "status",
@@ -0,0 +1,221 @@
+"""
+Pattern Composition Engine
+
+Runs CodeGenerationService._compose_category_patterns for independent
+categories concurrently.
+
+- Categories are scheduled in waves from the category dependency graph
+  (production_patterns.get_composition_waves); each wave runs concurrently,
+  the next wave starts when it is done.
+- Categories run in a worker pool, off the event loop:
+  - "thread" (default): no startup cost; keeps the event loop responsive
+    while a large spec is composed
+  - "process": uses every core for CPU-bound composition. Each worker
+    imports the code generation stack once (~15s), so this only pays off
+    for very large specs in a long-running process. Category composition
+    only reads its arguments and the service's app_ir, so a worker
+    composes with a bare service instance.
+- Results are merged in composition order, not completion order: the files
+  dict (keys, key order and overwrites between categories) is identical to
+  sequential composition.
+
+With max_workers=0 categories are composed one after the other on the event
+loop (previous behaviour). If the process pool cannot be used (e.g.
+unpicklable patterns or a crashed worker) the category falls back to
+in-process composition.
+
+Configuration:
+    CODEGEN_COMPOSITION_EXECUTOR: "thread" (default) or "process"
+    CODEGEN_COMPOSITION_WORKERS: Pool size (default: CPU count, 0 disables)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from src.cognitive.patterns.production_patterns import get_composition_waves
+from src.observability import StructuredLogger
+
+logger = StructuredLogger("pattern_composition_engine", output_json=False)
+
+DEFAULT_COMPOSITION_EXECUTOR = os.getenv("CODEGEN_COMPOSITION_EXECUTOR", "thread")
+DEFAULT_COMPOSITION_WORKERS = int(os.getenv("CODEGEN_COMPOSITION_WORKERS", str(os.cpu_count() or 1)))
+
+
+def compose_category_in_thread(compose_inline: Callable, category: str, category_patterns: list, spec_or_ir) -> Dict[str, str]:
+    """Compose one category in a thread pool worker (own event loop)."""
+    return asyncio.run(compose_inline(category, category_patterns, spec_or_ir))
+
+
+def compose_category_in_worker(category: str, category_patterns: list, spec_or_ir, app_ir=None) -> Dict[str, str]:
+    """
+    Compose one category in a process pool worker.
+
+    Args:
+        category: Category name
+        category_patterns: StoredPattern objects for this category
+        spec_or_ir: SpecRequirements or ApplicationIR object
+        app_ir: CodeGenerationService.app_ir of the calling service
+
+    Returns:
+        Dictionary of files generated for this category
+    """
+    from src.services.code_generation_service import CodeGenerationService
+
+    # Category composition uses no service state besides app_ir, so skip
+    # __init__ (LLM client, PatternBank, Neo4j connections)
+    composer = CodeGenerationService.__new__(CodeGenerationService)
+    composer.app_ir = app_ir
+    return asyncio.run(composer._compose_category_patterns(category, category_patterns, spec_or_ir))
+
+
+class PatternCompositionEngine:
+    """
+    Wave-scheduled, concurrent category composition.
+
+    Example:
+        >>> engine = PatternCompositionEngine(max_workers=8, executor="process")
+        >>> files = await engine.compose(
+        ...     categories, patterns, spec_or_ir,
+        ...     compose_inline=service._compose_category_patterns,
+        ... )
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, executor: Optional[str] = None):
+        """
+        Args:
+            max_workers: Pool size (default: CODEGEN_COMPOSITION_WORKERS, 0 = sequential on the event loop)
+            executor: "thread" or "process" (default: CODEGEN_COMPOSITION_EXECUTOR)
+        """
+        self.max_workers = DEFAULT_COMPOSITION_WORKERS if max_workers is None else max_workers
+        self.executor = executor or DEFAULT_COMPOSITION_EXECUTOR
+        if self.executor not in ("thread", "process"):
+            raise ValueError(f"Unknown composition executor: {self.executor}")
+
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                if self.executor == "process":
+                    # forkserver: workers do not inherit the parent's threads and
+                    # open connections (Qdrant, Neo4j, Redis)
+                    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context(method),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="pattern-composition",
+                    )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the pool workers."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    async def compose(
+        self,
+        categories: List[str],
+        patterns: Dict[str, list],
+        spec_or_ir,
+        compose_inline: Callable[[str, list, Any], Any],
+        app_ir=None,
+    ) -> Dict[str, str]:
+        """
+        Compose categories and merge their files in composition order.
+
+        Args:
+            categories: Categories in composition order (only those with patterns)
+            patterns: Dictionary of patterns by category
+            spec_or_ir: SpecRequirements or ApplicationIR object
+            compose_inline: In-process composer (CodeGenerationService._compose_category_patterns)
+            app_ir: CodeGenerationService.app_ir, forwarded to workers
+
+        Returns:
+            Dictionary mapping file paths to generated code
+        """
+        results: Dict[str, Dict[str, str]] = {}
+
+        if self.max_workers <= 0 or len(categories) <= 1:
+            for category in categories:
+                results[category] = await compose_inline(category, patterns[category], spec_or_ir)
+        else:
+            for wave in get_composition_waves(categories):
+                wave_results = await asyncio.gather(*[
+                    self._compose_in_pool(category, patterns[category], spec_or_ir, compose_inline, app_ir)
+                    for category in wave
+                ])
+                results.update(zip(wave, wave_results, strict=True))
+
+        files: Dict[str, str] = {}
+        for category in categories:
+            files.update(results[category])
+        return files
+
+    async def _compose_in_pool(
+        self,
+        category: str,
+        category_patterns: list,
+        spec_or_ir,
+        compose_inline: Callable[[str, list, Any], Any],
+        app_ir=None,
+    ) -> Dict[str, str]:
+        loop = asyncio.get_running_loop()
+        if self.executor == "thread":
+            return await loop.run_in_executor(
+                self._get_executor(),
+                compose_category_in_thread,
+                compose_inline,
+                category,
+                category_patterns,
+                spec_or_ir,
+            )
+
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(),
+                compose_category_in_worker,
+                category,
+                category_patterns,
+                spec_or_ir,
+                app_ir,
+            )
+        except (BrokenProcessPool, pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            # Pool unusable for this input - compose in-process instead
+            if isinstance(e, BrokenProcessPool):
+                with self._executor_lock:
+                    self._executor = None
+            logger.warning(
+                f"Process pool composition failed for {category}: {e}. Composing in-process.",
+                extra={"category": category, "error": str(e)}
+            )
+            return await compose_inline(category, category_patterns, spec_or_ir)
+
+
+# Global engine (pool workers are reused across generations)
+_engine: Optional[PatternCompositionEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_pattern_composition_engine() -> PatternCompositionEngine:
+    """Get the process-wide pattern composition engine."""
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = PatternCompositionEngine()
+
+    return _engine
@@ -38,6 +38,7 @@ from src.models.conversation import Conversation
 from src.models.message import Message
 from src.models.conversation_share import ConversationShare
 from src.services.rbac_service import RBACService
+from src.services.request_cache import request_cached
 from src.config.database import get_db_context
 from src.observability import get_logger
 
@@ -230,16 +231,16 @@ class PermissionService:
             True if user owns conversation, False otherwise
         """
         try:
-            with get_db_context() as db:
-                conversation = db.query(Conversation).filter(
-                    Conversation.conversation_id == conversation_id
-                ).first()
+            owner_id = request_cached(
+                ("conversation_owner", conversation_id),
+                lambda: self._load_conversation_owner(conversation_id)
+            )
 
-                if not conversation:
-                    logger.warning(f"Conversation {conversation_id} not found")
-                    return False
+            if owner_id is None:
+                logger.warning(f"Conversation {conversation_id} not found")
+                return False
 
-                return conversation.user_id == user_id
+            return owner_id == user_id
 
         except Exception as e:
             logger.error(
@@ -248,6 +249,14 @@ class PermissionService:
             )
             return False
 
+    @staticmethod
+    def _load_conversation_owner(conversation_id: uuid.UUID) -> Optional[uuid.UUID]:
+        with get_db_context() as db:
+            conversation = db.query(Conversation).filter(
+                Conversation.conversation_id == conversation_id
+            ).first()
+            return conversation.user_id if conversation else None
+
     def is_conversation_shared_with(
         self,
         user_id: uuid.UUID,
@@ -264,13 +273,10 @@ class PermissionService:
             True if conversation is shared with user, False otherwise
         """
         try:
-            with get_db_context() as db:
-                share = db.query(ConversationShare).filter(
-                    ConversationShare.conversation_id == conversation_id,
-                    ConversationShare.shared_with == user_id
-                ).first()
-
-                return share is not None
+            return request_cached(
+                ("conversation_share", conversation_id, user_id),
+                lambda: self._load_is_shared(user_id, conversation_id)
+            )
 
         except Exception as e:
             logger.error(
@@ -279,6 +285,16 @@ class PermissionService:
             )
             return False
 
+    @staticmethod
+    def _load_is_shared(user_id: uuid.UUID, conversation_id: uuid.UUID) -> bool:
+        with get_db_context() as db:
+            share = db.query(ConversationShare).filter(
+                ConversationShare.conversation_id == conversation_id,
+                ConversationShare.shared_with == user_id
+            ).first()
+
+            return share is not None
+
     def _permission_level_allows_action(
         self,
         permission_level: Optional[str],
@@ -22,6 +22,7 @@ from src.models.user_role import UserRole
 from src.config.database import get_db_context
 from src.observability import get_logger
 from src.observability.audit_logger import AuditLogger
+from src.services.request_cache import invalidate_request_cached, request_cached
 
 logger = get_logger("rbac_service")
 
@@ -155,6 +156,8 @@ class RBACService:
                     }
                 )
 
+                invalidate_request_cached(("user_roles", user_id))
+                invalidate_request_cached(("user_has_role", user_id, role_name))
                 return user_role
 
         except ValueError:
@@ -227,6 +230,8 @@ class RBACService:
                     }
                 )
 
+                invalidate_request_cached(("user_roles", user_id))
+                invalidate_request_cached(("user_has_role", user_id, role_name))
                 return True
 
         except ValueError:
@@ -239,6 +244,8 @@ class RBACService:
         """
         Check if user has a specific role.
 
+        Cached for the duration of the current request (request_cache).
+
         Args:
             user_id: UUID of user
             role_name: Name of role to check
@@ -247,25 +254,33 @@ class RBACService:
             True if user has the role, False otherwise
         """
         try:
-            with get_db_context() as db:
-                # Query for user role assignment
-                user_role = db.query(UserRole).join(
-                    Role, UserRole.role_id == Role.role_id
-                ).filter(
-                    UserRole.user_id == user_id,
-                    Role.role_name == role_name
-                ).first()
-
-                return user_role is not None
+            return request_cached(
+                ("user_has_role", user_id, role_name),
+                lambda: self._load_user_has_role(user_id, role_name)
+            )
 
         except Exception as e:
             logger.error(f"Error checking user role: {str(e)}", exc_info=True)
             return False
 
+    def _load_user_has_role(self, user_id: uuid.UUID, role_name: str) -> bool:
+        with get_db_context() as db:
+            # Query for user role assignment
+            user_role = db.query(UserRole).join(
+                Role, UserRole.role_id == Role.role_id
+            ).filter(
+                UserRole.user_id == user_id,
+                Role.role_name == role_name
+            ).first()
+
+            return user_role is not None
+
     def get_user_roles(self, user_id: uuid.UUID) -> List[Role]:
         """
         Get all roles assigned to a user.
 
+        Cached for the duration of the current request (request_cache).
+
         Args:
             user_id: UUID of user
 
@@ -273,20 +288,21 @@ class RBACService:
             List of Role objects
         """
         try:
-            with get_db_context() as db:
-                # Query all roles for user
-                roles = db.query(Role).join(
-                    UserRole, Role.role_id == UserRole.role_id
-                ).filter(
-                    UserRole.user_id == user_id
-                ).all()
-
-                return roles
+            return request_cached(("user_roles", user_id), lambda: self._load_user_roles(user_id))
 
         except Exception as e:
             logger.error(f"Error fetching user roles: {str(e)}", exc_info=True)
             return []
 
+    def _load_user_roles(self, user_id: uuid.UUID) -> List[Role]:
+        with get_db_context() as db:
+            # Query all roles for user
+            return db.query(Role).join(
+                UserRole, Role.role_id == UserRole.role_id
+            ).filter(
+                UserRole.user_id == user_id
+            ).all()
+
     def get_role_permissions(self, role_name: str) -> List[str]:
         """
         Get all permissions for a role.
@@ -0,0 +1,74 @@
+"""
+Request-Scoped Cache
+
+Memoizes lookups for the duration of one HTTP request, so the auth
+dependency, RBAC checks and ownership checks load the same user, roles or
+conversation owner once instead of once per check.
+
+The scope is opened by RequestCacheStage (API request pipeline). Outside a
+scope (CLI, background jobs, tests) every call goes straight to the loader.
+
+Usage:
+    roles = request_cached(("user_roles", user_id), lambda: load_roles(user_id))
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_request_cache: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar("request_cache", default=None)
+
+
+def begin_request_cache() -> Token:
+    """Open a new request scope; pass the token to end_request_cache()."""
+    return _request_cache.set({})
+
+
+def end_request_cache(token: Token) -> None:
+    """Close the request scope opened with begin_request_cache()."""
+    _request_cache.reset(token)
+
+
+@contextmanager
+def request_cache_scope() -> Iterator[None]:
+    """Context manager form of begin/end_request_cache."""
+    token = begin_request_cache()
+    try:
+        yield
+    finally:
+        end_request_cache(token)
+
+
+def request_cached(key: Hashable, loader: Callable[[], T]) -> T:
+    """
+    Return the cached value for key, calling loader() on the first access.
+
+    Args:
+        key: Cache key, e.g. ("user", user_id)
+        loader: Called on a miss (or always, outside a request scope)
+
+    Returns:
+        Cached or freshly loaded value
+    """
+    cache = _request_cache.get()
+    if cache is None:
+        return loader()
+    if key not in cache:
+        cache[key] = loader()
+    return cache[key]
+
+
+def set_request_cached(key: Hashable, value: Any) -> None:
+    """Seed the current request scope with an already loaded value."""
+    cache = _request_cache.get()
+    if cache is not None:
+        cache[key] = value
+
+
+def invalidate_request_cached(key: Hashable) -> None:
+    """Drop a key after the underlying data changed within the request."""
+    cache = _request_cache.get()
+    if cache is not None:
+        cache.pop(key, None)
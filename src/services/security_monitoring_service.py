@@ -13,14 +13,23 @@ Detects security anomalies and creates security events for:
 
 Runs in batch every 5 minutes via background job.
 
+Detections are aggregate queries (GROUP BY ... HAVING, window functions)
+over the audit log, so rows are counted by the database instead of loaded
+into the application. run_all_detections is incremental: it only reports
+detections with audit rows newer than the high-water mark (latest audit
+timestamp) of the previous run.
+
 Part of Phase 2 - Task Group 13: Security Event Monitoring
 """
 
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from collections import defaultdict
 
+from sqlalchemy import DateTime, String, and_, distinct, extract, func
+from sqlalchemy.orm import Session
+
 from src.models.security_event import SecurityEvent, SeverityLevel
 from src.models.audit_log import AuditLog
 from src.config.database import get_db_context
@@ -30,6 +39,9 @@ from src.observability import get_logger
 logger = get_logger("security_monitoring_service")
 settings = get_settings()
 
+# (severity, event_data) of a detection, keyed by user_id
+Detections = Dict[uuid.UUID, Tuple[SeverityLevel, Dict[str, Any]]]
+
 
 class SecurityMonitoringService:
     """
@@ -44,181 +56,284 @@ class SecurityMonitoringService:
     - high: geo_changes, privilege_escalation (to admin), 2fa_disabled (when enforced)
     - medium: multiple_403s, unusual_access, account_lockout
     - low: other events
+
+    Each detect_* method accepts an optional `since` timestamp: only detections
+    involving audit rows newer than it are reported. run_all_detections passes
+    the high-water mark of its previous run, so keep one instance per process.
     """
 
+    # Re-examine audit rows this far behind the high-water mark, for rows
+    # committed after a run with a timestamp just before its mark.
+    # Events are upserted, so re-examined rows never duplicate events.
+    HIGH_WATER_MARK_OVERLAP = timedelta(seconds=30)
+
     def __init__(self):
         """Initialize SecurityMonitoringService"""
         self.logger = logger
-
-    def detect_failed_login_clusters(self) -> List[SecurityEvent]:
+        self.high_water_mark: Optional[datetime] = None
+        self._detection_failed = False
+
+    # ========================================
+    # Shared helpers
+    # ========================================
+
+    def _detect(
+        self,
+        description: str,
+        finder: Callable[[Session, Optional[datetime]], List[SecurityEvent]],
+        since: Optional[datetime]
+    ) -> List[SecurityEvent]:
         """
-        Detect clusters of failed login attempts (5+ in 10 minutes).
+        Run one detection in its own transaction.
 
-        Severity:
-        - critical: 10+ failed attempts
-        - high: 5-9 failed attempts
+        Args:
+            description: Detection description for log messages
+            finder: Runs the detection queries and upserts its events
+            since: Only report detections with audit rows newer than this
 
         Returns:
-            List of SecurityEvent objects for detected clusters
+            List of created or updated SecurityEvent objects ([] on failure)
         """
         try:
             with get_db_context() as db:
-                # Look back 10 minutes
-                cutoff_time = datetime.utcnow() - timedelta(minutes=10)
-
-                # Query failed login attempts in last 10 minutes
-                failed_logins = db.query(AuditLog).filter(
-                    AuditLog.action == "auth.login_failed",
-                    AuditLog.result == "denied",
-                    AuditLog.timestamp >= cutoff_time
-                ).all()
-
-                # Group by user_id
-                user_failures = defaultdict(list)
-                for log in failed_logins:
-                    if log.user_id:
-                        user_failures[log.user_id].append(log)
-
-                # Create security events for users with 5+ failures
-                events = []
-                for user_id, failures in user_failures.items():
-                    if len(failures) >= 5:
-                        # Determine severity
-                        severity = SeverityLevel.CRITICAL if len(failures) >= 10 else SeverityLevel.HIGH
-
-                        # Check if event already exists for this user in last 10 minutes
-                        existing = db.query(SecurityEvent).filter(
-                            SecurityEvent.event_type == "failed_login_cluster",
-                            SecurityEvent.user_id == user_id,
-                            SecurityEvent.detected_at >= cutoff_time,
-                            SecurityEvent.resolved == False
-                        ).first()
-
-                        if existing:
-                            # Update existing event data
-                            existing.event_data = {
-                                "failed_attempts": len(failures),
-                                "ip_addresses": list(set([f.ip_address for f in failures if f.ip_address])),
-                                "time_window": "10 minutes",
-                                "first_attempt": min([f.timestamp for f in failures]).isoformat(),
-                                "last_attempt": max([f.timestamp for f in failures]).isoformat()
-                            }
-                            existing.severity = severity.value
-                            existing.detected_at = datetime.utcnow()
-                            events.append(existing)
-                        else:
-                            # Create new event
-                            event = SecurityEvent(
-                                event_id=uuid.uuid4(),
-                                event_type="failed_login_cluster",
-                                severity=severity.value,
-                                user_id=user_id,
-                                event_data={
-                                    "failed_attempts": len(failures),
-                                    "ip_addresses": list(set([f.ip_address for f in failures if f.ip_address])),
-                                    "time_window": "10 minutes",
-                                    "first_attempt": min([f.timestamp for f in failures]).isoformat(),
-                                    "last_attempt": max([f.timestamp for f in failures]).isoformat()
-                                },
-                                detected_at=datetime.utcnow(),
-                                resolved=False
-                            )
-                            db.add(event)
-                            events.append(event)
-
-                        self.logger.info(
-                            f"Detected failed login cluster: {len(failures)} attempts for user {user_id}",
-                            extra={"user_id": str(user_id), "attempts": len(failures)}
-                        )
-
+                events = finder(db, since)
                 db.commit()
                 return events
 
         except Exception as e:
-            self.logger.error(f"Failed to detect failed login clusters: {str(e)}", exc_info=True)
+            self._detection_failed = True
+            self.logger.error(f"Failed to detect {description}: {str(e)}", exc_info=True)
+            return []
+
+    def _upsert_events(
+        self,
+        db: Session,
+        event_type: str,
+        window_start: datetime,
+        detections: Detections,
+        update_existing: bool = False,
+        report_unchanged: bool = True
+    ) -> List[SecurityEvent]:
+        """
+        Create security events, or update the user's unresolved event in the window.
+
+        Existing events of all detected users are loaded with a single query.
+
+        Args:
+            db: Database session
+            event_type: Security event type
+            window_start: Unresolved events detected since then count as existing
+            detections: (severity, event_data) by user_id
+            update_existing: Refresh existing events (otherwise they are skipped)
+            report_unchanged: Also return refreshed events whose data did not change
+
+        Returns:
+            List of created (and updated) SecurityEvent objects
+        """
+        if not detections:
             return []
 
-    def detect_geo_changes(self) -> List[SecurityEvent]:
+        existing = {
+            event.user_id: event
+            for event in db.query(SecurityEvent).filter(
+                SecurityEvent.event_type == event_type,
+                SecurityEvent.user_id.in_(list(detections)),
+                SecurityEvent.detected_at >= window_start,
+                SecurityEvent.resolved == False
+            )
+        }
+
+        events = []
+        now = datetime.utcnow()
+        for user_id, (severity, event_data) in detections.items():
+            event = existing.get(user_id)
+            if event is not None:
+                if not update_existing:
+                    continue
+                unchanged = event.event_data == event_data and event.severity == severity.value
+                if unchanged and not report_unchanged:
+                    continue
+                event.event_data = event_data
+                event.severity = severity.value
+                event.detected_at = now
+            else:
+                event = SecurityEvent(
+                    event_id=uuid.uuid4(),
+                    event_type=event_type,
+                    severity=severity.value,
+                    user_id=user_id,
+                    event_data=event_data,
+                    detected_at=now,
+                    resolved=False
+                )
+                db.add(event)
+            events.append(event)
+
+        return events
+
+    @staticmethod
+    def _distinct_values(db: Session, column, user_ids: List[uuid.UUID], *criteria) -> Dict[uuid.UUID, List[Any]]:
+        """Distinct non-null values of an audit log column per user, in one query."""
+        values = defaultdict(list)
+        if user_ids:
+            rows = db.query(AuditLog.user_id, column).filter(
+                *criteria,
+                AuditLog.user_id.in_(user_ids),
+                column.isnot(None)
+            ).distinct()
+            for user_id, value in rows:
+                values[user_id].append(value)
+        return values
+
+    @staticmethod
+    def _new_rows_since(since: Optional[datetime]):
+        """HAVING clause keeping groups with audit rows newer than `since`."""
+        return func.max(AuditLog.timestamp) > since if since is not None else None
+
+    # ========================================
+    # Detections
+    # ========================================
+
+    def detect_failed_login_clusters(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
+        """
+        Detect clusters of failed login attempts (5+ in 10 minutes).
+
+        Severity:
+        - critical: 10+ failed attempts
+        - high: 5-9 failed attempts
+
+        Args:
+            since: Only report clusters with attempts newer than this
+
+        Returns:
+            List of SecurityEvent objects for detected clusters
+        """
+        return self._detect("failed login clusters", self._find_failed_login_clusters, since)
+
+    def _find_failed_login_clusters(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 10 minutes
+        cutoff_time = datetime.utcnow() - timedelta(minutes=10)
+        criteria = (
+            AuditLog.action == "auth.login_failed",
+            AuditLog.result == "denied",
+            AuditLog.timestamp >= cutoff_time,
+        )
+
+        attempts = func.count(AuditLog.id)
+        having = [attempts >= 5, self._new_rows_since(since)]
+        clusters = db.query(
+            AuditLog.user_id,
+            attempts.label("attempts"),
+            func.min(AuditLog.timestamp).label("first_attempt"),
+            func.max(AuditLog.timestamp).label("last_attempt")
+        ).filter(
+            *criteria,
+            AuditLog.user_id.isnot(None)
+        ).group_by(AuditLog.user_id).having(
+            and_(*[clause for clause in having if clause is not None])
+        ).all()
+
+        ip_addresses = self._distinct_values(
+            db, AuditLog.ip_address, [c.user_id for c in clusters], *criteria
+        )
+
+        detections: Detections = {}
+        for cluster in clusters:
+            severity = SeverityLevel.CRITICAL if cluster.attempts >= 10 else SeverityLevel.HIGH
+            detections[cluster.user_id] = (severity, {
+                "failed_attempts": cluster.attempts,
+                "ip_addresses": ip_addresses[cluster.user_id],
+                "time_window": "10 minutes",
+                "first_attempt": cluster.first_attempt.isoformat(),
+                "last_attempt": cluster.last_attempt.isoformat()
+            })
+            self.logger.info(
+                f"Detected failed login cluster: {cluster.attempts} attempts for user {cluster.user_id}",
+                extra={"user_id": str(cluster.user_id), "attempts": cluster.attempts}
+            )
+
+        # Clusters keep growing: refresh the open event with the latest counts.
+        # Incremental runs re-examine the high-water mark overlap, so only
+        # report clusters that actually changed.
+        return self._upsert_events(
+            db, "failed_login_cluster", cutoff_time, detections,
+            update_existing=True, report_unchanged=since is None
+        )
+
+    def detect_geo_changes(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
         """
         Detect geo-location changes (IP country change).
 
+        Compares each login with the user's previous login in the window
+        (LAG window function).
+
         Severity: high
 
+        Args:
+            since: Only report changes at logins newer than this
+
         Returns:
             List of SecurityEvent objects for detected geo changes
         """
-        try:
-            with get_db_context() as db:
-                # Look back 60 minutes for login events
-                cutoff_time = datetime.utcnow() - timedelta(minutes=60)
-
-                # Query successful logins with country metadata
-                logins = db.query(AuditLog).filter(
-                    AuditLog.action == "auth.login",
-                    AuditLog.result == "success",
-                    AuditLog.timestamp >= cutoff_time
-                ).order_by(AuditLog.timestamp).all()
-
-                # Group by user and track country changes
-                user_logins = defaultdict(list)
-                for log in logins:
-                    if log.user_id and log.event_metadata and "country" in log.event_metadata:
-                        user_logins[log.user_id].append(log)
-
-                # Detect country changes
-                events = []
-                for user_id, user_login_list in user_logins.items():
-                    if len(user_login_list) >= 2:
-                        # Check consecutive logins for country changes
-                        for i in range(1, len(user_login_list)):
-                            prev_country = user_login_list[i-1].event_metadata.get("country")
-                            curr_country = user_login_list[i].event_metadata.get("country")
-
-                            if prev_country and curr_country and prev_country != curr_country:
-                                # Time between logins
-                                time_diff = user_login_list[i].timestamp - user_login_list[i-1].timestamp
-
-                                # Check if event already exists
-                                existing = db.query(SecurityEvent).filter(
-                                    SecurityEvent.event_type == "geo_location_change",
-                                    SecurityEvent.user_id == user_id,
-                                    SecurityEvent.detected_at >= cutoff_time,
-                                    SecurityEvent.resolved == False
-                                ).first()
-
-                                if not existing:
-                                    event = SecurityEvent(
-                                        event_id=uuid.uuid4(),
-                                        event_type="geo_location_change",
-                                        severity=SeverityLevel.HIGH.value,
-                                        user_id=user_id,
-                                        event_data={
-                                            "previous_country": prev_country,
-                                            "new_country": curr_country,
-                                            "previous_ip": user_login_list[i-1].ip_address,
-                                            "new_ip": user_login_list[i].ip_address,
-                                            "time_between_logins": str(time_diff),
-                                            "timestamp": user_login_list[i].timestamp.isoformat()
-                                        },
-                                        detected_at=datetime.utcnow(),
-                                        resolved=False
-                                    )
-                                    db.add(event)
-                                    events.append(event)
-
-                                    self.logger.info(
-                                        f"Detected geo-location change: {prev_country} -> {curr_country} for user {user_id}",
-                                        extra={"user_id": str(user_id), "prev_country": prev_country, "new_country": curr_country}
-                                    )
-
-                db.commit()
-                return events
-
-        except Exception as e:
-            self.logger.error(f"Failed to detect geo-location changes: {str(e)}", exc_info=True)
-            return []
+        return self._detect("geo-location changes", self._find_geo_changes, since)
+
+    def _find_geo_changes(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 60 minutes for login events
+        cutoff_time = datetime.utcnow() - timedelta(minutes=60)
+
+        country = AuditLog.event_metadata["country"].as_string()
+        previous = dict(partition_by=AuditLog.user_id, order_by=AuditLog.timestamp)
+        logins = db.query(
+            AuditLog.user_id,
+            AuditLog.timestamp,
+            AuditLog.ip_address,
+            country.label("country"),
+            func.lag(country, type_=String).over(**previous).label("prev_country"),
+            func.lag(AuditLog.ip_address, type_=String).over(**previous).label("prev_ip"),
+            func.lag(AuditLog.timestamp, type_=DateTime(timezone=True)).over(**previous).label("prev_timestamp")
+        ).filter(
+            AuditLog.action == "auth.login",
+            AuditLog.result == "success",
+            AuditLog.timestamp >= cutoff_time,
+            AuditLog.user_id.isnot(None),
+            country.isnot(None)
+        ).subquery()
+
+        changes = db.query(logins).filter(
+            logins.c.prev_country.isnot(None),
+            logins.c.country != logins.c.prev_country
+        )
+        if since is not None:
+            changes = changes.filter(logins.c.timestamp > since)
+
+        # First change per user (one open event per user)
+        detections: Detections = {}
+        for change in changes.order_by(logins.c.user_id, logins.c.timestamp):
+            if change.user_id in detections:
+                continue
+            detections[change.user_id] = (SeverityLevel.HIGH, {
+                "previous_country": change.prev_country,
+                "new_country": change.country,
+                "previous_ip": change.prev_ip,
+                "new_ip": change.ip_address,
+                "time_between_logins": str(change.timestamp - change.prev_timestamp),
+                "timestamp": change.timestamp.isoformat()
+            })
+
+        events = self._upsert_events(db, "geo_location_change", cutoff_time, detections)
+        for event in events:
+            self.logger.info(
+                f"Detected geo-location change: {event.event_data['previous_country']} -> "
+                f"{event.event_data['new_country']} for user {event.user_id}",
+                extra={
+                    "user_id": str(event.user_id),
+                    "prev_country": event.event_data["previous_country"],
+                    "new_country": event.event_data["new_country"]
+                }
+            )
+        return events
 
-    def detect_privilege_escalations(self) -> List[SecurityEvent]:
+    def detect_privilege_escalations(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
         """
         Detect privilege escalation (role changed to admin/superadmin).
 
@@ -226,69 +341,52 @@ class SecurityMonitoringService:
         - critical: escalation to superadmin
         - high: escalation to admin
 
+        Args:
+            since: Only report role assignments newer than this
+
         Returns:
             List of SecurityEvent objects for detected escalations
         """
-        try:
-            with get_db_context() as db:
-                # Look back 60 minutes
-                cutoff_time = datetime.utcnow() - timedelta(minutes=60)
-
-                # Query role assignments
-                role_assignments = db.query(AuditLog).filter(
-                    AuditLog.action == "role.assigned",
-                    AuditLog.result == "success",
-                    AuditLog.timestamp >= cutoff_time
-                ).all()
-
-                # Detect escalations to admin/superadmin
-                events = []
-                for log in role_assignments:
-                    if log.event_metadata and "role" in log.event_metadata:
-                        role = log.event_metadata.get("role")
-
-                        if role in ["admin", "superadmin"]:
-                            # Determine severity
-                            severity = SeverityLevel.CRITICAL if role == "superadmin" else SeverityLevel.HIGH
-
-                            # Check if event already exists
-                            existing = db.query(SecurityEvent).filter(
-                                SecurityEvent.event_type == "privilege_escalation",
-                                SecurityEvent.user_id == log.user_id,
-                                SecurityEvent.detected_at >= cutoff_time,
-                                SecurityEvent.resolved == False
-                            ).first()
-
-                            if not existing:
-                                event = SecurityEvent(
-                                    event_id=uuid.uuid4(),
-                                    event_type="privilege_escalation",
-                                    severity=severity.value,
-                                    user_id=log.user_id,
-                                    event_data={
-                                        "role": role,
-                                        "assigned_by": log.event_metadata.get("assigned_by"),
-                                        "timestamp": log.timestamp.isoformat()
-                                    },
-                                    detected_at=datetime.utcnow(),
-                                    resolved=False
-                                )
-                                db.add(event)
-                                events.append(event)
-
-                                self.logger.info(
-                                    f"Detected privilege escalation: {role} for user {log.user_id}",
-                                    extra={"user_id": str(log.user_id), "role": role}
-                                )
-
-                db.commit()
-                return events
-
-        except Exception as e:
-            self.logger.error(f"Failed to detect privilege escalations: {str(e)}", exc_info=True)
-            return []
+        return self._detect("privilege escalations", self._find_privilege_escalations, since)
+
+    def _find_privilege_escalations(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 60 minutes
+        cutoff_time = datetime.utcnow() - timedelta(minutes=60)
+
+        role = AuditLog.event_metadata["role"].as_string()
+        assignments = db.query(
+            AuditLog.user_id,
+            AuditLog.timestamp,
+            role.label("role"),
+            AuditLog.event_metadata["assigned_by"].as_string().label("assigned_by")
+        ).filter(
+            AuditLog.action == "role.assigned",
+            AuditLog.result == "success",
+            AuditLog.timestamp >= (since if since is not None and since > cutoff_time else cutoff_time),
+            AuditLog.user_id.isnot(None),
+            role.in_(["admin", "superadmin"])
+        ).order_by(AuditLog.timestamp)
+
+        detections: Detections = {}
+        for assignment in assignments:
+            if assignment.user_id in detections:
+                continue
+            severity = SeverityLevel.CRITICAL if assignment.role == "superadmin" else SeverityLevel.HIGH
+            detections[assignment.user_id] = (severity, {
+                "role": assignment.role,
+                "assigned_by": assignment.assigned_by,
+                "timestamp": assignment.timestamp.isoformat()
+            })
+
+        events = self._upsert_events(db, "privilege_escalation", cutoff_time, detections)
+        for event in events:
+            self.logger.info(
+                f"Detected privilege escalation: {event.event_data['role']} for user {event.user_id}",
+                extra={"user_id": str(event.user_id), "role": event.event_data["role"]}
+            )
+        return events
 
-    def detect_unusual_access_patterns(self) -> List[SecurityEvent]:
+    def detect_unusual_access_patterns(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
         """
         Detect unusual access patterns (access at atypical hours).
 
@@ -296,270 +394,205 @@ class SecurityMonitoringService:
 
         Severity: medium
 
+        Args:
+            since: Only report users with atypical-hour accesses newer than this
+
         Returns:
             List of SecurityEvent objects for detected unusual access
         """
-        try:
-            with get_db_context() as db:
-                # Look back 60 minutes
-                cutoff_time = datetime.utcnow() - timedelta(minutes=60)
-
-                # Query all access events (read operations)
-                access_logs = db.query(AuditLog).filter(
-                    AuditLog.result == "success",
-                    AuditLog.timestamp >= cutoff_time
-                ).all()
-
-                # Detect access during atypical hours (midnight to 6 AM)
-                events = []
-                user_unusual_access = defaultdict(list)
-
-                for log in access_logs:
-                    if log.user_id and log.timestamp:
-                        hour = log.timestamp.hour
-
-                        # Atypical hours: 0-5 (midnight to 6 AM)
-                        if 0 <= hour < 6:
-                            user_unusual_access[log.user_id].append(log)
-
-                # Create events for users with unusual access
-                for user_id, unusual_logs in user_unusual_access.items():
-                    if len(unusual_logs) > 0:
-                        # Check if event already exists
-                        existing = db.query(SecurityEvent).filter(
-                            SecurityEvent.event_type == "unusual_access",
-                            SecurityEvent.user_id == user_id,
-                            SecurityEvent.detected_at >= cutoff_time,
-                            SecurityEvent.resolved == False
-                        ).first()
-
-                        if not existing:
-                            event = SecurityEvent(
-                                event_id=uuid.uuid4(),
-                                event_type="unusual_access",
-                                severity=SeverityLevel.MEDIUM.value,
-                                user_id=user_id,
-                                event_data={
-                                    "hour": unusual_logs[0].timestamp.hour,
-                                    "unusual_reason": "access_at_atypical_hours",
-                                    "access_count": len(unusual_logs),
-                                    "timestamp": unusual_logs[0].timestamp.isoformat()
-                                },
-                                detected_at=datetime.utcnow(),
-                                resolved=False
-                            )
-                            db.add(event)
-                            events.append(event)
-
-                            self.logger.info(
-                                f"Detected unusual access: {len(unusual_logs)} accesses at hour {unusual_logs[0].timestamp.hour} for user {user_id}",
-                                extra={"user_id": str(user_id), "hour": unusual_logs[0].timestamp.hour}
-                            )
-
-                db.commit()
-                return events
-
-        except Exception as e:
-            self.logger.error(f"Failed to detect unusual access patterns: {str(e)}", exc_info=True)
-            return []
+        return self._detect("unusual access patterns", self._find_unusual_access_patterns, since)
+
+    def _find_unusual_access_patterns(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 60 minutes
+        cutoff_time = datetime.utcnow() - timedelta(minutes=60)
+
+        having = self._new_rows_since(since)
+        unusual = db.query(
+            AuditLog.user_id,
+            func.count(AuditLog.id).label("access_count"),
+            func.min(AuditLog.timestamp).label("first_access")
+        ).filter(
+            AuditLog.result == "success",
+            AuditLog.timestamp >= cutoff_time,
+            AuditLog.user_id.isnot(None),
+            # Atypical hours: 0-5 (midnight to 6 AM)
+            extract("hour", AuditLog.timestamp) < 6
+        ).group_by(AuditLog.user_id)
+        if having is not None:
+            unusual = unusual.having(having)
+
+        detections: Detections = {}
+        for access in unusual:
+            detections[access.user_id] = (SeverityLevel.MEDIUM, {
+                "hour": access.first_access.hour,
+                "unusual_reason": "access_at_atypical_hours",
+                "access_count": access.access_count,
+                "timestamp": access.first_access.isoformat()
+            })
+
+        events = self._upsert_events(db, "unusual_access", cutoff_time, detections)
+        for event in events:
+            self.logger.info(
+                f"Detected unusual access: {event.event_data['access_count']} accesses at hour "
+                f"{event.event_data['hour']} for user {event.user_id}",
+                extra={"user_id": str(event.user_id), "hour": event.event_data["hour"]}
+            )
+        return events
 
-    def detect_multiple_403s(self) -> List[SecurityEvent]:
+    def detect_multiple_403s(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
         """
         Detect multiple 403 errors (10+ denied access in 5 minutes).
 
         Severity: medium
 
+        Args:
+            since: Only report users with denials newer than this
+
         Returns:
             List of SecurityEvent objects for detected multiple 403s
         """
-        try:
-            with get_db_context() as db:
-                # Look back 5 minutes
-                cutoff_time = datetime.utcnow() - timedelta(minutes=5)
-
-                # Query denied access attempts
-                denied_logs = db.query(AuditLog).filter(
-                    AuditLog.result == "denied",
-                    AuditLog.timestamp >= cutoff_time
-                ).all()
-
-                # Group by user_id
-                user_denials = defaultdict(list)
-                for log in denied_logs:
-                    if log.user_id:
-                        user_denials[log.user_id].append(log)
-
-                # Create events for users with 10+ denials
-                events = []
-                for user_id, denials in user_denials.items():
-                    if len(denials) >= 10:
-                        # Check if event already exists
-                        existing = db.query(SecurityEvent).filter(
-                            SecurityEvent.event_type == "multiple_403s",
-                            SecurityEvent.user_id == user_id,
-                            SecurityEvent.detected_at >= cutoff_time,
-                            SecurityEvent.resolved == False
-                        ).first()
-
-                        if not existing:
-                            event = SecurityEvent(
-                                event_id=uuid.uuid4(),
-                                event_type="multiple_403s",
-                                severity=SeverityLevel.MEDIUM.value,
-                                user_id=user_id,
-                                event_data={
-                                    "denied_count": len(denials),
-                                    "time_window": "5 minutes",
-                                    "resources": list(set([d.resource_type for d in denials if d.resource_type])),
-                                    "first_denial": min([d.timestamp for d in denials]).isoformat(),
-                                    "last_denial": max([d.timestamp for d in denials]).isoformat()
-                                },
-                                detected_at=datetime.utcnow(),
-                                resolved=False
-                            )
-                            db.add(event)
-                            events.append(event)
-
-                            self.logger.info(
-                                f"Detected multiple 403s: {len(denials)} denials for user {user_id}",
-                                extra={"user_id": str(user_id), "denied_count": len(denials)}
-                            )
-
-                db.commit()
-                return events
-
-        except Exception as e:
-            self.logger.error(f"Failed to detect multiple 403s: {str(e)}", exc_info=True)
-            return []
+        return self._detect("multiple 403s", self._find_multiple_403s, since)
+
+    def _find_multiple_403s(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 5 minutes
+        cutoff_time = datetime.utcnow() - timedelta(minutes=5)
+        criteria = (
+            AuditLog.result == "denied",
+            AuditLog.timestamp >= cutoff_time,
+        )
+
+        denied = func.count(AuditLog.id)
+        having = [denied >= 10, self._new_rows_since(since)]
+        denials = db.query(
+            AuditLog.user_id,
+            denied.label("denied_count"),
+            func.min(AuditLog.timestamp).label("first_denial"),
+            func.max(AuditLog.timestamp).label("last_denial")
+        ).filter(
+            *criteria,
+            AuditLog.user_id.isnot(None)
+        ).group_by(AuditLog.user_id).having(
+            and_(*[clause for clause in having if clause is not None])
+        ).all()
+
+        resources = self._distinct_values(
+            db, AuditLog.resource_type, [d.user_id for d in denials], *criteria
+        )
+
+        detections: Detections = {}
+        for denial in denials:
+            detections[denial.user_id] = (SeverityLevel.MEDIUM, {
+                "denied_count": denial.denied_count,
+                "time_window": "5 minutes",
+                "resources": resources[denial.user_id],
+                "first_denial": denial.first_denial.isoformat(),
+                "last_denial": denial.last_denial.isoformat()
+            })
+
+        events = self._upsert_events(db, "multiple_403s", cutoff_time, detections)
+        for event in events:
+            self.logger.info(
+                f"Detected multiple 403s: {event.event_data['denied_count']} denials for user {event.user_id}",
+                extra={"user_id": str(event.user_id), "denied_count": event.event_data["denied_count"]}
+            )
+        return events
 
-    def detect_account_lockouts(self) -> List[SecurityEvent]:
+    def detect_account_lockouts(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
         """
         Detect account lockout events.
 
         Severity: medium
 
+        Args:
+            since: Only report lockouts newer than this
+
         Returns:
             List of SecurityEvent objects for detected lockouts
         """
-        try:
-            with get_db_context() as db:
-                # Look back 60 minutes
-                cutoff_time = datetime.utcnow() - timedelta(minutes=60)
-
-                # Query account lockout events
-                lockout_logs = db.query(AuditLog).filter(
-                    AuditLog.action == "account.locked",
-                    AuditLog.result == "success",
-                    AuditLog.timestamp >= cutoff_time
-                ).all()
-
-                # Create security events for lockouts
-                events = []
-                for log in lockout_logs:
-                    if log.user_id:
-                        # Check if event already exists
-                        existing = db.query(SecurityEvent).filter(
-                            SecurityEvent.event_type == "account_lockout",
-                            SecurityEvent.user_id == log.user_id,
-                            SecurityEvent.detected_at >= cutoff_time,
-                            SecurityEvent.resolved == False
-                        ).first()
-
-                        if not existing:
-                            event = SecurityEvent(
-                                event_id=uuid.uuid4(),
-                                event_type="account_lockout",
-                                severity=SeverityLevel.MEDIUM.value,
-                                user_id=log.user_id,
-                                event_data={
-                                    "reason": log.event_metadata.get("reason") if log.event_metadata else "unknown",
-                                    "locked_until": log.event_metadata.get("locked_until") if log.event_metadata else None,
-                                    "timestamp": log.timestamp.isoformat()
-                                },
-                                detected_at=datetime.utcnow(),
-                                resolved=False
-                            )
-                            db.add(event)
-                            events.append(event)
-
-                            self.logger.info(
-                                f"Detected account lockout for user {log.user_id}",
-                                extra={"user_id": str(log.user_id)}
-                            )
-
-                db.commit()
-                return events
-
-        except Exception as e:
-            self.logger.error(f"Failed to detect account lockouts: {str(e)}", exc_info=True)
-            return []
+        return self._detect("account lockouts", self._find_account_lockouts, since)
+
+    def _find_account_lockouts(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 60 minutes
+        cutoff_time = datetime.utcnow() - timedelta(minutes=60)
+
+        lockouts = db.query(
+            AuditLog.user_id,
+            AuditLog.timestamp,
+            AuditLog.event_metadata
+        ).filter(
+            AuditLog.action == "account.locked",
+            AuditLog.result == "success",
+            AuditLog.timestamp >= (since if since is not None and since > cutoff_time else cutoff_time),
+            AuditLog.user_id.isnot(None)
+        ).order_by(AuditLog.timestamp)
+
+        detections: Detections = {}
+        for lockout in lockouts:
+            if lockout.user_id in detections:
+                continue
+            metadata = lockout.event_metadata or {}
+            detections[lockout.user_id] = (SeverityLevel.MEDIUM, {
+                "reason": metadata.get("reason") if lockout.event_metadata else "unknown",
+                "locked_until": metadata.get("locked_until"),
+                "timestamp": lockout.timestamp.isoformat()
+            })
+
+        events = self._upsert_events(db, "account_lockout", cutoff_time, detections)
+        for event in events:
+            self.logger.info(
+                f"Detected account lockout for user {event.user_id}",
+                extra={"user_id": str(event.user_id)}
+            )
+        return events
 
-    def detect_2fa_disabled(self) -> List[SecurityEvent]:
+    def detect_2fa_disabled(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
         """
         Detect 2FA disabled when enforcement is enabled.
 
         Severity: high
 
+        Args:
+            since: Only report 2FA disable events newer than this
+
         Returns:
             List of SecurityEvent objects for detected 2FA disabled events
         """
-        try:
-            with get_db_context() as db:
-                # Look back 60 minutes
-                cutoff_time = datetime.utcnow() - timedelta(minutes=60)
-
-                # Query 2FA disabled events
-                disabled_logs = db.query(AuditLog).filter(
-                    AuditLog.action == "2fa.disabled",
-                    AuditLog.result == "success",
-                    AuditLog.timestamp >= cutoff_time
-                ).all()
-
-                # Create security events for 2FA disabled when enforcement enabled
-                events = []
-                for log in disabled_logs:
-                    if log.user_id:
-                        # Check if enforcement was enabled
-                        enforce_2fa = log.event_metadata.get("enforce_2fa") if log.event_metadata else False
-
-                        if enforce_2fa:
-                            # Check if event already exists
-                            existing = db.query(SecurityEvent).filter(
-                                SecurityEvent.event_type == "2fa_disabled",
-                                SecurityEvent.user_id == log.user_id,
-                                SecurityEvent.detected_at >= cutoff_time,
-                                SecurityEvent.resolved == False
-                            ).first()
-
-                            if not existing:
-                                event = SecurityEvent(
-                                    event_id=uuid.uuid4(),
-                                    event_type="2fa_disabled",
-                                    severity=SeverityLevel.HIGH.value,
-                                    user_id=log.user_id,
-                                    event_data={
-                                        "enforce_2fa": enforce_2fa,
-                                        "timestamp": log.timestamp.isoformat()
-                                    },
-                                    detected_at=datetime.utcnow(),
-                                    resolved=False
-                                )
-                                db.add(event)
-                                events.append(event)
-
-                                self.logger.info(
-                                    f"Detected 2FA disabled (enforcement enabled) for user {log.user_id}",
-                                    extra={"user_id": str(log.user_id)}
-                                )
-
-                db.commit()
-                return events
-
-        except Exception as e:
-            self.logger.error(f"Failed to detect 2FA disabled events: {str(e)}", exc_info=True)
-            return []
+        return self._detect("2FA disabled events", self._find_2fa_disabled, since)
+
+    def _find_2fa_disabled(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 60 minutes
+        cutoff_time = datetime.utcnow() - timedelta(minutes=60)
+
+        disabled = db.query(
+            AuditLog.user_id,
+            AuditLog.timestamp,
+            AuditLog.event_metadata
+        ).filter(
+            AuditLog.action == "2fa.disabled",
+            AuditLog.result == "success",
+            AuditLog.timestamp >= (since if since is not None and since > cutoff_time else cutoff_time),
+            AuditLog.user_id.isnot(None)
+        ).order_by(AuditLog.timestamp)
+
+        detections: Detections = {}
+        for log in disabled:
+            # Enforcement flag is any truthy JSON value, checked on the (few) matching rows
+            enforce_2fa = log.event_metadata.get("enforce_2fa") if log.event_metadata else False
+            if enforce_2fa and log.user_id not in detections:
+                detections[log.user_id] = (SeverityLevel.HIGH, {
+                    "enforce_2fa": enforce_2fa,
+                    "timestamp": log.timestamp.isoformat()
+                })
+
+        events = self._upsert_events(db, "2fa_disabled", cutoff_time, detections)
+        for event in events:
+            self.logger.info(
+                f"Detected 2FA disabled (enforcement enabled) for user {event.user_id}",
+                extra={"user_id": str(event.user_id)}
+            )
+        return events
 
-    def detect_concurrent_sessions(self) -> List[SecurityEvent]:
+    def detect_concurrent_sessions(self, since: Optional[datetime] = None) -> List[SecurityEvent]:
         """
         Detect multiple concurrent sessions from different countries.
 
@@ -567,71 +600,53 @@ class SecurityMonitoringService:
         - critical: 3+ countries
         - high: 2 countries
 
+        Args:
+            since: Only report users with logins newer than this
+
         Returns:
             List of SecurityEvent objects for detected concurrent sessions
         """
-        try:
-            with get_db_context() as db:
-                # Look back 10 minutes for concurrent logins
-                cutoff_time = datetime.utcnow() - timedelta(minutes=10)
-
-                # Query successful logins with country metadata
-                logins = db.query(AuditLog).filter(
-                    AuditLog.action == "auth.login",
-                    AuditLog.result == "success",
-                    AuditLog.timestamp >= cutoff_time
-                ).all()
-
-                # Group by user and track countries
-                user_countries = defaultdict(set)
-                for log in logins:
-                    if log.user_id and log.event_metadata and "country" in log.event_metadata:
-                        user_countries[log.user_id].add(log.event_metadata["country"])
-
-                # Create events for users with sessions from multiple countries
-                events = []
-                for user_id, countries in user_countries.items():
-                    if len(countries) >= 2:
-                        # Determine severity
-                        severity = SeverityLevel.CRITICAL if len(countries) >= 3 else SeverityLevel.HIGH
-
-                        # Check if event already exists
-                        existing = db.query(SecurityEvent).filter(
-                            SecurityEvent.event_type == "concurrent_sessions",
-                            SecurityEvent.user_id == user_id,
-                            SecurityEvent.detected_at >= cutoff_time,
-                            SecurityEvent.resolved == False
-                        ).first()
-
-                        if not existing:
-                            event = SecurityEvent(
-                                event_id=uuid.uuid4(),
-                                event_type="concurrent_sessions",
-                                severity=severity.value,
-                                user_id=user_id,
-                                event_data={
-                                    "countries": sorted(list(countries)),
-                                    "session_count": len(countries),
-                                    "time_window": "10 minutes",
-                                    "timestamp": datetime.utcnow().isoformat()
-                                },
-                                detected_at=datetime.utcnow(),
-                                resolved=False
-                            )
-                            db.add(event)
-                            events.append(event)
-
-                            self.logger.info(
-                                f"Detected concurrent sessions: {len(countries)} countries for user {user_id}",
-                                extra={"user_id": str(user_id), "countries": list(countries)}
-                            )
-
-                db.commit()
-                return events
-
-        except Exception as e:
-            self.logger.error(f"Failed to detect concurrent sessions: {str(e)}", exc_info=True)
-            return []
+        return self._detect("concurrent sessions", self._find_concurrent_sessions, since)
+
+    def _find_concurrent_sessions(self, db: Session, since: Optional[datetime]) -> List[SecurityEvent]:
+        # Look back 10 minutes for concurrent logins
+        cutoff_time = datetime.utcnow() - timedelta(minutes=10)
+
+        country = AuditLog.event_metadata["country"].as_string()
+        criteria = (
+            AuditLog.action == "auth.login",
+            AuditLog.result == "success",
+            AuditLog.timestamp >= cutoff_time,
+        )
+
+        having = [func.count(distinct(country)) >= 2, self._new_rows_since(since)]
+        user_ids = [
+            row.user_id for row in db.query(AuditLog.user_id).filter(
+                *criteria,
+                AuditLog.user_id.isnot(None)
+            ).group_by(AuditLog.user_id).having(
+                and_(*[clause for clause in having if clause is not None])
+            )
+        ]
+        countries = self._distinct_values(db, country, user_ids, *criteria)
+
+        detections: Detections = {}
+        for user_id in user_ids:
+            severity = SeverityLevel.CRITICAL if len(countries[user_id]) >= 3 else SeverityLevel.HIGH
+            detections[user_id] = (severity, {
+                "countries": sorted(countries[user_id]),
+                "session_count": len(countries[user_id]),
+                "time_window": "10 minutes",
+                "timestamp": datetime.utcnow().isoformat()
+            })
+
+        events = self._upsert_events(db, "concurrent_sessions", cutoff_time, detections)
+        for event in events:
+            self.logger.info(
+                f"Detected concurrent sessions: {event.event_data['session_count']} countries for user {event.user_id}",
+                extra={"user_id": str(event.user_id), "countries": event.event_data["countries"]}
+            )
+        return events
 
     def run_all_detections(self) -> List[SecurityEvent]:
         """
@@ -639,23 +654,39 @@ class SecurityMonitoringService:
 
         This method is called by the background job every 5 minutes.
 
+        Incremental: detections only report audit rows newer than the
+        high-water mark of the previous run (minus HIGH_WATER_MARK_OVERLAP).
+        The mark only advances when every detection succeeded, so failed
+        detections are retried on the next run.
+
         Returns:
             List of all SecurityEvent objects detected across all methods
         """
         try:
             self.logger.info("Starting batch security event detection")
 
+            since = None
+            if self.high_water_mark is not None:
+                since = self.high_water_mark - self.HIGH_WATER_MARK_OVERLAP
+
+            with get_db_context() as db:
+                high_water_mark = db.query(func.max(AuditLog.timestamp)).scalar()
+
+            self._detection_failed = False
             all_events = []
 
             # Run all detection methods
-            all_events.extend(self.detect_failed_login_clusters())
-            all_events.extend(self.detect_geo_changes())
-            all_events.extend(self.detect_privilege_escalations())
-            all_events.extend(self.detect_unusual_access_patterns())
-            all_events.extend(self.detect_multiple_403s())
-            all_events.extend(self.detect_account_lockouts())
-            all_events.extend(self.detect_2fa_disabled())
-            all_events.extend(self.detect_concurrent_sessions())
+            all_events.extend(self.detect_failed_login_clusters(since))
+            all_events.extend(self.detect_geo_changes(since))
+            all_events.extend(self.detect_privilege_escalations(since))
+            all_events.extend(self.detect_unusual_access_patterns(since))
+            all_events.extend(self.detect_multiple_403s(since))
+            all_events.extend(self.detect_account_lockouts(since))
+            all_events.extend(self.detect_2fa_disabled(since))
+            all_events.extend(self.detect_concurrent_sessions(since))
+
+            if not self._detection_failed:
+                self.high_water_mark = high_water_mark
 
             self.logger.info(
                 f"Batch security event detection completed: {len(all_events)} events detected",
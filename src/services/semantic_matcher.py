@@ -9,15 +9,14 @@ Paper inspiration: ReMatch (arXiv:2403.01567)
 
 from dataclasses import dataclass
 from typing import Optional
+import importlib.util
 import json
 import logging
 
-try:
-    from sentence_transformers import SentenceTransformer, util
-    import numpy as np
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+from src.models.model_registry import get_model_registry, load_sentence_transformer
+
+# sentence_transformers (and torch) are imported when the encoder is first used
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
 
 try:
     from anthropic import Anthropic
@@ -74,17 +73,15 @@ class SemanticMatcher:
         self.llm_model = llm_model
         self._cache: dict[str, any] = {}
 
-        # Initialize sentence transformer
+        # Sentence transformer: loaded on first use from the shared model registry
+        self.model_name = model_name
+        self._encoder = None
+        self._encoder_loaded = False
         if SENTENCE_TRANSFORMERS_AVAILABLE:
-            try:
-                self.encoder = SentenceTransformer(model_name)
-                logger.info(f"Loaded sentence transformer: {model_name}")
-            except Exception as e:
-                logger.warning(f"Failed to load sentence transformer: {e}")
-                self.encoder = None
+            get_model_registry().declare(load_sentence_transformer, model_name)
         else:
             logger.warning("sentence-transformers not installed, using fallback")
-            self.encoder = None
+            self._encoder_loaded = True
 
         # Initialize Anthropic client
         if ANTHROPIC_AVAILABLE and use_llm_fallback:
@@ -97,6 +94,19 @@ class SemanticMatcher:
         else:
             self.client = None
 
+    @property
+    def encoder(self):
+        """Shared SentenceTransformer, or None if it cannot be loaded."""
+        if not self._encoder_loaded:
+            try:
+                self._encoder = get_model_registry().get(load_sentence_transformer, self.model_name)
+                logger.info(f"Loaded sentence transformer: {self.model_name}")
+            except Exception as e:
+                logger.warning(f"Failed to load sentence transformer: {e}")
+                self._encoder = None
+            self._encoder_loaded = True
+        return self._encoder
+
     def match(self, spec: str, code: str) -> MatchResult:
         """
         Match a spec constraint to a code constraint.
@@ -155,6 +165,8 @@ class SemanticMatcher:
         """Calculate cosine similarity between two texts."""
         emb1 = self._get_embedding(text1)
         emb2 = self._get_embedding(text2)
+        from sentence_transformers import util
+
         return float(util.cos_sim(emb1, emb2)[0][0])
 
     def _get_embedding(self, text: str):
@@ -8,10 +8,13 @@ Part of Phase 2 - Task Group 4: Session Timeout Management
 """
 
 import json
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from uuid import UUID
 
+from src.services.auth_cache import publish_auth_invalidation
 from src.state.redis_manager import RedisManager
 from src.config.settings import get_settings
 from src.observability import get_logger
@@ -52,6 +55,11 @@ class SessionService:
         self.idle_timeout_seconds = settings.SESSION_IDLE_TIMEOUT_MINUTES * 60
         self.absolute_timeout_seconds = settings.SESSION_ABSOLUTE_TIMEOUT_HOURS * 3600
 
+        # Activity write coalescing: session_key -> monotonic time of last write
+        self.activity_write_interval = settings.SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS
+        self._last_activity_write: Dict[str, float] = {}
+        self._activity_lock = threading.Lock()
+
     def create_session(
         self,
         user_id: UUID,
@@ -145,23 +153,32 @@ class SessionService:
     def update_activity(
         self,
         user_id: UUID,
-        token_jti: str
+        token_jti: str,
+        force: bool = False
     ) -> bool:
         """
         Update last activity timestamp and reset idle timeout.
 
-        Called on every authenticated request to track activity.
+        Called on every authenticated request to track activity. Writes are
+        coalesced: a session is written at most once per
+        activity_write_interval seconds (the idle timeout is far longer, so
+        skipping intermediate writes does not change expiry in practice).
 
         Args:
             user_id: User UUID
             token_jti: JWT ID (jti claim)
+            force: Write even if the session was written recently
 
         Returns:
-            True if activity updated successfully, False otherwise
+            True if activity updated (or a recent write still stands),
+            False if the session is gone or Redis is unavailable
         """
         try:
             session_key = f"session:{user_id}:{token_jti}"
 
+            if not force and not self._activity_write_due(session_key):
+                return True
+
             if not self.redis_manager.connected:
                 logger.warning(
                     f"Redis unavailable - cannot update activity for user {user_id}"
@@ -186,6 +203,9 @@ class SessionService:
                 json.dumps(session_metadata)
             )
 
+            with self._activity_lock:
+                self._last_activity_write[session_key] = time.monotonic()
+
             logger.debug(f"Session activity updated: {session_key}")
             return True
 
@@ -196,6 +216,25 @@ class SessionService:
             )
             return False
 
+    def _activity_write_due(self, session_key: str) -> bool:
+        """Whether the coalescing interval for this session has elapsed."""
+        if self.activity_write_interval <= 0:
+            return True
+
+        now = time.monotonic()
+        with self._activity_lock:
+            last = self._last_activity_write.get(session_key)
+            if last is not None and now - last < self.activity_write_interval:
+                return False
+
+            # Keep the map bounded: forget sessions not written for a full interval
+            if len(self._last_activity_write) > 10000:
+                cutoff = now - self.activity_write_interval
+                self._last_activity_write = {
+                    key: ts for key, ts in self._last_activity_write.items() if ts >= cutoff
+                }
+            return True
+
     def extend_session(
         self,
         user_id: UUID,
@@ -265,8 +304,14 @@ class SessionService:
         try:
             session_key = f"session:{user_id}:{token_jti}"
 
+            with self._activity_lock:
+                self._last_activity_write.pop(session_key, None)
+
             if self.redis_manager.connected:
                 deleted = self.redis_manager.client.delete(session_key)
+                # Cached principals for this token must not outlive the
+                # session; publish only once it is gone from Redis
+                publish_auth_invalidation(jti=token_jti)
 
                 if deleted > 0:
                     logger.info(f"Session deleted: {session_key}")
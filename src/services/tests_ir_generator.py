@@ -576,7 +576,7 @@ def generate_tests_ir(app_ir: ApplicationIR) -> TestsModelIR:
 
     Usage:
         tests_model = generate_tests_ir(app_ir)
-        app_ir.tests_model = tests_model
+        app_ir = app_ir.model_copy(update={"tests_model": tests_model})
     """
     generator = TestsIRGenerator(app_ir)
     return generator.generate()
@@ -0,0 +1,127 @@
+"""
+Spec sectioning for section-parallel ApplicationIR extraction.
+
+Splits spec markdown into its top-level sections and classifies them
+(entities, endpoints, flows, validations, or shared context), then builds
+the input of each extraction part:
+
+- domain: app name/description, entities, database
+- api: endpoints
+- behavior: flows, entity dependencies
+- validation: validation rules
+
+Each part only sees the sections it needs (plus shared context), so
+editing one section of a spec changes the content hash of - and
+re-extracts - only the parts that read it.
+"""
+
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Section kinds, checked in this order (first match wins)
+SECTION_KEYWORDS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("flows", ("flujo", "flow", "caso de uso", "casos de uso", "use case", "workflow")),
+    ("validations", ("validac", "validat", "regla", "rule", "constraint", "restricc")),
+    ("entities", ("entidad", "entit", "modelo", "model", "schema", "esquema")),
+    ("endpoints", ("endpoint", "api", "ruta", "route")),
+]
+CONTEXT = "context"
+
+
+@dataclass(frozen=True)
+class ExtractionPart:
+    """One independently extracted and cached part of the ApplicationIR JSON."""
+    name: str
+    keys: Tuple[str, ...]  # Top-level keys of the extraction JSON this part outputs
+    sections: Tuple[str, ...]  # Section kinds it reads (context is always included)
+
+
+EXTRACTION_PARTS: Tuple[ExtractionPart, ...] = (
+    ExtractionPart("domain", ("app_name", "app_description", "entities", "database"), ("entities",)),
+    ExtractionPart("api", ("endpoints",), ("entities", "endpoints", "flows")),
+    ExtractionPart("behavior", ("flows", "entity_dependencies"), ("entities", "flows")),
+    ExtractionPart("validation", ("validation_rules",), ("entities", "validations")),
+)
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*\S)\s*$")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and strip accents (Spanish specs: "Validación" -> "validacion")."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def classify_heading(title: str) -> str:
+    """Section kind of a heading, CONTEXT if it matches no kind."""
+    normalized = _normalize(title)
+    for kind, keywords in SECTION_KEYWORDS:
+        if any(keyword in normalized for keyword in keywords):
+            return kind
+    return CONTEXT
+
+
+def split_spec_sections(spec_markdown: str) -> Dict[str, str]:
+    """
+    Split spec markdown into section kinds.
+
+    Sections are delimited by the shallowest heading level that occurs more
+    than once (typically "##"); deeper headings stay inside their section.
+    Text before the first section and unclassified sections become CONTEXT.
+    Headings inside fenced code blocks are ignored.
+
+    Args:
+        spec_markdown: Raw markdown content of specification
+
+    Returns:
+        Section kind -> concatenated markdown of its sections, in spec order
+    """
+    lines = spec_markdown.splitlines()
+
+    headings: List[Tuple[int, int, str]] = []  # (line index, level, title)
+    in_fence = False
+    for i, line in enumerate(lines):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        match = None if in_fence else _HEADING.match(line)
+        if match:
+            headings.append((i, len(match.group(1)), match.group(2)))
+
+    levels = [level for _, level, _ in headings]
+    section_level = min((level for level in set(levels) if levels.count(level) > 1), default=None)
+
+    sections: Dict[str, List[str]] = {}
+    kind = CONTEXT
+    starts = {i: title for i, level, title in headings if level == section_level}
+    for i, line in enumerate(lines):
+        if i in starts:
+            kind = classify_heading(starts[i])
+        sections.setdefault(kind, []).append(line)
+
+    return {k: "\n".join(v).strip() for k, v in sections.items() if "\n".join(v).strip()}
+
+
+def is_sectioned(sections: Dict[str, str]) -> bool:
+    """True if the spec splits into entities plus at least one other kind."""
+    return "entities" in sections and any(k in sections for k in ("endpoints", "flows", "validations"))
+
+
+def build_part_input(part: ExtractionPart, sections: Dict[str, str]) -> str:
+    """Spec excerpt an extraction part reads: context plus its sections, in a fixed order."""
+    kinds = (CONTEXT,) + part.sections
+    return "\n\n".join(sections[k] for k in kinds if k in sections)
+
+
+def part_hash(part: ExtractionPart, part_input: str, version: Optional[str] = None) -> str:
+    """Cache key of an extraction part: its keys, input and code version."""
+    digest = hashlib.sha256()
+    digest.update(",".join(part.keys).encode())
+    digest.update(b"\0")
+    digest.update((version or "").encode())
+    digest.update(b"\0")
+    digest.update(part_input.encode())
+    return digest.hexdigest()
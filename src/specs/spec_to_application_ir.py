@@ -11,10 +11,13 @@ This is the GROUND TRUTH for validation:
 - Compare IR vs IR (Phase 3)
 """
 
+import asyncio
 import json
 import logging
 import hashlib
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Any
 from datetime import datetime
@@ -26,6 +29,12 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.cognitive.ir.application_ir import ApplicationIR
 from src.cognitive.ir.domain_model import (
     DomainModelIR,
@@ -62,6 +71,14 @@ from src.cognitive.ir.validation_model import (
 )
 from src.utils.constraint_helpers import normalize_constraints
 from src.state.redis_manager import RedisManager
+from src.specs.spec_sections import (
+    EXTRACTION_PARTS,
+    ExtractionPart,
+    build_part_input,
+    is_sectioned,
+    part_hash,
+    split_spec_sections,
+)
 
 # Neo4j persistence (Sprint 7)
 try:
@@ -73,8 +90,47 @@ except ImportError:
 # Feature flag for Neo4j persistence
 USE_NEO4J_CACHE = os.getenv("USE_NEO4J_CACHE", "false").lower() == "true"
 
+# Extract entities / endpoints / flows / validations as separate, concurrent
+# LLM calls, each cached by the content hash of the sections it reads
+SPEC_SECTION_EXTRACTION = os.getenv("SPEC_SECTION_EXTRACTION", "true").lower() == "true"
+SPEC_EXTRACTION_CONCURRENCY = int(os.getenv("SPEC_EXTRACTION_CONCURRENCY", "4"))
+
+# In-process (L0) cache of validated ApplicationIR objects, entries
+IR_MEMORY_CACHE_SIZE = int(os.getenv("IR_MEMORY_CACHE_SIZE", "32"))
+
 logger = logging.getLogger(__name__)
 
+# Bug #44 Fix: IR-related source files; when they change, cached IRs are stale
+# even if the spec content hasn't changed
+_CODE_VERSION_FILES = [
+    "src/cognitive/ir/api_model.py",
+    "src/cognitive/ir/ir_builder.py",
+    "src/services/business_logic_extractor.py",
+    "src/validation/compliance_validator.py",
+    "src/specs/spec_to_application_ir.py",
+    # Bug #56 Fix: Include enricher for cache invalidation when custom ops logic changes
+    "src/services/inferred_endpoint_enricher.py",
+]
+
+
+def _compute_code_version_hash() -> str:
+    """Hash of the IR-related source files (resolved from the repository root)."""
+    root = Path(__file__).resolve().parents[2]
+    combined = ""
+    for f in _CODE_VERSION_FILES:
+        file_path = root / f
+        if file_path.exists():
+            combined += hashlib.md5(file_path.read_bytes()).hexdigest()
+    return hashlib.md5(combined.encode()).hexdigest()[:8]
+
+
+# Source files don't change within a running process: hash them once
+CODE_VERSION = _compute_code_version_hash()
+
+# (spec name, spec hash, code version) -> ApplicationIR (LRU, shared by all converters)
+_ir_memory_cache: "OrderedDict[tuple[str, str, str], ApplicationIR]" = OrderedDict()
+_ir_memory_lock = threading.Lock()
+
 
 # Bug #16 Fix: Spanish→English translation dictionary for flow names
 # DevMatrix works internally in English only - this post-processes LLM output
@@ -219,10 +275,15 @@ class SpecToApplicationIR:
         Get ApplicationIR for spec, using multi-tier cache.
 
         CACHE STRATEGY:
+        0. In-process memory (L0) - already validated objects, no I/O
         1. Redis (primary) - fast, TTL auto-expire (7 days)
         2. Filesystem (fallback) - cold start recovery, debugging
         3. LLM generation - only when no cache exists
 
+        The returned ApplicationIR is shared with later callers asking for
+        the same spec: treat it as read-only (use ``model_copy(update=...)``
+        to derive a modified IR).
+
         Args:
             spec_markdown: Raw markdown content of specification
             spec_path: Path to spec file (for cache key and naming)
@@ -233,18 +294,26 @@ class SpecToApplicationIR:
         """
         spec_hash = self._hash_spec(spec_markdown)
         code_version = self._get_code_version_hash()  # Bug #44 Fix
-        cache_key = f"{Path(spec_path).stem}_{spec_hash[:8]}_{code_version}"
+        spec_name = Path(spec_path).stem
+        cache_key = f"{spec_name}_{spec_hash[:8]}_{code_version}"
         cache_path = self.CACHE_DIR / f"{cache_key}.json"
+        memory_key = (spec_name, spec_hash, code_version)
 
         if not force_refresh:
+            # TIER 0: In-process memory (validated objects)
+            app_ir = _memory_cache_get(memory_key)
+            if app_ir is not None:
+                logger.debug(f"🧠 Memory cache hit for {cache_key}")
+                return app_ir
+
             # TIER 1: Try Redis first (fast)
             cached_data = self.redis.get_cached_ir(cache_key)
             if cached_data:
                 try:
-                    ir_dict = cached_data.get("application_ir")
-                    if ir_dict:
-                        app_ir = ApplicationIR.model_validate(ir_dict)
+                    app_ir = self._ir_from_cache_data(cached_data)
+                    if app_ir is not None:
                         logger.info(f"📦 Redis cache hit for {cache_key}")
+                        _memory_cache_put(memory_key, app_ir)
                         return app_ir
                 except Exception as e:
                     logger.warning(f"Redis cache invalid, falling back: {e}")
@@ -256,17 +325,19 @@ class SpecToApplicationIR:
                     logger.info(f"📁 Filesystem cache hit for {cache_key}")
                     # Warm up Redis with filesystem data
                     self._cache_to_redis(app_ir, cache_key, spec_hash, spec_path)
+                    _memory_cache_put(memory_key, app_ir)
                     return app_ir
                 except Exception as e:
                     logger.warning(f"Filesystem cache invalid: {e}")
 
         # TIER 3: Generate with LLM
         logger.info(f"🤖 Generating ApplicationIR with LLM for {spec_path}")
-        application_ir = await self._generate_with_llm(spec_markdown, spec_path)
+        application_ir = await self._generate_with_llm(spec_markdown, spec_path, force_refresh)
 
         # Save to all caches
         self._save_to_cache(application_ir, cache_path, spec_hash, spec_path)
         self._cache_to_redis(application_ir, cache_key, spec_hash, spec_path)
+        _memory_cache_put(memory_key, application_ir)
 
         # TIER 4: Neo4j persistence (Sprint 7)
         if self._neo4j_service:
@@ -322,30 +393,64 @@ class SpecToApplicationIR:
         spec_hash: str,
         spec_path: str
     ):
-        """Save ApplicationIR to Redis cache."""
+        """
+        Save ApplicationIR to Redis cache.
+
+        The IR is stored as a JSON string ("application_ir_json") so a hit
+        is parsed and validated in one pass by pydantic-core
+        (model_validate_json) instead of json.loads + model_validate.
+        """
         cache_data = {
             "spec_hash": spec_hash,
             "spec_path": spec_path,
             "generated_at": datetime.utcnow().isoformat(),
-            "application_ir": application_ir.model_dump(mode="json"),
+            "application_ir_json": application_ir.model_dump_json(),
         }
         if self.redis.cache_ir(cache_key, cache_data):
             logger.info(f"💾 Cached ApplicationIR to Redis: {cache_key}")
 
+    @staticmethod
+    def _ir_from_cache_data(cached_data: dict) -> Optional[ApplicationIR]:
+        """Rebuild ApplicationIR from a Redis cache entry (None if it has no IR)."""
+        ir_json = cached_data.get("application_ir_json")
+        if ir_json:
+            return ApplicationIR.model_validate_json(ir_json)
+
+        # Entries written before application_ir_json existed
+        ir_dict = cached_data.get("application_ir")
+        if ir_dict:
+            return ApplicationIR.model_validate(ir_dict)
+        return None
+
     async def _generate_with_llm(
         self,
         spec_markdown: str,
-        spec_path: str
+        spec_path: str,
+        force_refresh: bool = False
     ) -> ApplicationIR:
-        """Generate ApplicationIR from spec using LLM."""
+        """
+        Generate ApplicationIR from spec using LLM.
+
+        Specs that split into sections (entities plus endpoints / flows /
+        validations) are extracted part by part, concurrently; others with
+        one monolithic prompt. force_refresh also bypasses the section cache.
+        """
         if not self.client:
             raise RuntimeError("Anthropic client not available - set ANTHROPIC_API_KEY")
 
-        prompt = self._build_extraction_prompt(spec_markdown)
+        sections = split_spec_sections(spec_markdown)
+        if SPEC_SECTION_EXTRACTION and is_sectioned(sections):
+            ir_data = await self._extract_sections(sections, spec_path, force_refresh)
+        else:
+            ir_data = await self._extract_ir_data(self._build_extraction_prompt(spec_markdown), spec_path)
+
+        return self._build_application_ir(ir_data, spec_path)
 
+    async def _extract_ir_data(self, prompt: str, label: str) -> dict:
+        """Run one extraction prompt and parse its JSON."""
         try:
             # Always use streaming (SDK enforces it for potentially long operations)
-            logger.info(f"📡 Streaming IR extraction from {spec_path}")
+            logger.info(f"📡 Streaming IR extraction from {label}")
             response_text = await self._generate_with_streaming(prompt)
         except Exception as e:
             logger.error(f"❌ LLM extraction failed: {e}")
@@ -353,7 +458,7 @@ class SpecToApplicationIR:
 
         try:
             json_str = self._extract_json(response_text)
-            ir_data = json.loads(json_str)
+            return json.loads(json_str)
         except json.JSONDecodeError as e:
             logger.error(f"❌ JSON parsing failed: {e}\nResponse: {response_text[:200]}")
             raise RuntimeError(f"Invalid JSON response from LLM: {e}")
@@ -361,11 +466,73 @@ class SpecToApplicationIR:
             logger.error(f"❌ Response parsing failed: {e}")
             raise RuntimeError(f"Invalid response structure from LLM: {e}")
 
-        return self._build_application_ir(ir_data, spec_path)
+    async def _extract_sections(
+        self,
+        sections: dict[str, str],
+        spec_path: str,
+        force_refresh: bool = False
+    ) -> dict:
+        """
+        Extract every part of the IR JSON concurrently and merge them.
+
+        At most SPEC_EXTRACTION_CONCURRENCY LLM calls run at once. Each part
+        is cached under CACHE_DIR/sections by spec name and the hash of its
+        input, so only parts whose sections changed are re-extracted.
+
+        Args:
+            sections: Section kind -> markdown (split_spec_sections)
+            spec_path: Spec path (names the section cache entries)
+            force_refresh: Re-extract every part, ignoring the section cache
+
+        Returns:
+            Extraction JSON with the same keys as a monolithic extraction
+        """
+        semaphore = asyncio.Semaphore(max(1, SPEC_EXTRACTION_CONCURRENCY))
+        spec_name = Path(spec_path).stem
 
-    def _build_extraction_prompt(self, spec_markdown: str) -> str:
-        """Build the LLM prompt for comprehensive spec extraction."""
-        return f"""Extract ALL information from this API specification to create a complete ApplicationIR.
+        async def extract(part: ExtractionPart) -> dict:
+            part_input = build_part_input(part, sections)
+            part_key = part_hash(part, part_input, CODE_VERSION)[:16]
+            cache_path = self.CACHE_DIR / "sections" / f"{spec_name}_{part.name}_{part_key}.json"
+            if cache_path.exists() and not force_refresh:
+                try:
+                    logger.info(f"📁 Section cache hit for {spec_path} ({part.name})")
+                    return _loads(cache_path.read_bytes())
+                except ValueError as e:
+                    logger.warning(f"Section cache invalid, re-extracting: {e}")
+
+            async with semaphore:
+                data = await self._extract_ir_data(
+                    self._build_extraction_prompt(part_input, keys=part.keys),
+                    f"{spec_path} ({part.name})",
+                )
+
+            part_data = {key: data[key] for key in part.keys if key in data}
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_dumps(part_data))
+            return part_data
+
+        ir_data: dict = {}
+        for part_data in await asyncio.gather(*(extract(part) for part in EXTRACTION_PARTS)):
+            ir_data.update(part_data)
+        return ir_data
+
+    def _build_extraction_prompt(self, spec_markdown: str, keys: Optional[tuple[str, ...]] = None) -> str:
+        """
+        Build the LLM prompt for comprehensive spec extraction.
+
+        Args:
+            spec_markdown: Spec (or spec excerpt) to extract from
+            keys: Restrict the output to these top-level keys (section extraction)
+        """
+        scope = ""
+        if keys:
+            scope = (
+                f"SCOPE: Output ONLY these top-level keys: {', '.join(keys)}. "
+                "Omit every other key of the format below. The specification below is the "
+                "excerpt of the full spec relevant to these keys.\n\n"
+            )
+        return scope + f"""Extract ALL information from this API specification to create a complete ApplicationIR.
 
 Be EXHAUSTIVE. Extract every entity, field, constraint, endpoint, and validation rule.
 
@@ -1021,30 +1188,15 @@ Output JSON only, no explanation:"""
         Bug #44 Fix: Hash of IR-related source files for cache invalidation.
 
         When IR extraction/validation code changes, the cache should be invalidated
-        even if the spec content hasn't changed.
+        even if the spec content hasn't changed. Computed once at import (CODE_VERSION).
         """
-        files_to_hash = [
-            "src/cognitive/ir/api_model.py",
-            "src/cognitive/ir/ir_builder.py",
-            "src/services/business_logic_extractor.py",
-            "src/validation/compliance_validator.py",
-            "src/specs/spec_to_application_ir.py",
-            # Bug #56 Fix: Include enricher for cache invalidation when custom ops logic changes
-            "src/services/inferred_endpoint_enricher.py",
-        ]
-        combined = ""
-        for f in files_to_hash:
-            file_path = Path(f)
-            if file_path.exists():
-                combined += hashlib.md5(file_path.read_bytes()).hexdigest()
-        return hashlib.md5(combined.encode()).hexdigest()[:8]
+        return CODE_VERSION
 
     def _load_from_cache(self, cache_path: Path) -> ApplicationIR:
         """Load ApplicationIR from cached JSON."""
         try:
-            with open(cache_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = _loads(cache_path.read_bytes())
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
             logger.error(f"❌ Corrupted cache file: {cache_path} - {e}")
             cache_path.unlink()  # Remove corrupted cache
             raise RuntimeError(f"Cache corrupted, removed: {cache_path}")
@@ -1080,12 +1232,11 @@ Output JSON only, no explanation:"""
             "application_ir": application_ir.model_dump(mode="json"),
         }
 
-        with open(cache_path, "w") as f:
-            json.dump(cache_data, f, indent=2, default=str)
+        cache_path.write_bytes(_dumps(cache_data))
 
     def clear_cache(self, spec_path: Optional[str] = None):
         """
-        Clear cached ApplicationIR from both Redis and filesystem.
+        Clear cached ApplicationIR from memory, Redis and filesystem.
 
         FLUSH STRATEGY:
         - Redis: Uses SCAN (non-blocking, safe for production)
@@ -1097,6 +1248,11 @@ Output JSON only, no explanation:"""
         """
         spec_name = Path(spec_path).stem if spec_path else None
 
+        # Clear in-process memory cache
+        with _ir_memory_lock:
+            for key in [k for k in _ir_memory_cache if spec_name is None or k[0] == spec_name]:
+                del _ir_memory_cache[key]
+
         # Clear Redis first (uses SCAN, non-blocking)
         redis_deleted = self.redis.clear_ir_cache(spec_name)
         if redis_deleted > 0:
@@ -1108,10 +1264,15 @@ Output JSON only, no explanation:"""
             for cache_file in self.CACHE_DIR.glob(pattern):
                 cache_file.unlink()
                 logger.info(f"🗑️ Removed filesystem cache: {cache_file}")
+            for cache_file in (self.CACHE_DIR / "sections").glob(pattern):
+                cache_file.unlink()
         else:
             for cache_file in self.CACHE_DIR.glob("*.json"):
                 cache_file.unlink()
                 logger.info(f"🗑️ Removed filesystem cache: {cache_file}")
+            # Section extraction cache
+            for cache_file in (self.CACHE_DIR / "sections").glob("*.json"):
+                cache_file.unlink()
 
     def get_cache_info(self, spec_path: str) -> dict[str, Any]:
         """Get information about cached ApplicationIR from both tiers."""
@@ -1164,6 +1325,40 @@ Output JSON only, no explanation:"""
         return info
 
 
+def _memory_cache_get(key: tuple[str, str, str]) -> Optional[ApplicationIR]:
+    """Look up a validated ApplicationIR in the in-process cache (shared, read-only)."""
+    with _ir_memory_lock:
+        app_ir = _ir_memory_cache.get(key)
+        if app_ir is not None:
+            _ir_memory_cache.move_to_end(key)
+        return app_ir
+
+
+def _memory_cache_put(key: tuple[str, str, str], app_ir: ApplicationIR) -> None:
+    """Store a validated ApplicationIR in the in-process cache (LRU)."""
+    if IR_MEMORY_CACHE_SIZE <= 0:
+        return
+    with _ir_memory_lock:
+        _ir_memory_cache[key] = app_ir
+        _ir_memory_cache.move_to_end(key)
+        while len(_ir_memory_cache) > IR_MEMORY_CACHE_SIZE:
+            _ir_memory_cache.popitem(last=False)
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize a filesystem cache entry (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a filesystem cache entry (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 # Sync wrapper for non-async contexts
 def get_application_ir_sync(
     spec_markdown: str,
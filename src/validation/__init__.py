@@ -36,6 +36,9 @@ from .smoke_test_models import (
 )
 from .smoke_test_orchestrator import SmokeTestOrchestrator
 
+# Trie-based fuzzy endpoint lookup (shared by compliance scoring)
+from .endpoint_route_index import EndpointRouteIndex
+
 __all__ = [
     'AtomicValidator',
     'AtomicValidationResult',
@@ -61,4 +64,5 @@ __all__ = [
     'TestMetrics',
     'SmokeTestReport',
     'SmokeTestOrchestrator',
+    'EndpointRouteIndex',
 ]
@@ -0,0 +1,196 @@
+"""
+Endpoint Route Index - Trie-based fuzzy endpoint lookup
+
+Indexes endpoints found in generated code ("GET /products/{id}") into a
+route trie so that expected endpoints can be matched with a single walk
+instead of being compared against every found endpoint.
+
+Matching rules (same as ComplianceValidator fuzzy endpoint matching):
+1. Path parameters are wildcards: /carts/{id} ≈ /carts/{customer_id}
+2. Functionally equivalent methods:
+   - POST ≈ DELETE when either path mentions "clear"
+   - POST ≈ PUT ≈ PATCH when either path mentions "cancel"
+3. Action routes: /carts/{id} ≈ /carts/clear (also cancel, checkout)
+
+Paths are compared case-insensitively, ignoring leading/trailing slashes.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Parameter segments collapse to this wildcard key
+WILDCARD = "{*}"
+
+_PARAM_RE = re.compile(r"\{[^}]+\}")
+
+# Last segments that may stand in for a path parameter (/carts/clear ≈ /carts/{id})
+ACTION_SEGMENTS = frozenset({"clear", "cancel", "checkout"})
+
+# Method-equivalence classes, keyed by the keyword that activates them
+_CLEAR_METHODS = frozenset({"POST", "DELETE"})
+_CANCEL_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
+def parse_endpoint(endpoint_str: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse "METHOD /path" into (METHOD, path).
+
+    Returns:
+        (None, None) if the string has no method/path pair
+    """
+    parts = endpoint_str.strip().split(maxsplit=1)
+    if len(parts) == 2:
+        return parts[0].upper(), parts[1]
+    return None, None
+
+
+def route_segments(path: str) -> List[str]:
+    """
+    Split a path into normalized trie segments.
+
+    Lowercases, strips surrounding slashes and replaces every {param}
+    with the WILDCARD key.
+    """
+    normalized = path.lower().strip().strip("/")
+    return _PARAM_RE.sub(WILDCARD, normalized).split("/")
+
+
+class _MethodFlags:
+    """Keyword flags aggregated over all found paths registered for one method."""
+
+    __slots__ = ("clear", "cancel")
+
+    def __init__(self) -> None:
+        self.clear = False
+        self.cancel = False
+
+
+class _RouteNode:
+    """Trie node; `methods` is only populated on nodes that terminate a route."""
+
+    __slots__ = ("children", "methods")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_RouteNode"] = {}
+        self.methods: Dict[str, _MethodFlags] = {}
+
+
+class EndpointRouteIndex:
+    """
+    Route trie over found endpoints with fuzzy lookup.
+
+    Build once per set of found endpoints, then call `matches()` for each
+    expected endpoint. Lookup cost depends on path depth, not on the number
+    of indexed endpoints.
+
+    Example:
+        index = EndpointRouteIndex.from_strings(["GET /products/{id}"])
+        index.matches("GET", "/products/{product_id}")  # True
+    """
+
+    def __init__(self, endpoints: Optional[Iterable[Tuple[str, str]]] = None):
+        self._root = _RouteNode()
+        self._size = 0
+        if endpoints:
+            for method, path in endpoints:
+                self.add(method, path)
+
+    @classmethod
+    def from_strings(cls, endpoints: Iterable[str]) -> "EndpointRouteIndex":
+        """Build an index from "METHOD /path" strings, skipping malformed entries."""
+        index = cls()
+        for endpoint in endpoints:
+            method, path = parse_endpoint(endpoint)
+            if method and path:
+                index.add(method, path)
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, method: str, path: str) -> None:
+        """Register a found endpoint."""
+        node = self._root
+        for segment in route_segments(path):
+            child = node.children.get(segment)
+            if child is None:
+                child = _RouteNode()
+                node.children[segment] = child
+            node = child
+
+        flags = node.methods.get(method.upper())
+        if flags is None:
+            flags = _MethodFlags()
+            node.methods[method.upper()] = flags
+
+        path_lower = path.lower()
+        flags.clear = flags.clear or "clear" in path_lower
+        flags.cancel = flags.cancel or "cancel" in path_lower
+        self._size += 1
+
+    def matches(self, method: str, path: str) -> bool:
+        """
+        Check if an expected endpoint fuzzily matches any indexed endpoint.
+
+        Args:
+            method: Expected HTTP method
+            path: Expected path (/carts/{customer_id})
+
+        Returns:
+            True if a fuzzy match is found
+        """
+        method = method.upper()
+        path_lower = path.lower()
+        has_clear = "clear" in path_lower
+        has_cancel = "cancel" in path_lower
+
+        for node in self._candidate_nodes(route_segments(path)):
+            if self._node_accepts(node, method, has_clear, has_cancel):
+                return True
+        return False
+
+    def _candidate_nodes(self, segments: List[str]) -> Iterator[_RouteNode]:
+        """Yield terminal nodes whose routes are similar to `segments`."""
+        parent = self._root
+        for segment in segments[:-1]:
+            parent = parent.children.get(segment)
+            if parent is None:
+                return
+
+        last = segments[-1]
+        exact = parent.children.get(last)
+        if exact is not None:
+            yield exact
+
+        # Action routes: /carts/{id} ≈ /carts/clear and vice versa
+        if last == WILDCARD:
+            for action in ACTION_SEGMENTS:
+                node = parent.children.get(action)
+                if node is not None:
+                    yield node
+        elif last in ACTION_SEGMENTS:
+            node = parent.children.get(WILDCARD)
+            if node is not None:
+                yield node
+
+    @staticmethod
+    def _node_accepts(
+        node: _RouteNode, method: str, has_clear: bool, has_cancel: bool
+    ) -> bool:
+        """Check the method-equivalence classes registered on a terminal node."""
+        if method in node.methods:
+            return True
+
+        if method in _CLEAR_METHODS:
+            for other in _CLEAR_METHODS - {method}:
+                flags = node.methods.get(other)
+                if flags is not None and (has_clear or flags.clear):
+                    return True
+
+        if method in _CANCEL_METHODS:
+            for other in _CANCEL_METHODS - {method}:
+                flags = node.methods.get(other)
+                if flags is not None and (has_cancel or flags.cancel):
+                    return True
+
+        return False
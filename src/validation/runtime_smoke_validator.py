@@ -16,6 +16,7 @@ import subprocess
 import sys
 import time
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -23,6 +24,7 @@ import httpx
 
 from src.cognitive.ir.application_ir import ApplicationIR
 from src.cognitive.ir.api_model import Endpoint, HttpMethod
+from src.validation.smoke_scheduler import DEFAULT_SMOKE_CONCURRENCY, run_smoke_requests
 
 # Active Learning imports (optional - graceful degradation if Neo4j unavailable)
 try:
@@ -98,6 +100,7 @@ class RuntimeSmokeTestValidator:
         request_timeout: float = 10.0,
         error_knowledge_repo: Optional["ErrorKnowledgeRepository"] = None,
         pattern_feedback: Optional["PatternFeedbackIntegration"] = None,
+        max_concurrency: int = DEFAULT_SMOKE_CONCURRENCY,
     ):
         self.app_dir = Path(app_dir)
         self.host = host
@@ -105,10 +108,17 @@ class RuntimeSmokeTestValidator:
         self.max_iterations = max_iterations
         self.startup_timeout = startup_timeout
         self.request_timeout = request_timeout
+        # Max endpoint requests in flight (1 = strictly sequential)
+        self.max_concurrency = max_concurrency
         self.server_process: Optional[subprocess.Popen] = None
         self.base_url = f"http://{host}:{port}"
         # Bug #85: Track if using Docker for proper cleanup
         self._using_docker = False
+        # Set by SmokeServerSession: server is kept warm across validate() calls
+        self.reuse_running_server = False
+        # Start of the current validate() run: server logs are captured from here,
+        # so a warm server's tracebacks from earlier runs are not re-attributed
+        self._run_started_at: Optional[datetime] = None
         # Active Learning: Repository for learning from failures
         self._error_knowledge_repo = error_knowledge_repo
         self._learning_enabled = error_knowledge_repo is not None and ACTIVE_LEARNING_AVAILABLE
@@ -122,16 +132,18 @@ class RuntimeSmokeTestValidator:
         Returns violations in Code Repair compatible format.
         """
         start_time = time.time()
+        self._run_started_at = datetime.now(timezone.utc)
         violations: List[Dict[str, Any]] = []
         results: List[EndpointTestResult] = []
         server_startup_time = 0.0
 
-        # 1. Start uvicorn server
+        # 1. Start uvicorn server (unless a warm SmokeServerSession owns it)
         try:
-            startup_start = time.time()
-            await self._start_server()
-            server_startup_time = (time.time() - startup_start) * 1000
-            logger.info(f"✅ Server started in {server_startup_time:.0f}ms at {self.base_url}")
+            if not self.reuse_running_server:
+                startup_start = time.time()
+                await self._start_server()
+                server_startup_time = (time.time() - startup_start) * 1000
+                logger.info(f"✅ Server started in {server_startup_time:.0f}ms at {self.base_url}")
         except Exception as e:
             logger.error(f"❌ Failed to start server: {e}")
             # Bug #91 Fix: Always cleanup Docker even when startup fails
@@ -165,9 +177,22 @@ class RuntimeSmokeTestValidator:
             # Bug #85: With Docker, seed data is created by db-init service
             # No need to create resources manually - they exist in the database
 
-            # 3. Test each endpoint
-            for endpoint in endpoints:
-                result = await self._test_endpoint(endpoint)
+            # 3. Test endpoints concurrently; same-entity create/read/delete
+            # chains stay ordered (see smoke_scheduler). One pooled client.
+            limits = httpx.Limits(
+                max_connections=max(1, self.max_concurrency),
+                max_keepalive_connections=max(1, self.max_concurrency),
+            )
+            async with httpx.AsyncClient(limits=limits) as client:
+                endpoint_results = await run_smoke_requests(
+                    endpoints,
+                    lambda ep: (ep.method.value, ep.path),
+                    lambda ep: self._test_endpoint(ep, client),
+                    self.max_concurrency,
+                )
+
+            # Report in IR order regardless of completion order
+            for endpoint, result in zip(endpoints, endpoint_results, strict=True):
                 results.append(result)
 
                 if not result.success:
@@ -187,8 +212,9 @@ class RuntimeSmokeTestValidator:
                 logger.info(f"📝 Captured {len(stack_traces)} stack traces from server logs")
 
         finally:
-            # 5. Stop server (always)
-            await self._stop_server()
+            # 5. Stop server (always, unless the session keeps it warm)
+            if not self.reuse_running_server:
+                await self._stop_server()
 
         total_time = (time.time() - start_time) * 1000
         passed_count = len([r for r in results if r.success])
@@ -390,6 +416,7 @@ class RuntimeSmokeTestValidator:
 
         Returns logs from Docker container or uvicorn process.
         These logs contain stack traces needed to identify root causes.
+        Only logs since the start of the current validate() run are returned.
         """
         if self._using_docker:
             try:
@@ -399,6 +426,8 @@ class RuntimeSmokeTestValidator:
                     '-f', 'docker/docker-compose.yml',
                     'logs', 'app', '--no-color', '--tail', '500'
                 ]
+                if self._run_started_at is not None:
+                    cmd += ['--since', self._run_started_at.strftime('%Y-%m-%dT%H:%M:%S.%fZ')]
                 result = subprocess.run(
                     cmd,
                     cwd=str(self.app_dir),
@@ -483,10 +512,14 @@ class RuntimeSmokeTestValidator:
             finally:
                 self.server_process = None
 
-    async def _test_endpoint(self, endpoint: Endpoint) -> EndpointTestResult:
+    async def _test_endpoint(
+        self, endpoint: Endpoint, client: Optional[httpx.AsyncClient] = None
+    ) -> EndpointTestResult:
         """
         Call endpoint with minimal test data.
         Catch 500s, parse error messages.
+
+        Uses the given pooled client, or a one-off client when None.
         """
         method = endpoint.method.value.lower()
 
@@ -502,19 +535,11 @@ class RuntimeSmokeTestValidator:
         start_time = time.time()
 
         try:
-            async with httpx.AsyncClient() as client:
-                if method == 'get':
-                    response = await client.get(url, timeout=self.request_timeout)
-                elif method == 'post':
-                    response = await client.post(url, json=payload, timeout=self.request_timeout)
-                elif method == 'put':
-                    response = await client.put(url, json=payload, timeout=self.request_timeout)
-                elif method == 'patch':
-                    response = await client.patch(url, json=payload, timeout=self.request_timeout)
-                elif method == 'delete':
-                    response = await client.delete(url, timeout=self.request_timeout)
-                else:
-                    response = await client.request(method, url, json=payload, timeout=self.request_timeout)
+            if client is None:
+                async with httpx.AsyncClient() as own_client:
+                    response = await self._send_request(own_client, method, url, payload)
+            else:
+                response = await self._send_request(client, method, url, payload)
 
             response_time = (time.time() - start_time) * 1000
 
@@ -569,6 +594,27 @@ class RuntimeSmokeTestValidator:
                 response_time_ms=(time.time() - start_time) * 1000
             )
 
+    async def _send_request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """Send a single smoke request."""
+        if method == 'get':
+            return await client.get(url, timeout=self.request_timeout)
+        elif method == 'post':
+            return await client.post(url, json=payload, timeout=self.request_timeout)
+        elif method == 'put':
+            return await client.put(url, json=payload, timeout=self.request_timeout)
+        elif method == 'patch':
+            return await client.patch(url, json=payload, timeout=self.request_timeout)
+        elif method == 'delete':
+            return await client.delete(url, timeout=self.request_timeout)
+        else:
+            return await client.request(method, url, json=payload, timeout=self.request_timeout)
+
     def _substitute_path_params(self, path: str) -> str:
         """Replace path parameters like {id} with test values."""
         # Bug #85: Use predictable UUIDs that match seed data
@@ -947,7 +993,8 @@ class RuntimeSmokeTestValidator:
 async def run_smoke_test(
     app_dir: Path,
     ir: ApplicationIR,
-    port: int = 8099
+    port: int = 8099,
+    max_concurrency: int = DEFAULT_SMOKE_CONCURRENCY
 ) -> SmokeTestResult:
     """
     Convenience function to run smoke tests.
@@ -959,5 +1006,5 @@ async def run_smoke_test(
             for v in result.violations:
                 print(f"  - {v['endpoint']}: {v['error_type']}")
     """
-    validator = RuntimeSmokeTestValidator(app_dir, port=port)
+    validator = RuntimeSmokeTestValidator(app_dir, port=port, max_concurrency=max_concurrency)
     return await validator.validate(ir)
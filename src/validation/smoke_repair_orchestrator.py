@@ -20,6 +20,7 @@ Reference: DOCS/mvp/exit/SMOKE_DRIVEN_REPAIR_ARCHITECTURE.md
 Created: 2025-11-29
 """
 import asyncio
+import hashlib
 import logging
 import re
 import subprocess
@@ -30,6 +31,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 from enum import Enum
 
+from src.validation.smoke_server_session import SmokeServerSession
+
 logger = logging.getLogger(__name__)
 
 # Phase 2 Components (Delta Validation, Confidence Model, Pattern Learning)
@@ -137,6 +140,7 @@ class SmokeRepairConfig:
     enable_server_log_capture: bool = True
     enable_learning: bool = True
     convergence_epsilon: float = 0.01  # 1% change threshold
+    reuse_server: bool = True  # Keep smoke server warm across iterations (hot reload)
 
 
 @dataclass
@@ -198,6 +202,140 @@ class MutationRecord:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+class CodeSnapshotStore:
+    """
+    Content-addressed snapshots of the app's *.py files for rollback.
+
+    File contents are stored once per distinct content hash, shared by every
+    iteration. Each snapshot records only the files whose hash changed since
+    the previous snapshot (None = file deleted). Unchanged files are detected
+    by (mtime, size) and not re-read.
+    """
+
+    # Files modified this close to being hashed are re-read ("racy" mtimes
+    # on filesystems with coarse timestamp resolution)
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self):
+        self._blobs: Dict[str, str] = {}  # sha256 → content
+        self._deltas: Dict[int, Dict[str, Optional[str]]] = {}  # iteration → {rel_path: sha256}
+        self._head: Dict[str, str] = {}  # manifest of the latest snapshot
+        # rel_path → (mtime_ns, size, sha256, hashed_at_ns)
+        self._stat_cache: Dict[str, Tuple[int, int, str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    def __contains__(self, iteration: int) -> bool:
+        return iteration in self._deltas
+
+    def reset(self) -> None:
+        """Drop every snapshot, e.g. before a new repair loop on another app."""
+        self._blobs.clear()
+        self._deltas.clear()
+        self._head = {}
+        self._stat_cache.clear()
+
+    def take(self, iteration: int, app_path: Path) -> int:
+        """
+        Snapshot the current tree.
+
+        Snapshotting an iteration at or before the latest recorded one starts
+        a new history, since iteration numbers restart with every repair loop.
+
+        Returns:
+            Number of files recorded in this iteration's delta
+        """
+        if self._deltas and iteration <= max(self._deltas):
+            self.reset()
+        current = self._scan(app_path)
+        delta: Dict[str, Optional[str]] = {
+            rel_path: digest
+            for rel_path, digest in current.items()
+            if self._head.get(rel_path) != digest
+        }
+        delta.update({rel_path: None for rel_path in self._head if rel_path not in current})
+
+        self._deltas[iteration] = delta
+        self._head = current
+        return len(delta)
+
+    def manifest(self, iteration: int) -> Dict[str, str]:
+        """Reconstruct {rel_path: sha256} at a snapshot by replaying deltas."""
+        manifest: Dict[str, str] = {}
+        for snap_iteration in sorted(self._deltas):
+            if snap_iteration > iteration:
+                break
+            for rel_path, digest in self._deltas[snap_iteration].items():
+                if digest is None:
+                    manifest.pop(rel_path, None)
+                else:
+                    manifest[rel_path] = digest
+        return manifest
+
+    def restore(self, iteration: int, app_path: Path) -> List[str]:
+        """
+        Rewrite only the files whose content differs from the snapshot.
+
+        Files created after the snapshot are left in place.
+
+        Returns:
+            Relative paths that were rewritten
+        """
+        target = self.manifest(iteration)
+        current = self._scan(app_path)
+        restored = []
+
+        for rel_path, digest in target.items():
+            if current.get(rel_path) == digest:
+                continue
+            file_path = app_path / rel_path
+            try:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_text(self._blobs[digest])
+                restored.append(rel_path)
+            except Exception as e:
+                logger.error(f"Rollback failed for {rel_path}: {e}")
+
+        # Rewritten files are re-hashed on the next scan
+        for rel_path in restored:
+            self._stat_cache.pop(rel_path, None)
+        return restored
+
+    def _scan(self, app_path: Path) -> Dict[str, str]:
+        """Hash every *.py file, storing new contents as blobs."""
+        manifest: Dict[str, str] = {}
+        seen = set()
+        scan_ns = time.time_ns()
+        for py_file in app_path.rglob("*.py"):
+            try:
+                rel_path = str(py_file.relative_to(app_path))
+                stat = py_file.stat()
+                seen.add(rel_path)
+
+                cached = self._stat_cache.get(rel_path)
+                if (
+                    cached
+                    and cached[0] == stat.st_mtime_ns
+                    and cached[1] == stat.st_size
+                    and cached[0] < cached[3] - self.RACY_WINDOW_NS
+                ):
+                    manifest[rel_path] = cached[2]
+                    continue
+
+                content = py_file.read_text()
+                digest = hashlib.sha256(content.encode()).hexdigest()
+                self._blobs.setdefault(digest, content)
+                self._stat_cache[rel_path] = (stat.st_mtime_ns, stat.st_size, digest, scan_ns)
+                manifest[rel_path] = digest
+            except Exception:
+                pass
+
+        for rel_path in [p for p in self._stat_cache if p not in seen]:
+            del self._stat_cache[rel_path]
+        return manifest
+
+
 class ServerLogParser:
     """Parses server logs to extract stack traces and error information."""
 
@@ -377,7 +515,10 @@ class SmokeRepairOrchestrator:
 
         # Mutation tracking
         self.mutation_history: List[MutationRecord] = []
-        self._snapshots: Dict[int, Dict[str, str]] = {}
+        self._snapshots = CodeSnapshotStore()
+
+        # Warm smoke server shared by all iterations of a cycle
+        self._server_session: Optional[SmokeServerSession] = None
 
         # Phase 2: Delta Validation Integration
         self.delta_validator: Optional[DeltaIRValidator] = None
@@ -425,92 +566,97 @@ class SmokeRepairOrchestrator:
 
         logger.info(f"🔄 Starting Smoke-Repair Cycle (max {self.config.max_iterations} iterations)")
 
-        for i in range(self.config.max_iterations):
-            iter_start = time.time()
-            logger.info(f"\n  📍 Iteration {i + 1}/{self.config.max_iterations}")
-
-            # 1. Take snapshot before repair (for potential rollback)
-            self._take_snapshot(i, app_path)
-
-            # 2. Run smoke test with log capture
-            smoke_result = await self._run_smoke_test(app_path, application_ir, capture_logs)
+        self._snapshots.reset()
 
-            current_pass_rate = self._calculate_pass_rate(smoke_result)
-            violations = smoke_result.violations
+        try:
+            for i in range(self.config.max_iterations):
+                iter_start = time.time()
+                logger.info(f"\n  📍 Iteration {i + 1}/{self.config.max_iterations}")
 
-            if i == 0:
-                initial_pass_rate = current_pass_rate
+                # 1. Take snapshot before repair (for potential rollback)
+                self._take_snapshot(i, app_path)
 
-            logger.info(f"    📊 Pass rate: {current_pass_rate:.1%} ({smoke_result.endpoints_passed}/{smoke_result.endpoints_tested})")
+                # 2. Run smoke test with log capture
+                smoke_result = await self._run_smoke_test(app_path, application_ir, capture_logs)
 
-            iteration = SmokeIteration(
-                iteration=i + 1,
-                pass_rate=current_pass_rate,
-                violations_count=len(violations),
-                duration_ms=(time.time() - iter_start) * 1000
-            )
+                current_pass_rate = self._calculate_pass_rate(smoke_result)
+                violations = smoke_result.violations
 
-            # 3. Check success condition
-            if current_pass_rate >= self.config.target_pass_rate:
-                logger.info(f"    ✅ Target reached! ({self.config.target_pass_rate:.0%})")
-                iterations.append(iteration)
-                break
+                if i == 0:
+                    initial_pass_rate = current_pass_rate
 
-            # 4. Check regression (pass rate decreased)
-            if i > 0 and current_pass_rate < iterations[-1].pass_rate:
-                logger.warning(f"    ⚠️ Regression detected! {iterations[-1].pass_rate:.1%} → {current_pass_rate:.1%}")
-                regression_detected = True
-                # Rollback to previous state
-                self._rollback_to(i - 1, app_path)
-                current_pass_rate = iterations[-1].pass_rate
-                iterations.append(iteration)
-                break
+                logger.info(f"    📊 Pass rate: {current_pass_rate:.1%} ({smoke_result.endpoints_passed}/{smoke_result.endpoints_tested})")
 
-            # 5. Check convergence (stuck at same level)
-            if i > 0 and abs(current_pass_rate - iterations[-1].pass_rate) < self.config.convergence_epsilon:
-                logger.info(f"    📈 Converged at {current_pass_rate:.1%} (delta < {self.config.convergence_epsilon:.1%})")
-                convergence_detected = True
-                iterations.append(iteration)
-                break
+                iteration = SmokeIteration(
+                    iteration=i + 1,
+                    pass_rate=current_pass_rate,
+                    violations_count=len(violations),
+                    duration_ms=(time.time() - iter_start) * 1000
+                )
 
-            # 6. Parse server logs for stack traces
-            stack_traces = []
-            if capture_logs and hasattr(smoke_result, 'server_logs') and smoke_result.server_logs:
-                stack_traces = self.log_parser.parse_logs(smoke_result.server_logs)
-                logger.info(f"    🔍 Found {len(stack_traces)} stack traces in logs")
-
-            # 7. Classify errors for targeted repair
-            classified = self.error_classifier.classify_violations(violations, stack_traces)
-
-            # Log error distribution
-            for strategy_type, vios in classified.items():
-                if vios:
-                    logger.info(f"    📋 {strategy_type.value}: {len(vios)} violations")
-
-            # 8. Repair based on classifications
-            repair_result = await self._repair_from_smoke(
-                classified,
-                stack_traces,
-                app_path,
-                application_ir
-            )
+                # 3. Check success condition
+                if current_pass_rate >= self.config.target_pass_rate:
+                    logger.info(f"    ✅ Target reached! ({self.config.target_pass_rate:.0%})")
+                    iterations.append(iteration)
+                    break
+
+                # 4. Check regression (pass rate decreased)
+                if i > 0 and current_pass_rate < iterations[-1].pass_rate:
+                    logger.warning(f"    ⚠️ Regression detected! {iterations[-1].pass_rate:.1%} → {current_pass_rate:.1%}")
+                    regression_detected = True
+                    # Rollback to previous state
+                    self._rollback_to(i - 1, app_path)
+                    current_pass_rate = iterations[-1].pass_rate
+                    iterations.append(iteration)
+                    break
+
+                # 5. Check convergence (stuck at same level)
+                if i > 0 and abs(current_pass_rate - iterations[-1].pass_rate) < self.config.convergence_epsilon:
+                    logger.info(f"    📈 Converged at {current_pass_rate:.1%} (delta < {self.config.convergence_epsilon:.1%})")
+                    convergence_detected = True
+                    iterations.append(iteration)
+                    break
+
+                # 6. Parse server logs for stack traces
+                stack_traces = []
+                if capture_logs and hasattr(smoke_result, 'server_logs') and smoke_result.server_logs:
+                    stack_traces = self.log_parser.parse_logs(smoke_result.server_logs)
+                    logger.info(f"    🔍 Found {len(stack_traces)} stack traces in logs")
+
+                # 7. Classify errors for targeted repair
+                classified = self.error_classifier.classify_violations(violations, stack_traces)
+
+                # Log error distribution
+                for strategy_type, vios in classified.items():
+                    if vios:
+                        logger.info(f"    📋 {strategy_type.value}: {len(vios)} violations")
+
+                # 8. Repair based on classifications
+                repair_result = await self._repair_from_smoke(
+                    classified,
+                    stack_traces,
+                    app_path,
+                    application_ir
+                )
 
-            iteration.repairs_applied = len(repair_result.get('fixes', []))
-            iteration.repairs_successful = repair_result.get('successful', 0)
-            total_repairs += iteration.repairs_applied
-            all_fixes.extend(repair_result.get('fixes', []))
+                iteration.repairs_applied = len(repair_result.get('fixes', []))
+                iteration.repairs_successful = repair_result.get('successful', 0)
+                total_repairs += iteration.repairs_applied
+                all_fixes.extend(repair_result.get('fixes', []))
 
-            logger.info(f"    🔧 Applied {iteration.repairs_applied} repairs ({iteration.repairs_successful} successful)")
+                logger.info(f"    🔧 Applied {iteration.repairs_applied} repairs ({iteration.repairs_successful} successful)")
 
-            # 9. Record learnings
-            if self.config.enable_learning and self.pattern_adapter:
-                self._record_learning(
-                    violations=violations,
-                    repairs=repair_result.get('fixes', []),
-                    iteration=i + 1
-                )
+                # 9. Record learnings
+                if self.config.enable_learning and self.pattern_adapter:
+                    self._record_learning(
+                        violations=violations,
+                        repairs=repair_result.get('fixes', []),
+                        iteration=i + 1
+                    )
 
-            iterations.append(iteration)
+                iterations.append(iteration)
+        finally:
+            await self._close_server_session()
 
         total_duration = (time.time() - start_time) * 1000
 
@@ -537,10 +683,40 @@ class SmokeRepairOrchestrator:
         application_ir,
         capture_logs: bool
     ):
-        """Run smoke test with optional log capture."""
+        """
+        Run smoke test with optional log capture.
+
+        With config.reuse_server the server is started once per cycle and
+        later iterations only hot reload the repaired files (see
+        SmokeServerSession); otherwise the validator starts and stops its
+        own server on every call.
+        """
+        if self.config.reuse_server and SmokeServerSession.supports(self.smoke_validator):
+            try:
+                if self._server_session is None:
+                    self._server_session = SmokeServerSession(self.smoke_validator)
+                    await self._server_session.start()
+                else:
+                    mode = await self._server_session.refresh()
+                    logger.info(f"    🔥 Warm server refreshed ({mode})")
+            except Exception as e:
+                # validate() reports startup failures as a ServerStartupError violation
+                logger.warning(f"    ⚠️ Warm server unavailable, using cold start: {e}")
+                await self._close_server_session()
+
         # The RuntimeSmokeTestValidator already handles this
         return await self.smoke_validator.validate(application_ir)
 
+    async def _close_server_session(self) -> None:
+        """Stop the warm smoke server, if one is running."""
+        if self._server_session is None:
+            return
+        session, self._server_session = self._server_session, None
+        try:
+            await session.stop()
+        except Exception as e:
+            logger.warning(f"Error stopping warm smoke server: {e}")
+
     def _calculate_pass_rate(self, smoke_result) -> float:
         """Calculate pass rate from smoke result."""
         if smoke_result.endpoints_tested == 0:
@@ -1244,30 +1420,18 @@ class SmokeRepairOrchestrator:
 
     def _take_snapshot(self, iteration: int, app_path: Path) -> None:
         """Take snapshot of current code state for potential rollback."""
-        snapshot = {}
-        for py_file in app_path.rglob("*.py"):
-            try:
-                rel_path = str(py_file.relative_to(app_path))
-                snapshot[rel_path] = py_file.read_text()
-            except Exception:
-                pass
-        self._snapshots[iteration] = snapshot
+        changed = self._snapshots.take(iteration, app_path)
+        logger.debug(f"Snapshot {iteration}: {changed} file(s) changed")
 
     def _rollback_to(self, iteration: int, app_path: Path) -> None:
-        """Rollback to snapshot at specific iteration."""
+        """Rollback to snapshot at specific iteration (only differing files are rewritten)."""
         if iteration not in self._snapshots:
             logger.warning(f"No snapshot at iteration {iteration}")
             return
 
         logger.info(f"    🔄 Rolling back to iteration {iteration}")
-        snapshot = self._snapshots[iteration]
-
-        for rel_path, content in snapshot.items():
-            file_path = app_path / rel_path
-            try:
-                file_path.write_text(content)
-            except Exception as e:
-                logger.error(f"Rollback failed for {rel_path}: {e}")
+        restored = self._snapshots.restore(iteration, app_path)
+        logger.info(f"    🔄 Restored {len(restored)} file(s)")
 
         # Mark mutations as reverted
         for mutation in self.mutation_history:
@@ -1495,117 +1659,123 @@ class SmokeRepairOrchestrator:
 
         logger.info(f"🔄 Starting Full Smoke-Repair Cycle (max {max_cycles} cycles, Docker rebuild: {with_docker_rebuild})")
 
-        for cycle in range(max_cycles):
-            cycle_start = time.time()
-            logger.info(f"\n  🔁 Cycle {cycle + 1}/{max_cycles}")
+        self._snapshots.reset()
 
-            # 1. Take snapshot
-            self._take_snapshot(cycle, app_path)
+        try:
+            for cycle in range(max_cycles):
+                cycle_start = time.time()
+                logger.info(f"\n  🔁 Cycle {cycle + 1}/{max_cycles}")
+
+                # 1. Take snapshot
+                self._take_snapshot(cycle, app_path)
+
+                # 2. Run smoke test
+                smoke_result = await self._run_smoke_test(app_path, application_ir, True)
+                current_pass_rate = self._calculate_pass_rate(smoke_result)
+                violations = smoke_result.violations
+
+                if cycle == 0:
+                    initial_pass_rate = current_pass_rate
+
+                logger.info(f"    📊 Pass rate: {current_pass_rate:.1%} ({smoke_result.endpoints_passed}/{smoke_result.endpoints_tested})")
+
+                # 3. Check success
+                if current_pass_rate >= self.config.target_pass_rate:
+                    logger.info(f"    ✅ Target reached!")
+                    all_iterations.append(SmokeIteration(
+                        iteration=cycle + 1,
+                        pass_rate=current_pass_rate,
+                        violations_count=len(violations),
+                        duration_ms=(time.time() - cycle_start) * 1000
+                    ))
+                    break
+
+                # 4. Check regression
+                if cycle > 0 and current_pass_rate < all_iterations[-1].pass_rate - self.config.convergence_epsilon:
+                    logger.warning(f"    ⚠️ Regression detected! Rolling back...")
+                    regression_detected = True
+                    self._rollback_to(cycle - 1, app_path)
+                    break
+
+                # 5. Check convergence
+                if cycle > 0 and abs(current_pass_rate - all_iterations[-1].pass_rate) < self.config.convergence_epsilon:
+                    logger.info(f"    📈 Converged at {current_pass_rate:.1%}")
+                    convergence_detected = True
+                    all_iterations.append(SmokeIteration(
+                        iteration=cycle + 1,
+                        pass_rate=current_pass_rate,
+                        violations_count=len(violations),
+                        duration_ms=(time.time() - cycle_start) * 1000
+                    ))
+                    break
+
+                # 6. Parse logs
+                stack_traces = []
+                if hasattr(smoke_result, 'server_logs') and smoke_result.server_logs:
+                    stack_traces = self.log_parser.parse_logs(smoke_result.server_logs)
+                    logger.info(f"    🔍 Found {len(stack_traces)} stack traces")
+
+                # 7. Classify errors
+                classified = self.error_classifier.classify_violations(violations, stack_traces)
+
+                # 8. Apply repairs with learned patterns priority
+                cycle_fixes = []
+                cycle_successful = 0
+
+                for strategy_type, vios in classified.items():
+                    if not vios:
+                        continue
 
-            # 2. Run smoke test
-            smoke_result = await self._run_smoke_test(app_path, application_ir, True)
-            current_pass_rate = self._calculate_pass_rate(smoke_result)
-            violations = smoke_result.violations
+                    for violation in vios:
+                        # Try learned patterns first
+                        learned = self._get_learned_antipatterns(violation, stack_traces)
+                        if learned:
+                            fix = self._repair_with_learned_patterns(
+                                strategy_type, violation, stack_traces,
+                                app_path, application_ir, learned
+                            )
+                            if fix and fix.success:
+                                cycle_fixes.append(fix)
+                                cycle_successful += 1
+                                learned_patterns_applied += 1
+                                continue
+
+                        # Fallback to regular repair
+                        fix = await self._apply_repair_with_confidence(
+                            strategy_type, violation, stack_traces,
+                            app_path, application_ir, None
+                        )
+                        if fix:
+                            cycle_fixes.append(fix)
+                            if fix.success:
+                                cycle_successful += 1
 
-            if cycle == 0:
-                initial_pass_rate = current_pass_rate
+                total_repairs += len(cycle_fixes)
+                all_fixes.extend(cycle_fixes)
 
-            logger.info(f"    📊 Pass rate: {current_pass_rate:.1%} ({smoke_result.endpoints_passed}/{smoke_result.endpoints_tested})")
+                logger.info(f"    🔧 Applied {len(cycle_fixes)} repairs ({learned_patterns_applied} from learned patterns)")
 
-            # 3. Check success
-            if current_pass_rate >= self.config.target_pass_rate:
-                logger.info(f"    ✅ Target reached!")
-                all_iterations.append(SmokeIteration(
-                    iteration=cycle + 1,
-                    pass_rate=current_pass_rate,
-                    violations_count=len(violations),
-                    duration_ms=(time.time() - cycle_start) * 1000
-                ))
-                break
+                # 9. Rebuild Docker if repairs were made
+                # (a warm server session hot reloads them on the next smoke test)
+                if with_docker_rebuild and cycle_fixes and self._server_session is None:
+                    rebuild_ok = await self._rebuild_docker_no_cache(app_path)
+                    if rebuild_ok:
+                        await self._restart_container(app_path)
 
-            # 4. Check regression
-            if cycle > 0 and current_pass_rate < all_iterations[-1].pass_rate - self.config.convergence_epsilon:
-                logger.warning(f"    ⚠️ Regression detected! Rolling back...")
-                regression_detected = True
-                self._rollback_to(cycle - 1, app_path)
-                break
+                # 10. Record learning
+                if self.config.enable_learning:
+                    self._record_learning(violations, cycle_fixes, cycle + 1)
 
-            # 5. Check convergence
-            if cycle > 0 and abs(current_pass_rate - all_iterations[-1].pass_rate) < self.config.convergence_epsilon:
-                logger.info(f"    📈 Converged at {current_pass_rate:.1%}")
-                convergence_detected = True
                 all_iterations.append(SmokeIteration(
                     iteration=cycle + 1,
                     pass_rate=current_pass_rate,
                     violations_count=len(violations),
+                    repairs_applied=len(cycle_fixes),
+                    repairs_successful=cycle_successful,
                     duration_ms=(time.time() - cycle_start) * 1000
                 ))
-                break
-
-            # 6. Parse logs
-            stack_traces = []
-            if hasattr(smoke_result, 'server_logs') and smoke_result.server_logs:
-                stack_traces = self.log_parser.parse_logs(smoke_result.server_logs)
-                logger.info(f"    🔍 Found {len(stack_traces)} stack traces")
-
-            # 7. Classify errors
-            classified = self.error_classifier.classify_violations(violations, stack_traces)
-
-            # 8. Apply repairs with learned patterns priority
-            cycle_fixes = []
-            cycle_successful = 0
-
-            for strategy_type, vios in classified.items():
-                if not vios:
-                    continue
-
-                for violation in vios:
-                    # Try learned patterns first
-                    learned = self._get_learned_antipatterns(violation, stack_traces)
-                    if learned:
-                        fix = self._repair_with_learned_patterns(
-                            strategy_type, violation, stack_traces,
-                            app_path, application_ir, learned
-                        )
-                        if fix and fix.success:
-                            cycle_fixes.append(fix)
-                            cycle_successful += 1
-                            learned_patterns_applied += 1
-                            continue
-
-                    # Fallback to regular repair
-                    fix = await self._apply_repair_with_confidence(
-                        strategy_type, violation, stack_traces,
-                        app_path, application_ir, None
-                    )
-                    if fix:
-                        cycle_fixes.append(fix)
-                        if fix.success:
-                            cycle_successful += 1
-
-            total_repairs += len(cycle_fixes)
-            all_fixes.extend(cycle_fixes)
-
-            logger.info(f"    🔧 Applied {len(cycle_fixes)} repairs ({learned_patterns_applied} from learned patterns)")
-
-            # 9. Rebuild Docker if repairs were made
-            if with_docker_rebuild and cycle_fixes:
-                rebuild_ok = await self._rebuild_docker_no_cache(app_path)
-                if rebuild_ok:
-                    await self._restart_container(app_path)
-
-            # 10. Record learning
-            if self.config.enable_learning:
-                self._record_learning(violations, cycle_fixes, cycle + 1)
-
-            all_iterations.append(SmokeIteration(
-                iteration=cycle + 1,
-                pass_rate=current_pass_rate,
-                violations_count=len(violations),
-                repairs_applied=len(cycle_fixes),
-                repairs_successful=cycle_successful,
-                duration_ms=(time.time() - cycle_start) * 1000
-            ))
+        finally:
+            await self._close_server_session()
 
         total_duration = (time.time() - start_time) * 1000
 
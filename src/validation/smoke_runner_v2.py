@@ -23,6 +23,7 @@ from src.cognitive.ir.tests_model import (
     TestPriority,
     ExpectedOutcome,
 )
+from src.validation.smoke_scheduler import DEFAULT_SMOKE_CONCURRENCY, run_smoke_requests
 
 
 class ScenarioStatus(str, Enum):
@@ -74,7 +75,7 @@ class SmokeRunnerV2:
 
     Executes scenarios directly from TestsModelIR with:
     - Priority-based ordering (critical first)
-    - Parallel execution support
+    - Parallel execution support (dependency-aware, see smoke_scheduler)
     - Unified metrics for Code Repair
     """
 
@@ -84,11 +85,14 @@ class SmokeRunnerV2:
         base_url: str = "http://localhost:8000",
         timeout_seconds: float = 30.0,
         auth_token: Optional[str] = None,
+        max_concurrency: int = DEFAULT_SMOKE_CONCURRENCY,
     ):
         self.tests_model = tests_model
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout_seconds
         self.auth_token = auth_token
+        # Max scenario requests in flight (1 = strictly sequential)
+        self.max_concurrency = max_concurrency
 
     async def run(
         self,
@@ -117,15 +121,21 @@ class SmokeRunnerV2:
             report.completed_at = datetime.utcnow()
             return report
 
-        # Execute scenarios
+        # Execute scenarios on one pooled client
+        limits = httpx.Limits(
+            max_connections=max(1, self.max_concurrency),
+            max_keepalive_connections=max(1, self.max_concurrency),
+        )
         async with httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
+            limits=limits,
         ) as client:
             start_time = time.time()
 
-            for scenario in scenarios:
-                result = await self._execute_scenario(client, scenario)
+            for scenario, result in await self._execute_scenarios(
+                client, scenarios, stop_on_critical_failure
+            ):
                 report.results.append(result)
 
                 # Update counters
@@ -139,12 +149,6 @@ class SmokeRunnerV2:
                 else:
                     report.errors += 1
 
-                # Stop on critical failure if requested
-                if (stop_on_critical_failure and
-                    scenario.priority == TestPriority.CRITICAL and
-                    result.status != ScenarioStatus.PASSED):
-                    break
-
             report.total_duration_ms = (time.time() - start_time) * 1000
 
         # Calculate metrics
@@ -155,6 +159,41 @@ class SmokeRunnerV2:
 
         return report
 
+    async def _execute_scenarios(
+        self,
+        client: httpx.AsyncClient,
+        scenarios: List[TestScenarioIR],
+        stop_on_critical_failure: bool,
+    ) -> List[Tuple[TestScenarioIR, ScenarioResult]]:
+        """
+        Execute scenarios and return (scenario, result) pairs in scenario order.
+
+        With stop_on_critical_failure, critical scenarios (sorted first) run
+        sequentially so the run can stop at the first failing one, exactly as a
+        sequential run would. Remaining scenarios run concurrently.
+        """
+        executed: List[Tuple[TestScenarioIR, ScenarioResult]] = []
+        remaining = scenarios
+
+        if stop_on_critical_failure:
+            critical = [s for s in scenarios if s.priority == TestPriority.CRITICAL]
+            remaining = [s for s in scenarios if s.priority != TestPriority.CRITICAL]
+
+            for scenario in critical:
+                result = await self._execute_scenario(client, scenario)
+                executed.append((scenario, result))
+                if result.status != ScenarioStatus.PASSED:
+                    return executed
+
+        results = await run_smoke_requests(
+            remaining,
+            lambda s: (s.http_method, s.endpoint_path),
+            lambda s: self._execute_scenario(client, s),
+            self.max_concurrency,
+        )
+        executed.extend(zip(remaining, results, strict=True))
+        return executed
+
     def _get_ordered_scenarios(
         self,
         priority_filter: Optional[List[TestPriority]],
@@ -0,0 +1,115 @@
+"""
+Smoke Scheduler - Dependency-aware concurrent execution of smoke requests.
+
+Shared by RuntimeSmokeTestValidator (endpoints) and SmokeRunnerV2 (scenarios).
+
+Requests are grouped into chains that must run in order:
+- Requests on an entity that is mutated (POST/PUT/PATCH) form one chain in
+  input order, so create → read → update on the same entity stay ordered.
+- Requests on read-only entities are independent chains of one.
+- DELETE requests run in a second phase, after every other request, so rows
+  referenced across entities (seed data) are never deleted mid-run.
+
+Chains run concurrently under a shared concurrency cap. Results are
+returned in input order regardless of completion order.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Sequence, Tuple, TypeVar
+
+from src.cognitive.services.ir_code_correlator import PATH_PREFIXES, normalize_entity_key
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_SMOKE_CONCURRENCY = 8
+
+_MUTATING_METHODS = {"POST", "PUT", "PATCH"}
+
+
+def smoke_entity_key(path: str) -> str:
+    """
+    Derive the entity a request operates on from its path.
+
+    /products/{id} → product, /api/v1/carts/{id}/items → cart,
+    /categories → category (one plural suffix, see normalize_entity_key)
+    """
+    for part in path.lower().split("/"):
+        if part and not part.startswith("{") and part not in PATH_PREFIXES:
+            return normalize_entity_key(part)
+    return ""
+
+
+def plan_smoke_phases(
+    requests: Sequence[Tuple[str, str]],
+    max_concurrency: int = DEFAULT_SMOKE_CONCURRENCY,
+) -> List[List[List[int]]]:
+    """
+    Plan execution phases for (method, path) requests.
+
+    Returns:
+        Phases in execution order; each phase is a list of chains, each chain
+        a list of request indices to run sequentially. With max_concurrency <= 1
+        a single chain in input order is returned (fully sequential mode).
+    """
+    if max_concurrency <= 1:
+        return [[list(range(len(requests)))]] if requests else []
+
+    mutated_entities = {
+        smoke_entity_key(path)
+        for method, path in requests
+        if method.upper() in _MUTATING_METHODS
+    }
+
+    phases: List[List[List[int]]] = []
+    for deletes in (False, True):
+        chains: List[List[int]] = []
+        chain_by_entity = {}
+        for index, (method, path) in enumerate(requests):
+            if (method.upper() == "DELETE") != deletes:
+                continue
+            entity = smoke_entity_key(path)
+            if deletes or entity in mutated_entities:
+                if entity not in chain_by_entity:
+                    chain_by_entity[entity] = []
+                    chains.append(chain_by_entity[entity])
+                chain_by_entity[entity].append(index)
+            else:
+                chains.append([index])
+        if chains:
+            phases.append(chains)
+
+    return phases
+
+
+async def run_smoke_requests(
+    items: Sequence[T],
+    method_path: Callable[[T], Tuple[str, str]],
+    run_one: Callable[[T], Awaitable[R]],
+    max_concurrency: int = DEFAULT_SMOKE_CONCURRENCY,
+) -> List[R]:
+    """
+    Run `run_one` for every item following plan_smoke_phases.
+
+    Args:
+        items: Endpoints or scenarios to execute
+        method_path: Returns (HTTP method, path template) for an item
+        run_one: Coroutine executing a single item
+        max_concurrency: Maximum requests in flight
+
+    Returns:
+        Results in the same order as `items`
+    """
+    results: List[R] = [None] * len(items)  # type: ignore[list-item]
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run_chain(chain: List[int]) -> None:
+        for index in chain:
+            async with semaphore:
+                results[index] = await run_one(items[index])
+
+    phases = plan_smoke_phases([method_path(item) for item in items], max_concurrency)
+    for chains in phases:
+        await asyncio.gather(*(run_chain(chain) for chain in chains))
+
+    return results
@@ -0,0 +1,297 @@
+"""
+Smoke Server Session - Warm server reuse across smoke-repair iterations.
+
+RuntimeSmokeTestValidator.validate() builds Docker (--no-cache), runs the
+db-init service (migrations + seed) and tears everything down on every call.
+In the smoke → repair → retest loop that is 30-90s per iteration.
+
+A SmokeServerSession keeps the server running between iterations:
+- Repairs are applied by copying changed files into the running app container
+  and restarting only the app service (uvicorn apps simply restart the process,
+  their in-memory SQLite database is recreated on startup).
+- Database state is reset from a Postgres template database captured right
+  after the first seeded startup, instead of re-running the seed scripts.
+- A full restart (rebuild + reseed) happens only when it is actually required:
+  dependency, Docker, migration, seed or model-schema changes.
+
+Usage:
+    session = SmokeServerSession(smoke_validator)
+    await session.start()
+    result = await smoke_validator.validate(ir)   # server already running
+    ...apply repairs...
+    await session.refresh()                         # hot reload or restart
+    result = await smoke_validator.validate(ir)
+    await session.stop()
+"""
+import hashlib
+import logging
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+COMPOSE_FILE = "docker/docker-compose.yml"
+
+# Files whose changes cannot be hot reloaded (image, schema or seed data changes)
+FULL_RESTART_FILES = {
+    "requirements.txt",
+    "pyproject.toml",
+    "alembic.ini",
+    "docker/Dockerfile",
+    COMPOSE_FILE,
+    "scripts/seed_db.py",
+    "src/models/entities.py",
+}
+FULL_RESTART_DIRS = ("alembic/",)
+
+# Only these paths are copied into the app image (see generated Dockerfile)
+_IMAGE_DIRS = ("src/", "scripts/", "alembic/")
+_TRACKED_SUFFIXES = {".py", ".txt", ".toml", ".ini", ".yml", ".yaml", ".cfg"}
+_TRACKED_NAMES = {"Dockerfile"}
+
+
+def requires_full_restart(changed_files: List[str]) -> bool:
+    """
+    Check whether changed files need a full rebuild + reseed.
+
+    Args:
+        changed_files: Paths relative to the app root (posix separators)
+
+    Returns:
+        True if any change affects dependencies, the image or the DB schema
+    """
+    return any(
+        path in FULL_RESTART_FILES or path.startswith(FULL_RESTART_DIRS)
+        for path in changed_files
+    )
+
+
+class SmokeServerSession:
+    """
+    Keeps the smoke-test server of a RuntimeSmokeTestValidator warm.
+
+    While the session is active, validator.reuse_running_server is True so
+    validate() neither starts nor stops the server.
+    """
+
+    def __init__(self, smoke_validator, snapshot_suffix: str = "_smoke_snapshot"):
+        self.validator = smoke_validator
+        self.app_dir = Path(smoke_validator.app_dir)
+        self.snapshot_suffix = snapshot_suffix
+        self.active = False
+
+        self._fingerprints: Dict[str, str] = {}
+        self._db_name: Optional[str] = None
+        self._db_user: Optional[str] = None
+        self._snapshot_ready = False
+
+        # Stats for logging / tests
+        self.full_restarts = 0
+        self.hot_reloads = 0
+
+    @staticmethod
+    def supports(smoke_validator) -> bool:
+        """Only RuntimeSmokeTestValidator-like validators can be kept warm."""
+        return hasattr(smoke_validator, "reuse_running_server") and hasattr(smoke_validator, "app_dir")
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start the server (full build + seed) and capture the DB snapshot."""
+        await self._full_restart()
+        self.validator.reuse_running_server = True
+        self.active = True
+
+    async def refresh(self) -> str:
+        """
+        Bring the running server up to date with the code on disk.
+
+        Even without code changes the database is reset, since the previous
+        smoke run created and deleted rows.
+
+        Returns:
+            "hot_reload" or "full_restart"
+        """
+        if not self.active:
+            await self.start()
+            return "full_restart"
+
+        changed = self._changed_files()
+        if requires_full_restart(changed):
+            logger.info(f"    🔁 Full server restart required ({', '.join(sorted(changed)[:3])})")
+            await self._full_restart()
+            return "full_restart"
+
+        try:
+            await self._hot_reload(changed)
+            return "hot_reload"
+        except Exception as e:
+            logger.warning(f"    ⚠️ Hot reload failed ({e}), falling back to full restart")
+            await self._full_restart()
+            return "full_restart"
+
+    async def stop(self) -> None:
+        """Stop the server and release the validator."""
+        self.validator.reuse_running_server = False
+        if self.active:
+            self._drop_snapshot()
+            await self.validator._stop_server()
+        self.active = False
+        self._snapshot_ready = False
+
+    # =========================================================================
+    # Restart strategies
+    # =========================================================================
+
+    async def _full_restart(self) -> None:
+        """Rebuild and reseed via the validator, then snapshot the seeded DB."""
+        self._drop_snapshot()
+        await self.validator._start_server()
+        self.full_restarts += 1
+        self._fingerprints = self._fingerprint_app()
+        self._snapshot_ready = self._create_snapshot()
+        if self.validator._using_docker:
+            # Snapshotting stops the app container to release DB connections
+            await self.validator._wait_for_server()
+
+    async def _hot_reload(self, changed: List[str]) -> None:
+        """Apply changed files to the running server without rebuilding."""
+        if not self.validator._using_docker:
+            # uvicorn: restarting the process is cheap and resets the in-memory DB
+            await self.validator._stop_server()
+            await self.validator._start_uvicorn_server()
+        else:
+            if not self._snapshot_ready:
+                raise RuntimeError("no database snapshot to reset from")
+
+            for rel_path in changed:
+                if not rel_path.startswith(_IMAGE_DIRS):
+                    continue
+                if (self.app_dir / rel_path).exists():
+                    self._compose("cp", rel_path, f"app:/app/{rel_path}")
+                else:
+                    self._compose("exec", "-T", "app", "rm", "-f", f"/app/{rel_path}")
+
+            self._reset_database_state()
+            self._compose("start", "app")
+            await self.validator._wait_for_server()
+
+        self.hot_reloads += 1
+        self._fingerprints = self._fingerprint_app()
+        logger.info(f"    ♻️ Hot reloaded server ({len(changed)} changed file(s))")
+
+    # =========================================================================
+    # Database snapshot (Postgres template database)
+    # =========================================================================
+
+    def _create_snapshot(self) -> bool:
+        """Clone the freshly seeded database into a template database."""
+        if not self.validator._using_docker or not self._load_db_settings():
+            return False
+        try:
+            self._compose("stop", "app")
+            self._psql(
+                f'DROP DATABASE IF EXISTS "{self._snapshot_name}"',
+                f'CREATE DATABASE "{self._snapshot_name}" TEMPLATE "{self._db_name}"',
+            )
+            self._compose("start", "app")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not snapshot smoke database: {e}")
+            try:
+                self._compose("start", "app")
+            except Exception:
+                pass
+            return False
+
+    def _reset_database_state(self) -> None:
+        """
+        Restore the seeded database from the template snapshot.
+
+        Leaves the app container stopped; the caller starts it again.
+        """
+        self._compose("stop", "app")
+        self._psql(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            f"WHERE datname = '{self._db_name}' AND pid <> pg_backend_pid()",
+            f'DROP DATABASE IF EXISTS "{self._db_name}"',
+            f'CREATE DATABASE "{self._db_name}" TEMPLATE "{self._snapshot_name}"',
+        )
+
+    def _drop_snapshot(self) -> None:
+        if not self._snapshot_ready:
+            return
+        try:
+            self._psql(f'DROP DATABASE IF EXISTS "{self._snapshot_name}"')
+        except Exception as e:
+            logger.debug(f"Could not drop smoke snapshot: {e}")
+        self._snapshot_ready = False
+
+    @property
+    def _snapshot_name(self) -> str:
+        return f"{self._db_name}{self.snapshot_suffix}"
+
+    def _load_db_settings(self) -> bool:
+        """Read POSTGRES_DB / POSTGRES_USER from the generated compose file."""
+        compose_file = self.app_dir / COMPOSE_FILE
+        if not compose_file.exists():
+            return False
+        content = compose_file.read_text()
+        db_match = re.search(r"POSTGRES_DB:\s*['\"]?([\w-]+)", content)
+        user_match = re.search(r"POSTGRES_USER:\s*['\"]?([\w-]+)", content)
+        if not db_match or not user_match:
+            return False
+        self._db_name = db_match.group(1)
+        self._db_user = user_match.group(1)
+        return True
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _compose(self, *args: str) -> subprocess.CompletedProcess:
+        cmd = ["docker", "compose", "-f", COMPOSE_FILE, *args]
+        result = subprocess.run(
+            cmd, cwd=str(self.app_dir), capture_output=True, text=True, timeout=60
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(cmd)} failed: {(result.stderr or result.stdout)[:300]}")
+        return result
+
+    def _psql(self, *statements: str) -> None:
+        # One -c per statement: DROP/CREATE DATABASE cannot run in a transaction block
+        args = ["exec", "-T", "postgres", "psql", "-U", self._db_user, "-d", "postgres",
+                "-v", "ON_ERROR_STOP=1"]
+        for statement in statements:
+            args += ["-c", statement]
+        self._compose(*args)
+
+    def _fingerprint_app(self) -> Dict[str, str]:
+        """Content hash of every file that can affect the running server."""
+        fingerprints = {}
+        for path in self.app_dir.rglob("*"):
+            if not path.is_file():
+                continue
+            if path.suffix not in _TRACKED_SUFFIXES and path.name not in _TRACKED_NAMES:
+                continue
+            rel_path = path.relative_to(self.app_dir).as_posix()
+            if "__pycache__" in rel_path or rel_path.startswith((".", "venv/", ".venv/")):
+                continue
+            try:
+                fingerprints[rel_path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                continue
+        return fingerprints
+
+    def _changed_files(self) -> List[str]:
+        current = self._fingerprint_app()
+        changed = {
+            path for path, digest in current.items()
+            if self._fingerprints.get(path) != digest
+        }
+        changed.update(path for path in self._fingerprints if path not in current)
+        return sorted(changed)
@@ -32,7 +32,7 @@ class TestPatternBankInitialization:
 
     def test_pattern_bank_initialization_default_settings(self):
         """Test PatternBank initializes with default settings from config."""
-        with patch('src.cognitive.patterns.pattern_bank.SentenceTransformer'):
+        with patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer'):
             bank = PatternBank()
 
             assert bank is not None
@@ -43,13 +43,13 @@ class TestPatternBankInitialization:
 
     def test_pattern_bank_initialization_custom_collection(self):
         """Test PatternBank with custom collection name."""
-        with patch('src.cognitive.patterns.pattern_bank.SentenceTransformer'):
+        with patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer'):
             bank = PatternBank(collection_name="custom_patterns")
 
             assert bank.collection_name == "custom_patterns"
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_qdrant_client_connection_successful(self, mock_st, mock_qdrant_client):
         """Test Qdrant client connects successfully."""
         mock_client = Mock()
@@ -65,7 +65,7 @@ class TestPatternBankInitialization:
         mock_client.get_collections.assert_called_once()
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_qdrant_client_connection_failure_raises_error(self, mock_st, mock_qdrant_client):
         """Test connection failure raises appropriate error."""
         mock_client = Mock()
@@ -82,7 +82,7 @@ class TestCollectionManagement:
     """Test Qdrant collection creation and management."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_collection_creation_with_correct_parameters(self, mock_st, mock_qdrant_client):
         """Test collection created with 768 dimensions and cosine distance."""
         mock_client = Mock()
@@ -101,7 +101,7 @@ class TestCollectionManagement:
         assert call_kwargs['collection_name'] == "semantic_patterns"
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_collection_already_exists_no_error(self, mock_st, mock_qdrant_client):
         """Test creating existing collection doesn't raise error."""
         mock_client = Mock()
@@ -123,7 +123,7 @@ class TestCollectionManagement:
         mock_client.create_collection.assert_not_called()
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_collection_deletion_successful(self, mock_st, mock_qdrant_client):
         """Test collection can be deleted."""
         mock_client = Mock()
@@ -145,7 +145,7 @@ class TestPatternStorage:
     """Test pattern storage with validation."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_store_pattern_with_valid_success_rate(self, mock_st, mock_qdrant_client):
         """Test storing pattern with success_rate ≥ 95%."""
         mock_encoder = Mock()
@@ -183,7 +183,7 @@ class TestPatternStorage:
         assert pattern_id.startswith("pat_")
         mock_client.upsert.assert_called_once()
 
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_store_pattern_rejects_low_success_rate(self, mock_st):
         """Test storing pattern with success_rate < 95% raises error."""
         bank = PatternBank()
@@ -206,7 +206,7 @@ class TestPatternStorage:
             )
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_store_pattern_includes_correct_metadata(self, mock_st, mock_qdrant_client):
         """Test stored pattern includes all required metadata."""
         mock_encoder = Mock()
@@ -253,7 +253,7 @@ class TestPatternRetrieval:
     """Test pattern retrieval with similarity search."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_search_patterns_returns_top_k_results(self, mock_st, mock_qdrant_client):
         """Test search returns requested number of results."""
         mock_encoder = Mock()
@@ -305,7 +305,7 @@ class TestPatternRetrieval:
         assert len(results) == 3
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_search_patterns_filters_by_similarity_threshold(self, mock_st, mock_qdrant_client):
         """Test search filters results by ≥85% similarity threshold."""
         mock_encoder = Mock()
@@ -357,7 +357,7 @@ class TestPatternRetrieval:
             assert pattern.similarity_score >= 0.85
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_search_patterns_returns_sorted_by_similarity(self, mock_st, mock_qdrant_client):
         """Test search results sorted by similarity (descending)."""
         mock_encoder = Mock()
@@ -416,7 +416,7 @@ class TestHybridSearch:
     """Test hybrid search combining vector and metadata filtering."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_hybrid_search_with_domain_filter(self, mock_st, mock_qdrant_client):
         """Test hybrid search filters by domain."""
         mock_encoder = Mock()
@@ -473,7 +473,7 @@ class TestPatternMetrics:
     """Test pattern metrics tracking."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_get_pattern_metrics_returns_aggregated_stats(self, mock_st, mock_qdrant_client):
         """Test get_pattern_metrics returns comprehensive statistics."""
         mock_client = Mock()
@@ -516,7 +516,7 @@ class TestPatternMetrics:
         assert metrics['total_patterns'] == 10
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_update_pattern_success_rate(self, mock_st, mock_qdrant_client):
         """Test updating success rate for existing pattern."""
         mock_client = Mock()
@@ -538,7 +538,7 @@ class TestPatternMetrics:
         assert call_args.kwargs['payload']['success_rate'] == 0.98
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_domain_distribution_tracks_all_domains(self, mock_st, mock_qdrant_client):
         """Test domain distribution tracks patterns across all domains."""
         mock_client = Mock()
@@ -582,7 +582,7 @@ class TestAutoConnection:
     """Test automatic connection when is_connected=False."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_create_collection_auto_connects_if_not_connected(self, mock_st, mock_qdrant_client):
         """Test that create_collection calls connect() if not connected."""
         mock_encoder = Mock()
@@ -604,7 +604,7 @@ class TestAutoConnection:
             mock_connect.assert_called_once()
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_delete_collection_auto_connects_if_not_connected(self, mock_st, mock_qdrant_client):
         """Test that delete_collection calls connect() if not connected."""
         mock_encoder = Mock()
@@ -627,7 +627,7 @@ class TestExceptionHandling:
     """Test exception handling and error cases."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_create_collection_handles_exception(self, mock_st, mock_qdrant_client):
         """Test that create_collection raises exception on failure."""
         mock_encoder = Mock()
@@ -648,7 +648,7 @@ class TestExceptionHandling:
             bank.create_collection()  # This should fail
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_increment_usage_count_handles_exception(self, mock_st, mock_qdrant_client):
         """Test that _increment_usage_count handles exception gracefully."""
         mock_encoder = Mock()
@@ -669,7 +669,7 @@ class TestGetPatternById:
     """Test pattern retrieval by ID."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_get_pattern_by_id_returns_pattern_if_found(self, mock_st, mock_qdrant_client):
         """Test get_pattern_by_id returns pattern when found."""
         mock_encoder = Mock()
@@ -701,7 +701,7 @@ class TestGetPatternById:
         assert pattern.code == "def test(): pass"
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_get_pattern_by_id_returns_none_if_not_found(self, mock_st, mock_qdrant_client):
         """Test get_pattern_by_id returns None when not found."""
         mock_encoder = Mock()
@@ -719,7 +719,7 @@ class TestGetPatternById:
         assert pattern is None
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_get_pattern_by_id_handles_exception(self, mock_st, mock_qdrant_client):
         """Test get_pattern_by_id returns None on exception."""
         mock_encoder = Mock()
@@ -737,7 +737,7 @@ class TestGetPatternById:
         assert pattern is None  # Returns None on error
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_get_pattern_by_id_auto_connects_if_not_connected(self, mock_st, mock_qdrant_client):
         """Test get_pattern_by_id auto-connects if needed."""
         mock_encoder = Mock()
@@ -761,7 +761,7 @@ class TestVectorSearch:
     """Test internal vector search method."""
 
     @patch('src.cognitive.patterns.pattern_bank.QdrantClient')
-    @patch('src.cognitive.patterns.pattern_bank.SentenceTransformer')
+    @patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer')
     def test_vector_search_returns_results(self, mock_st, mock_qdrant_client):
         """Test _vector_search returns search results."""
         mock_encoder = Mock()
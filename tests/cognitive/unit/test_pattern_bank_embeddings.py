@@ -0,0 +1,127 @@
+"""
+Unit Tests for PatternBank query embeddings and batched hybrid search
+
+Test Coverage:
+- (model, text) embedding memo
+- One forward pass for a batch of texts
+- hybrid_search_many: one Qdrant batch request, per-query results
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+import torch
+
+from src.cognitive.patterns.pattern_bank import PatternBank
+from src.cognitive.signatures.semantic_signature import SemanticTaskSignature
+
+
+def _signature(purpose):
+    return SemanticTaskSignature(purpose=purpose, intent="implement", inputs={}, outputs={}, domain="api")
+
+
+def _hit(pattern_id, score, domain="api"):
+    return SimpleNamespace(
+        id=pattern_id,
+        score=score,
+        payload={
+            "pattern_id": pattern_id,
+            "purpose": f"purpose {pattern_id}",
+            "code": "def f(): pass",
+            "domain": domain,
+            "success_rate": 1.0,
+        },
+    )
+
+
+@pytest.fixture
+def bank():
+    def forward(input_ids, attention_mask):
+        # CLS embedding = first token id, so each text gets a distinct vector
+        return SimpleNamespace(last_hidden_state=input_ids.unsqueeze(-1).float().repeat(1, 1, 4))
+
+    def tokenize(texts, **kwargs):
+        ids = torch.tensor([[len(text), 0] for text in texts])
+        return {"input_ids": ids, "attention_mask": torch.ones_like(ids)}
+
+    with patch('src.cognitive.patterns.pattern_bank.load_transformers_tokenizer') as mock_tokenizer, \
+            patch('src.cognitive.patterns.pattern_bank.load_transformers_model') as mock_model, \
+            patch('src.cognitive.patterns.pattern_bank.QdrantClient') as mock_qdrant:
+        mock_tokenizer.return_value = Mock(side_effect=tokenize)
+        mock_model.return_value = Mock(side_effect=forward)
+        mock_qdrant.return_value = Mock(**{"retrieve.return_value": []})
+
+        bank = PatternBank(enable_dag_ranking=False, enable_dual_embeddings=False)
+        bank.connect()
+        yield bank
+        bank.usage_tracker.stop()
+
+
+class TestEmbeddingMemo:
+    """Test (model, text) memoized, batched encoding."""
+
+    def test_batch_is_one_forward_pass_and_memoized(self, bank):
+        vectors = bank._encode_many(["ab", "abcd", "ab"])
+
+        assert vectors == [[2.0] * 4, [4.0] * 4, [2.0] * 4]
+        assert bank.model.call_count == 1
+        assert bank.tokenizer.call_args.args[0] == ["ab", "abcd"]
+
+        # Cached texts are not re-encoded; only the new one is
+        assert bank._encode("abcd") == [4.0] * 4
+        bank._encode_many(["ab", "xyz"])
+        assert bank.model.call_count == 2
+        assert bank.tokenizer.call_args.args[0] == ["xyz"]
+
+    def test_memo_is_bounded(self, bank):
+        bank._embedding_cache_size = 2
+        bank._encode_many(["a", "bb", "ccc"])
+
+        assert len(bank._embedding_cache) == 2
+        assert (bank.embedding_model_name, "a") not in bank._embedding_cache
+
+
+class TestHybridSearchMany:
+    """Test batched hybrid search."""
+
+    def test_one_batch_request_per_call(self, bank):
+        bank.client.search_batch.return_value = [
+            [_hit("p1", 0.5), _hit("p2", 0.9)],
+            [],
+        ]
+
+        results = bank.hybrid_search_many(
+            [_signature("first"), _signature("second")],
+            domains=["api", None],
+            production_ready=True,
+            top_k=10,
+        )
+
+        bank.client.search_batch.assert_called_once()
+        bank.client.search.assert_not_called()
+        assert bank.model.call_count == 1
+
+        requests = bank.client.search_batch.call_args.kwargs["requests"]
+        assert [r.limit for r in requests] == [10, 10]
+        assert len(requests[0].filter.must) == 2  # domain + production_ready
+        assert len(requests[1].filter.must) == 1  # production_ready only
+
+        assert [p.pattern_id for p in results[0]] == ["p2", "p1"]
+        assert results[1] == []
+        assert bank.usage_tracker.pending() == {"p1": 1, "p2": 1}
+
+    def test_results_match_hybrid_search(self, bank):
+        hits = [_hit("p1", 0.8), _hit("p2", 0.7, domain="other")]
+        bank.client.search_batch.return_value = [hits]
+        bank.client.search.return_value = hits
+
+        batched = bank.hybrid_search_many([_signature("query")], domains=["api"])[0]
+        single = bank.hybrid_search(_signature("query"), domain="api")
+
+        assert [(p.pattern_id, p.similarity_score) for p in batched] == \
+            [(p.pattern_id, p.similarity_score) for p in single]
+
+    def test_domains_must_align(self, bank):
+        with pytest.raises(ValueError):
+            bank.hybrid_search_many([_signature("a"), _signature("b")], domains=["api"])
@@ -0,0 +1,123 @@
+"""
+Unit Tests for PatternBank's write-free read path
+
+Test Coverage:
+- PatternUsageTracker buffering and batched flushes
+- Failed flushes are retried
+- PatternBank.close() flushes and stops its tracker
+- DAG ranking scores fetched in one UNWIND query and cached
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.cognitive.patterns.pattern_bank import NEUTRAL_DAG_SCORE, PatternBank
+from src.cognitive.patterns.usage_tracker import PatternUsageTracker
+
+
+def _point(point_id, usage_count):
+    return SimpleNamespace(id=point_id, payload={"usage_count": usage_count})
+
+
+class TestPatternUsageTracker:
+    """Test buffered usage_count increments."""
+
+    def test_record_is_buffered_and_flushed_in_one_batch(self):
+        client = Mock()
+        client.retrieve.return_value = [_point("a", 10), _point("b", 0)]
+        tracker = PatternUsageTracker(client, "semantic_patterns")
+
+        tracker.record(["a", "b"])
+        tracker.record(["a"])
+        client.retrieve.assert_not_called()
+        assert tracker.pending() == {"a": 2, "b": 1}
+
+        assert tracker.flush() == 2
+        client.retrieve.assert_called_once()
+        assert sorted(client.retrieve.call_args.kwargs["ids"]) == ["a", "b"]
+
+        operations = client.batch_update_points.call_args.kwargs["update_operations"]
+        updates = {op.set_payload.points[0]: op.set_payload.payload["usage_count"] for op in operations}
+        assert updates == {"a": 12, "b": 1}
+        assert tracker.pending() == {}
+
+    def test_failed_flush_keeps_increments(self):
+        client = Mock()
+        client.retrieve.side_effect = Exception("Qdrant down")
+        tracker = PatternUsageTracker(client, "semantic_patterns")
+
+        tracker.record(["a"])
+        assert tracker.flush() == 0
+        tracker.record(["a"])
+        assert tracker.pending() == {"a": 2}
+
+    def test_flush_without_pending_does_no_io(self):
+        client = Mock()
+        tracker = PatternUsageTracker(client, "semantic_patterns")
+
+        assert tracker.flush() == 0
+        client.retrieve.assert_not_called()
+
+    def test_bank_close_flushes_and_stops_the_tracker(self):
+        with patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer'), \
+                patch('src.cognitive.patterns.pattern_bank.QdrantClient') as mock_qdrant, \
+                patch('src.cognitive.patterns.usage_tracker.atexit') as mock_atexit:
+            client = mock_qdrant.return_value
+            client.retrieve.return_value = [_point("a", 1)]
+            bank = PatternBank(enable_dag_ranking=False, enable_dual_embeddings=False)
+            bank.connect()
+            tracker = bank.usage_tracker
+            tracker.record(["a"])
+
+            bank.close()
+            bank.close()  # idempotent
+
+        assert not tracker._thread.is_alive()
+        client.batch_update_points.assert_called_once()
+        client.close.assert_called_once()
+        mock_atexit.unregister.assert_called_once_with(tracker.stop)
+        assert bank.usage_tracker is None and bank.is_connected is False
+
+
+class TestDagRankingScores:
+    """Test batched, cached DAG ranking lookups."""
+
+    @pytest.fixture
+    def bank(self):
+        with patch('src.cognitive.patterns.pattern_bank.load_sentence_transformer'), \
+                patch('src.cognitive.patterns.pattern_bank.load_transformers_tokenizer'), \
+                patch('src.cognitive.patterns.pattern_bank.load_transformers_model'), \
+                patch('src.cognitive.patterns.pattern_bank.DAG_RANKING_AVAILABLE', True), \
+                patch('src.cognitive.patterns.pattern_bank.Neo4jPatternClient', create=True) as mock_neo4j:
+            mock_neo4j.return_value = Mock(_driver=object())
+            yield PatternBank(enable_dag_ranking=True, enable_dual_embeddings=False)
+
+    def test_scores_fetched_in_one_query_and_cached(self, bank):
+        bank.neo4j_client._execute_query.return_value = [
+            {"pattern_id": "p1", "base_score": 0.8, "executions": []},
+            {"pattern_id": "p2", "base_score": 0.6, "executions": [{"success": False, "timestamp": 0}]},
+        ]
+
+        scores = bank._get_dag_ranking_scores(["p1", "p2", "p3", None, "p1"])
+
+        assert scores == {"p1": 0.8, "p2": pytest.approx(0.55), "p3": NEUTRAL_DAG_SCORE}
+        bank.neo4j_client._execute_query.assert_called_once()
+        query, params = bank.neo4j_client._execute_query.call_args.args
+        assert "UNWIND $pattern_ids" in query
+        assert params == {"pattern_ids": ["p1", "p2", "p3"]}
+
+        # Second lookup is served from the TTL cache
+        assert bank._get_dag_ranking_score("p2") == pytest.approx(0.55)
+        bank.neo4j_client._execute_query.assert_called_once()
+
+    def test_errors_fall_back_to_neutral_and_are_not_cached(self, bank):
+        bank.neo4j_client._execute_query.side_effect = Exception("Neo4j down")
+        assert bank._get_dag_ranking_scores(["p1"]) == {"p1": NEUTRAL_DAG_SCORE}
+
+        bank.neo4j_client._execute_query.side_effect = None
+        bank.neo4j_client._execute_query.return_value = [
+            {"pattern_id": "p1", "base_score": 0.9, "executions": []},
+        ]
+        assert bank._get_dag_ranking_scores(["p1"]) == {"p1": 0.9}
@@ -4099,8 +4099,8 @@ Once running, visit:
             # Generate TestsModelIR deterministically
             tests_model = generate_tests_ir(self.application_ir)
 
-            # Update ApplicationIR with tests model
-            self.application_ir.tests_model = tests_model
+            # Update ApplicationIR with tests model (the cached IR is shared: copy, don't mutate)
+            self.application_ir = self.application_ir.model_copy(update={"tests_model": tests_model})
 
             # Save TestsModelIR for debugging
             tests_ir_path = self.output_path / "tests_model_ir.json"
@@ -4511,11 +4511,13 @@ Once running, visit:
                 print(f"      Step 6: Re-validating compliance...")
 
             try:
-                # Use validate_from_app() to get real compliance after repair
+                # Re-validate only what the repair touched (same result as validate_from_app())
                 # Bug #49 Fix: Use ApplicationIR instead of legacy spec_requirements
-                new_compliance_report = self.compliance_validator.validate_from_app(
+                new_compliance_report = self.compliance_validator.validate_from_app_incremental(
                     spec_requirements=self.application_ir,
-                    output_path=self.output_path
+                    output_path=self.output_path,
+                    changed_files=[Path(f).resolve() for f in repair_result.repaired_files],
+                    previous_report=current_compliance_report,
                 )
                 new_compliance = new_compliance_report.overall_compliance
 
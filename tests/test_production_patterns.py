@@ -18,6 +18,7 @@ from src.cognitive.patterns.production_patterns import (
     get_category_by_domain,
     get_patterns_by_category,
     get_composition_order,
+    get_composition_waves,
     validate_category_config,
 )
 
@@ -217,3 +218,20 @@ def test_test_infrastructure_patterns():
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_composition_waves_respect_dependencies(monkeypatch):
+    """Test that categories are scheduled after their dependencies."""
+    # No declared dependencies: one wave in composition order
+    assert get_composition_waves() == [get_composition_order()]
+
+    monkeypatch.setitem(
+        PRODUCTION_PATTERN_CATEGORIES,
+        "api_routes",
+        {**PRODUCTION_PATTERN_CATEGORIES["api_routes"], "depends_on": ["business_logic"]},
+    )
+    waves = get_composition_waves(["core_config", "business_logic", "api_routes"])
+    assert waves == [["core_config", "business_logic"], ["api_routes"]]
+
+    # Dependencies outside the scheduled categories are ignored
+    assert get_composition_waves(["api_routes"]) == [["api_routes"]]
@@ -0,0 +1,135 @@
+"""
+Unit tests for MetricsCollector streaming histograms and exposition cache.
+"""
+
+import random
+import threading
+
+import pytest
+
+from src.observability import MetricsCollector, QuantileSketch, StreamingHistogram
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+def test_sketch_quantiles_within_relative_accuracy(q):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-3, 1.2) for _ in range(20000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    exact = _exact_quantile(values, q)
+    assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_sketch_merge_matches_single_sketch():
+    left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i in range(1, 5001):
+        (left if i % 2 else right).add(i / 1000)
+        combined.add(i / 1000)
+
+    left.merge(right)
+
+    assert left.count == combined.count
+    assert left.quantile(0.99) == combined.quantile(0.99)
+
+
+def test_histogram_memory_is_bounded():
+    histogram = StreamingHistogram()
+    sketch = histogram.sketch
+    sketch.max_bins = 64
+
+    for i in range(100000):
+        histogram.observe(10 ** (i % 12 - 6) * (1 + i % 97))
+
+    assert sketch.num_bins <= 64
+    assert histogram.count == 100000
+    assert histogram.cumulative_buckets()[-1] == ("+Inf", 100000)
+
+
+def test_collector_histogram_stats_and_buckets():
+    metrics = MetricsCollector()
+    for ms in range(1, 1001):
+        metrics.observe_histogram("latency_seconds", ms / 1000, labels={"route": "/a"})
+
+    stats = metrics.get_histogram_stats("latency_seconds", {"route": "/a"})
+    assert stats["count"] == 1000
+    assert stats["min"] == 0.001 and stats["max"] == 1.0
+    assert stats["p99"] == pytest.approx(0.99, rel=0.02)
+    assert metrics.get_histogram_stats("missing")["count"] == 0
+
+    text = metrics.export_prometheus()
+    assert 'latency_seconds_bucket{le="0.1",route="/a"} 100' in text
+    assert 'latency_seconds_bucket{le="+Inf",route="/a"} 1000' in text
+    assert 'latency_seconds_count{route="/a"} 1000' in text
+
+
+def test_export_only_rerenders_changed_series(monkeypatch):
+    metrics = MetricsCollector()
+    metrics.increment_counter("requests_total", labels={"method": "GET"}, help_text="Requests")
+    metrics.set_gauge("in_progress", 1)
+
+    first = metrics.export_prometheus()
+    assert metrics.export_prometheus() is first
+
+    rendered = []
+    original = metrics._render_series
+    monkeypatch.setattr(metrics, "_render_series", lambda *a: rendered.append(a) or original(*a))
+
+    metrics.increment_counter("requests_total", labels={"method": "GET"})
+    text = metrics.export_prometheus()
+
+    assert len(rendered) == 1
+    assert 'requests_total{method="GET"} 2.0' in text
+    assert "in_progress 1" in text
+
+
+def test_concurrent_counter_increments():
+    metrics = MetricsCollector()
+
+    def work(worker):
+        for i in range(5000):
+            metrics.increment_counter("hits_total", labels={"shard": str(i % 4)})
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(metrics.get_counter("hits_total", {"shard": str(s)}) for s in range(4)) == 40000
+
+
+def test_concurrent_updates_and_exports_render_every_series():
+    metrics = MetricsCollector()
+    stop = threading.Event()
+
+    def work(worker):
+        for i in range(2000):
+            metrics.increment_counter(
+                f"worker_{worker}_total", labels={"n": str(i % 50)}, help_text=f"Worker {worker} ({i % 3})"
+            )
+
+    def scrape():
+        while not stop.is_set():
+            metrics.export_prometheus()
+
+    scraper = threading.Thread(target=scrape)
+    scraper.start()
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop.set()
+    scraper.join()
+
+    text = metrics.export_prometheus()
+    for worker in range(8):
+        assert text.count(f"# HELP worker_{worker}_total Worker {worker} (1)") == 50
+        assert f'worker_{worker}_total{{n="49"}} 40.0' in text
@@ -0,0 +1,70 @@
+"""
+Unit tests for CrossEncoderReranker candidate pruning and score caching.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.rag.cross_encoder_reranker import CrossEncoderReranker
+from src.rag.retriever import RetrievalResult
+
+
+def _result(example_id, code, similarity):
+    return RetrievalResult(id=example_id, code=code, metadata={}, similarity=similarity)
+
+
+@pytest.fixture
+def reranker():
+    reranker = CrossEncoderReranker(top_k=2, max_candidates=3, score_margin=0.3, cache_size=16)
+    reranker.model = Mock()
+    # Longer code scores higher
+    reranker.model.predict.side_effect = lambda pairs, show_progress_bar: np.array(
+        [float(len(code)) for _, code in pairs]
+    )
+    reranker._model_loaded = True
+    return reranker
+
+
+def test_scores_only_candidates_within_margin_in_length_order(reranker):
+    results = [
+        _result("a", "x" * 5, 0.9),
+        _result("b", "x" * 30, 0.8),
+        _result("c", "x" * 10, 0.7),
+        _result("d", "x" * 99, 0.2),  # outside margin
+    ]
+
+    reranked = reranker.rerank("query", results)
+
+    scored = [code for _, code in reranker.model.predict.call_args.args[0]]
+    assert scored == ["x" * 5, "x" * 10, "x" * 30]
+    assert [r.id for r in reranked] == ["b", "c"]
+    assert reranked[0].metadata["cross_encoder_score"] == 30.0
+
+
+def test_pair_scores_cached_by_query_and_document_version(reranker):
+    results = [_result("a", "def a(): pass", 0.9), _result("b", "def b(): pass", 0.8)]
+
+    reranker.rerank("query", results)
+    reranker.rerank("query", results)
+    assert reranker.model.predict.call_count == 1
+
+    results[0].code = "def a(): return 1"  # new version of document "a"
+    reranker.rerank("query", results)
+    assert [code for _, code in reranker.model.predict.call_args.args[0]] == ["def a(): return 1"]
+
+    reranker.rerank("other query", results)
+    assert reranker.model.predict.call_count == 3
+
+
+def test_switching_backend_reloads_model_and_clears_cache(reranker):
+    reranker.rerank("query", [_result("a", "code", 0.9)])
+
+    reranker.set_backend("onnx-int8")
+
+    assert reranker.backend == "onnx-int8"
+    assert reranker.model is None and not reranker._model_loaded
+    assert len(reranker._score_cache) == 0
+    with pytest.raises(ValueError):
+        reranker.set_backend("tensorrt")
@@ -0,0 +1,62 @@
+"""
+Unit tests for MultiCollectionManager parallel search.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.rag.multi_collection_manager import RRF_K, MultiCollectionManager
+
+
+def _hit(example_id, similarity):
+    return {"id": example_id, "code": f"# {example_id}", "metadata": {}, "similarity": similarity}
+
+
+@pytest.fixture
+def manager():
+    embedding_model = Mock()
+    embedding_model.embed_text.return_value = [0.1, 0.2]
+    stores = {name: Mock() for name in ("devmatrix_curated", "devmatrix_project_code", "devmatrix_standards")}
+
+    with patch("src.rag.multi_collection_manager.VectorStore") as mock_store:
+        mock_store.side_effect = lambda model, collection_name: stores[collection_name]
+        yield MultiCollectionManager(embedding_model, mode="parallel")
+
+
+def test_parallel_search_embeds_once_and_fuses_with_rrf(manager):
+    manager.curated.search.return_value = [_hit("c1", 0.6), _hit("shared", 0.5)]
+    manager.project_code.search.return_value = [_hit("shared", 0.7), _hit("p1", 0.2)]  # p1 below threshold
+    manager.standards.search.return_value = [_hit("s1", 0.9)]
+
+    results = manager.search("create user endpoint", top_k=3)
+
+    manager.embedding_model.embed_text.assert_called_once()
+    for store in (manager.curated, manager.project_code, manager.standards):
+        assert store.search.call_args.kwargs["query_embedding"] == [0.1, 0.2]
+
+    # "shared" appears in two collections: its reciprocal ranks add up
+    assert [r.id for r in results] == ["shared", "s1", "c1"]
+    assert results[0].score == pytest.approx(1 / (RRF_K + 2) + 1 / (RRF_K + 1))
+
+
+def test_calibrated_fusion_rescales_by_collection_threshold(manager):
+    manager.curated.search.return_value = [_hit("c1", 0.6)]
+    manager.project_code.search.return_value = [_hit("p1", 0.6)]
+    manager.standards.search.return_value = []
+
+    results = manager.search_parallel("query", top_k=2, fusion="calibrated")
+
+    # Same similarity, but further above the lenient project threshold
+    assert [r.id for r in results] == ["p1", "c1"]
+
+
+def test_early_cutoff_when_curated_satisfies_top_k(manager):
+    manager.curated.search.return_value = [_hit("c1", 0.95), _hit("c2", 0.9), _hit("c3", 0.3)]
+    manager.project_code.search.return_value = [_hit("p1", 0.99)]
+    manager.standards.search.side_effect = RuntimeError("not awaited")
+
+    results = manager.search_parallel("query", top_k=2, early_cutoff=0.85)
+
+    assert [r.id for r in results] == ["c1", "c2"]
+    assert all(r.collection == "curated" for r in results)
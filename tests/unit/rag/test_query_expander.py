@@ -0,0 +1,31 @@
+"""
+Unit tests for QueryExpander memoization and variant deduplication.
+"""
+
+from src.rag.query_expander import QueryExpander
+
+
+def test_expansion_is_memoized():
+    expander = QueryExpander(cache_size=2)
+    calls = []
+    original = expander._expand_query
+    expander._expand_query = lambda query, max_variants: calls.append(query) or original(query, max_variants)
+
+    first = expander.expand_query("express error handling")
+    first.append("mutated by caller")
+    second = expander.expand_query("express error handling")
+
+    assert calls == ["express error handling"]
+    assert second[0] == "express error handling"
+    assert "mutated by caller" not in second
+
+
+def test_deduplicate_variants_keeps_original_and_distinct_variants():
+    expander = QueryExpander()
+    variants = ["original", "near duplicate", "distinct", "duplicate of distinct"]
+    embeddings = [[1.0, 0.0], [0.999, 0.04], [0.0, 1.0], [0.01, 0.999]]
+
+    kept, kept_embeddings = expander.deduplicate_variants(variants, embeddings, threshold=0.95)
+
+    assert kept == ["original", "distinct"]
+    assert kept_embeddings == [[1.0, 0.0], [0.0, 1.0]]
@@ -399,6 +399,66 @@ class TestCaching:
         assert len(retriever.cache) == 0
 
 
+class TestQueryExpansion:
+    """Test expanded retrieval."""
+
+    def test_variants_embedded_once_and_deduplicated(self, mock_vector_store):
+        """Near-duplicate variants are dropped; the rest reuse their batched embedding."""
+        retriever = Retriever(
+            vector_store=mock_vector_store,
+            enable_v2_caching=False,
+            enable_cross_encoder_reranking=False,
+        )
+        retriever._query_expander.expand_query = Mock(
+            return_value=["fastapi auth", "fast api auth", "fastapi auth jwt"]
+        )
+        mock_vector_store.embedding_model.embed_batch.return_value = [
+            [1.0, 0.0],
+            [0.99, 0.01],  # near-duplicate of the original
+            [0.0, 1.0],
+        ]
+        mock_vector_store.search_with_metadata.side_effect = [
+            [{"id": "id1", "code": "a", "metadata": {}, "similarity": 0.7}],
+            [
+                {"id": "id1", "code": "a", "metadata": {}, "similarity": 0.9},
+                {"id": "id2", "code": "b", "metadata": {}, "similarity": 0.8},
+            ],
+        ]
+
+        results = retriever.retrieve_with_expansion(
+            "fastapi auth", strategy=RetrievalStrategy.SIMILARITY
+        )
+
+        mock_vector_store.embedding_model.embed_batch.assert_called_once()
+        mock_vector_store.embedding_model.embed_text.assert_not_called()
+        calls = mock_vector_store.search_with_metadata.call_args_list
+        assert [(c.kwargs["query"], c.kwargs["query_embedding"]) for c in calls] == [
+            ("fastapi auth", [1.0, 0.0]),
+            ("fastapi auth jwt", [0.0, 1.0]),
+        ]
+        assert {r.id for r in results} == {"id1", "id2"}
+
+    def test_multi_collection_variants_reuse_batched_embedding(self):
+        """Multi-collection retrieval gets each variant's precomputed embedding."""
+        manager = Mock()
+        manager.embedding_model.embed_batch.return_value = [[1.0, 0.0], [0.0, 1.0]]
+        manager.search.return_value = []
+        retriever = Retriever(
+            multi_collection_manager=manager,
+            enable_v2_caching=False,
+            enable_cross_encoder_reranking=False,
+        )
+        retriever._query_expander.expand_query = Mock(return_value=["crud api", "rest endpoints"])
+
+        assert retriever.retrieve_with_expansion("crud api") == []
+
+        manager.embedding_model.embed_batch.assert_called_once()
+        assert [c.kwargs["query_embedding"] for c in manager.search.call_args_list] == [
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ]
+
+
 class TestCosineSimilarity:
     """Test cosine similarity calculation."""
 
@@ -0,0 +1,88 @@
+"""
+Unit tests for UnifiedRAGRetriever concurrent fan-out.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from src.rag.unified_retriever import UnifiedRAGRetriever, UnifiedRetrievalResult
+
+
+def _result(content, score):
+    return UnifiedRetrievalResult(content=content, source="", score=score)
+
+
+def _slow(results, delay):
+    def search(query, top_k):
+        time.sleep(delay)
+        return [_result(r.content, r.score) for r in results]
+    return search
+
+
+@pytest.fixture
+def retriever():
+    retriever = UnifiedRAGRetriever.__new__(UnifiedRAGRetriever)
+    retriever.logger = Mock()
+    retriever._executor = ThreadPoolExecutor(max_workers=8)
+    retriever.chroma_enabled = False
+    retriever.qdrant_enabled = True
+    retriever.neo4j_enabled = True
+    yield retriever
+    retriever._executor.shutdown(wait=False)
+
+
+def test_sources_run_concurrently_and_merge_by_content(retriever):
+    retriever._search_qdrant = _slow([_result("shared", 0.9), _result("q1", 0.5)], 0.2)
+    retriever._search_neo4j = _slow([_result("shared", 1.0), _result("n1", 1.0)], 0.2)
+
+    start = time.perf_counter()
+    response = asyncio.run(retriever.retrieve_with_report("query", top_k=5))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.35  # slowest source, not the sum
+    assert not response.partial
+    # Weighted: shared -> qdrant 0.63 beats neo4j 0.3; no duplicate entry
+    assert [(r.content, r.source) for r in response.results] == [
+        ("shared", "qdrant"), ("q1", "qdrant"), ("n1", "neo4j")
+    ]
+    assert [r.rank for r in response.results] == [1, 2, 3]
+
+
+def test_slow_source_is_dropped_and_response_tagged_partial(retriever):
+    retriever._search_qdrant = _slow([_result("q1", 0.8)], 0.0)
+    retriever._search_neo4j = _slow([_result("n1", 1.0)], 1.0)
+
+    start = time.perf_counter()
+    response = asyncio.run(retriever.retrieve_with_report("query", source_timeout=0.1))
+
+    assert time.perf_counter() - start < 0.5
+    assert response.partial
+    assert response.timed_out == ["neo4j"]
+    assert [r.content for r in response.results] == ["q1"]
+
+
+def test_failed_source_does_not_fail_retrieval(retriever):
+    retriever._search_qdrant = Mock(side_effect=ConnectionError("qdrant down"))
+    retriever._search_neo4j = _slow([_result("n1", 1.0)], 0.0)
+
+    results = asyncio.run(retriever.retrieve("query"))
+
+    assert [r.source for r in results] == ["neo4j"]
+
+
+def test_backend_error_marks_source_failed(retriever):
+    retriever.qdrant = Mock()
+    retriever.qdrant.search.side_effect = ConnectionError("qdrant down")
+    retriever.qdrant_embeddings = Mock()
+    retriever.qdrant_embeddings.encode.return_value.tolist.return_value = [0.1, 0.2]
+    retriever._search_neo4j = _slow([_result("n1", 1.0)], 0.0)
+
+    response = asyncio.run(retriever.retrieve_with_report("query"))
+
+    assert response.partial
+    assert response.failed == ["qdrant"]
+    assert [r.source for r in response.results] == ["neo4j"]
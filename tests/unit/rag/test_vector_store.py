@@ -9,6 +9,9 @@ Tests cover:
 - Statistics and health checks
 """
 
+import json
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
@@ -213,6 +216,102 @@ class TestAddBatch:
         assert example_ids == custom_ids
 
 
+class _InMemoryCollection:
+    """Minimal ChromaDB collection: get(ids) and upsert."""
+
+    def __init__(self, fail_on_upsert=None):
+        self.rows = {}
+        self.upserts = []
+        self.fail_on_upsert = fail_on_upsert
+
+    def count(self):
+        return len(self.rows)
+
+    def get(self, ids, include):
+        found = [i for i in ids if i in self.rows]
+        return {"ids": found, "metadatas": [self.rows[i]["metadata"] for i in found]}
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        if self.fail_on_upsert == len(self.upserts):
+            raise ConnectionError("ChromaDB unavailable")
+        self.upserts.append(list(ids))
+        for example_id, code, metadata in zip(ids, documents, metadatas, strict=True):
+            self.rows[example_id] = {"code": code, "metadata": metadata}
+
+
+class TestAddStream:
+    """Test streaming, idempotent, resumable ingestion."""
+
+    @pytest.fixture
+    def store(self, mock_embedding_model):
+        mock_embedding_model.embed_batch.side_effect = lambda texts, **kwargs: [[0.1] * 3 for _ in texts]
+        with patch("src.rag.vector_store.chromadb.PersistentClient") as mock_client_class:
+            mock_client_class.return_value.get_or_create_collection.return_value = _InMemoryCollection()
+            yield VectorStore(embedding_model=mock_embedding_model)
+
+    def test_streams_in_batches_and_reindex_is_idempotent(self, store):
+        documents = [f"def f{i}(): pass" for i in range(5)] + [("", {}), {"id": "x", "code": "x = 1", "metadatas": {"language": "python"}}]
+
+        stats = store.add_stream(iter(documents), batch_size=2)
+
+        assert (stats.processed, stats.added, stats.invalid, stats.batches) == (7, 6, 1, 4)
+        assert [len(ids) for ids in store.collection.upserts] == [2, 2, 1, 1]
+        assert store.collection.rows["x"]["metadata"]["language"] == "python"
+        assert store.embedding_model.embed_batch.call_count == 4
+
+        # Re-index: nothing re-embedded or re-written, changed content is upserted
+        store.embedding_model.embed_batch.reset_mock()
+        documents[-1] = {"id": "x", "code": "x = 2"}
+        stats = store.add_stream(documents, batch_size=2)
+
+        assert (stats.skipped, stats.updated, stats.added) == (5, 1, 0)
+        assert store.embedding_model.embed_batch.call_count == 1
+        assert store.collection.rows["x"]["code"] == "x = 2"
+
+    def test_dedups_against_the_write_in_flight(self, store):
+        looked_up = threading.Event()
+        collection = store.collection
+        get, upsert = collection.get, collection.upsert
+
+        def get_then_release(ids, include):
+            result = get(ids, include)
+            if collection.get_calls == 1:
+                looked_up.set()  # The next batch has been checked
+            collection.get_calls += 1
+            return result
+
+        def upsert_after_lookup(*args, **kwargs):
+            # The first upsert lands only after the second batch's lookup
+            assert looked_up.wait(timeout=5)
+            upsert(*args, **kwargs)
+
+        collection.get_calls = 0
+        collection.get, collection.upsert = get_then_release, upsert_after_lookup
+        documents = [{"id": "x", "code": "x = 1"}, {"id": "x", "code": "x = 1"}, {"id": "x", "code": "x = 2"}]
+
+        stats = store.add_stream(documents, batch_size=1)
+
+        assert (stats.added, stats.skipped, stats.updated) == (1, 1, 1)
+        assert collection.upserts == [["x"], ["x"]]
+        assert collection.rows["x"]["code"] == "x = 2"
+
+    def test_interrupted_ingestion_resumes_from_checkpoint(self, store, tmp_path):
+        checkpoint = tmp_path / "ingest.json"
+        documents = [{"id": f"doc{i}", "code": f"def f{i}(): pass"} for i in range(6)]
+        store.collection.fail_on_upsert = 1
+
+        with pytest.raises(ConnectionError):
+            store.add_stream(documents, batch_size=2, checkpoint_path=checkpoint)
+        assert json.loads(checkpoint.read_text())["processed"] == 2
+
+        store.collection.fail_on_upsert = None
+        stats = store.add_stream(documents, batch_size=2, checkpoint_path=checkpoint)
+
+        assert (stats.resumed_from, stats.added, stats.processed) == (2, 4, 6)
+        assert sorted(store.collection.rows) == [f"doc{i}" for i in range(6)]
+        assert not checkpoint.exists()
+
+
 class TestSearch:
     """Test similarity search functionality."""
 
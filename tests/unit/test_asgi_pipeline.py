@@ -0,0 +1,169 @@
+"""
+Unit tests for the pure-ASGI middleware pipeline and its stages.
+"""
+
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.responses import PlainTextResponse
+
+from src.api.middleware.audit_middleware import (
+    AuditStage,
+    compile_excluded_paths,
+    should_log_read_operation,
+)
+from src.api.middleware.security_headers_middleware import SecurityHeadersStage
+from src.observability import MetricsCollector, MetricsStage, MiddlewarePipeline, PipelineStage
+
+
+class RecordingStage(PipelineStage):
+    def __init__(self, name, events, short_circuit=False):
+        self.name = name
+        self.events = events
+        self.short_circuit = short_circuit
+
+    async def on_request(self, ctx):
+        self.events.append(f"{self.name}:request")
+        if self.short_circuit:
+            return PlainTextResponse("blocked", status_code=429)
+        return None
+
+    def on_response_start(self, ctx, headers):
+        self.events.append(f"{self.name}:headers")
+        headers[f"X-{self.name}"] = "1"
+
+    async def on_complete(self, ctx, exc):
+        self.events.append(f"{self.name}:complete:{ctx.status_code}")
+
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/api/v1/conversations/{conversation_id}")
+    async def conversation(conversation_id: str, request: Request):
+        request.state.correlation_id = "corr-1"
+        return {"id": conversation_id}
+
+    return app
+
+
+def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_stage_order_and_short_circuit():
+    events = []
+    app = _app()
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            RecordingStage("outer", events),
+            RecordingStage("limit", events, short_circuit=True),
+            RecordingStage("inner", events),
+        ],
+    )
+
+    async with _client(app) as client:
+        response = await client.get("/ok")
+
+    assert response.status_code == 429
+    assert response.headers["X-outer"] == "1"
+    assert "X-inner" not in response.headers
+    assert events == ["outer:request", "limit:request", "outer:headers", "outer:complete:429"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through_with_headers():
+    events = []
+    app = _app()
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[RecordingStage("outer", events), RecordingStage("inner", events)],
+    )
+
+    async with _client(app) as client:
+        response = await client.get("/stream")
+
+    assert response.text == "abc"
+    assert response.headers["X-outer"] == response.headers["X-inner"] == "1"
+    # Inner stages see the response first, completion runs in reverse order
+    assert events == [
+        "outer:request", "inner:request",
+        "inner:headers", "outer:headers",
+        "inner:complete:200", "outer:complete:200",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_metrics_and_security_headers():
+    metrics = MetricsCollector()
+    app = _app()
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[MetricsStage(metrics), SecurityHeadersStage(environment="production")],
+    )
+
+    async with _client(app) as client:
+        ok = await client.get(f"/api/v1/conversations/{uuid.uuid4()}")
+        failed = await client.get("/boom")
+
+    assert ok.headers["X-Frame-Options"] == "DENY"
+    assert "Strict-Transport-Security" in ok.headers
+    assert failed.status_code == 500
+
+    labels = {"method": "GET", "endpoint": "/api/v1/conversations/{id}", "status": "200"}
+    assert metrics.get_counter("http_requests_total", labels) == 1
+    assert metrics.get_counter(
+        "http_errors_total",
+        {"method": "GET", "endpoint": "/boom", "status": "500", "error_type": "server_error"},
+    ) == 1
+    assert metrics.get_gauge("http_requests_in_progress") == 0
+
+
+@pytest.mark.asyncio
+async def test_audit_stage_logs_successful_reads(monkeypatch):
+    log_read = AsyncMock()
+    monkeypatch.setattr("src.api.middleware.audit_middleware.AuditLogger.log_read_operation", log_read)
+
+    app = _app()
+    app.add_middleware(MiddlewarePipeline, stages=[AuditStage(enabled=True, excluded_paths="/ok")])
+
+    conversation_id = uuid.uuid4()
+    async with _client(app) as client:
+        await client.get(f"/api/v1/conversations/{conversation_id}", headers={"User-Agent": "pytest"})
+        await client.get("/ok")
+        await client.post(f"/api/v1/conversations/{conversation_id}")
+
+    log_read.assert_awaited_once()
+    kwargs = log_read.await_args.kwargs
+    assert kwargs["resource_type"] == "conversation"
+    assert kwargs["resource_id"] == conversation_id
+    assert kwargs["user_agent"] == "pytest"
+    assert kwargs["correlation_id"] == "corr-1"
+
+
+def test_excluded_paths_are_compiled_once():
+    excluded = compile_excluded_paths("/internal/*,/ping")
+
+    assert compile_excluded_paths("/internal/*,/ping") is excluded
+    assert not should_log_read_operation("/internal/jobs/1", "GET", excluded)
+    assert not should_log_read_operation("/ping", "GET", excluded)
+    assert not should_log_read_operation("/favicon.ico", "GET", excluded)
+    assert should_log_read_operation("/api/v1/users/1", "GET", excluded)
@@ -0,0 +1,189 @@
+"""
+Unit tests for the auth fast path: principal cache, pub/sub invalidation,
+coalesced session activity writes and the request-scoped cache.
+"""
+
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from src.api.middleware import auth_middleware
+from src.config.settings import get_settings
+from src.models.user import User
+from src.services.auth_cache import (
+    AUTH_INVALIDATION_CHANNEL,
+    AuthInvalidationListener,
+    AuthPrincipalCache,
+)
+from src.services.auth_service import AuthService
+from src.services.request_cache import request_cache_scope, request_cached, set_request_cached
+from src.services.session_service import SessionService
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _user():
+    return User(
+        user_id=uuid.uuid4(),
+        email="dev@example.com",
+        username="dev",
+        password_hash="x",
+        is_active=True,
+        is_superuser=False,
+    )
+
+
+@pytest.fixture
+def redis_manager():
+    return SimpleNamespace(connected=True, client=fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_cache_returns_fresh_detached_users():
+    cache = AuthPrincipalCache(ttl_seconds=5)
+    user = _user()
+    cache.put("jti-1", user, token_exp=time.time() + 60)
+
+    first = cache.get("jti-1", str(user.user_id))
+    second = cache.get("jti-1", str(user.user_id))
+
+    assert first is not second and first is not user
+    assert (first.user_id, first.email, first.is_active) == (user.user_id, user.email, True)
+    # A token whose sub does not match the cached principal is a miss
+    assert cache.get("jti-1", str(uuid.uuid4())) is None
+
+
+def test_cache_entries_expire_with_token_and_invalidate_per_user():
+    cache = AuthPrincipalCache(ttl_seconds=5)
+    user = _user()
+
+    cache.put("expired", user, token_exp=time.time() - 1)
+    assert cache.get("expired", str(user.user_id)) is None
+
+    cache.put("a", user)
+    cache.put("b", user)
+    cache.invalidate(user_id=str(user.user_id))
+    assert len(cache) == 0
+
+
+def test_listener_applies_published_invalidations():
+    server = fakeredis.FakeServer()
+    cache = AuthPrincipalCache(ttl_seconds=60)
+    user = _user()
+    cache.put("revoked", user)
+    cache.put("other", user)
+
+    listener = AuthInvalidationListener(cache, fakeredis.FakeRedis(server=server))
+    listener.start()
+    try:
+        publisher = fakeredis.FakeRedis(server=server)
+        deadline = time.time() + 5
+        while "revoked" in cache._entries and time.time() < deadline:
+            publisher.publish(AUTH_INVALIDATION_CHANNEL, '{"jti": "revoked", "user_id": null}')
+            time.sleep(0.05)
+    finally:
+        listener.stop()
+
+    assert "revoked" not in cache._entries
+    assert "other" in cache._entries
+
+
+def test_activity_writes_are_coalesced(redis_manager):
+    service = SessionService(redis_manager=redis_manager)
+    service.activity_write_interval = 60
+    user_id = uuid.uuid4()
+    service.create_session(user_id, "jti", datetime.utcnow())
+
+    setex = Mock(wraps=redis_manager.client.setex)
+    redis_manager.client.setex = setex
+
+    assert all(service.update_activity(user_id, "jti") for _ in range(5))
+    assert setex.call_count == 1
+
+    assert service.update_activity(user_id, "jti", force=True)
+    assert setex.call_count == 2
+
+
+def test_request_cache_scope():
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return "roles"
+
+    # Outside a request scope every call loads
+    request_cached("k", loader)
+    request_cached("k", loader)
+    assert len(loads) == 2
+
+    with request_cache_scope():
+        set_request_cached("seeded", 1)
+        assert request_cached("seeded", loader) == 1
+        request_cached("k", loader)
+        request_cached("k", loader)
+    assert len(loads) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_fast_path(monkeypatch, redis_manager):
+    user = _user()
+    token = AuthService.create_access_token(user.user_id, user.email, user.username)
+    settings = get_settings()
+    jti = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])["jti"]
+
+    session_service = SessionService(redis_manager=redis_manager)
+    session_service.create_session(user.user_id, jti, datetime.utcnow())
+    cache = AuthPrincipalCache(ttl_seconds=5)
+    slow_lookup = Mock(return_value=user)
+
+    monkeypatch.setattr(auth_middleware, "get_session_service", lambda: session_service)
+    monkeypatch.setattr(auth_middleware, "get_principal_cache", lambda: cache)
+    monkeypatch.setattr(auth_middleware.auth_middleware.auth_service, "get_current_user", slow_lookup)
+
+    def request():
+        return SimpleNamespace(state=SimpleNamespace(correlation_id="c"))
+
+    first = await auth_middleware.get_current_user(request(), token)
+    second = await auth_middleware.get_current_user(request(), token)
+
+    assert slow_lookup.call_count == 1
+    assert cache.hits == 1
+    assert second.user_id == first.user_id == user.user_id
+
+    # Logout: session deleted -> cache invalidated, token rejected
+    monkeypatch.setattr("src.services.auth_cache._principal_cache", cache)
+    session_service.delete_session(user.user_id, jti)
+    with pytest.raises(HTTPException) as exc_info:
+        await auth_middleware.get_current_user(request(), token)
+    assert exc_info.value.status_code == 401
+
+
+def test_invalidation_is_published_after_the_redis_write(monkeypatch, redis_manager):
+    user = _user()
+    token = AuthService.create_access_token(user.user_id, user.email, user.username)
+    settings = get_settings()
+    jti = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])["jti"]
+    session_service = SessionService(redis_manager=redis_manager)
+    session_service.create_session(user.user_id, jti, datetime.utcnow())
+    session_key = f"session:{user.user_id}:{jti}"
+    seen = []
+
+    def record(**kwargs):
+        seen.append((
+            redis_manager.client.exists(f"blacklist:access:{jti}"),
+            redis_manager.client.exists(session_key),
+        ))
+
+    monkeypatch.setattr("src.services.auth_service.publish_auth_invalidation", record)
+    monkeypatch.setattr("src.services.session_service.publish_auth_invalidation", record)
+    monkeypatch.setattr("src.services.auth_service.get_redis_client", lambda: redis_manager)
+
+    assert AuthService.blacklist_token(token, "access")
+    assert session_service.delete_session(user.user_id, jti)
+    # Blacklisted before the first publish, session gone before the second
+    assert seen == [(1, 1), (1, 0)]
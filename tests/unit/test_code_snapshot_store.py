@@ -0,0 +1,123 @@
+"""
+Unit tests for CodeSnapshotStore (content-addressed smoke-repair rollback).
+"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.validation.smoke_repair_orchestrator import CodeSnapshotStore, SmokeRepairOrchestrator
+
+OLD_MTIME = 1_600_000_000
+
+
+def _write(app_dir, rel_path, content):
+    path = app_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    # Outside the racy window so the stat cache is trusted
+    os.utime(path, (OLD_MTIME, OLD_MTIME))
+    return path
+
+
+@pytest.fixture
+def app_dir(tmp_path):
+    _write(tmp_path, "src/main.py", "app = FastAPI()\n")
+    _write(tmp_path, "src/models/entities.py", "class Product: ...\n")
+    _write(tmp_path, "src/models/schemas.py", "class ProductCreate: ...\n")
+    _write(tmp_path, "README.md", "not tracked\n")
+    return tmp_path
+
+
+def test_snapshots_store_deltas_and_deduplicate(app_dir):
+    store = CodeSnapshotStore()
+
+    assert store.take(0, app_dir) == 3
+    assert store.take(1, app_dir) == 0  # nothing changed
+
+    _write(app_dir, "src/models/entities.py", "class Product: nullable = True\n")
+    assert store.take(2, app_dir) == 1
+
+    # Reverting to the original content reuses the stored blob
+    _write(app_dir, "src/models/entities.py", "class Product: ...\n")
+    assert store.take(3, app_dir) == 1
+    assert len(store._blobs) == 4
+    assert len(store) == 4
+    assert store.manifest(3) == store.manifest(0)
+
+
+def test_restore_rewrites_only_differing_files(app_dir):
+    store = CodeSnapshotStore()
+    store.take(0, app_dir)
+
+    _write(app_dir, "src/models/entities.py", "broken repair\n")
+    (app_dir / "src/models/schemas.py").unlink()
+    _write(app_dir, "src/api/new_route.py", "router = None\n")
+    store.take(1, app_dir)
+
+    restored = store.restore(0, app_dir)
+
+    assert sorted(restored) == ["src/models/entities.py", "src/models/schemas.py"]
+    assert (app_dir / "src/models/entities.py").read_text() == "class Product: ...\n"
+    assert (app_dir / "src/models/schemas.py").read_text() == "class ProductCreate: ...\n"
+    # Untouched file keeps its mtime; files created later are left in place
+    assert (app_dir / "src/main.py").stat().st_mtime == OLD_MTIME
+    assert (app_dir / "src/api/new_route.py").exists()
+
+
+def test_racy_mtime_is_rehashed(app_dir):
+    store = CodeSnapshotStore()
+    path = app_dir / "src/main.py"
+    path.write_text("app = 1\n")
+    store.take(0, app_dir)
+
+    # Same size, rewritten within the timestamp resolution window
+    stat = path.stat()
+    path.write_text("app = 2\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert store.take(1, app_dir) == 1
+
+
+def test_orchestrator_rollback_restores_snapshot(app_dir):
+    orchestrator = SmokeRepairOrchestrator(smoke_validator=None)
+    orchestrator._take_snapshot(0, app_dir)
+    _write(app_dir, "src/main.py", "app = None\n")
+    orchestrator._take_snapshot(1, app_dir)
+
+    orchestrator._rollback_to(0, app_dir)
+    orchestrator._rollback_to(7, app_dir)  # unknown iteration is ignored
+
+    assert (app_dir / "src/main.py").read_text() == "app = FastAPI()\n"
+
+
+def test_iteration_restart_begins_new_history(app_dir):
+    store = CodeSnapshotStore()
+    store.take(0, app_dir)
+    _write(app_dir, "src/main.py", "app = None\n")
+    store.take(1, app_dir)
+
+    assert store.take(0, app_dir) == 3
+    assert len(store) == 1
+    assert len(store._blobs) == 3
+
+
+def test_second_repair_cycle_rolls_back_to_its_own_snapshot(app_dir, tmp_path_factory):
+    class PassingValidator:
+        async def validate(self, application_ir):
+            return SimpleNamespace(endpoints_tested=1, endpoints_passed=1, violations=[])
+
+    other_app = tmp_path_factory.mktemp("other_app")
+    _write(other_app, "src/main.py", "app = FastAPI()\n")
+    _write(other_app, "src/models/entities.py", "class Order: ...\n")
+
+    orchestrator = SmokeRepairOrchestrator(smoke_validator=PassingValidator())
+    asyncio.run(orchestrator.run_smoke_repair_cycle(app_dir, None, capture_logs=False))
+    asyncio.run(orchestrator.run_smoke_repair_cycle(other_app, None, capture_logs=False))
+
+    assert orchestrator._snapshots.manifest(0).keys() == {"src/main.py", "src/models/entities.py"}
+    _write(other_app, "src/main.py", "app = None\n")
+    orchestrator._rollback_to(0, other_app)
+    assert (other_app / "src/main.py").read_text() == "app = FastAPI()\n"
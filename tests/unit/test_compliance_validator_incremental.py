@@ -0,0 +1,201 @@
+"""
+Differential tests: incremental app validation must match a full run.
+"""
+
+import copy
+
+import pytest
+
+from src.parsing.spec_parser import Endpoint, Entity, Field, SpecRequirements
+from src.validation.compliance_validator import ComplianceValidator
+
+MAIN_PY = """
+from fastapi import FastAPI
+from src.api.routes import products
+
+app = FastAPI()
+app.include_router(products.router)
+"""
+
+ROUTES_PY = """
+from fastapi import APIRouter
+from src.models.schemas import ProductCreate
+
+router = APIRouter()
+"""
+
+SCHEMAS_PY = """
+from pydantic import BaseModel, Field
+
+
+class ProductCreate(BaseModel):
+    name: str = Field(..., min_length=1)
+    price: float = Field(..., gt=0)
+"""
+
+ENTITIES_PY = """
+from sqlalchemy import Column, String, Numeric
+
+
+class ProductEntity(Base):
+    __tablename__ = "products"
+    name = Column(String(100), nullable=False)
+"""
+
+OPENAPI = {
+    "paths": {"/products": {"get": {}, "post": {}}},
+    "components": {
+        "schemas": {
+            "ProductCreate": {
+                "required": ["name", "price"],
+                "properties": {
+                    "name": {"type": "string", "minLength": 1},
+                    "price": {"type": "number", "exclusiveMinimum": 0},
+                },
+            }
+        }
+    },
+}
+
+
+@pytest.fixture
+def app_dir(tmp_path):
+    files = {
+        "src/__init__.py": "",
+        "src/main.py": MAIN_PY,
+        "src/api/__init__.py": "",
+        "src/api/routes/__init__.py": "",
+        "src/api/routes/products.py": ROUTES_PY,
+        "src/models/__init__.py": "",
+        "src/models/schemas.py": SCHEMAS_PY,
+        "src/models/entities.py": ENTITIES_PY,
+        "src/services/reporting.py": "REPORT_VERSION = 1\n",
+    }
+    for relative, content in files.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+@pytest.fixture
+def spec():
+    return SpecRequirements(
+        entities=[
+            Entity(name="Product", fields=[Field(name="price", type="float", constraints=["gt=0"])]),
+            Entity(name="Order", fields=[Field(name="total", type="float")]),
+        ],
+        endpoints=[
+            Endpoint(method="GET", path="/products", entity="Product", operation="list"),
+            Endpoint(method="POST", path="/orders", entity="Order", operation="create"),
+        ],
+    )
+
+
+@pytest.fixture
+def validator(monkeypatch):
+    """Validator whose app import is replaced by a controllable OpenAPI schema."""
+    validator = ComplianceValidator(use_semantic_matching=False)
+    validator.openapi = copy.deepcopy(OPENAPI)
+    validator.openapi_loads = 0
+
+    def fake_load(output_path, is_root_main):
+        validator.openapi_loads += 1
+        return copy.deepcopy(validator.openapi)
+
+    monkeypatch.setattr(validator, "_load_app_openapi_schema", fake_load)
+    return validator
+
+
+def _incremental_vs_full(validator, spec, app_dir, previous, changed):
+    loads_before = validator.openapi_loads
+    incremental = validator.validate_from_app_incremental(spec, app_dir, changed, previous)
+    incremental_loads = validator.openapi_loads - loads_before
+
+    full = validator.validate_from_app(spec, app_dir)
+    assert incremental == full
+    return incremental, incremental_loads
+
+
+def test_full_run_collects_facts(validator, spec, app_dir):
+    report = validator.validate_from_app(spec, app_dir)
+
+    assert report.app_facts is not None
+    assert report.entities_implemented == ["Product"]
+    assert report.endpoints_implemented == ["GET /products", "POST /products"]
+    assert "src/models/schemas.py" in report.app_facts.import_closure
+    assert "src/services/reporting.py" not in report.app_facts.import_closure
+
+
+def test_entities_change_reuses_openapi(validator, spec, app_dir):
+    previous = validator.validate_from_app(spec, app_dir)
+
+    (app_dir / "src/models/entities.py").write_text(
+        ENTITIES_PY
+        + """
+
+class OrderEntity(Base):
+    __tablename__ = "orders"
+    total = Column(Numeric(10, 2), nullable=False)
+"""
+    )
+    report, loads = _incremental_vs_full(
+        validator, spec, app_dir, previous, {"src/models/entities.py"}
+    )
+
+    assert loads == 0
+    assert report.entities_implemented == ["Product", "Order"]
+
+
+def test_imported_module_change_reloads_openapi(validator, spec, app_dir):
+    previous = validator.validate_from_app(spec, app_dir)
+
+    (app_dir / "src/api/routes/products.py").write_text(ROUTES_PY + "\n# orders route\n")
+    validator.openapi["paths"]["/orders"] = {"post": {}}
+    report, loads = _incremental_vs_full(
+        validator, spec, app_dir, previous, {app_dir / "src/api/routes/products.py"}
+    )
+
+    assert loads == 1
+    assert report.compliance_details["endpoints"] == 1.0
+
+
+def test_schemas_change_matches_full_run(validator, spec, app_dir):
+    previous = validator.validate_from_app(spec, app_dir)
+
+    (app_dir / "src/models/schemas.py").write_text(
+        SCHEMAS_PY.replace("gt=0", "gt=0, le=1000")
+    )
+    _incremental_vs_full(validator, spec, app_dir, previous, {"src/models/schemas.py"})
+
+
+def test_unimported_change_reuses_everything(validator, spec, app_dir):
+    previous = validator.validate_from_app(spec, app_dir)
+
+    (app_dir / "src/services/reporting.py").write_text("REPORT_VERSION = 2\n")
+    _, loads = _incremental_vs_full(
+        validator, spec, app_dir, previous, {"src/services/reporting.py"}
+    )
+
+    assert loads == 0
+
+
+def test_without_previous_facts_runs_full(validator, spec, app_dir):
+    report = validator.validate_from_app_incremental(spec, app_dir, set(), previous_report=None)
+
+    assert validator.openapi_loads == 1
+    assert report == validator.validate_from_app(spec, app_dir)
+
+
+def test_schemas_file_validations_present(validator, app_dir, caplog):
+    validations = validator._extract_schemas_file_validations(app_dir)
+
+    assert any(v.endswith("name: min_length=1") for v in validations)
+    assert "not found" not in caplog.text
+
+
+def test_schemas_file_validations_missing(validator, app_dir, caplog):
+    (app_dir / "src/models/schemas.py").unlink()
+
+    assert validator._extract_schemas_file_validations(app_dir) == []
+    assert "schemas.py not found" in caplog.text
@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+
+from src.validation.compliance_validator import ComplianceValidator
+from src.validation.endpoint_route_index import (
+    EndpointRouteIndex,
+    parse_endpoint,
+    route_segments,
+)
+
+
+def _brute_force_match(validator, method, path, found):
+    """Reference semantics: pairwise comparison against every found endpoint."""
+    for found_method, found_path in found:
+        if validator._are_methods_functionally_equivalent(
+            method, found_method, path, found_path
+        ) and validator._are_paths_similar(path, found_path):
+            return True
+    return False
+
+
+def test_route_segments_collapse_parameters():
+    assert route_segments("/Carts/{customer_id}/") == ["carts", "{*}"]
+    assert route_segments("/files/{name}.json") == ["files", "{*}.json"]
+
+
+def test_parse_endpoint():
+    assert parse_endpoint("get /products") == ("GET", "/products")
+    assert parse_endpoint("GET") == (None, None)
+
+
+@pytest.mark.parametrize(
+    ("expected", "found", "matched"),
+    [
+        ("GET /products/{product_id}", ["GET /products/{id}"], True),
+        ("GET /products/", ["GET /products"], True),
+        ("POST /products", ["GET /products"], False),
+        ("POST /carts/clear", ["DELETE /carts/{id}"], True),
+        ("DELETE /carts/{id}", ["POST /carts/clear"], True),
+        ("PUT /orders/{id}/cancel", ["POST /orders/{id}/cancel"], True),
+        ("POST /orders/checkout", ["POST /orders/{id}"], True),
+        ("GET /orders/{id}/items", ["GET /orders/{id}"], False),
+    ],
+)
+def test_fuzzy_rules(expected, found, matched):
+    index = EndpointRouteIndex.from_strings(found)
+    method, path = parse_endpoint(expected)
+    assert index.matches(method, path) is matched
+
+
+def test_index_matches_pairwise_reference():
+    """Trie lookup must agree with the pairwise fuzzy rules on every combination."""
+    validator = ComplianceValidator()
+    methods = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+    paths = [
+        "/carts",
+        "/carts/{id}",
+        "/carts/{cart_id}/",
+        "/carts/clear",
+        "/carts/{id}/clear",
+        "/carts/{id}/items",
+        "/orders/{id}/cancel",
+        "/orders/cancel",
+        "/orders/{order_id}",
+        "/orders/checkout",
+        "/Products/{id}",
+    ]
+    endpoints = [(m, p) for m in methods for p in paths]
+
+    for found in itertools.combinations(endpoints[::3], 4):
+        index = EndpointRouteIndex(found)
+        for method, path in endpoints:
+            assert index.matches(method, path) == _brute_force_match(
+                validator, method, path, found
+            ), (method, path, found)
+
+
+def test_endpoint_compliance_fuzzy_uses_index():
+    validator = ComplianceValidator()
+    found = ["GET /products", "GET /products/{id}", "DELETE /carts/{id}", "bogus"]
+    expected = [
+        "GET /products",
+        "GET /products/{product_id}",
+        "POST /carts/clear",
+        "POST /orders",
+    ]
+
+    assert validator._calculate_endpoint_compliance_fuzzy(found, expected) == 0.75
@@ -0,0 +1,109 @@
+"""
+Unit tests for IRCodeCorrelator smoke-result indexing and background persistence.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.cognitive.services.ir_code_correlator import (
+    IRCodeCorrelator,
+    SmokeResultIndex,
+    normalize_entity_key,
+)
+
+
+@pytest.fixture
+def correlator():
+    with patch("src.cognitive.services.ir_code_correlator.GraphDatabase") as graph_db:
+        graph_db.driver.return_value = MagicMock()
+        instance = IRCodeCorrelator()
+        yield instance
+        instance.close()
+
+
+SMOKE_RESULTS = {
+    "violations": [
+        {"endpoint": "POST /products", "error_type": "ValidationError"},
+        {"endpoint": "GET /products/{id}", "error_type": "KeyError"},
+        {"endpoint": "POST /order-items", "error_type": "ValidationError"},
+        {"endpoint": "POST /products", "error_type": "ValidationError"},
+    ],
+    "passed_scenarios": [
+        {"endpoint": "GET /products", "status_code": 200},
+        {"method": "GET", "endpoint": "/products/{product_id}", "status_code": 200},
+        {"endpoint": "GET /api/customers/{id}/orders", "status_code": 200},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Product", "product"),
+        ("products", "product"),
+        ("OrderItem", "orderitem"),
+        ("order-items", "orderitem"),
+        ("categories", "category"),
+        ("Address", "address"),
+    ],
+)
+def test_normalize_entity_key(name, expected):
+    assert normalize_entity_key(name) == expected
+
+
+def test_index_groups_by_entity_and_endpoint():
+    index = SmokeResultIndex(SMOKE_RESULTS)
+
+    product = index.entity_stats("Product")
+    assert (product.passes, product.failures) == (2, 3)
+    assert list(product.failure_types) == ["ValidationError", "KeyError"]
+
+    # Path parameter names do not matter for endpoint keys
+    get_product = index.endpoint_stats("GET", "/products/{pid}")
+    assert (get_product.passes, get_product.failures) == (1, 1)
+
+    # Nested routes count for every static segment, ignoring api prefixes
+    assert index.entity_stats("Customer").passes == 1
+    assert index.entity_stats("Order").passes == 1
+    assert index.entity_stats("Api").passes == 0
+
+    # No data = assume OK
+    assert index.entity_stats("Invoice").pass_rate() == 1.0
+
+
+def test_analyze_generation_uses_index(correlator):
+    report = correlator.analyze_generation(
+        entities=[{"name": "Product"}, {"name": "OrderItem"}],
+        endpoints=[{"path": "/products", "method": "post"}, {"path": "/products", "method": "GET"}],
+        smoke_results=SMOKE_RESULTS,
+    )
+
+    product, order_item = report.entity_correlations
+    assert product.pass_rate == pytest.approx(2 / 5)
+    assert product.failure_histogram == {"ValidationError": 2, "KeyError": 1}
+    assert order_item.pass_rate == 0.0
+
+    create_product, list_products = report.endpoint_correlations
+    assert create_product.pass_rate == 0.0
+    assert create_product.failure_types == ["ValidationError"]
+    assert list_products.pass_rate == 1.0
+
+
+def test_report_persistence_runs_in_background(correlator):
+    release = threading.Event()
+    persisted = []
+
+    def slow_persist(report):
+        release.wait(timeout=5)
+        persisted.append(report)
+
+    correlator._persist_report = slow_persist
+
+    report = correlator.analyze_generation(entities=[], endpoints=[], smoke_results={})
+    assert persisted == []  # analyze_generation did not wait for Neo4j
+
+    release.set()
+    correlator.flush(timeout=5)
+    assert persisted == [report]
@@ -0,0 +1,87 @@
+"""
+Unit tests for ModelRegistry (shared, lazily loaded models).
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.models import model_registry
+from src.models.model_registry import ModelRegistry, load_transformers_tokenizer
+
+
+def _loader():
+    return Mock(side_effect=lambda model_name, device: object())
+
+
+def test_model_loaded_once_and_shared_by_name_and_device():
+    registry = ModelRegistry()
+    loader = _loader()
+
+    first = registry.get(loader, "all-MiniLM-L6-v2")
+    assert registry.get(loader, "all-MiniLM-L6-v2") is first
+    assert registry.get(loader, "all-MiniLM-L6-v2", "cpu") is not first
+    assert registry.get(_loader(), "all-MiniLM-L6-v2") is not first
+    assert loader.call_count == 2
+
+
+def test_default_device_shares_the_explicit_device_instance(monkeypatch):
+    registry = ModelRegistry()
+    loader = _loader()
+    monkeypatch.setitem(model_registry._DEFAULT_DEVICES, loader, lambda: "cpu")
+
+    model = registry.get(loader, "all-MiniLM-L6-v2")
+
+    assert registry.get(loader, "all-MiniLM-L6-v2", "cpu") is model
+    assert registry.is_loaded(loader, "all-MiniLM-L6-v2", "cpu")
+    assert registry.get(loader, "all-MiniLM-L6-v2", "cuda") is not model
+    loader.assert_any_call("all-MiniLM-L6-v2", "cpu")
+    assert loader.call_count == 2
+    assert model_registry.resolve_device(load_transformers_tokenizer, "cuda") is None
+
+
+def test_concurrent_first_use_loads_once():
+    registry = ModelRegistry()
+
+    def slow_load(model_name, device):
+        time.sleep(0.05)
+        return object()
+
+    loader = Mock(side_effect=slow_load)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get(loader, "m"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.call_count == 1
+    assert len({id(model) for model in results}) == 1
+
+
+def test_failed_load_is_retried():
+    registry = ModelRegistry()
+    loader = Mock(side_effect=[OSError("offline"), "model"])
+
+    with pytest.raises(OSError):
+        registry.get(loader, "m")
+    assert registry.get(loader, "m") == "model"
+
+
+def test_warm_up_loads_declared_models():
+    registry = ModelRegistry()
+    loader = _loader()
+    failing = Mock(side_effect=OSError("offline"))
+
+    registry.declare(loader, "a")
+    registry.declare(loader, "a")
+    registry.declare(failing, "b")
+    assert not registry.is_loaded(loader, "a")
+
+    registry.warm_up(background=True).join()
+
+    assert registry.is_loaded(loader, "a")
+    assert not registry.is_loaded(failing, "b")
+    assert loader.call_count == 1
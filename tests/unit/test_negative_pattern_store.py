@@ -0,0 +1,102 @@
+"""
+Unit tests for NegativePatternStore indexed lookups.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.learning.negative_pattern_store import (
+    NegativePatternStore,
+    create_anti_pattern,
+    endpoint_key,
+)
+
+
+def _pattern(entity="Product", endpoint="*", error_type="database", occurrences=3):
+    pattern = create_anti_pattern(
+        error_type=error_type,
+        exception_class="IntegrityError",
+        entity_pattern=entity,
+        endpoint_pattern=endpoint,
+    )
+    pattern.occurrence_count = occurrences
+    return pattern
+
+
+@pytest.fixture
+def offline_store():
+    with patch("src.learning.negative_pattern_store.GraphDatabase") as graph:
+        graph.driver.side_effect = RuntimeError("neo4j down")
+        yield NegativePatternStore()
+
+
+def test_endpoint_key_normalizes_ids_and_parameters():
+    assert endpoint_key("POST /products/123/") == ("POST", "/products/{id}")
+    assert endpoint_key("post /products/{product_id}") == ("POST", "/products/{id}")
+    assert endpoint_key("/users/3f1c2a9e-1b2c-4d5e-8f90-123456789abc/orders") == ("", "/users/{id}/orders")
+    assert endpoint_key("*") == ("", "*")
+
+
+def test_cache_only_lookups_use_index(offline_store):
+    put = _pattern(endpoint="PUT /products/{product_id}")
+    any_method = _pattern(entity="Order", endpoint="/products/{id}")
+    wildcard = _pattern(entity="*", endpoint="*", error_type="validation")
+    other = _pattern(entity="Order", endpoint="GET /orders")
+    rare = _pattern(endpoint="PUT /products/{id}", error_type="validation", occurrences=1)
+    for p in (put, any_method, wildcard, other, rare):
+        offline_store.store(p)
+
+    endpoint_ids = {p.pattern_id for p in offline_store.get_patterns_for_endpoint("PUT /products/42")}
+    assert endpoint_ids == {put.pattern_id, any_method.pattern_id, wildcard.pattern_id}
+
+    entity_ids = {p.pattern_id for p in offline_store.get_patterns_for_entity("Product")}
+    assert entity_ids == {put.pattern_id, wildcard.pattern_id}
+
+    schema_ids = {p.pattern_id for p in offline_store.get_patterns_for_schema("ProductCreate", min_occurrences=1)}
+    assert schema_ids == {wildcard.pattern_id, rare.pattern_id}
+
+    # Re-storing mirrors the MERGE: the cached pattern's count goes up
+    offline_store.store(_pattern(entity="Order", endpoint="GET /orders", occurrences=1))
+    assert offline_store.get(other.pattern_id).occurrence_count == 4
+
+
+def test_endpoint_filter_runs_in_cypher_and_refreshes_index():
+    node = _pattern(endpoint="POST /products").to_dict()
+    session = MagicMock()
+    session.run.return_value = [{"ap": node}]
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+
+    with patch("src.learning.negative_pattern_store.GraphDatabase") as graph:
+        graph.driver.return_value = driver
+        store = NegativePatternStore()
+    session.run.reset_mock()
+
+    first = store.get_patterns_for_endpoint("POST /products/", min_occurrences=2)
+    query, params = session.run.call_args.args
+    assert "ap.endpoint_key = $path" in query
+    assert params["path"] == "/products" and params["method"] == "POST"
+
+    # Within the TTL, equal or stricter queries are served from the index
+    second = store.get_patterns_for_endpoint("POST /products", min_occurrences=3)
+    assert session.run.call_count == 1
+    assert [p.pattern_id for p in first] == [p.pattern_id for p in second] == [node["pattern_id"]]
+
+    store.get_patterns_for_endpoint("POST /products", min_occurrences=1)
+    assert session.run.call_count == 2
+
+
+def test_refresh_bookkeeping_is_bounded(offline_store, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("src.learning.negative_pattern_store.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr(offline_store, "MAX_TRACKED_QUERIES", 3)
+
+    for i in range(5):
+        offline_store._mark_refreshed(("entity", f"E{i}"), 2)
+    assert list(offline_store._refreshed) == [("entity", "E2"), ("entity", "E3"), ("entity", "E4")]
+
+    # Expired entries are dropped on the next refresh
+    clock[0] += offline_store.CACHE_TTL_SECONDS
+    offline_store._mark_refreshed(("entity", "E5"), 2)
+    assert list(offline_store._refreshed) == [("entity", "E5")]
@@ -0,0 +1,39 @@
+"""
+Unit tests for PatternCompositionEngine (concurrent category composition).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.services.pattern_composition_engine import PatternCompositionEngine
+
+
+@pytest.mark.parametrize("max_workers", [0, 4])
+async def test_files_merged_in_composition_order(max_workers):
+    threads = set()
+
+    async def compose_inline(category, category_patterns, spec_or_ir):
+        threads.add(threading.current_thread().name)
+        # Later categories finish first
+        await asyncio.sleep(0.01 if category == "core_config" else 0)
+        return {"shared.py": category, f"{category}.py": category_patterns[0]}
+
+    categories = ["core_config", "repository_pattern", "project_config"]
+    patterns = {category: [f"{category}-code"] for category in categories}
+    engine = PatternCompositionEngine(max_workers=max_workers, executor="thread")
+
+    try:
+        files = await engine.compose(categories, patterns, None, compose_inline=compose_inline)
+    finally:
+        engine.shutdown()
+
+    assert list(files) == ["shared.py", "core_config.py", "repository_pattern.py", "project_config.py"]
+    assert files["shared.py"] == "project_config"  # last category wins, as in sequential composition
+    assert any(name.startswith("pattern-composition") for name in threads) == (max_workers > 0)
+
+
+def test_unknown_executor_rejected():
+    with pytest.raises(ValueError):
+        PatternCompositionEngine(executor="gpu")
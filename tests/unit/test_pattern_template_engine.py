@@ -0,0 +1,52 @@
+"""
+Unit tests for PatternTemplateEngine (compiled template cache + legacy placeholders).
+"""
+
+from src.services.pattern_template_engine import PatternTemplateEngine, replace_legacy_placeholders
+
+
+def test_templates_are_compiled_once_per_pattern():
+    engine = PatternTemplateEngine()
+    code = "class {{ entity.name }}Repository:  # {{ entity.name | snake_case }}"
+
+    results = engine.render_many(
+        code,
+        [{"entity": {"name": "Product"}}, {"entity": {"name": "CartItem"}}],
+        [{}, {}],
+    )
+    engine.render(code, {"entity": {"name": "Order"}})
+
+    assert results == [
+        "class ProductRepository:  # product",
+        "class CartItemRepository:  # cart_item",
+    ]
+    assert (engine.misses, engine.hits) == (1, 1)
+
+
+def test_lru_evicts_least_recently_used():
+    engine = PatternTemplateEngine(max_templates=2)
+    engine.compile("a")
+    engine.compile("b")
+    engine.compile("a")
+    engine.compile("c")  # evicts "b"
+
+    engine.compile("a")
+    engine.compile("b")
+    assert engine.misses == 4
+
+
+def test_broken_template_falls_back_to_legacy_replacement():
+    engine = PatternTemplateEngine()
+    code = "{% if broken %} app = '{APP_NAME}'"
+
+    assert engine.render(code, {}, {"APP_NAME": "shop"}) == "{% if broken %} app = 'shop'"
+    assert engine.render(code, {}, {"APP_NAME": "shop"}) == "{% if broken %} app = 'shop'"
+    assert engine.misses == 1
+
+
+def test_legacy_placeholders_single_pass():
+    values = {"APP_NAME": "shop", "APP_NAME_SNAKE": "my_shop", "DATABASE_URL": "{APP_NAME}"}
+
+    assert replace_legacy_placeholders(
+        "{APP_NAME} {APP_NAME_SNAKE} {DATABASE_URL} {ENTITY_NAME} {id}", values
+    ) == "shop my_shop {APP_NAME} {ENTITY_NAME} {id}"
@@ -0,0 +1,105 @@
+"""
+Unit tests for the atomic Redis sliding-window rate limiter.
+
+The Lua script runs on fakeredis (with Lua support via lupa).
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.middleware.rate_limit_engine import SlidingWindowRateLimiter
+from src.api.middleware.rate_limit_middleware import RateLimitMiddleware
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_is_atomic_under_concurrency(redis_client):
+    limiter = SlidingWindowRateLimiter(redis_client, local_fraction=0)
+
+    results = await asyncio.gather(*(limiter.check("ip:1.2.3.4", 10) for _ in range(25)))
+
+    assert sum(allowed for allowed, _, _ in results) == 10
+    assert await redis_client.zcard("rate_limit:ip:1.2.3.4") == 10
+    assert limiter.redis_checks == 25
+
+    allowed, remaining, reset_time = await limiter.check("ip:1.2.3.4", 10)
+    assert (allowed, remaining) == (False, 0)
+    assert reset_time > 0
+    assert 0 < await redis_client.ttl("rate_limit:ip:1.2.3.4") <= 120
+
+
+@pytest.mark.asyncio
+async def test_local_bucket_batches_redis_syncs(redis_client):
+    limiter = SlidingWindowRateLimiter(redis_client, local_fraction=0.5, max_local_batch=20)
+
+    for _ in range(30):
+        allowed, _, _ = await limiter.check("user:42", 100)
+        assert allowed
+
+    # First call syncs and grants tokens; most requests never hit Redis
+    assert limiter.local_hits > 20
+    assert limiter.redis_checks < 5
+
+    # Locally admitted requests are recorded on the next sync
+    limiter._buckets["rate_limit:user:42"].synced_at = 0
+    await limiter.check("user:42", 100)
+    assert await redis_client.zcard("rate_limit:user:42") == 31
+
+
+@pytest.mark.asyncio
+async def test_local_bucket_never_exceeds_limit(redis_client):
+    limiter = SlidingWindowRateLimiter(redis_client, local_fraction=0.5)
+
+    results = [await limiter.check("user:7", 20) for _ in range(40)]
+    limiter._buckets.clear()
+
+    assert sum(allowed for allowed, _, _ in results) == 20
+    assert [allowed for allowed, _, _ in results[20:]] == [False] * 20
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_fails_open():
+    broken = Mock()
+    broken.register_script.return_value = Mock(side_effect=ConnectionError("down"))
+    limiter = SlidingWindowRateLimiter(broken, retry_after_error=30)
+
+    assert (await limiter.check("ip:1", 5))[0]
+    assert (await limiter.check("ip:1", 5))[0]
+    # Redis is not retried until the back-off expires
+    assert broken.register_script.return_value.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_middleware_returns_429_with_headers(redis_client, monkeypatch):
+    monkeypatch.setattr("src.api.middleware.rate_limit_middleware.ANONYMOUS_AUTH_LIMIT", 3)
+    monkeypatch.setattr("src.api.middleware.rate_limit_middleware.REDIS_TTL", 90)
+
+    app = FastAPI()
+
+    @app.post("/api/v1/auth/login")
+    async def login():
+        return {"status": "ok"}
+
+    app.add_middleware(RateLimitMiddleware, redis_client=redis_client, local_bucket_fraction=0)
+
+    transport = ASGITransport(app=app, client=("192.168.1.1", 1234))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = [await client.post("/api/v1/auth/login") for _ in range(4)]
+
+    assert [r.status_code for r in responses] == [200, 200, 200, 429]
+    assert [r.headers["X-RateLimit-Remaining"] for r in responses] == ["2", "1", "0", "0"]
+    assert responses[-1].headers["X-RateLimit-Limit"] == "3"
+    assert "Retry-After" in responses[-1].headers
+    [key] = await redis_client.keys("*")
+    assert 60 < await redis_client.ttl(key) <= 90
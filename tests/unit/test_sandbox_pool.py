@@ -0,0 +1,186 @@
+"""
+Unit tests for the pre-forked sandbox worker pool used by CodeExecutor.
+"""
+
+import os
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from src.execution.code_executor import CodeExecutor
+from src.execution.sandbox_pool import (
+    SandboxPoolExhausted,
+    SandboxWorkerCrashed,
+    SandboxWorkerPool,
+    parse_memory_limit,
+)
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="sandbox pool is POSIX only")
+
+
+def _atom(code, language="python"):
+    return SimpleNamespace(atom_id=uuid.uuid4(), language=language, code_to_generate=code)
+
+
+@pytest.fixture
+def pool():
+    with SandboxWorkerPool(size=2, memory_limit="1g") as pool:
+        yield pool
+
+
+@pytest.mark.parametrize(
+    ("limit", "expected"),
+    [("512m", 512 * 1024 ** 2), ("1g", 1024 ** 3), ("256K", 256 * 1024), ("1024", 1024), ("", 0), ("lots", 0)],
+)
+def test_parse_memory_limit(limit, expected):
+    assert parse_memory_limit(limit) == expected
+
+
+def test_run_returns_structured_result(pool):
+    run = pool.run("print('hi')\nresult = {'sum': input_data['a'] + 1}", {"a": 41})
+
+    assert run.exit_code == 0
+    assert run.stdout == "hi\n"
+    assert run.return_value == {"sum": 42}
+
+
+def test_exceptions_and_exit_codes(pool):
+    run = pool.run("raise ValueError('bad atom')")
+    assert run.exit_code == 1
+    assert run.exception_type == "ValueError"
+    assert "bad atom" in run.stderr
+
+    assert pool.run("import sys; sys.exit(3)").exit_code == 3
+
+
+def test_namespace_is_reset_between_runs():
+    with SandboxWorkerPool(size=1, memory_limit="1g") as pool:
+        pool.run("leaked = 1\nimport os\nos.environ['ATOM_VAR'] = 'x'")
+        run = pool.run("print('leaked' in globals(), 'ATOM_VAR' in __import__('os').environ)")
+
+    assert run.stdout == "False False\n"
+
+
+def test_timeout_kills_and_respawns_worker():
+    with SandboxWorkerPool(size=1, memory_limit="1g") as pool:
+        run = pool.run("while True: pass", timeout=0.5)
+
+        assert run.timed_out and run.exception_type == "TimeoutError"
+        assert pool.respawns == 1
+        assert pool.run("result = 1").return_value == 1
+
+
+def test_memory_limit_is_enforced():
+    with SandboxWorkerPool(size=1, memory_limit="256m") as pool:
+        run = pool.run("blob = bytearray(512 * 1024 * 1024)")
+
+    assert run.exception_type == "MemoryError"
+
+
+def test_executor_batch_fans_out_in_order():
+    executor = CodeExecutor(timeout=10, memory_limit="1g", pool_size=4)
+    try:
+        atoms = [_atom(f"import time\ntime.sleep(0.3)\nresult = {i}") for i in range(4)]
+
+        start = time.time()
+        results = executor.execute_batch(atoms)
+        elapsed = time.time() - start
+
+        assert [r.return_value for r in results] == [0, 1, 2, 3]
+        assert [r.atom_id for r in results] == [a.atom_id for a in atoms]
+        assert elapsed < 1.0  # serial execution would take >= 1.2s
+    finally:
+        executor.close()
+
+
+def test_executor_pooled_matches_subprocess_runner():
+    pooled = CodeExecutor(timeout=10, memory_limit="1g", pool_size=1)
+    direct = CodeExecutor(timeout=10, use_worker_pool=False)
+    try:
+        for code in ["print('x')\nresult = [1, 2]", "import missing_module_xyz"]:
+            a, b = pooled.execute_atom(_atom(code)), direct.execute_atom(_atom(code))
+            assert (a.success, a.stdout, a.return_value) == (b.success, b.stdout, b.return_value)
+            assert a.exception_type == b.exception_type
+    finally:
+        pooled.close()
+
+
+def test_builtins_and_module_mutations_do_not_leak():
+    with SandboxWorkerPool(size=1, memory_limit="1g") as pool:
+        pool.run(
+            "import builtins, sys, fractions\n"
+            "builtins.len = lambda obj: 0\n"
+            "builtins.EXTRA = 1\n"
+            "__builtins__['print'] = None\n"
+            "fractions.PATCHED = True\n"
+            "sys.modules['json'] = None"
+        )
+        run = pool.run(
+            "import json, fractions\n"
+            "print(len('abc'), 'EXTRA' in dir(__import__('builtins')), hasattr(fractions, 'PATCHED'))\n"
+            "result = json.loads('[1]')"
+        )
+
+    assert run.stdout == "3 False False\n"
+    assert run.return_value == [1]
+
+
+def test_c_extension_imports_work_on_every_run():
+    pytest.importorskip("numpy")
+    with SandboxWorkerPool(size=1, memory_limit="2g") as pool:
+        runs = [pool.run("import numpy as np\nresult = int(np.arange(4).sum())") for _ in range(2)]
+        idle_respawns = pool.respawns
+        pool.run("result = 1")
+
+    assert [run.return_value for run in runs] == [6, 6]
+    # Runs that imported modules are recycled, others keep their worker
+    assert idle_respawns == 2 and pool.respawns == 2
+
+
+def test_malformed_reply_replaces_the_worker():
+    with SandboxWorkerPool(size=1, memory_limit="1g") as pool:
+        worker = pool._idle.get()
+        worker._read_line = lambda deadline: b"\xff{not json"
+        pool._idle.put(worker)
+        with pytest.raises(SandboxWorkerCrashed):
+            pool.run("result = 1")
+        assert pool.respawns == 1
+
+        # Patching json inside an atom does not corrupt the protocol
+        pool.run("import json\njson.dumps = json.loads = None")
+        assert pool.run("result = {'ok': True}").return_value == {"ok": True}
+
+
+def test_failed_respawn_keeps_the_slot(monkeypatch):
+    def fail_spawn():
+        raise OSError("fork failed")
+
+    with SandboxWorkerPool(size=1, memory_limit="1g", acquire_timeout=1) as pool:
+        spawn = pool._spawn
+        monkeypatch.setattr(pool, "_spawn", fail_spawn)
+        assert pool.run("while True: pass", timeout=0.5).timed_out
+
+        with pytest.raises(SandboxWorkerCrashed):
+            pool.run("result = 1")
+
+        monkeypatch.setattr(pool, "_spawn", spawn)
+        assert pool.run("result = 1").return_value == 1
+
+
+def test_exhausted_pool_raises_instead_of_blocking():
+    with SandboxWorkerPool(size=1, memory_limit="1g", acquire_timeout=0.1) as pool:
+        worker = pool._idle.get()
+        try:
+            with pytest.raises(SandboxPoolExhausted):
+                pool.run("result = 1")
+        finally:
+            pool._idle.put(worker)
+
+
+def test_subprocess_runner_receives_json_input_data():
+    executor = CodeExecutor(timeout=10, use_worker_pool=False)
+    run = executor.execute_atom(_atom("result = [input_data['flag'], input_data['missing']]"), {"flag": True, "missing": None})
+
+    assert run.success and run.return_value == [True, None]
@@ -643,3 +643,48 @@ class TestSecurityMonitoringService:
         # Should complete quickly (in tests, should be < 1 second)
         assert duration < 5.0, f"Batch processing took {duration}s, should be < 5s in tests"
         assert len(events) >= 0, "Should return results"
+
+    # ========================================
+    # Test 16: Incremental Detection (High-Water Mark)
+    # ========================================
+
+    @freeze_time("2025-10-26 10:00:00")
+    @patch('src.services.security_monitoring_service.get_db_context')
+    def test_run_all_detections_is_incremental(self, mock_db_context, service, test_db_session, test_user):
+        """Test that detection runs only report audit logs newer than the high-water mark"""
+        mock_db_context.return_value.__enter__.return_value = test_db_session
+        mock_db_context.return_value.__exit__.return_value = None
+
+        def add_failed_login(timestamp):
+            test_db_session.add(AuditLog(
+                id=uuid.uuid4(),
+                timestamp=timestamp,
+                user_id=test_user.user_id,
+                action="auth.login_failed",
+                result="denied",
+                ip_address="192.168.1.100",
+                user_agent="Mozilla/5.0",
+                event_metadata={}
+            ))
+            test_db_session.commit()
+
+        base_time = datetime(2025, 10, 26, 9, 55, 0)
+        for i in range(5):
+            add_failed_login(base_time + timedelta(seconds=i))
+
+        first = service.run_all_detections()
+        assert [e.event_type for e in first] == ["failed_login_cluster"]
+        assert service.high_water_mark == base_time + timedelta(seconds=4)
+
+        # Nothing new since the high-water mark (beyond the overlap): nothing reported
+        with freeze_time("2025-10-26 10:01:00"):
+            assert service.run_all_detections() == []
+
+            # A new failure updates the open cluster event instead of creating another one
+            add_failed_login(datetime(2025, 10, 26, 10, 0, 30))
+            second = service.run_all_detections()
+
+        assert len(second) == 1
+        assert second[0].event_id == first[0].event_id
+        assert second[0].event_data["failed_attempts"] == 6
+        assert test_db_session.query(SecurityEvent).count() == 1
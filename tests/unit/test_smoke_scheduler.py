@@ -0,0 +1,197 @@
+"""
+Unit tests for dependency-aware concurrent smoke execution.
+
+Covers the shared scheduler plus its use in RuntimeSmokeTestValidator
+(endpoints) and SmokeRunnerV2 (scenarios). No real server is started.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.cognitive.ir.api_model import Endpoint, HttpMethod
+from src.cognitive.ir.tests_model import TestPriority, TestScenarioIR
+from src.validation.runtime_smoke_validator import EndpointTestResult, RuntimeSmokeTestValidator
+from src.validation.smoke_runner_v2 import ScenarioResult, ScenarioStatus, SmokeRunnerV2
+from src.validation.smoke_scheduler import plan_smoke_phases, run_smoke_requests, smoke_entity_key
+
+REQUESTS = [
+    ("GET", "/products"),              # 0 product chain (product is mutated)
+    ("POST", "/products"),             # 1
+    ("GET", "/customers"),             # 2 read-only entity: independent
+    ("GET", "/customers/{id}"),        # 3 read-only entity: independent
+    ("DELETE", "/products/{id}"),      # 4 delete phase
+    ("PUT", "/products/{id}"),         # 5 product chain
+    ("DELETE", "/customers/{id}"),     # 6 delete phase
+    ("POST", "/api/v1/carts/{id}/items"),  # 7 cart chain
+]
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/products/{id}", "product"),
+        ("/api/v1/carts/{id}/items", "cart"),
+        ("/categories", "category"),
+        ("/order-items/{id}", "orderitem"),
+        ("/class", "class"),
+        ("/{id}", ""),
+    ],
+)
+def test_smoke_entity_key(path, expected):
+    assert smoke_entity_key(path) == expected
+
+
+def test_plan_chains_mutated_entities_and_defers_deletes():
+    phases = plan_smoke_phases(REQUESTS, max_concurrency=4)
+
+    assert phases == [
+        [[0, 1, 5], [2], [3], [7]],
+        [[4], [6]],
+    ]
+
+
+def test_plan_sequential_mode_keeps_input_order():
+    assert plan_smoke_phases(REQUESTS, max_concurrency=1) == [[list(range(len(REQUESTS)))]]
+    assert plan_smoke_phases([], max_concurrency=1) == []
+
+
+@pytest.mark.asyncio
+async def test_run_respects_chains_cap_and_input_order():
+    in_flight = 0
+    max_in_flight = 0
+    completed = []
+
+    async def run_one(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later requests finish first to shuffle completion order
+        await asyncio.sleep(0.001 * (len(REQUESTS) - REQUESTS.index(request)))
+        in_flight -= 1
+        completed.append(REQUESTS.index(request))
+        return request
+
+    results = await run_smoke_requests(REQUESTS, lambda r: r, run_one, max_concurrency=2)
+
+    assert results == REQUESTS
+    assert max_in_flight <= 2
+    # Product chain ran in order, deletes ran after everything else
+    product_chain = [i for i in completed if i in (0, 1, 5)]
+    assert product_chain == [0, 1, 5]
+    assert set(completed[-2:]) == {4, 6}
+
+
+@pytest.mark.asyncio
+async def test_runtime_validator_shares_pooled_client(tmp_path):
+    validator = RuntimeSmokeTestValidator(tmp_path, max_concurrency=4)
+    endpoints = [
+        Endpoint(path="/products", method=HttpMethod.GET, operation_id="list_products"),
+        Endpoint(path="/orders", method=HttpMethod.GET, operation_id="list_orders"),
+    ]
+    clients = set()
+
+    async def fake_test_endpoint(endpoint, client=None):
+        clients.add(id(client))
+        return EndpointTestResult(
+            endpoint_path=endpoint.path,
+            method=endpoint.method.value,
+            success=endpoint.path != "/orders",
+            status_code=200 if endpoint.path != "/orders" else 500,
+            error_type=None if endpoint.path != "/orders" else "HTTP_500",
+        )
+
+    async def noop():
+        return None
+
+    validator._test_endpoint = fake_test_endpoint
+    validator._start_server = noop
+    validator._stop_server = noop
+    validator._capture_server_logs = lambda: asyncio.sleep(0, result="")
+    validator._get_endpoints_from_ir = lambda ir: endpoints
+
+    result = await validator.validate(ir=None)
+
+    assert len(clients) == 1 and id(None) not in clients
+    assert [r.endpoint_path for r in result.results] == ["/products", "/orders"]
+    assert [v["endpoint"] for v in result.violations] == ["GET /orders"]
+
+
+@pytest.mark.asyncio
+async def test_test_endpoint_uses_given_client(tmp_path):
+    validator = RuntimeSmokeTestValidator(tmp_path)
+    endpoint = Endpoint(path="/products/{id}", method=HttpMethod.GET, operation_id="get_product")
+    transport = httpx.MockTransport(lambda request: httpx.Response(500, text="KeyError: 'name'"))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await validator._test_endpoint(endpoint, client)
+
+    assert not result.success
+    assert result.error_type == "KeyError"
+
+
+def _scenario(scenario_id, method, path, priority=TestPriority.MEDIUM):
+    return TestScenarioIR(
+        scenario_id=scenario_id,
+        name=scenario_id,
+        endpoint_path=path,
+        http_method=method,
+        operation_id=scenario_id,
+        priority=priority,
+    )
+
+
+def _runner(scenarios, statuses):
+    tests_model = SimpleNamespace(
+        get_smoke_scenarios=lambda: list(scenarios),
+        endpoint_suites=[],
+    )
+    runner = SmokeRunnerV2(tests_model, max_concurrency=4)
+
+    async def fake_execute(client, scenario):
+        await asyncio.sleep(0.001 * (len(scenarios) - scenarios.index(scenario)))
+        return ScenarioResult(
+            scenario_id=scenario.scenario_id,
+            scenario_name=scenario.name,
+            endpoint_path=scenario.endpoint_path,
+            http_method=scenario.http_method,
+            status=statuses.get(scenario.scenario_id, ScenarioStatus.PASSED),
+            expected_status_code=200,
+        )
+
+    runner._execute_scenario = fake_execute
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_smoke_runner_reports_in_priority_order():
+    scenarios = [
+        _scenario("critical", "GET", "/health", TestPriority.CRITICAL),
+        _scenario("list", "GET", "/products"),
+        _scenario("create", "POST", "/products"),
+        _scenario("orders", "GET", "/orders"),
+    ]
+    runner = _runner(scenarios, {"orders": ScenarioStatus.FAILED})
+
+    report = await runner.run()
+
+    assert [r.scenario_id for r in report.results] == ["critical", "list", "create", "orders"]
+    assert report.passed == 3
+    assert report.failed_endpoints == ["GET /orders"]
+
+
+@pytest.mark.asyncio
+async def test_smoke_runner_stops_on_critical_failure():
+    scenarios = [
+        _scenario("critical-1", "GET", "/health", TestPriority.CRITICAL),
+        _scenario("critical-2", "GET", "/ready", TestPriority.CRITICAL),
+        _scenario("list", "GET", "/products"),
+    ]
+    runner = _runner(scenarios, {"critical-1": ScenarioStatus.FAILED})
+
+    report = await runner.run()
+
+    assert [r.scenario_id for r in report.results] == ["critical-1"]
+    assert report.failed == 1
@@ -0,0 +1,205 @@
+"""
+Unit tests for SmokeServerSession (warm smoke server across repair iterations).
+
+Docker and uvicorn are never started: the validator is a fake and
+docker compose commands are recorded instead of executed.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.validation.smoke_repair_orchestrator import SmokeRepairConfig, SmokeRepairOrchestrator
+from src.validation.smoke_server_session import SmokeServerSession, requires_full_restart
+
+COMPOSE_YML = """
+services:
+  postgres:
+    environment:
+      POSTGRES_DB: shop_db
+      POSTGRES_USER: devmatrix
+"""
+
+
+class FakeValidator:
+    """Records server lifecycle calls like RuntimeSmokeTestValidator would perform them."""
+
+    def __init__(self, app_dir, using_docker):
+        self.app_dir = app_dir
+        self.reuse_running_server = False
+        self._using_docker = False
+        self._docker = using_docker
+        self.calls = []
+
+    async def _start_server(self):
+        self.calls.append("start_server")
+        self._using_docker = self._docker
+
+    async def _start_uvicorn_server(self):
+        self.calls.append("start_uvicorn")
+
+    async def _stop_server(self):
+        self.calls.append("stop_server")
+
+    async def _wait_for_server(self):
+        self.calls.append("wait")
+
+    async def validate(self, ir):
+        self.calls.append("validate" if self.reuse_running_server else "validate_cold")
+        return SimpleNamespace(
+            endpoints_tested=2, endpoints_passed=1, violations=[], server_logs=""
+        )
+
+
+@pytest.fixture
+def app_dir(tmp_path):
+    (tmp_path / "src" / "models").mkdir(parents=True)
+    (tmp_path / "docker").mkdir()
+    (tmp_path / "src" / "main.py").write_text("app = None\n")
+    (tmp_path / "src" / "models" / "entities.py").write_text("class Product: ...\n")
+    (tmp_path / "docker" / "docker-compose.yml").write_text(COMPOSE_YML)
+    return tmp_path
+
+
+def _docker_session(app_dir):
+    validator = FakeValidator(app_dir, using_docker=True)
+    session = SmokeServerSession(validator)
+    session.commands = []
+    session._compose = lambda *args: session.commands.append(args)
+    return validator, session
+
+
+@pytest.mark.parametrize(
+    ("changed", "expected"),
+    [
+        (["src/api/routes/product.py"], False),
+        (["src/models/schemas.py"], False),
+        (["src/models/entities.py"], True),
+        (["requirements.txt"], True),
+        (["alembic/versions/001_initial.py"], True),
+        ([], False),
+    ],
+)
+def test_requires_full_restart(changed, expected):
+    assert requires_full_restart(changed) is expected
+
+
+@pytest.mark.asyncio
+async def test_docker_start_snapshots_seeded_database(app_dir):
+    validator, session = _docker_session(app_dir)
+
+    await session.start()
+
+    assert validator.reuse_running_server
+    assert validator.calls == ["start_server", "wait"]
+    psql = [c for c in session.commands if c[0] == "exec"]
+    assert any('CREATE DATABASE "shop_db_smoke_snapshot" TEMPLATE "shop_db"' in c for c in psql)
+
+
+@pytest.mark.asyncio
+async def test_docker_refresh_hot_reloads_changed_code(app_dir):
+    validator, session = _docker_session(app_dir)
+    await session.start()
+    session.commands.clear()
+    validator.calls.clear()
+
+    (app_dir / "src" / "main.py").write_text("app = 'repaired'\n")
+    mode = await session.refresh()
+
+    assert mode == "hot_reload"
+    assert "start_server" not in validator.calls
+    assert ("cp", "src/main.py", "app:/app/src/main.py") in session.commands
+    # Database restored from the template instead of re-seeding
+    psql = [c for c in session.commands if c[0] == "exec"][0]
+    assert 'CREATE DATABASE "shop_db" TEMPLATE "shop_db_smoke_snapshot"' in psql
+    assert session.commands[-1] == ("start", "app")
+
+    # Nothing changed since: reset data only, no copies
+    session.commands.clear()
+    assert await session.refresh() == "hot_reload"
+    assert not any(c[0] == "cp" for c in session.commands)
+
+
+@pytest.mark.asyncio
+async def test_docker_refresh_restarts_on_schema_change(app_dir):
+    validator, session = _docker_session(app_dir)
+    await session.start()
+    validator.calls.clear()
+
+    (app_dir / "src" / "models" / "entities.py").write_text("class Product: nullable = True\n")
+
+    assert await session.refresh() == "full_restart"
+    assert validator.calls[0] == "start_server"
+    assert session.full_restarts == 2
+
+
+@pytest.mark.asyncio
+async def test_uvicorn_refresh_restarts_process(app_dir):
+    validator = FakeValidator(app_dir, using_docker=False)
+    session = SmokeServerSession(validator)
+    await session.start()
+    validator.calls.clear()
+
+    (app_dir / "src" / "main.py").write_text("app = 'repaired'\n")
+
+    assert await session.refresh() == "hot_reload"
+    assert validator.calls == ["stop_server", "start_uvicorn"]
+
+    await session.stop()
+    assert not validator.reuse_running_server
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_keeps_server_warm_across_iterations(app_dir):
+    validator = FakeValidator(app_dir, using_docker=False)
+    orchestrator = SmokeRepairOrchestrator(
+        smoke_validator=validator,
+        config=SmokeRepairConfig(max_iterations=3, convergence_epsilon=-1.0, enable_learning=False),
+    )
+
+    async def no_repairs(*args, **kwargs):
+        return {"fixes": [], "successful": 0}
+
+    orchestrator._repair_from_smoke = no_repairs
+
+    result = await orchestrator.run_smoke_repair_cycle(app_dir, application_ir=None)
+
+    assert len(result.iterations) == 3
+    assert validator.calls.count("start_server") == 1
+    assert validator.calls.count("validate") == 3
+    assert validator.calls[-1] == "stop_server"
+    assert not validator.reuse_running_server
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_cold_start_when_reuse_disabled(app_dir):
+    validator = FakeValidator(app_dir, using_docker=False)
+    orchestrator = SmokeRepairOrchestrator(
+        smoke_validator=validator,
+        config=SmokeRepairConfig(max_iterations=1, reuse_server=False, enable_learning=False),
+    )
+
+    await orchestrator.run_smoke_repair_cycle(app_dir, application_ir=None)
+
+    assert validator.calls == ["validate_cold"]
+
+
+def test_warm_server_logs_are_captured_since_run_start(tmp_path, monkeypatch):
+    import asyncio
+    from datetime import datetime, timezone
+
+    from src.validation import runtime_smoke_validator
+    from src.validation.runtime_smoke_validator import RuntimeSmokeTestValidator
+
+    commands = []
+    monkeypatch.setattr(
+        runtime_smoke_validator.subprocess, "run",
+        lambda cmd, **kwargs: commands.append(cmd) or SimpleNamespace(stdout="", stderr=""),
+    )
+    validator = RuntimeSmokeTestValidator(tmp_path)
+    validator._using_docker = True
+    validator._run_started_at = datetime(2025, 11, 20, 10, 0, 0, 250000, tzinfo=timezone.utc)
+
+    asyncio.run(validator._capture_server_logs())
+
+    assert commands[0][-2:] == ["--since", "2025-11-20T10:00:00.250000Z"]
@@ -355,6 +355,213 @@ class TestCacheOperations:
         assert not cache_file2.exists()
 
 
+class TestTieredCache:
+    """Tests for the in-process (L0) and Redis cache tiers."""
+
+    @pytest.fixture
+    def app_ir(self):
+        from src.cognitive.ir.domain_model import DomainModelIR, Entity, Attribute
+        from src.cognitive.ir.api_model import APIModelIR
+        from src.cognitive.ir.infrastructure_model import InfrastructureModelIR, DatabaseConfig
+
+        return ApplicationIR(
+            name="test_app",
+            domain_model=DomainModelIR(
+                entities=[
+                    Entity(
+                        name="Product",
+                        attributes=[Attribute(name="id", data_type=DataType.UUID, is_primary_key=True)],
+                    )
+                ]
+            ),
+            api_model=APIModelIR(endpoints=[]),
+            infrastructure_model=InfrastructureModelIR(
+                database=DatabaseConfig(
+                    type=DatabaseType.POSTGRESQL,
+                    port=5432,
+                    name="app_db",
+                    user="app_user",
+                    password_env_var="DB_PASSWORD",
+                )
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_is_memoized_in_process(self, converter, app_ir):
+        """A Redis hit is validated once; later calls skip Redis."""
+        from unittest.mock import Mock
+
+        stored = {}
+        converter.redis = Mock()
+        converter.redis.cache_ir.side_effect = lambda key, data: stored.update({key: data}) or True
+        converter.redis.get_cached_ir.side_effect = lambda key: stored.get(key)
+        converter.redis.clear_ir_cache.return_value = 0
+
+        spec = "# Memo spec"
+        code_version = converter._get_code_version_hash()
+        cache_key = f"memo_{converter._hash_spec(spec)[:8]}_{code_version}"
+        converter._cache_to_redis(app_ir, cache_key, converter._hash_spec(spec), "memo.md")
+        assert "application_ir_json" in stored[cache_key]
+
+        first = await converter.get_application_ir(spec, "memo.md")
+        second = await SpecToApplicationIR(cache_dir=converter.CACHE_DIR).get_application_ir(spec, "memo.md")
+
+        assert first == app_ir
+        assert second is first
+        assert converter.redis.get_cached_ir.call_count == 1
+
+        converter.clear_cache("memo.md")
+        await converter.get_application_ir(spec, "memo.md")
+        assert converter.redis.get_cached_ir.call_count == 2
+
+    def test_filesystem_roundtrip(self, converter, app_ir, temp_cache_dir):
+        """Filesystem cache entries load back to an equal ApplicationIR."""
+        cache_path = temp_cache_dir / "test_app_12345678.json"
+        converter._save_to_cache(app_ir, cache_path, "hash", "test_app.md")
+
+        assert converter._load_from_cache(cache_path) == app_ir
+
+
+SAMPLE_SPEC = Path(__file__).parents[1] / "e2e" / "test_specs" / "ecommerce-api-spec-human.md"
+
+# What the LLM returns for a full extraction of SAMPLE_SPEC (abridged)
+SAMPLE_EXTRACTION = {
+    "app_name": "E-commerce API",
+    "app_description": "Online store",
+    "entities": [
+        {
+            "name": "Product",
+            "attributes": [
+                {"name": "id", "data_type": "UUID", "is_primary_key": True},
+                {"name": "price", "data_type": "float", "constraints": {"min_value": 0}},
+            ],
+            "relationships": [],
+        }
+    ],
+    "endpoints": [{"path": "/products", "method": "POST", "operation_id": "create_product"}],
+    "validation_rules": [
+        {"entity": "Product", "attribute": "price", "type": "RANGE", "condition": "> 0"}
+    ],
+    "flows": [
+        {
+            "name": "F1: Create Product",
+            "type": "workflow",
+            "trigger": "POST /products",
+            "steps": [{"order": 1, "description": "Create product", "action": "create"}],
+        }
+    ],
+    "entity_dependencies": [],
+    "database": {"type": "postgresql", "name": "app_db"},
+}
+
+# Top-level headings of SAMPLE_SPEC by section kind
+SAMPLE_SECTION_HEADINGS = {
+    "context": [
+        "# E-commerce API - Especificación en Lenguaje Natural",
+        "## ¿Qué vamos a construir?",
+        "## Ejemplo Completo: Un Cliente Compra Algo",
+        "## Notas Técnicas Importantes",
+        "## ¿Qué Debería Pasar en el Sistema?",
+    ],
+    "entities": ["## Las 6 Entidades Principales"],
+    "flows": ["## Los 17 Flujos Principales (Casos de Uso)"],
+    "validations": ["## Reglas de Validación (Lo Importante)", "## Resumen de Validaciones Esperadas"],
+}
+
+
+class TestSectionExtraction:
+    """Tests for section-parallel extraction."""
+
+    @pytest.fixture
+    def llm(self, converter):
+        """Fake streaming LLM answering with SAMPLE_EXTRACTION, limited to the SCOPE keys."""
+        import asyncio
+        import re
+        from unittest.mock import Mock
+
+        calls = {"prompts": [], "active": 0, "max_active": 0}
+
+        async def generate(prompt):
+            calls["prompts"].append(prompt)
+            calls["active"] += 1
+            calls["max_active"] = max(calls["max_active"], calls["active"])
+            await asyncio.sleep(0.01)
+            calls["active"] -= 1
+
+            scope = re.match(r"SCOPE: Output ONLY these top-level keys: ([^.]+)\.", prompt)
+            keys = scope.group(1).split(", ") if scope else list(SAMPLE_EXTRACTION)
+            return json.dumps({key: SAMPLE_EXTRACTION[key] for key in keys})
+
+        converter.client = Mock()
+        converter._generate_with_streaming = generate
+        return calls
+
+    def test_real_spec_sections_are_classified(self):
+        """Top-level sections of the sample spec land in the expected kinds."""
+        from src.specs.spec_sections import is_sectioned, split_spec_sections
+
+        sections = split_spec_sections(SAMPLE_SPEC.read_text())
+
+        assert set(sections) == set(SAMPLE_SECTION_HEADINGS)
+        for kind, headings in SAMPLE_SECTION_HEADINGS.items():
+            found = [line for line in sections[kind].splitlines() if line.startswith(("# ", "## "))]
+            assert found == headings, kind
+        assert "### 6. Ítem de la Orden (OrderItem)" in sections["entities"]
+        assert is_sectioned(sections)
+
+    @pytest.mark.asyncio
+    async def test_each_part_prompt_contains_exactly_its_sections(self, converter, llm, monkeypatch):
+        """Every part prompt holds the shared context plus only the sections it reads."""
+        import src.specs.spec_to_application_ir as module
+        from src.specs.spec_sections import EXTRACTION_PARTS
+
+        monkeypatch.setattr(module, "SPEC_SECTION_EXTRACTION", True)
+        monkeypatch.setattr(module, "SPEC_EXTRACTION_CONCURRENCY", 2)
+        app_ir = await converter._generate_with_llm(SAMPLE_SPEC.read_text(), SAMPLE_SPEC.name)
+
+        assert len(llm["prompts"]) == len(EXTRACTION_PARTS)
+        assert llm["max_active"] == 2
+        prompts = {prompt.split("\n", 1)[0]: prompt for prompt in llm["prompts"]}
+        for part in EXTRACTION_PARTS:
+            [prompt] = [p for scope, p in prompts.items() if f"keys: {', '.join(part.keys)}." in scope]
+            for kind, headings in SAMPLE_SECTION_HEADINGS.items():
+                expected = kind == "context" or kind in part.sections
+                assert all((heading in prompt) == expected for heading in headings), (part.name, kind)
+
+        assert [entity.name for entity in app_ir.get_entities()] == ["Product"]
+
+    @pytest.mark.asyncio
+    async def test_editing_one_section_re_extracts_only_its_parts(self, converter, llm):
+        """Unchanged parts come from the section cache."""
+        spec = SAMPLE_SPEC.read_text()
+        await converter._generate_with_llm(spec, SAMPLE_SPEC.name)
+        assert len(llm["prompts"]) == 4
+
+        edited = spec.replace("## Resumen de Validaciones Esperadas", "## Resumen de Validaciones Esperadas\n\n- Stock >= 0")
+        await converter._generate_with_llm(edited, SAMPLE_SPEC.name)
+
+        assert len(llm["prompts"]) == 5
+        assert "validation_rules" in llm["prompts"][-1].split("\n", 1)[0]
+
+        await converter._generate_with_llm(edited, SAMPLE_SPEC.name, force_refresh=True)
+        assert len(llm["prompts"]) == 9
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_removes_the_specs_section_entries(self, converter, llm, temp_cache_dir):
+        """clear_cache(spec_path) drops that spec's section cache, not other specs'."""
+        await converter._generate_with_llm(SAMPLE_SPEC.read_text(), SAMPLE_SPEC.name)
+        sections_dir = temp_cache_dir / "sections"
+        assert len(list(sections_dir.glob(f"{SAMPLE_SPEC.stem}_*.json"))) == 4
+        other = sections_dir / "other_domain_0123456789abcdef.json"
+        other.write_text("{}")
+
+        converter.clear_cache(str(SAMPLE_SPEC))
+
+        assert list(sections_dir.glob("*.json")) == [other]
+        await converter._generate_with_llm(SAMPLE_SPEC.read_text(), SAMPLE_SPEC.name)
+        assert len(llm["prompts"]) == 8
+
+
 class TestCacheInfo:
     """Tests for cache information retrieval."""
 